@@ -1,15 +1,19 @@
-"""Registration of CLI commands."""
+"""
+Registration of CLI commands.
 
-from pysatl_experiment.cli.commands.build_and_run import build_and_run
-from pysatl_experiment.cli.commands.configure import configure
-from pysatl_experiment.cli.commands.create import create
-from pysatl_experiment.cli.commands.criteria import available_criteria
-from pysatl_experiment.cli.commands.show import show
+Commands are registered by import path and imported on first use, so
+that each invocation only imports the dependencies of its command.
+"""
+
+from typing import cast
+
+from pysatl_experiment.cli.lazy_group import LazyGroup
 from pysatl_experiment.cli.shared import cli
 
 
-cli.add_command(available_criteria)
-cli.add_command(create)
-cli.add_command(configure)
-cli.add_command(show)
-cli.add_command(build_and_run)
+_commands = cast(LazyGroup, cli)
+_commands.add_lazy_command("available-criteria", "pysatl_experiment.cli.commands.criteria:available_criteria")
+_commands.add_lazy_command("create", "pysatl_experiment.cli.commands.create:create")
+_commands.add_lazy_command("configure", "pysatl_experiment.cli.commands.configure:configure")
+_commands.add_lazy_command("show", "pysatl_experiment.cli.commands.show:show")
+_commands.add_lazy_command("build-and-run", "pysatl_experiment.cli.commands.build_and_run:build_and_run")
@@ -12,9 +12,13 @@ from pysatl_experiment.configuration.experiment_data.experiment_data import Expe
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.experiment_execution.experiment import Experiment
 from pysatl_experiment.experiment_execution.experiment_steps import ExperimentSteps
-from pysatl_experiment.experiment_execution.factory import PowerExperimentFactory, TimeComplexityExperimentFactory
+from pysatl_experiment.experiment_execution.factory import (
+    MemoryComplexityExperimentFactory,
+    PowerExperimentFactory,
+    TimeComplexityExperimentFactory,
+)
 from pysatl_experiment.experiment_execution.factory.critical_value import CriticalValueExperimentFactory
-from pysatl_experiment.loggers import setup_logging
+from pysatl_experiment.loggers import queue_logging, setup_logging, setup_telemetry
 
 
 # TODO: refactor names!
@@ -24,7 +28,11 @@ from pysatl_experiment.loggers import setup_logging
 @argument("name")
 @option("-l", "--log-level", type=LogLevel(), default="WARNING", help="Set logging level", show_default=True)
 @option("--log-file", help="Set logging file")
-def build_and_run(name: str, log_level: int, log_file: str) -> None:
+@option(
+    "--telemetry",
+    help="Write JSON-lines run telemetry to a file, 'udp://host:port' or 'unix:///path/to/socket'",
+)
+def build_and_run(name: str, log_level: int, log_file: str, telemetry: str | None) -> None:
     """
     Build and execute an experiment.
 
@@ -36,11 +44,13 @@ def build_and_run(name: str, log_level: int, log_file: str) -> None:
         Logging level.
     log_file : str
         Logging file name.
+    telemetry : str | None
+        Target of run telemetry events, None to disable telemetry.
 
     Raises
     ------
     click.BadParameter
-        If the experiment does not exist.
+        If the experiment does not exist or the telemetry target is invalid.
     """
     name = normalize_experiment_name(name)
 
@@ -50,12 +60,18 @@ def build_and_run(name: str, log_level: int, log_file: str) -> None:
     experiment_configuration = read_experiment_data(name)
 
     setup_logging(experiment_configuration, log_level, log_file)
+    if telemetry:
+        try:
+            setup_telemetry(telemetry)
+        except (OSError, ValueError) as e:
+            raise BadParameter(str(e), param_hint="--telemetry") from e
 
     experiment_data = validate_build_and_run(experiment_configuration)
     experiment_steps = _build_experiment(experiment_data)
 
     experiment = Experiment(experiment_steps)
-    experiment.run_experiment()
+    with queue_logging():
+        experiment.run_experiment()
 
 
 def _build_experiment(experiment_data: ExperimentData) -> ExperimentSteps:
@@ -76,6 +92,7 @@ def _build_experiment(experiment_data: ExperimentData) -> ExperimentSteps:
         ExperimentType.POWER: PowerExperimentFactory,
         ExperimentType.CRITICAL_VALUE: CriticalValueExperimentFactory,
         ExperimentType.TIME_COMPLEXITY: TimeComplexityExperimentFactory,
+        ExperimentType.MEMORY_COMPLEXITY: MemoryComplexityExperimentFactory,
     }
 
     experiment_type = experiment_data.config.experiment_type
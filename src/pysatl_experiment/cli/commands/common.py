@@ -3,11 +3,11 @@
 import json
 from enum import Enum
 from pathlib import Path
-from typing import cast, overload
+from typing import overload
 
 from click import ClickException, Context
-from pysatl_criterion import DistributionType
-from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
+
+from pysatl_experiment.configuration.criteria_registry import get_criteria_registry
 
 
 # TODO: Split utilities into dedicated modules?
@@ -192,21 +192,17 @@ def get_statistics_short_codes_for_hypothesis(hypothesis: str | list[str] | None
     -------
     list[str]
         List of short statistic codes (e.g., ``["KS", "AD"]``).
+
+    Notes
+    -----
+    Codes are read from the cached criteria registry, so that
+    ``pysatl_criterion`` statistics are not imported for validation.
     """
+    registry = get_criteria_registry()
     if hypothesis is None or isinstance(hypothesis, list):
-        return {member.value: get_statistics_short_codes_for_hypothesis(member.value) for member in DistributionType}
-
-    base_class = DistributionType(hypothesis).base_class
-
-    valid_criteria_types = cast(
-        list[type[AbstractGoodnessOfFitStatistic]],
-        base_class.__subclasses__(),
-    )
-    valid_criteria_codes = [
-        cls.code().split("_")[0] for cls in valid_criteria_types if not getattr(cls, "__abstractmethods__", None)
-    ]
+        return {name: registry.short_codes(name) for name in registry.hypotheses}
 
-    return valid_criteria_codes
+    return registry.short_codes(hypothesis)
 
 
 def get_experiment_data(ctx: Context) -> dict:
@@ -18,10 +18,14 @@ from pysatl_experiment.cli.commands.common import (
 from pysatl_experiment.cli.validation.commands.common.common import if_experiment_exists
 from pysatl_experiment.cli.validation.schemas.alternative import AlternativesConfig
 from pysatl_experiment.cli.validation.schemas.criteria import CriteriaConfig, Criterion
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.configuration.models.hypothesis import Hypothesis
+from pysatl_experiment.configuration.models.parallel_workers import AUTO_WORKERS
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.configuration.models.run_mode import RunMode
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
 from pysatl_experiment.configuration.models.step_type import StepType
 
 
@@ -49,6 +53,75 @@ def _configure_report_mode(experiment_config: dict, mode: str | None):
     experiment_config["report_mode"] = validated_report_mode.value
 
 
+def _configure_report_format(experiment_config: dict, report_format: str | None):
+    if report_format is None:
+        return
+
+    validated_report_format = ReportFormat(report_format.lower())
+    experiment_config["report_format"] = validated_report_format.value
+
+
+def _configure_chart_format(experiment_config: dict, chart_format: str | None):
+    if chart_format is None:
+        return
+
+    validated_chart_format = ChartFormat(chart_format.lower())
+    experiment_config["chart_format"] = validated_chart_format.value
+
+
+def _configure_sample_codec(experiment_config: dict, sample_codec: str | None):
+    if sample_codec is None:
+        return
+
+    validated_sample_codec = SampleCodec(sample_codec.lower())
+    experiment_config["sample_codec"] = validated_sample_codec.value
+
+
+def _configure_nested_samples(experiment_config: dict, nested_samples: bool | None):
+    if nested_samples is None:
+        return
+
+    experiment_config["nested_samples"] = nested_samples
+
+
+def _configure_statistic_cache(experiment_config: dict, statistic_cache: bool | None):
+    if statistic_cache is None:
+        return
+
+    experiment_config["statistic_cache"] = statistic_cache
+
+
+def _configure_common_random_numbers(experiment_config: dict, common_random_numbers: bool | None):
+    if common_random_numbers is None:
+        return
+
+    experiment_config["common_random_numbers"] = common_random_numbers
+
+
+def _configure_benchmark(
+    experiment_config: dict,
+    benchmark: bool | None,
+    warmup: int | None,
+    min_time: float | None,
+    cpus: tuple[int, ...],
+):
+    settings = {
+        "benchmark": benchmark,
+        "warmup_iterations": warmup,
+        "min_timing_seconds": min_time,
+        "cpu_affinity": list(cpus) if cpus else None,
+    }
+    settings = {key: value for key, value in settings.items() if value is not None}
+    if not settings:
+        return
+
+    experiment_type = experiment_config.get("experiment_type")
+    if experiment_type != ExperimentType.TIME_COMPLEXITY.value:
+        raise ClickException("Benchmarking mode is supported for time complexity experiments only.")
+
+    experiment_config.update(settings)
+
+
 def _configure_generator_type(experiment_config: dict, generator_type: str | None):
     if generator_type is None:
         return
@@ -143,19 +216,28 @@ def _configure_experiment_type(experiment_config: dict, experiment_type: str | N
     experiment_config["experiment_type"] = validated_experiment_type.value
 
 
-def _configure_workers(experiment_config: dict, workers: int | None):
+def _configure_workers(experiment_config: dict, workers: str | None):
     if workers is None:
         return
 
+    if workers.lower() == AUTO_WORKERS:
+        experiment_config["parallel_workers"] = AUTO_WORKERS
+        return
+
+    try:
+        workers_count = int(workers)
+    except ValueError:
+        raise ClickException(f"Cannot set parallel workers to {workers}. Please specify a number or '{AUTO_WORKERS}'.")
+
     max_possible = mp.cpu_count()
-    if workers > max_possible:
+    if not 1 <= workers_count <= max_possible:
         raise ClickException(
             f"Cannot set parallel workers to {workers}. "
             f"Your machine has only {max_possible} CPU cores. "
-            f"Please specify a value between 1 and {max_possible}."
+            f"Please specify a value between 1 and {max_possible} or '{AUTO_WORKERS}'."
         )
 
-    experiment_config["parallel_workers"] = workers
+    experiment_config["parallel_workers"] = workers_count
 
 
 def _configure_alternatives(experiment_config: dict, alternative: tuple[str, ...] | None):
@@ -193,12 +275,12 @@ def _configure_alternatives(experiment_config: dict, alternative: tuple[str, ...
 
 
 def _configure_significance_levels(experiment_config: dict, levels: tuple[float, ...] | None):
-    if levels is None:
+    if not levels:
         return
 
     experiment_type = experiment_config.get("experiment_type")
-    if experiment_type == ExperimentType.TIME_COMPLEXITY.value:  # TODO: check in test
-        raise ClickException("Significance levels are not supported for time complexity experiments.")
+    if experiment_type in (ExperimentType.TIME_COMPLEXITY.value, ExperimentType.MEMORY_COMPLEXITY.value):
+        raise ClickException("Significance levels are not supported for complexity experiments.")
 
     levels_list = list(levels)
     experiment_config["significance_levels"] = levels_list
@@ -223,6 +305,36 @@ def _configure_significance_levels(experiment_config: dict, levels: tuple[float,
 @option("-s", "--size", required=True, multiple=True, type=IntRange(min=10), help="Sample sizes. Example: '10 20 30'")
 @option("-rm", "--run-mode", type=Choice(RunMode.list()), help="Run mode. Example: reuse")
 @option("-rp", "--report-mode", type=Choice(ReportMode.list()), help="Report type. Example: with-chart")
+@option("-rf", "--report-format", type=Choice(ReportFormat.list()), help="Report output format. Example: html")
+@option("-cf", "--chart-format", type=Choice(ChartFormat.list()), help="Report chart format. Example: svg")
+@option("-sc", "--sample-codec", type=Choice(SampleCodec.list()), help="Stored sample encoding. Example: raw-float64")
+@option(
+    "--nested-samples/--independent-samples",
+    default=None,
+    help="Use prefixes of the largest samples for smaller sample sizes.",
+)
+@option(
+    "--statistic-cache/--no-statistic-cache",
+    default=None,
+    help="Reuse statistic values computed on the same samples by earlier runs.",
+)
+@option(
+    "--common-random-numbers/--independent-alternatives",
+    default=None,
+    help="Derive samples of all alternatives from one shared uniform pool.",
+)
+@option(
+    "--benchmark/--no-benchmark",
+    default=None,
+    help="Time complexity benchmarking mode: warmup, repeated calls and exclusive execution.",
+)
+@option("--warmup", type=IntRange(min=0), help="Benchmark warmup calls per criterion. Example: 3")
+@option(
+    "--min-time",
+    type=FloatRange(min=0.0),
+    help="Minimum duration in seconds of repeated calls timed per sample. Example: 0.01",
+)
+@option("--cpu", multiple=True, type=IntRange(min=0), help="CPUs the benchmark is pinned to. Example: 2")
 @option("-rbt", "--report-builder-type", type=Choice(StepType.list()), help="Report builder type. Example: standard")
 @option("-c", "--count", required=True, type=IntRange(min=100), help="Montecarlo iterations count. Example: 10000")
 @option(
@@ -238,7 +350,7 @@ def _configure_significance_levels(experiment_config: dict, levels: tuple[float,
 )
 @option("-et", "--executor-type", type=Choice(StepType.list()), help="Executor type. Example: standard")
 @option("-cr", "--criteria", multiple=True, help="Criterion codes. Example: KS")
-@option("-w", "--workers", type=IntRange(min=1), help="Parallel workers. Example: 2")
+@option("-w", "--workers", help="Parallel workers or 'auto' to size them from CPUs and memory. Example: 2")
 def configure(
     name: str,
     alternative: tuple[str],
@@ -247,6 +359,16 @@ def configure(
     size: tuple[int, ...],
     run_mode: str,
     report_mode: str,
+    report_format: str,
+    chart_format: str,
+    sample_codec: str,
+    nested_samples: bool | None,
+    statistic_cache: bool | None,
+    common_random_numbers: bool | None,
+    benchmark: bool | None,
+    warmup: int | None,
+    min_time: float | None,
+    cpu: tuple[int, ...],
     report_builder_type: str,
     count: int,
     hypothesis: str,
@@ -254,7 +376,7 @@ def configure(
     experiment_type: str,
     executor_type: str,
     criteria: tuple[str, ...],
-    workers: int,
+    workers: str | None,
 ) -> None:
     """
     Configure experiment parameters.
@@ -275,6 +397,26 @@ def configure(
         Experiment run mode.
     report_mode : str
         Report generation mode.
+    report_format : str
+        Report output format.
+    chart_format : str
+        Image format of report charts.
+    sample_codec : str
+        Encoding of generated samples in storage.
+    nested_samples : bool | None
+        Whether smaller samples are prefixes of the largest ones.
+    statistic_cache : bool | None
+        Whether statistic values of earlier runs are reused.
+    common_random_numbers : bool | None
+        Whether alternative samples are derived from a shared uniform pool.
+    benchmark : bool | None
+        Whether execution times are measured in benchmarking mode.
+    warmup : int | None
+        Untimed calls of a criterion before its first measurement.
+    min_time : float | None
+        Minimum duration of the repeated calls timed for one sample.
+    cpu : tuple[int, ...]
+        CPUs the measuring process is pinned to.
     report_builder_type : str
         Report builder implementation type.
     count : int
@@ -289,8 +431,8 @@ def configure(
         Executor implementation type.
     criteria : tuple[str, ...]
         Criterion codes.
-    workers : int
-        Number of parallel workers.
+    workers : str | None
+        Number of parallel workers or ``auto``.
     """
     name = normalize_experiment_name(name)
 
@@ -306,6 +448,13 @@ def configure(
     _configure_sample_sizes(experiment_config, size)
     _configure_run_mode(experiment_config, run_mode)
     _configure_report_mode(experiment_config, report_mode)
+    _configure_report_format(experiment_config, report_format)
+    _configure_chart_format(experiment_config, chart_format)
+    _configure_sample_codec(experiment_config, sample_codec)
+    _configure_nested_samples(experiment_config, nested_samples)
+    _configure_statistic_cache(experiment_config, statistic_cache)
+    _configure_common_random_numbers(experiment_config, common_random_numbers)
+    _configure_benchmark(experiment_config, benchmark, warmup, min_time, cpu)
     _configure_report_builder_type(experiment_config, report_builder_type)
     _configure_monte_carlo_count(experiment_config, count)
     _configure_hypothesis(experiment_config, hypothesis)
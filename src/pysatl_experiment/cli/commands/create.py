@@ -41,6 +41,7 @@ def create(name: str) -> None:
             "report_builder_type": "standard",
             "run_mode": "reuse",
             "report_mode": "with-chart",
+            "report_format": "pdf",
             "parallel_workers": 1,
         },
     }  # TODO: default settings to constant?
@@ -0,0 +1,118 @@
+"""Click command group importing its subcommands on first use."""
+
+from importlib import import_module
+from typing import Any
+
+from click import Command, Context, Group
+
+
+class LazyGroup(Group):
+    """
+    Command group resolving subcommands from import paths.
+
+    A subcommand module is imported only when the subcommand is invoked
+    or its help is rendered, so running one command does not import the
+    dependencies of all other commands.
+
+    Parameters
+    ----------
+    *args : Any
+        Positional arguments of :class:`click.Group`.
+    lazy_subcommands : dict[str, str] | None, default=None
+        Mapping of command names to ``"module:attribute"`` import paths.
+    **kwargs : Any
+        Keyword arguments of :class:`click.Group`.
+    """
+
+    def __init__(self, *args: Any, lazy_subcommands: dict[str, str] | None = None, **kwargs: Any) -> None:
+        """
+        Initialize lazy command group.
+
+        Parameters
+        ----------
+        *args : Any
+            Positional arguments of :class:`click.Group`.
+        lazy_subcommands : dict[str, str] | None, default=None
+            Mapping of command names to ``"module:attribute"`` import paths.
+        **kwargs : Any
+            Keyword arguments of :class:`click.Group`.
+        """
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands: dict[str, str] = dict(lazy_subcommands or {})
+
+    def add_lazy_command(self, name: str, import_path: str) -> None:
+        """
+        Register subcommand imported on first use.
+
+        Parameters
+        ----------
+        name : str
+            Command name.
+        import_path : str
+            Import path of the command in ``"module:attribute"`` form.
+        """
+        self.lazy_subcommands[name] = import_path
+
+    def list_commands(self, ctx: Context) -> list[str]:
+        """
+        List names of loaded and lazy subcommands.
+
+        Parameters
+        ----------
+        ctx : click.Context
+            Click context.
+
+        Returns
+        -------
+        list[str]
+            Sorted command names.
+        """
+        return sorted({*super().list_commands(ctx), *self.lazy_subcommands})
+
+    def get_command(self, ctx: Context, cmd_name: str) -> Command | None:
+        """
+        Get subcommand by name, importing it if needed.
+
+        Parameters
+        ----------
+        ctx : click.Context
+            Click context.
+        cmd_name : str
+            Command name.
+
+        Returns
+        -------
+        Command | None
+            Resolved command, or None if no such command is registered.
+        """
+        if cmd_name in self.lazy_subcommands:
+            self.add_command(self._load_command(cmd_name), cmd_name)
+            del self.lazy_subcommands[cmd_name]
+
+        return super().get_command(ctx, cmd_name)
+
+    def _load_command(self, cmd_name: str) -> Command:
+        """
+        Import lazy subcommand.
+
+        Parameters
+        ----------
+        cmd_name : str
+            Command name.
+
+        Returns
+        -------
+        Command
+            Imported command.
+
+        Raises
+        ------
+        TypeError
+            If the import path does not refer to a click command.
+        """
+        module_name, attribute = self.lazy_subcommands[cmd_name].split(":")
+        command = getattr(import_module(module_name), attribute)
+        if not isinstance(command, Command):
+            raise TypeError(f"Lazy command '{cmd_name}' is not a click command: {command!r}.")
+
+        return command
@@ -3,12 +3,13 @@
 from click import group, version_option
 
 from pysatl_experiment.cli.commands.common import get_project_root
+from pysatl_experiment.cli.lazy_group import LazyGroup
 
 
 # TODO: refactor name!!
 
 
-@group()
+@group(cls=LazyGroup)
 @version_option()
 def cli() -> None:
     """PySATL experiments command-line interface."""
@@ -24,12 +24,16 @@ from pysatl_experiment.cli.validation.commands.common.checker import SQLiteCriti
 from pysatl_experiment.cli.validation.schemas.experiment import BaseExperimentConfig as PydanticBaseExperiment
 from pysatl_experiment.cli.validation.schemas.experiment import CriticalValueConfig as PydanticCriticalValueConfig
 from pysatl_experiment.cli.validation.schemas.experiment import ExperimentConfig as ExperimentInputSchema
+from pysatl_experiment.cli.validation.schemas.experiment import MemoryComplexityConfig as PydanticMemoryComplexityConfig
 from pysatl_experiment.cli.validation.schemas.experiment import PowerConfig as PydanticPowerConfig
 from pysatl_experiment.cli.validation.schemas.experiment import TimeComplexityConfig as PydanticTimeComplexityConfig
 from pysatl_experiment.configuration.experiment_config.critical_value import (
     CriticalValueExperimentConfig as LegacyCriticalValueExperimentConfig,
 )
 from pysatl_experiment.configuration.experiment_config.experiment_config import ExperimentConfig
+from pysatl_experiment.configuration.experiment_config.memory_complexity import (
+    MemoryComplexityExperimentConfig as LegacyMemoryComplexityExperimentConfig,
+)
 from pysatl_experiment.configuration.experiment_config.power import PowerExperimentConfig as LegacyPowerExperimentConfig
 from pysatl_experiment.configuration.experiment_config.time_complexity import (
     TimeComplexityExperimentConfig as LegacyTimeComplexityExperimentConfig,
@@ -40,6 +44,7 @@ from pysatl_experiment.configuration.models.experiment_type import ExperimentTyp
 from pysatl_experiment.configuration.models.hypothesis import Hypothesis
 from pysatl_experiment.configuration.models.run_mode import RunMode
 from pysatl_experiment.configuration.models.step_type import StepType
+from pysatl_experiment.experiment_execution.parallel.resources import worker_count_record
 from pysatl_experiment.persistence.experiment_storage import AlchemyExperimentStorage
 from pysatl_experiment.persistence.models.experiment import ExperimentModel, ExperimentQuery, IExperimentStorage
 
@@ -177,6 +182,8 @@ def _get_experiment_config_from_storage(
 
     significance_levels = []
     alternatives = {}
+    common_random_numbers = False
+    benchmark = False
     if experiment_type == ExperimentType.CRITICAL_VALUE:
         critical_value_config = cast(LegacyCriticalValueExperimentConfig, config)
         significance_levels = critical_value_config.significance_levels
@@ -184,6 +191,9 @@ def _get_experiment_config_from_storage(
         power_config = cast(LegacyPowerExperimentConfig, config)
         significance_levels = power_config.significance_levels
         alternatives = {alternative.generator_name: alternative.parameters for alternative in power_config.alternatives}
+        common_random_numbers = power_config.common_random_numbers
+    elif experiment_type == ExperimentType.TIME_COMPLEXITY:
+        benchmark = cast(LegacyTimeComplexityExperimentConfig, config).benchmark
 
     query = ExperimentQuery(
         experiment_type=experiment_type.value,
@@ -199,7 +209,10 @@ def _get_experiment_config_from_storage(
         criteria=criteria,
         significance_levels=significance_levels,
         alternatives=alternatives,
-        parallel_workers=config.parallel_workers,
+        parallel_workers=worker_count_record(config.parallel_workers),
+        nested_samples=config.nested_samples,
+        common_random_numbers=common_random_numbers,
+        benchmark=benchmark,
     )
 
     experiment_config_from_db = storage.get_data(query)
@@ -228,6 +241,8 @@ def _save_experiment_config_to_storage(config: ExperimentConfig, storage: IExper
 
     significance_levels = []
     alternatives = {}
+    common_random_numbers = False
+    benchmark = False
     if experiment_type == ExperimentType.CRITICAL_VALUE:
         critical_value_config = cast(LegacyCriticalValueExperimentConfig, config)
         significance_levels = critical_value_config.significance_levels
@@ -235,13 +250,16 @@ def _save_experiment_config_to_storage(config: ExperimentConfig, storage: IExper
         power_config = cast(LegacyPowerExperimentConfig, config)
         significance_levels = power_config.significance_levels
         alternatives = {alternative.generator_name: alternative.parameters for alternative in power_config.alternatives}
+        common_random_numbers = power_config.common_random_numbers
+    elif experiment_type == ExperimentType.TIME_COMPLEXITY:
+        benchmark = cast(LegacyTimeComplexityExperimentConfig, config).benchmark
 
     query = ExperimentModel(
         experiment_type=experiment_type.value,
         storage_connection=config.storage_connection,
         run_mode=config.run_mode.value,
         report_mode=config.report_mode.value,
-        parallel_workers=config.parallel_workers,
+        parallel_workers=worker_count_record(config.parallel_workers),
         hypothesis=config.hypothesis.value,
         generator_type=config.generator_type.value,
         executor_type=config.executor_type.value,
@@ -254,6 +272,9 @@ def _save_experiment_config_to_storage(config: ExperimentConfig, storage: IExper
         is_generation_done=False,
         is_execution_done=False,
         is_report_building_done=False,
+        nested_samples=config.nested_samples,
+        common_random_numbers=common_random_numbers,
+        benchmark=benchmark,
     )
 
     storage.insert_data(query)
@@ -300,6 +321,7 @@ PYDANTIC_TO_LEGACY_MAP = {
     PydanticPowerConfig: LegacyPowerExperimentConfig,
     PydanticCriticalValueConfig: LegacyCriticalValueExperimentConfig,
     PydanticTimeComplexityConfig: LegacyTimeComplexityExperimentConfig,
+    PydanticMemoryComplexityConfig: LegacyMemoryComplexityExperimentConfig,
 }
 
 
@@ -327,7 +349,10 @@ def _adapt_pydantic_to_dataclass(pydantic_config: PydanticBaseExperiment) -> Exp
     """
     legacy_dataclass_type = PYDANTIC_TO_LEGACY_MAP.get(
         cast(
-            type[PydanticPowerConfig] | type[PydanticCriticalValueConfig] | type[PydanticTimeComplexityConfig],
+            type[PydanticPowerConfig]
+            | type[PydanticCriticalValueConfig]
+            | type[PydanticTimeComplexityConfig]
+            | type[PydanticMemoryComplexityConfig],
             type(pydantic_config),
         )
     )
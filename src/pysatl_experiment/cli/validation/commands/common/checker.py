@@ -3,19 +3,23 @@ Database validation helpers.
 
 This module provides utility classes used during configuration validation.
 The main purpose is verifying that required precomputed critical values
-exist in the configured SQLite database before a power experiment starts.
+exist in the configured database before a power experiment starts.
 """
 
-from sqlalchemy import create_engine, text
+from collections.abc import Iterable
+
+from sqlalchemy import bindparam, text
+
+from pysatl_experiment.persistence.db_store.db_init import init_db
 
 
 class SQLiteCriticalValueChecker:
     """
-    Validator for checking the existence of critical values in SQLite storage.
+    Validator for checking the existence of critical values in storage.
 
-    The checker establishes a database connection and provides methods
-    for verifying whether critical values for specific criteria and
-    sample sizes are already available.
+    The checker uses the engine shared by all storages of the database
+    in the current process and answers all (criterion, sample size)
+    pairs of a configuration with a single query.
     """
 
     def __init__(self, connection_string: str):
@@ -35,12 +39,56 @@ class SQLiteCriticalValueChecker:
         self.connection_string = connection_string
         self.engine = None
         try:
-            self.engine = create_engine(connection_string)
-            with self.engine.connect() as conn:
-                conn.execute(text("SELECT 1"))
+            self.engine = init_db(connection_string)
+            # The connection returns to the pool and is reused by the lookup.
+            self.engine.connect().close()
         except Exception as e:
             raise ConnectionError(f"Failed to connect to the database '{self.connection_string}': {e}")
 
+    def find_missing(self, criterion_codes: Iterable[str], sample_sizes: Iterable[int]) -> set[tuple[str, int]]:
+        """
+        Find (criterion, sample size) pairs without critical values.
+
+        Parameters
+        ----------
+        criterion_codes : Iterable[str]
+            Criterion identifiers.
+        sample_sizes : Iterable[int]
+            Sample sizes.
+
+        Returns
+        -------
+        set[tuple[str, int]]
+            Pairs of the cartesian product of criteria and sample sizes
+            missing from storage.
+
+        Notes
+        -----
+        The lookup is performed against the ``limit_distributions`` table
+        with one set-based query.
+        """
+        codes = sorted(set(criterion_codes))
+        sizes = sorted({int(size) for size in sample_sizes})
+        requested = {(code, size) for code in codes for size in sizes}
+        if not requested or self.engine is None:
+            return requested
+
+        sql = text("""
+            SELECT DISTINCT criterion_code, sample_size
+            FROM limit_distributions
+            WHERE criterion_code IN :criterion_codes
+              AND sample_size IN :sample_sizes
+        """).bindparams(
+            bindparam("criterion_codes", expanding=True),
+            bindparam("sample_sizes", expanding=True),
+        )
+
+        with self.engine.connect() as conn:
+            rows = conn.execute(sql, {"criterion_codes": codes, "sample_sizes": sizes})
+            found = {(str(code), int(size)) for code, size in rows}
+
+        return requested - found
+
     def check_exists(self, criterion_code: str, sample_size: int) -> bool:
         """
         Check whether critical values exist.
@@ -56,32 +104,11 @@ class SQLiteCriticalValueChecker:
         -------
         bool
             True if matching critical values exist, otherwise False.
-
-        Notes
-        -----
-        The lookup is performed against the ``limit_distributions`` table.
         """
         if self.engine is None:
             return False
 
-        sql = text("""
-            SELECT EXISTS (
-                SELECT 1
-                FROM limit_distributions
-                WHERE criterion_code = :criterion_code
-                  AND sample_size = :sample_size
-            )
-        """)
-
-        with self.engine.connect() as conn:
-            result = conn.execute(
-                sql,
-                {
-                    "criterion_code": criterion_code,
-                    "sample_size": sample_size,
-                },
-            )
-            return result.scalar() == 1
+        return not self.find_missing([criterion_code], [sample_size])
 
 
 # TODO: refactor structure
@@ -5,6 +5,9 @@ This module defines structures for specifying alternative hypothesis
 generators used in statistical experiments. It supports both string-based
 and structured initialization, and performs runtime validation against
 available generator implementations.
+
+Generators are imported by the validators rather than at module level,
+so that importing the schemas does not load the distribution libraries.
 """
 
 import inspect
@@ -13,7 +16,6 @@ from typing import Any
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
-from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
 
 
 class Alternative(BaseModel):
@@ -65,6 +67,8 @@ class Alternative(BaseModel):
         ValueError
             If no generator matches or multiple ambiguous matches exist.
         """
+        from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
+
         available_generators: list[str] = [
             gen_cls.__name__.upper() for gen_cls in AbstractRVSGenerator.__subclasses__()
         ]
@@ -144,6 +148,8 @@ class Alternative(BaseModel):
         ValueError
             If generator is not found or parameter count mismatches.
         """
+        from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
+
         generator_by_name: dict[str, type[AbstractRVSGenerator]] = {
             gen_cls.__name__.upper(): gen_cls for gen_cls in AbstractRVSGenerator.__subclasses__()
         }
@@ -13,9 +13,12 @@ from pydantic import BaseModel, Field, ValidationError, ValidationInfo, field_va
 from pysatl_experiment.cli.validation.commands.common.checker import SQLiteCriticalValueChecker
 from pysatl_experiment.cli.validation.schemas.alternative import Alternative
 from pysatl_experiment.cli.validation.schemas.criteria import CriteriaConfig, Criterion
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
 from pysatl_experiment.configuration.models.hypothesis import Hypothesis
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.configuration.models.run_mode import RunMode
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
 from pysatl_experiment.configuration.models.step_type import StepType
 
 
@@ -47,8 +50,20 @@ class BaseExperimentConfig(BaseModel):
         Sample sizes used in experiment.
     monte_carlo_count : int
         Number of Monte Carlo simulations.
-    parallel_workers : int
-        Number of parallel workers.
+    parallel_workers : int | Literal["auto"]
+        Number of parallel workers, or ``"auto"`` to choose it from
+        available CPUs and memory.
+    report_format : ReportFormat
+        Output format of the generated report.
+    chart_format : ChartFormat
+        Image format of charts stored as external report assets.
+    sample_codec : SampleCodec
+        Encoding of generated samples in storage.
+    nested_samples : bool
+        Generate samples of the largest size only and use their
+        prefixes for smaller sizes.
+    statistic_cache : bool
+        Reuse statistic values computed on the same samples by earlier runs.
 
     Raises
     ------
@@ -66,7 +81,12 @@ class BaseExperimentConfig(BaseModel):
     storage_connection: str
     sample_sizes: list[int]
     monte_carlo_count: int
-    parallel_workers: int
+    parallel_workers: int | Literal["auto"]
+    report_format: ReportFormat = ReportFormat.PDF
+    chart_format: ChartFormat = ChartFormat.SVG
+    sample_codec: SampleCodec = SampleCodec.RAW_FLOAT64
+    nested_samples: bool = False
+    statistic_cache: bool = False
 
     @field_validator("generator_type", "executor_type", "report_builder_type")
     @classmethod
@@ -145,6 +165,31 @@ class BaseExperimentConfig(BaseModel):
             raise ValueError("Monte Carlo count must be greater than 100.")  # TODO: fix magic constant!
         return value
 
+    @field_validator("parallel_workers")
+    @classmethod
+    def check_parallel_workers(cls, value):
+        """
+        Validate number of parallel workers.
+
+        Parameters
+        ----------
+        value : int | Literal["auto"]
+            Number of workers or ``"auto"``.
+
+        Returns
+        -------
+        int | Literal["auto"]
+            Validated value.
+
+        Raises
+        ------
+        ValueError
+            If a number of workers is less than 1.
+        """
+        if value != "auto" and value < 1:
+            raise ValueError("Parallel workers must be a positive number or 'auto'.")
+        return value
+
     @model_validator(mode="after")
     def validate_using_criteria_config(self) -> "BaseExperimentConfig":
         """
@@ -191,6 +236,8 @@ class PowerConfig(BaseExperimentConfig):
         Alternative hypotheses used in power analysis.
     significance_levels : list[float]
         Significance levels (alpha values).
+    common_random_numbers : bool
+        Derive alternative samples from one shared uniform pool.
 
     Raises
     ------
@@ -201,6 +248,7 @@ class PowerConfig(BaseExperimentConfig):
     experiment_type: Literal["power"]
     alternatives: list[Alternative]
     significance_levels: list[float]
+    common_random_numbers: bool = False
 
     @model_validator(mode="before")
     @classmethod
@@ -209,7 +257,8 @@ class PowerConfig(BaseExperimentConfig):
         Validate availability of required critical values.
 
         Ensures that all required (criterion, sample size) combinations
-        exist in storage before running power analysis.
+        exist in storage before running power analysis. All combinations
+        are looked up with one query and every missing one is reported.
 
         Parameters
         ----------
@@ -253,18 +302,20 @@ class PowerConfig(BaseExperimentConfig):
         if not hypothesis_part:
             raise ValueError(f"Unknown hypothesis '{hypothesis_name}' for constructing criterion name.")
 
+        full_names = {}
         for criterion in criteria:
             code = criterion["criterion_code"] if isinstance(criterion, dict) else criterion.criterion_code
-            full_name = f"{code.upper()}_{hypothesis_part}_{family_part}"
-            for size in sample_sizes:
-                if not checker.check_exists(full_name, size):
-                    for alpha in significance_levels:
-                        missing_combinations.append(
-                            f"  - Hypothesis: {hypothesis_name}, "
-                            f"Criterion: {code}, "
-                            f"Sample Size: {size}, "
-                            f"Significance: {alpha}"
-                        )
+            full_names[f"{code.upper()}_{hypothesis_part}_{family_part}"] = code
+
+        missing_pairs = checker.find_missing(full_names, sample_sizes)
+        for full_name, size in missing_pairs:
+            for alpha in significance_levels:
+                missing_combinations.append(
+                    f"  - Hypothesis: {hypothesis_name}, "
+                    f"Criterion: {full_names[full_name]}, "
+                    f"Sample Size: {size}, "
+                    f"Significance: {alpha}"
+                )
 
         if missing_combinations:
             unique_missing = sorted(list(set(missing_combinations)))
@@ -302,13 +353,62 @@ class TimeComplexityConfig(BaseExperimentConfig):
     ----------
     experiment_type : Literal["time_complexity"]
         Experiment type discriminator.
+    benchmark : bool
+        Measure execution times in benchmarking mode.
+    warmup_iterations : int
+        Untimed calls of a criterion before its first measurement.
+    min_timing_seconds : float
+        Minimum duration of the repeated calls timed for one sample.
+    cpu_affinity : list[int]
+        CPUs the measuring process is pinned to.
     """
 
     experiment_type: Literal["time_complexity"]
-    pass
+    benchmark: bool = False
+    warmup_iterations: int = Field(default=3, ge=0)
+    min_timing_seconds: float = Field(default=0.01, ge=0.0)
+    cpu_affinity: list[int] = Field(default_factory=list)
+
+    @field_validator("cpu_affinity")
+    @classmethod
+    def check_cpu_affinity(cls, value):
+        """
+        Validate CPU indices.
+
+        Parameters
+        ----------
+        value : list[int]
+            CPU indices.
+
+        Returns
+        -------
+        list[int]
+            Validated CPU indices.
+
+        Raises
+        ------
+        ValueError
+            If any CPU index is negative.
+        """
+        if any(cpu < 0 for cpu in value):
+            raise ValueError("CPU indices must be non-negative.")
+        return value
+
+
+class MemoryComplexityConfig(BaseExperimentConfig):
+    """
+    Configuration for memory complexity analysis experiments.
+
+    Attributes
+    ----------
+    experiment_type : Literal["memory_complexity"]
+        Experiment type discriminator.
+    """
+
+    experiment_type: Literal["memory_complexity"]
 
 
-Experiment = PowerConfig | CriticalValueConfig | TimeComplexityConfig
+Experiment = PowerConfig | CriticalValueConfig | TimeComplexityConfig | MemoryComplexityConfig
 
 
 class ExperimentConfig(BaseModel):
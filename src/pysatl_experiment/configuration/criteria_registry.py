@@ -0,0 +1,318 @@
+"""
+Registry of goodness-of-fit criteria implementations.
+
+The registry maps every hypothesis of ``pysatl_criterion`` to the short
+codes of its statistics and the import paths of their classes. It is
+built once by walking the statistic class hierarchy and cached on disk
+per installed ``pysatl_criterion`` version, so that validating
+configurations does not import the statistics at all.
+"""
+
+import functools
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass
+from importlib import import_module
+from importlib.metadata import PackageNotFoundError, version
+from pathlib import Path
+from typing import Any
+
+
+logger = logging.getLogger(__name__)
+
+CRITERIA_PACKAGE = "pysatl-criterion"
+CACHE_DIR_ENV = "PYSATL_EXPERIMENT_CACHE_DIR"
+
+
+@dataclass(frozen=True)
+class CriterionEntry:
+    """
+    Registered criterion implementation.
+
+    Attributes
+    ----------
+    short_code : str
+        Code used in experiment configurations, e.g. ``KS``.
+    code : str
+        Full statistic code.
+    class_path : str
+        Import path of the statistic class in ``module:ClassName`` form.
+    """
+
+    short_code: str
+    code: str
+    class_path: str
+
+    def load_class(self) -> type[Any]:
+        """
+        Import the statistic class.
+
+        Returns
+        -------
+        type[Any]
+            Statistic class.
+        """
+        return _import_path(self.class_path)
+
+
+@dataclass(frozen=True)
+class HypothesisEntry:
+    """
+    Criteria registered for a hypothesis.
+
+    Attributes
+    ----------
+    base_class : str
+        Import path of the abstract statistic class of the hypothesis.
+    criteria : dict[str, CriterionEntry]
+        Criteria by short code.
+    """
+
+    base_class: str
+    criteria: dict[str, CriterionEntry]
+
+
+class CriteriaRegistry:
+    """
+    Lookup of criteria by hypothesis and short code.
+
+    Parameters
+    ----------
+    hypotheses : dict[str, HypothesisEntry]
+        Criteria of each hypothesis, keyed by ``DistributionType`` value.
+    """
+
+    def __init__(self, hypotheses: dict[str, HypothesisEntry]) -> None:
+        """
+        Initialize criteria registry.
+
+        Parameters
+        ----------
+        hypotheses : dict[str, HypothesisEntry]
+            Criteria of each hypothesis, keyed by ``DistributionType`` value.
+        """
+        self.hypotheses = hypotheses
+        self._by_base_class = {entry.base_class: entry for entry in hypotheses.values()}
+
+    @classmethod
+    def build(cls) -> "CriteriaRegistry":
+        """
+        Build registry by walking subclasses of the hypothesis base classes.
+
+        Returns
+        -------
+        CriteriaRegistry
+            Registry of all concrete statistics of ``pysatl_criterion``.
+        """
+        from pysatl_criterion import DistributionType
+
+        hypotheses = {}
+        for distribution in DistributionType:
+            base_class = distribution.base_class
+            criteria = {}
+            for sub in base_class.__subclasses__():
+                if getattr(sub, "__abstractmethods__", None):
+                    continue
+                short_code = sub.code().split("_")[0]
+                criteria[short_code] = CriterionEntry(
+                    short_code=short_code,
+                    code=sub.code(),
+                    class_path=class_path(sub),
+                )
+            hypotheses[distribution.value] = HypothesisEntry(base_class=class_path(base_class), criteria=criteria)
+
+        return cls(hypotheses)
+
+    def short_codes(self, hypothesis: str) -> list[str]:
+        """
+        Get short codes of criteria of a hypothesis.
+
+        Parameters
+        ----------
+        hypothesis : str
+            ``DistributionType`` value of the hypothesis.
+
+        Returns
+        -------
+        list[str]
+            Short codes in registration order.
+
+        Raises
+        ------
+        ValueError
+            If the hypothesis is unknown.
+        """
+        return list(self._get_hypothesis(hypothesis).criteria)
+
+    def get(self, hypothesis: str, short_code: str) -> CriterionEntry | None:
+        """
+        Get criterion of a hypothesis by short code.
+
+        Parameters
+        ----------
+        hypothesis : str
+            ``DistributionType`` value of the hypothesis.
+        short_code : str
+            Criterion short code.
+
+        Returns
+        -------
+        CriterionEntry | None
+            Registered criterion, or None if the hypothesis has no such criterion.
+
+        Raises
+        ------
+        ValueError
+            If the hypothesis is unknown.
+        """
+        return self._get_hypothesis(hypothesis).criteria.get(short_code)
+
+    def criteria_of_base_class(self, base_class: type[Any]) -> dict[str, CriterionEntry]:
+        """
+        Get criteria deriving from an abstract statistic class.
+
+        Parameters
+        ----------
+        base_class : type[Any]
+            Abstract statistic class of a hypothesis.
+
+        Returns
+        -------
+        dict[str, CriterionEntry]
+            Criteria by short code, empty if the class is not registered.
+        """
+        entry = self._by_base_class.get(class_path(base_class))
+        return entry.criteria if entry is not None else {}
+
+    def to_dict(self) -> dict[str, Any]:
+        """
+        Serialize registry.
+
+        Returns
+        -------
+        dict[str, Any]
+            JSON-compatible representation.
+        """
+        return {name: asdict(entry) for name, entry in self.hypotheses.items()}
+
+    @classmethod
+    def from_dict(cls, data: dict[str, Any]) -> "CriteriaRegistry":
+        """
+        Deserialize registry.
+
+        Parameters
+        ----------
+        data : dict[str, Any]
+            Representation produced by :meth:`to_dict`.
+
+        Returns
+        -------
+        CriteriaRegistry
+            Restored registry.
+        """
+        return cls(
+            {
+                name: HypothesisEntry(
+                    base_class=entry["base_class"],
+                    criteria={code: CriterionEntry(**criterion) for code, criterion in entry["criteria"].items()},
+                )
+                for name, entry in data.items()
+            }
+        )
+
+    def _get_hypothesis(self, hypothesis: str) -> HypothesisEntry:
+        entry = self.hypotheses.get(hypothesis)
+        if entry is None:
+            raise ValueError(f"'{hypothesis}' is not a valid hypothesis. Valid values: {', '.join(self.hypotheses)}")
+        return entry
+
+
+def class_path(cls: type[Any]) -> str:
+    """
+    Get import path of a class.
+
+    Parameters
+    ----------
+    cls : type[Any]
+        Class defined at module level.
+
+    Returns
+    -------
+    str
+        Path in ``module:ClassName`` form.
+    """
+    return f"{cls.__module__}:{cls.__qualname__}"
+
+
+def get_cache_path() -> Path | None:
+    """
+    Get path of the on-disk registry cache.
+
+    Returns
+    -------
+    Path | None
+        Cache file named after the installed ``pysatl_criterion`` version,
+        or None if the version cannot be determined.
+
+    Notes
+    -----
+    The directory is taken from ``PYSATL_EXPERIMENT_CACHE_DIR``, then from
+    ``XDG_CACHE_HOME``, and defaults to ``~/.cache/pysatl_experiment``.
+    """
+    try:
+        criteria_version = version(CRITERIA_PACKAGE)
+    except PackageNotFoundError:
+        return None
+
+    cache_dir = os.environ.get(CACHE_DIR_ENV)
+    if cache_dir is None:
+        cache_dir = str(Path(os.environ.get("XDG_CACHE_HOME", Path.home() / ".cache")) / "pysatl_experiment")
+
+    return Path(cache_dir) / f"criteria-registry-{criteria_version}.json"
+
+
+@functools.cache
+def get_criteria_registry() -> CriteriaRegistry:
+    """
+    Return criteria registry shared by the current process.
+
+    The registry is read from the on-disk cache of the installed
+    ``pysatl_criterion`` version, or built and written to the cache.
+
+    Returns
+    -------
+    CriteriaRegistry
+        Process-wide criteria registry.
+    """
+    cache_path = get_cache_path()
+    if cache_path is not None and cache_path.is_file():
+        try:
+            return CriteriaRegistry.from_dict(json.loads(cache_path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable criteria registry cache %s: %s", cache_path, e)
+
+    registry = CriteriaRegistry.build()
+    if cache_path is not None:
+        _write_cache(registry, cache_path)
+
+    return registry
+
+
+def _write_cache(registry: CriteriaRegistry, cache_path: Path) -> None:
+    """Write registry cache atomically, logging instead of failing on errors."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        temporary_path.write_text(json.dumps(registry.to_dict()), encoding="utf-8")
+        temporary_path.replace(cache_path)
+    except OSError as e:
+        logger.debug("Cannot write criteria registry cache %s: %s", cache_path, e)
+
+
+def _import_path(path: str) -> Any:
+    module_name, _, qualname = path.partition(":")
+    target: Any = import_module(module_name)
+    for attribute in qualname.split("."):
+        target = getattr(target, attribute)
+    return target
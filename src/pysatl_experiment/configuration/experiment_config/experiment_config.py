@@ -1,12 +1,16 @@
 """Base experiment configuration model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from typing import Literal
 
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
 from pysatl_experiment.configuration.models.criterion import Criterion
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.configuration.models.hypothesis import Hypothesis
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.configuration.models.run_mode import RunMode
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
 from pysatl_experiment.configuration.models.step_type import StepType
 
 
@@ -39,8 +43,20 @@ class ExperimentConfig:
         Configured goodness-of-fit criteria.
     report_mode : ReportMode
         Report generation mode.
-    parallel_workers : int
-        Number of parallel worker processes.
+    parallel_workers : int | Literal["auto"]
+        Number of parallel worker processes, or ``"auto"`` to choose it
+        from available CPUs, memory and the footprint of tasks.
+    report_format : ReportFormat
+        Output format of the generated report.
+    chart_format : ChartFormat
+        Image format of charts stored as external report assets.
+    sample_codec : SampleCodec
+        Encoding of generated samples in storage.
+    nested_samples : bool
+        Generate samples of the largest size only and use their
+        prefixes for smaller sizes.
+    statistic_cache : bool
+        Reuse statistic values computed on the same samples by earlier runs.
     """
 
     experiment_type: ExperimentType
@@ -54,4 +70,9 @@ class ExperimentConfig:
     monte_carlo_count: int
     criteria: list[Criterion]
     report_mode: ReportMode
-    parallel_workers: int
+    parallel_workers: int | Literal["auto"]
+    report_format: ReportFormat = field(default=ReportFormat.PDF, kw_only=True)
+    chart_format: ChartFormat = field(default=ChartFormat.SVG, kw_only=True)
+    sample_codec: SampleCodec = field(default=SampleCodec.RAW_FLOAT64, kw_only=True)
+    nested_samples: bool = field(default=False, kw_only=True)
+    statistic_cache: bool = field(default=False, kw_only=True)
@@ -0,0 +1,10 @@
+"""Memory complexity experiment configuration model."""
+
+from dataclasses import dataclass
+
+from pysatl_experiment.configuration.experiment_config.experiment_config import ExperimentConfig
+
+
+@dataclass
+class MemoryComplexityExperimentConfig(ExperimentConfig):
+    """Memory complexity experiment configuration."""
@@ -1,6 +1,6 @@
 """Power experiment configuration model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pysatl_experiment.configuration.experiment_config.experiment_config import ExperimentConfig
 from pysatl_experiment.configuration.models.alternative import Alternative
@@ -17,7 +17,11 @@ class PowerExperimentConfig(ExperimentConfig):
         Alternative distributions used for power estimation.
     significance_levels : list[float]
         Significance levels used during testing.
+    common_random_numbers : bool
+        Store one uniform sample pool per size and derive samples of
+        alternatives supporting ``transform`` from it.
     """
 
     alternatives: list[Alternative]
     significance_levels: list[float]
+    common_random_numbers: bool = field(default=False, kw_only=True)
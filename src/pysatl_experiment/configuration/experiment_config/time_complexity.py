@@ -1,10 +1,30 @@
 """Time complexity experiment configuration model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pysatl_experiment.configuration.experiment_config.experiment_config import ExperimentConfig
 
 
 @dataclass
 class TimeComplexityExperimentConfig(ExperimentConfig):
-    """Time complexity experiment configuration."""
+    """
+    Time complexity experiment configuration.
+
+    Attributes
+    ----------
+    benchmark : bool
+        Measure execution times in benchmarking mode: warm up criteria,
+        repeat short calls, subtract timer overhead and run tasks one at
+        a time.
+    warmup_iterations : int
+        Untimed calls of a criterion before its first measurement.
+    min_timing_seconds : float
+        Minimum duration of the repeated calls timed for one sample.
+    cpu_affinity : list[int]
+        CPUs the measuring process is pinned to, empty to not pin it.
+    """
+
+    benchmark: bool = field(default=False, kw_only=True)
+    warmup_iterations: int = field(default=3, kw_only=True)
+    min_timing_seconds: float = field(default=0.01, kw_only=True)
+    cpu_affinity: list[int] = field(default_factory=list, kw_only=True)
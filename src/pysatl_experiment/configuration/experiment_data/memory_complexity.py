@@ -0,0 +1,11 @@
+"""Memory complexity experiment data model."""
+
+from dataclasses import dataclass
+
+from pysatl_experiment.configuration.experiment_config.memory_complexity import MemoryComplexityExperimentConfig
+from pysatl_experiment.configuration.experiment_data.experiment_data import ExperimentData
+
+
+@dataclass
+class MemoryComplexityExperimentData(ExperimentData[MemoryComplexityExperimentConfig]):
+    """Experiment data for memory usage profiling."""
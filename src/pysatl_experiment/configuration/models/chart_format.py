@@ -0,0 +1,22 @@
+"""Report chart image format definitions."""
+
+from enum import Enum
+
+
+class ChartFormat(Enum):
+    """Image formats of charts stored as external report assets."""
+
+    SVG = "svg"
+    PNG = "png"
+
+    @classmethod
+    def list(cls):
+        """
+        Return all enum values.
+
+        Returns
+        -------
+        list[str]
+            Available enum values.
+        """
+        return [member.value for member in cls]
@@ -10,6 +10,7 @@ class ExperimentType(str, Enum):
     CRITICAL_VALUE = "critical_value"
     POWER = "power"
     TIME_COMPLEXITY = "time_complexity"
+    MEMORY_COMPLEXITY = "memory_complexity"
 
     @classmethod
     def list(cls) -> list[str]:
@@ -0,0 +1,7 @@
+"""Parallel workers configuration values."""
+
+from typing import Literal
+
+
+AUTO_WORKERS: Literal["auto"] = "auto"
+"""Value of ``parallel_workers`` choosing the worker count from available resources."""
@@ -0,0 +1,32 @@
+"""Report output format definitions."""
+
+from enum import Enum
+
+
+class ReportFormat(Enum):
+    """
+    Report output formats.
+
+    Notes
+    -----
+    ``PDF`` renders the HTML report through ``xhtml2pdf``. ``HTML`` writes
+    a standalone HTML document with charts stored as external assets next
+    to it. ``HTML_PDF`` additionally draws a PDF directly with ``fpdf2``,
+    bypassing HTML layout.
+    """
+
+    PDF = "pdf"
+    HTML = "html"
+    HTML_PDF = "html-pdf"
+
+    @classmethod
+    def list(cls):
+        """
+        Return all enum values.
+
+        Returns
+        -------
+        list[str]
+            Available enum values.
+        """
+        return [member.value for member in cls]
@@ -0,0 +1,34 @@
+"""Stored sample encoding definitions."""
+
+from enum import Enum
+
+
+class SampleCodec(Enum):
+    """
+    Binary encodings of stored random value samples.
+
+    Raw codecs store little-endian floats as is, the others additionally
+    compress them. ``float32`` codecs halve the storage size at the cost
+    of precision. ``compressed-float-array`` is the zstd format with
+    a header used by databases created before codecs were introduced.
+    """
+
+    RAW_FLOAT64 = "raw-float64"
+    RAW_FLOAT32 = "raw-float32"
+    ZSTD_FLOAT64 = "zstd-float64"
+    ZSTD_FLOAT32 = "zstd-float32"
+    LZ4_FLOAT64 = "lz4-float64"
+    LZ4_FLOAT32 = "lz4-float32"
+    COMPRESSED_FLOAT_ARRAY = "compressed-float-array"
+
+    @classmethod
+    def list(cls):
+        """
+        Return all enum values.
+
+        Returns
+        -------
+        list[str]
+            Available enum values.
+        """
+        return [member.value for member in cls]
@@ -0,0 +1,10 @@
+"""Empirical complexity models of criteria execution times."""
+
+from .fitting import COMPLEXITY_CLASSES, ComplexityFit, fit_complexity
+
+
+__all__ = [
+    "COMPLEXITY_CLASSES",
+    "ComplexityFit",
+    "fit_complexity",
+]
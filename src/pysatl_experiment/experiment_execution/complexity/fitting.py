@@ -0,0 +1,200 @@
+"""
+Empirical complexity fitting of measured execution times.
+
+Execution times are aggregated into the geometric mean of every sample
+size and fitted on the log-log scale, where timing noise is roughly
+additive. The free power law ``t = c * n^k`` gives the empirical exponent
+with its confidence interval, and candidate complexity classes
+``t = c * g(n)`` are compared by the Akaike information criterion to
+select the model used for extrapolation.
+"""
+
+from collections.abc import Callable, Sequence
+from dataclasses import dataclass, field
+from typing import Final
+
+import numpy as np
+from scipy import stats
+
+
+COMPLEXITY_CLASSES: Final[dict[str, Callable[[np.ndarray], np.ndarray]]] = {
+    "O(1)": np.ones_like,
+    "O(log n)": np.log,
+    "O(n)": lambda n: n,
+    "O(n log n)": lambda n: n * np.log(n),
+    "O(n^2)": np.square,
+    "O(n^3)": lambda n: n**3,
+}
+"""Candidate complexity classes and their growth functions."""
+
+
+@dataclass
+class ComplexityFit:
+    """
+    Complexity models fitted to execution times of a criterion.
+
+    Attributes
+    ----------
+    model : str
+        Selected complexity class, a key of ``COMPLEXITY_CLASSES``.
+    model_constant : float
+        Constant ``c`` of the selected model ``t = c * g(n)`` in seconds.
+    model_constant_interval : tuple[float, float] | None
+        Confidence interval of the model constant, None if there are
+        too few sample sizes to estimate it.
+    exponent : float
+        Exponent ``k`` of the power law ``t = c * n^k``.
+    exponent_interval : tuple[float, float] | None
+        Confidence interval of the exponent, None if there are too few
+        sample sizes to estimate it.
+    constant : float
+        Constant ``c`` of the power law in seconds.
+    constant_interval : tuple[float, float] | None
+        Confidence interval of the power law constant.
+    r_squared : float
+        Coefficient of determination of the power law on the log-log scale.
+    aic : dict[str, float]
+        Akaike information criterion of every candidate class, lower is
+        better. Classes whose growth is not positive at every measured
+        sample size, e.g. ``O(log n)`` at size 1, are not fitted.
+    """
+
+    model: str
+    model_constant: float
+    model_constant_interval: tuple[float, float] | None
+    exponent: float
+    exponent_interval: tuple[float, float] | None
+    constant: float
+    constant_interval: tuple[float, float] | None
+    r_squared: float
+    aic: dict[str, float] = field(default_factory=dict)
+
+    def predict(self, sample_size: int) -> float:
+        """
+        Extrapolate execution time of a single sample with the selected model.
+
+        Parameters
+        ----------
+        sample_size : int
+            Sample size, not necessarily measured.
+
+        Returns
+        -------
+        float
+            Predicted execution time in seconds.
+        """
+        growth = COMPLEXITY_CLASSES[self.model](np.array([float(sample_size)]))
+        return self.model_constant * float(growth[0])
+
+
+def fit_complexity(
+    sample_sizes: Sequence[int],
+    times: Sequence[Sequence[float]],
+    confidence: float = 0.95,
+) -> ComplexityFit | None:
+    """
+    Fit complexity models to execution times measured for several sample sizes.
+
+    Parameters
+    ----------
+    sample_sizes : Sequence[int]
+        Measured sample sizes.
+    times : Sequence[Sequence[float]]
+        Execution times in seconds of every sample size.
+    confidence : float, default=0.95
+        Confidence level of the reported intervals.
+
+    Returns
+    -------
+    ComplexityFit | None
+        Fitted models, None if less than two sample sizes have positive
+        execution times.
+    """
+    sizes = []
+    log_times = []
+    for size, size_times in zip(sample_sizes, times, strict=True):
+        values = np.asarray(size_times, dtype=np.float64)
+        values = values[values > 0]
+        if values.size:
+            sizes.append(float(size))
+            log_times.append(float(np.mean(np.log(values))))
+
+    if len(set(sizes)) < 2:
+        return None
+
+    n = np.array(sizes)
+    y = np.array(log_times)
+    points = len(n)
+    quantile = _student_quantile(confidence, points - 2)
+
+    x = np.log(n)
+    x_mean = float(np.mean(x))
+    sxx = float(np.sum((x - x_mean) ** 2))
+    exponent = float(np.sum((x - x_mean) * (y - np.mean(y))) / sxx)
+    intercept = float(np.mean(y)) - exponent * x_mean
+    rss = float(np.sum((y - intercept - exponent * x) ** 2))
+    sst = float(np.sum((y - np.mean(y)) ** 2))
+
+    exponent_interval = None
+    constant_interval = None
+    if quantile is not None:
+        variance = rss / (points - 2)
+        exponent_error = quantile * np.sqrt(variance / sxx)
+        intercept_error = quantile * np.sqrt(variance * (1 / points + x_mean**2 / sxx))
+        exponent_interval = (exponent - float(exponent_error), exponent + float(exponent_error))
+        constant_interval = (float(np.exp(intercept - intercept_error)), float(np.exp(intercept + intercept_error)))
+
+    aic = {}
+    log_constants = {}
+    class_rss = {}
+    for name, growth in COMPLEXITY_CLASSES.items():
+        growth_values = growth(n)
+        if np.any(growth_values <= 0):
+            continue
+        log_growth = np.log(growth_values)
+        log_constants[name] = float(np.mean(y - log_growth))
+        class_rss[name] = float(np.sum((y - log_constants[name] - log_growth) ** 2))
+        aic[name] = points * float(np.log(max(class_rss[name] / points, np.finfo(np.float64).tiny))) + 2
+
+    model = min(aic, key=aic.__getitem__)
+    model_quantile = _student_quantile(confidence, points - 1)
+    model_constant_interval = None
+    if model_quantile is not None:
+        model_error = model_quantile * np.sqrt(class_rss[model] / (points - 1) / points)
+        model_constant_interval = (
+            float(np.exp(log_constants[model] - model_error)),
+            float(np.exp(log_constants[model] + model_error)),
+        )
+
+    return ComplexityFit(
+        model=model,
+        model_constant=float(np.exp(log_constants[model])),
+        model_constant_interval=model_constant_interval,
+        exponent=exponent,
+        exponent_interval=exponent_interval,
+        constant=float(np.exp(intercept)),
+        constant_interval=constant_interval,
+        r_squared=1 - rss / sst if sst > 0 else 1.0,
+        aic=aic,
+    )
+
+
+def _student_quantile(confidence: float, degrees_of_freedom: int) -> float | None:
+    """
+    Get two-sided Student t quantile.
+
+    Parameters
+    ----------
+    confidence : float
+        Confidence level.
+    degrees_of_freedom : int
+        Residual degrees of freedom.
+
+    Returns
+    -------
+    float | None
+        Quantile, None if there are no degrees of freedom left.
+    """
+    if degrees_of_freedom < 1:
+        return None
+    return float(stats.t.ppf((1 + confidence) / 2, degrees_of_freedom))
@@ -0,0 +1,21 @@
+"""Vectorized and cached critical value calculation shared by reports and power resolvers."""
+
+from .calculator import VectorizedCVCalculator, compute_critical_values, get_quantile_levels, sorted_quantiles
+from .resolver import (
+    CachedCriticalValueResolver,
+    VectorizedCriticalValueResolver,
+    create_critical_area,
+    get_process_critical_value_resolver,
+)
+
+
+__all__ = [
+    "CachedCriticalValueResolver",
+    "VectorizedCVCalculator",
+    "VectorizedCriticalValueResolver",
+    "compute_critical_values",
+    "create_critical_area",
+    "get_process_critical_value_resolver",
+    "get_quantile_levels",
+    "sorted_quantiles",
+]
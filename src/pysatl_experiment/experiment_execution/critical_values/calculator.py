@@ -0,0 +1,247 @@
+"""
+Vectorized critical value calculation.
+
+This module derives critical values from empirical limit distributions
+using NumPy array operations. All limit distributions of a criterion are
+stacked into a single 2-D array, each row is sorted once, and every
+requested quantile is extracted with a single ``np.take`` call.
+
+Results match :class:`pysatl_criterion.hypothesis_testing.critical_values.
+cv_calculator.cv_calculator.CVCalculator`, which computes linear
+interpolated quantiles over the distinct values of the empirical CDF.
+"""
+
+import numpy as np
+from pysatl_criterion.persistence.models.limit_distribution import ILimitDistributionStorage, LimitDistributionModel
+from pysatl_criterion.statistics.models import HypothesisType
+
+
+def get_quantile_levels(significance_levels: list[float], alternative: HypothesisType) -> np.ndarray:
+    """
+    Convert significance levels into quantile probabilities.
+
+    Parameters
+    ----------
+    significance_levels : list[float]
+        Significance levels (alpha values).
+    alternative : HypothesisType
+        Test alternative.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(levels,)`` for one-sided alternatives or
+        ``(levels, 2)`` with left and right probabilities for
+        two-sided alternatives.
+
+    Raises
+    ------
+    ValueError
+        If the alternative is unknown.
+    """
+    levels = np.asarray(significance_levels, dtype=np.float64)
+
+    if alternative == HypothesisType.RIGHT:
+        return 1 - levels
+    if alternative == HypothesisType.LEFT:
+        return levels
+    if alternative == HypothesisType.TWO_TAILED:
+        return np.stack([levels / 2, 1 - levels / 2], axis=-1)
+    raise ValueError(f"Unknown alternative: {alternative}.")
+
+
+def sorted_quantiles(sorted_values: np.ndarray, probabilities: np.ndarray) -> np.ndarray:
+    """
+    Compute linear interpolated quantiles of row-wise sorted data.
+
+    Parameters
+    ----------
+    sorted_values : np.ndarray
+        Array of shape ``(rows, n)`` with each row sorted ascending.
+    probabilities : np.ndarray
+        Quantile probabilities of arbitrary shape.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(rows, *probabilities.shape)``.
+
+    Notes
+    -----
+    The interpolation replicates ``np.quantile(method="linear")`` so the
+    results are bit-identical, but skips the partitioning step because
+    the rows are already sorted.
+    """
+    n = sorted_values.shape[1]
+    positions = probabilities.ravel() * (n - 1)
+    lower = np.floor(positions).astype(np.intp)
+    upper = np.minimum(lower + 1, n - 1)
+    gamma = positions - lower
+
+    bounds = np.take(sorted_values, np.concatenate([lower, upper]), axis=1)
+    below, above = bounds[:, : lower.size], bounds[:, lower.size :]
+
+    diff = above - below
+    result = below + diff * gamma
+    np.subtract(above, diff * (1 - gamma), out=result, where=gamma >= 0.5)
+
+    return result.reshape(sorted_values.shape[0], *probabilities.shape)
+
+
+def compute_critical_values(
+    distributions: np.ndarray | list[list[float]],
+    significance_levels: list[float],
+    alternative: HypothesisType = HypothesisType.RIGHT,
+) -> np.ndarray:
+    """
+    Compute critical values for a batch of limit distributions.
+
+    Parameters
+    ----------
+    distributions : np.ndarray | list[list[float]]
+        Limit distributions, one per row. Rows may differ in length.
+    significance_levels : list[float]
+        Significance levels (alpha values).
+    alternative : HypothesisType, default=HypothesisType.RIGHT
+        Test alternative.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape ``(rows, levels)`` for one-sided alternatives or
+        ``(rows, levels, 2)`` with left and right critical values for
+        two-sided alternatives.
+
+    Notes
+    -----
+    Rows of equal length without repeated values are processed in one
+    vectorized pass. Rows containing ties are reduced to their distinct
+    values first, as done by the empirical CDF, and handled one by one.
+    """
+    probabilities = get_quantile_levels(significance_levels, alternative)
+
+    rows = [np.asarray(row, dtype=np.float64) for row in distributions]
+    result = np.empty((len(rows), *probabilities.shape), dtype=np.float64)
+    if not rows:
+        return result
+
+    if len({row.size for row in rows}) == 1:
+        sorted_values = np.sort(np.stack(rows), axis=1)
+        has_ties = np.any(np.diff(sorted_values, axis=1) == 0, axis=1)
+        plain = ~has_ties
+        if plain.any():
+            result[plain] = sorted_quantiles(sorted_values[plain], probabilities)
+        pending = np.flatnonzero(has_ties)
+    else:
+        pending = np.arange(len(rows))
+
+    for index in pending:
+        distinct_values = np.unique(rows[index])
+        result[index] = sorted_quantiles(distinct_values[np.newaxis, :], probabilities)[0]
+
+    return result
+
+
+class VectorizedCVCalculator:
+    """
+    Critical value calculator operating on whole experiments.
+
+    The calculator fetches the limit distributions of all requested
+    criteria with one storage query per sample size and computes
+    critical values for every significance level at once.
+
+    Parameters
+    ----------
+    limit_distribution_storage : ILimitDistributionStorage
+        Storage with limit distributions.
+    """
+
+    def __init__(self, limit_distribution_storage: ILimitDistributionStorage):
+        """
+        Initialize calculator.
+
+        Parameters
+        ----------
+        limit_distribution_storage : ILimitDistributionStorage
+            Storage with limit distributions.
+        """
+        self.limit_distribution_storage = limit_distribution_storage
+
+    def load_limit_distributions(
+        self,
+        criterion_codes: list[str],
+        sample_sizes: list[int],
+    ) -> dict[str, list[LimitDistributionModel]]:
+        """
+        Load limit distributions for all criteria and sample sizes.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_sizes : list[int]
+            Sample sizes.
+
+        Returns
+        -------
+        dict[str, list[LimitDistributionModel]]
+            Limit distributions per criterion ordered as ``sample_sizes``.
+
+        Raises
+        ------
+        ValueError
+            If any (criterion, sample size) distribution is missing.
+            All missing pairs are reported at once.
+        """
+        by_size = {
+            size: {
+                model.criterion_code: model
+                for model in self.limit_distribution_storage.get_bulk_data(criterion_codes, size)
+            }
+            for size in sample_sizes
+        }
+
+        missing = [(code, size) for code in criterion_codes for size in sample_sizes if code not in by_size[size]]
+        if missing:
+            pairs = ", ".join(f"({code}, {size})" for code, size in missing)
+            raise ValueError(f"Limit distributions for (criterion, sample size) pairs do not exist: {pairs}.")
+
+        return {code: [by_size[size][code] for size in sample_sizes] for code in criterion_codes}
+
+    def calculate_critical_values(
+        self,
+        criterion_codes: list[str],
+        sample_sizes: list[int],
+        significance_levels: list[float],
+        alternative: HypothesisType = HypothesisType.RIGHT,
+    ) -> dict[str, np.ndarray]:
+        """
+        Calculate critical values for all criteria, sizes and levels.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_sizes : list[int]
+            Sample sizes.
+        significance_levels : list[float]
+            Significance levels (alpha values).
+        alternative : HypothesisType, default=HypothesisType.RIGHT
+            Test alternative.
+
+        Returns
+        -------
+        dict[str, np.ndarray]
+            Critical values per criterion with shape ``(sizes, levels)``,
+            or ``(sizes, levels, 2)`` for two-sided alternatives.
+        """
+        distributions = self.load_limit_distributions(criterion_codes, sample_sizes)
+
+        return {
+            code: compute_critical_values(
+                [model.results_statistics for model in models],
+                significance_levels,
+                alternative,
+            )
+            for code, models in distributions.items()
+        }
@@ -0,0 +1,360 @@
+"""
+Vectorized and cached critical value resolvers.
+
+This module adapts the vectorized critical value calculation to the
+``CriticalValueResolver`` interface used by ``GoodnessOfFitTest``,
+so that power experiments and critical value reports share the same
+quantile extraction code.
+
+``GoodnessOfFitTest`` resolves critical values once per tested sample.
+:class:`CachedCriticalValueResolver` keeps resolved critical areas in an
+in-process LRU cache and reads precomputed critical values before falling
+back to limit distributions, so a power worker process loads each limit
+distribution at most once.
+"""
+
+import functools
+from collections import OrderedDict
+
+import numpy as np
+from pysatl_criterion.hypothesis_testing.critical_values.critical_area.critical_areas import (
+    LeftCriticalArea,
+    RightCriticalArea,
+    TwoSidedCriticalArea,
+)
+from pysatl_criterion.hypothesis_testing.critical_values.critical_area.model import CriticalArea
+from pysatl_criterion.hypothesis_testing.critical_values.resolver.model import CriticalValueResolver
+from pysatl_criterion.persistence.models.limit_distribution import ILimitDistributionStorage
+from pysatl_criterion.persistence.sqlalchemy.datastorage import AlchemyLimitDistributionStorage
+from pysatl_criterion.statistics.models import HypothesisType
+from typing_extensions import override
+
+from pysatl_experiment.experiment_execution.critical_values.calculator import compute_critical_values
+from pysatl_experiment.persistence.critical_value_storage import AlchemyCriticalValueStorage
+from pysatl_experiment.persistence.models.critical_value import CriticalValueModel, ICriticalValueStorage
+
+
+class VectorizedCriticalValueResolver(CriticalValueResolver):
+    """
+    Critical value resolver backed by vectorized quantile extraction.
+
+    Parameters
+    ----------
+    limit_distribution_storage : ILimitDistributionStorage
+        Storage with limit distributions.
+    """
+
+    def __init__(self, limit_distribution_storage: ILimitDistributionStorage):
+        """
+        Initialize resolver.
+
+        Parameters
+        ----------
+        limit_distribution_storage : ILimitDistributionStorage
+            Storage with limit distributions.
+        """
+        self.limit_distribution_storage = limit_distribution_storage
+
+    @override
+    def resolve_bulk(
+        self,
+        criterion_codes: list[str],
+        sample_size: int,
+        sl: float,
+        alternative: HypothesisType = HypothesisType.RIGHT,
+    ) -> dict[str, CriticalArea]:
+        """
+        Resolve critical areas for several criteria at once.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_size : int
+            Sample size.
+        sl : float
+            Significance level.
+        alternative : HypothesisType, default=HypothesisType.RIGHT
+            Test alternative.
+
+        Returns
+        -------
+        dict[str, CriticalArea]
+            Critical areas for criteria with existing limit distributions.
+        """
+        limit_distributions = self.limit_distribution_storage.get_bulk_data(criterion_codes, sample_size)
+        if not limit_distributions:
+            return {}
+
+        critical_values = compute_critical_values(
+            [distribution.results_statistics for distribution in limit_distributions],
+            [sl],
+            alternative,
+        )
+
+        return {
+            distribution.criterion_code: create_critical_area(values[0], alternative)
+            for distribution, values in zip(limit_distributions, critical_values, strict=True)
+        }
+
+
+class CachedCriticalValueResolver(CriticalValueResolver):
+    """
+    Critical value resolver with an in-process LRU cache.
+
+    Critical areas are looked up in the following order:
+        1. in-memory cache,
+        2. precomputed critical value storage (if provided),
+        3. limit distributions via :class:`VectorizedCriticalValueResolver`.
+
+    Misses are cached as well, so criteria without limit distributions
+    are not queried again for every tested sample.
+
+    Cache entries are keyed by criterion code, sample size, significance
+    level and alternative. Criterion parameters are intentionally ignored:
+    the ``CriticalValueResolver`` interface only passes criterion codes,
+    and both limit distribution and critical value bulk lookups select
+    rows by code as well.
+
+    Parameters
+    ----------
+    limit_distribution_storage : ILimitDistributionStorage
+        Storage with limit distributions.
+    critical_value_storage : ICriticalValueStorage | None, default=None
+        Storage with precomputed critical values.
+    maxsize : int, default=1024
+        Maximum number of cached critical areas.
+    """
+
+    def __init__(
+        self,
+        limit_distribution_storage: ILimitDistributionStorage,
+        critical_value_storage: ICriticalValueStorage | None = None,
+        maxsize: int = 1024,
+    ):
+        """
+        Initialize resolver.
+
+        Parameters
+        ----------
+        limit_distribution_storage : ILimitDistributionStorage
+            Storage with limit distributions.
+        critical_value_storage : ICriticalValueStorage | None, default=None
+            Storage with precomputed critical values.
+        maxsize : int, default=1024
+            Maximum number of cached critical areas.
+
+        Raises
+        ------
+        ValueError
+            If ``maxsize`` is not positive.
+        """
+        if maxsize <= 0:
+            raise ValueError("Cache size must be positive.")
+
+        self.critical_value_storage = critical_value_storage
+        self.maxsize = maxsize
+        self._fallback = VectorizedCriticalValueResolver(limit_distribution_storage)
+        self._cache: OrderedDict[tuple[str, int, float, HypothesisType], CriticalArea | None] = OrderedDict()
+
+    @override
+    def resolve_bulk(
+        self,
+        criterion_codes: list[str],
+        sample_size: int,
+        sl: float,
+        alternative: HypothesisType = HypothesisType.RIGHT,
+    ) -> dict[str, CriticalArea]:
+        """
+        Resolve critical areas for several criteria at once.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_size : int
+            Sample size.
+        sl : float
+            Significance level.
+        alternative : HypothesisType, default=HypothesisType.RIGHT
+            Test alternative.
+
+        Returns
+        -------
+        dict[str, CriticalArea]
+            Critical areas for criteria with known critical values.
+        """
+        resolved: dict[str, CriticalArea | None] = {}
+        missing = []
+        for code in criterion_codes:
+            key = (code, sample_size, sl, alternative)
+            if key in self._cache:
+                self._cache.move_to_end(key)
+                resolved[code] = self._cache[key]
+            else:
+                missing.append(code)
+
+        if missing:
+            found = self._resolve_from_storage(missing, sample_size, sl, alternative)
+            not_stored = [code for code in missing if code not in found]
+            if not_stored:
+                found.update(self._fallback.resolve_bulk(not_stored, sample_size, sl, alternative))
+
+            for code in missing:
+                resolved[code] = found.get(code)
+                self._put((code, sample_size, sl, alternative), resolved[code])
+
+        return {code: area for code, area in resolved.items() if area is not None}
+
+    def clear(self) -> None:
+        """Drop all cached critical areas."""
+        self._cache.clear()
+
+    def _resolve_from_storage(
+        self,
+        criterion_codes: list[str],
+        sample_size: int,
+        sl: float,
+        alternative: HypothesisType,
+    ) -> dict[str, CriticalArea]:
+        """
+        Read precomputed critical values.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_size : int
+            Sample size.
+        sl : float
+            Significance level.
+        alternative : HypothesisType
+            Test alternative.
+
+        Returns
+        -------
+        dict[str, CriticalArea]
+            Critical areas found in the critical value storage.
+        """
+        if self.critical_value_storage is None:
+            return {}
+
+        models = self.critical_value_storage.get_bulk_data(criterion_codes, sample_size, sl, alternative.value)
+
+        areas = {}
+        for model in models:
+            critical_value = _get_stored_critical_value(model, alternative)
+            if critical_value is not None:
+                areas[model.criterion_code] = create_critical_area(critical_value, alternative)
+        return areas
+
+    def _put(self, key: tuple[str, int, float, HypothesisType], area: CriticalArea | None) -> None:
+        """
+        Store critical area in cache evicting the least recently used entry.
+
+        Parameters
+        ----------
+        key : tuple[str, int, float, HypothesisType]
+            Criterion code, sample size, significance level and alternative.
+        area : CriticalArea | None
+            Resolved critical area or None for unknown criteria.
+        """
+        self._cache[key] = area
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+
+@functools.cache
+def get_process_critical_value_resolver(storage_connection: str) -> CachedCriticalValueResolver:
+    """
+    Return critical value resolver shared by all tasks of the current process.
+
+    Storages are created and initialized once per process and connection,
+    so consecutive power tasks reuse both the database session and the
+    critical value cache.
+
+    Parameters
+    ----------
+    storage_connection : str
+        SQLAlchemy database connection string.
+
+    Returns
+    -------
+    CachedCriticalValueResolver
+        Process-wide critical value resolver.
+    """
+    limit_distribution_storage = AlchemyLimitDistributionStorage(storage_connection)
+    limit_distribution_storage.init()
+
+    critical_value_storage = AlchemyCriticalValueStorage(storage_connection)
+    critical_value_storage.init()
+
+    return CachedCriticalValueResolver(limit_distribution_storage, critical_value_storage)
+
+
+def _get_stored_critical_value(
+    model: CriticalValueModel, alternative: HypothesisType
+) -> float | tuple[float, float] | None:
+    """
+    Extract critical value for alternative from stored model.
+
+    Parameters
+    ----------
+    model : CriticalValueModel
+        Stored critical value.
+    alternative : HypothesisType
+        Test alternative.
+
+    Returns
+    -------
+    float | tuple[float, float] | None
+        Critical value, left and right critical values for two-sided
+        alternatives, or None if the model lacks required values.
+    """
+    if alternative == HypothesisType.RIGHT:
+        return model.upper_value
+    if alternative == HypothesisType.LEFT:
+        return model.lower_value
+    if model.lower_value is None or model.upper_value is None:
+        return None
+    return model.lower_value, model.upper_value
+
+
+def create_critical_area(
+    critical_value: float | tuple[float, float] | np.ndarray, alternative: HypothesisType
+) -> CriticalArea:
+    """
+    Build a critical area from computed critical values.
+
+    Parameters
+    ----------
+    critical_value : float | tuple[float, float] | np.ndarray
+        Critical value, or left and right critical values
+        for two-sided alternatives.
+    alternative : HypothesisType
+        Test alternative.
+
+    Returns
+    -------
+    CriticalArea
+        Critical area of the test.
+
+    Raises
+    ------
+    ValueError
+        If the alternative is unknown or the critical value does not
+        match the alternative.
+    """
+    if alternative == HypothesisType.TWO_TAILED:
+        if isinstance(critical_value, float):
+            raise ValueError("Two-sided alternative requires left and right critical values.")
+        left, right = critical_value
+        return TwoSidedCriticalArea(float(left), float(right))
+    if alternative not in (HypothesisType.RIGHT, HypothesisType.LEFT):
+        raise ValueError(f"Unknown alternative: {alternative}.")
+    if isinstance(critical_value, tuple):
+        raise ValueError("One-sided alternative requires a single critical value.")
+    if alternative == HypothesisType.RIGHT:
+        return RightCriticalArea(float(critical_value))
+    return LeftCriticalArea(float(critical_value))
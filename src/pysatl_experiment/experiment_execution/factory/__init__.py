@@ -2,6 +2,7 @@
 
 from .abstract_experiment_factory import AbstractExperimentFactory
 from .critical_value import CriticalValueExperimentFactory
+from .memory_complexity import MemoryComplexityExperimentFactory
 from .power import PowerExperimentFactory
 from .time_complexity import TimeComplexityExperimentFactory
 
@@ -9,6 +10,7 @@ from .time_complexity import TimeComplexityExperimentFactory
 __all__ = [
     "AbstractExperimentFactory",
     "CriticalValueExperimentFactory",
+    "MemoryComplexityExperimentFactory",
     "PowerExperimentFactory",
     "TimeComplexityExperimentFactory",
 ]
@@ -7,11 +7,11 @@ types and provides extension points for experiment-specific step creation.
 """
 
 from abc import ABC, abstractmethod
+from pathlib import Path
 from typing import Any, Generic, TypeVar, cast
 
 from pysatl_criterion.persistence.models.base import IDataStorage
 from pysatl_criterion.persistence.models.limit_distribution import LimitDistributionQuery
-from pysatl_criterion.persistence.sqlalchemy.datastorage import AlchemyLimitDistributionStorage
 from pysatl_criterion.statistics import (
     AbstractBetaGofStatistic,
     AbstractExponentialityGofStatistic,
@@ -24,14 +24,19 @@ from pysatl_criterion.statistics import (
 )
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.criteria_registry import get_criteria_registry
 from pysatl_experiment.configuration.experiment_data.experiment_data import ExperimentData
+from pysatl_experiment.configuration.models.alternative import Alternative
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.configuration.models.hypothesis import Hypothesis
+from pysatl_experiment.configuration.models.parallel_workers import AUTO_WORKERS
 from pysatl_experiment.configuration.models.run_mode import RunMode
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
 from pysatl_experiment.experiment_execution.experiment_steps import ExperimentSteps
 from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
 from pysatl_experiment.experiment_execution.generator.generators import (
+    BASE_POOL_GENERATOR_NAME,
+    BASE_POOL_GENERATOR_PARAMETERS,
     BetaRVSGenerator,
     ExponentialGenerator,
     GammaGenerator,
@@ -40,14 +45,30 @@ from pysatl_experiment.experiment_execution.generator.generators import (
     TRVSGenerator,
     UniformGenerator,
     WeibullGenerator,
+    create_generator,
 )
+from pysatl_experiment.experiment_execution.parallel.resources import (
+    WorkerAllocation,
+    estimate_sample_memory,
+    plan_workers,
+    worker_count_record,
+)
+from pysatl_experiment.experiment_execution.progress import ProgressTracker, get_status_path
+from pysatl_experiment.loggers.rich_console import get_rich_console
 from pysatl_experiment.persistence.criterion_power_storage import AlchemyPowerStorage
 from pysatl_experiment.persistence.experiment_storage import AlchemyExperimentStorage
+from pysatl_experiment.persistence.limit_distribution_storage import AlchemyLimitDistributionStorage
+from pysatl_experiment.persistence.memory_complexity_storage import AlchemyMemoryComplexityStorage
 from pysatl_experiment.persistence.models.experiment import ExperimentQuery, IExperimentStorage
+from pysatl_experiment.persistence.models.memory_complexity import MemoryComplexityQuery
 from pysatl_experiment.persistence.models.power import PowerQuery
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllQuery
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage, make_pool_key
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 from pysatl_experiment.persistence.models.time_complexity import TimeComplexityQuery
 from pysatl_experiment.persistence.random_values_storage import AlchemyRandomValuesStorage
+from pysatl_experiment.persistence.statistic_cache_storage import AlchemyStatisticCacheStorage
+from pysatl_experiment.persistence.task_profile_storage import AlchemyTaskProfileStorage
 from pysatl_experiment.persistence.time_complexity_storage import AlchemyTimeComplexityStorage
 
 
@@ -63,6 +84,8 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
 
     def __init__(self, experiment_data: D):
         self.experiment_data = experiment_data
+        self._progress_tracker: ProgressTracker | None = None
+        self._experiment_id: int | None = None
 
     def create_experiment_steps(self) -> ExperimentSteps:
         """
@@ -76,13 +99,15 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         data_storage = self._init_data_storage()
         result_storage = self._init_result_storage()
         experiment_storage = self._init_experiment_storage()
+        statistic_cache = self._init_statistic_cache_storage()
 
         run_mode = self.experiment_data.config.run_mode
         if run_mode == RunMode.OVERWRITE:
-            self._delete_sample_data(data_storage)
+            self._delete_sample_data(data_storage, statistic_cache)
             self._delete_results_from_storage(result_storage)
 
         experiment_id = self._get_experiment_id(experiment_storage)
+        self._experiment_id = experiment_id
         experiment_steps = ExperimentSteps(
             experiment_id=experiment_id,
             experiment_storage=experiment_storage,
@@ -99,7 +124,13 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
             experiment_steps.generation_step = generation_step
 
         if not is_execution_step_done:
-            execution_step = self._create_execution_step(data_storage, result_storage, experiment_storage)
+            execution_step = self._create_execution_step(
+                data_storage,
+                result_storage,
+                experiment_storage,
+                statistic_cache if self.experiment_data.config.statistic_cache else None,
+                self._init_task_profile_storage(),
+            )
             experiment_steps.execution_step = execution_step
 
         report_building_step = self._create_report_building_step(result_storage)
@@ -132,6 +163,8 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         data_storage: IRandomValuesStorage,
         result_storage: RS,
         experiment_storage: IExperimentStorage,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
     ) -> E:
         """
         Create an execution step.
@@ -146,6 +179,12 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
             Experiment result storage.
         experiment_storage : IExperimentStorage
             Experiment metadata storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Storage of statistic values reused across runs, None to
+            compute all statistic values.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log
+            the profile.
 
         Returns
         -------
@@ -175,27 +214,34 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         """
         pass
 
-    def _delete_sample_data(self, data_storage: IRandomValuesStorage) -> None:
+    def _delete_sample_data(
+        self, data_storage: IRandomValuesStorage, statistic_cache: IStatisticCacheStorage | None = None
+    ) -> None:
         """
         Delete generated sample data.
 
         Selects an appropriate cleanup strategy depending on the current
-        experiment type and removes stored random samples.
+        experiment type and removes stored random samples together with
+        statistic values cached for them.
 
         Parameters
         ----------
         data_storage : IRandomValuesStorage
             Random values storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Statistic cache storage.
         """
         experiment_type = self.experiment_data.config.experiment_type
         if experiment_type == ExperimentType.CRITICAL_VALUE:
-            self._delete_hypothesis_sample_data(data_storage)
+            self._delete_hypothesis_sample_data(data_storage, statistic_cache)
         elif experiment_type == ExperimentType.POWER:
-            self._delete_alternatives_sample_data(data_storage)
-        elif experiment_type == ExperimentType.TIME_COMPLEXITY:
-            self._delete_hypothesis_sample_data(data_storage)
+            self._delete_alternatives_sample_data(data_storage, statistic_cache)
+        elif experiment_type in (ExperimentType.TIME_COMPLEXITY, ExperimentType.MEMORY_COMPLEXITY):
+            self._delete_hypothesis_sample_data(data_storage, statistic_cache)
 
-    def _delete_hypothesis_sample_data(self, data_storage: IRandomValuesStorage) -> None:
+    def _delete_hypothesis_sample_data(
+        self, data_storage: IRandomValuesStorage, statistic_cache: IStatisticCacheStorage | None = None
+    ) -> None:
         """
         Delete samples generated under the null hypothesis.
 
@@ -206,9 +252,11 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         ----------
         data_storage : IRandomValuesStorage
             Random values storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Statistic cache storage.
         """
         generator_name, generator_parameters, _ = self._get_hypothesis_generator_metadata()
-        sample_sizes = self.experiment_data.config.sample_sizes
+        sample_sizes = self._get_generation_sample_sizes()
 
         for sample_size in sample_sizes:
             all_data_query = RandomValuesAllQuery(
@@ -217,32 +265,133 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
                 sample_size=sample_size,
             )
             data_storage.delete_all_data(all_data_query)
+            if statistic_cache is not None:
+                statistic_cache.delete_pool_data(make_pool_key(generator_name, generator_parameters, sample_size))
 
-    def _delete_alternatives_sample_data(self, data_storage: IRandomValuesStorage) -> None:
+    def _delete_alternatives_sample_data(
+        self, data_storage: IRandomValuesStorage, statistic_cache: IStatisticCacheStorage | None = None
+    ) -> None:
         """
         Delete samples generated under alternative distributions.
 
         Removes all samples associated with configured alternative
-        generators and sample sizes.
+        generators and sample sizes, including the base uniform pool
+        in common random numbers mode.
 
         Parameters
         ----------
         data_storage : IRandomValuesStorage
             Random values storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Statistic cache storage.
         """
-        alternatives_config = self.experiment_data.config.alternatives
-        sample_sizes = self.experiment_data.config.sample_sizes
+        sample_pools = self._get_alternative_sample_pools()
+        sample_sizes = self._get_generation_sample_sizes()
 
         for sample_size in sample_sizes:
-            for alternative in alternatives_config:
-                generator_name = alternative.generator_name
-                generator_parameters = alternative.parameters
+            for generator_name, generator_parameters in sample_pools:
                 all_data_query = RandomValuesAllQuery(
                     generator_name=generator_name,
                     generator_parameters=generator_parameters,
                     sample_size=sample_size,
                 )
                 data_storage.delete_all_data(all_data_query)
+                if statistic_cache is not None:
+                    statistic_cache.delete_pool_data(make_pool_key(generator_name, generator_parameters, sample_size))
+
+    def _get_generation_sample_sizes(self) -> list[int]:
+        """
+        Get sizes of samples to generate and store.
+
+        Returns
+        -------
+        list[int]
+            Only the largest sample size in nested samples mode,
+            otherwise all configured sample sizes.
+        """
+        config = self.experiment_data.config
+        if config.nested_samples:
+            return [max(config.sample_sizes)]
+        return list(config.sample_sizes)
+
+    def _get_pool_sample_size(self) -> int | None:
+        """
+        Get size of stored samples shared by all sample sizes.
+
+        Returns
+        -------
+        int | None
+            The largest sample size in nested samples mode, otherwise None.
+
+        Notes
+        -----
+        In nested samples mode a sample of size n is the prefix of length n
+        of the stored sample, which is valid for generators drawing
+        i.i.d. values.
+        """
+        config = self.experiment_data.config
+        return max(config.sample_sizes) if config.nested_samples else None
+
+    def _get_worker_allocation(self) -> WorkerAllocation:
+        """
+        Get worker pool size and memory budget of the execution step.
+
+        Returns
+        -------
+        WorkerAllocation
+            Configured worker count without memory budget, or in ``auto``
+            mode a worker count chosen from available CPUs and memory,
+            with a budget throttling concurrency of large-sample tasks.
+        """
+        config = self.experiment_data.config
+        if config.parallel_workers != AUTO_WORKERS:
+            return WorkerAllocation(workers=int(config.parallel_workers))
+
+        pool_sample_size = self._get_pool_sample_size()
+        return plan_workers(
+            [estimate_sample_memory(size, config.monte_carlo_count, pool_sample_size) for size in config.sample_sizes]
+        )
+
+    def _get_alternative_sample_pools(self) -> list[tuple[str, list[float]]]:
+        """
+        Get generators whose samples are stored for alternatives.
+
+        Returns
+        -------
+        list[tuple[str, list[float]]]
+            Generator names and parameters of stored sample pools. In common
+            random numbers mode alternatives supporting ``transform`` share
+            the base uniform pool, other alternatives keep their own pools.
+        """
+        pools: list[tuple[str, list[float]]] = []
+        for alternative in self.experiment_data.config.alternatives:
+            if self._uses_base_pool(alternative):
+                pool = (BASE_POOL_GENERATOR_NAME, list(BASE_POOL_GENERATOR_PARAMETERS))
+            else:
+                pool = (alternative.generator_name, alternative.parameters)
+            if pool not in pools:
+                pools.append(pool)
+        return pools
+
+    def _uses_base_pool(self, alternative: Alternative) -> bool:
+        """
+        Check whether alternative samples are derived from the base uniform pool.
+
+        Parameters
+        ----------
+        alternative : Alternative
+            Alternative distribution configuration.
+
+        Returns
+        -------
+        bool
+            True in common random numbers mode if the alternative generator
+            supports ``transform``.
+        """
+        if not self.experiment_data.config.common_random_numbers:
+            return False
+        generator = self._get_generator_class_object(alternative.generator_name, alternative.parameters)
+        return generator.supports_transform()
 
     def _get_hypothesis_generator_metadata(self) -> tuple[str, list[float], AbstractRVSGenerator]:
         """
@@ -330,25 +479,23 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         Notes
         -----
         Criteria config consists of criterion from user, criterion code and statistics class object.
+        Implementations are looked up in the cached criteria registry.
         """
         config = self.experiment_data.config
-        base_class = self._HYPOTHESIS_TO_BASE_CLASS[config.hypothesis]
-        short_code_to_subclass = {}
-        for sub in base_class.__subclasses__():
-            if getattr(sub, "__abstractmethods__", None):
-                continue
-            short_code_to_subclass[sub.code().split("_")[0]] = sub
+        registered_criteria = get_criteria_registry().criteria_of_base_class(
+            self._HYPOTHESIS_TO_BASE_CLASS[config.hypothesis]
+        )
 
         criteria_config = []
         for criterion in config.criteria:
-            if criterion.criterion_code not in short_code_to_subclass:
+            entry = registered_criteria.get(criterion.criterion_code)
+            if entry is None:
                 continue
-            sub = short_code_to_subclass[criterion.criterion_code]
             criteria_config.append(
                 CriterionConfig(
                     criterion=criterion,
-                    criterion_code=sub.code(),
-                    statistics_class_object=sub(),
+                    criterion_code=entry.code,
+                    statistics_class_object=entry.load_class()(),
                 )
             )
 
@@ -393,6 +540,13 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
                 statistics_codes=statistics_codes,
                 sample_sizes=sample_sizes,
                 monte_carlo_count=monte_carlo_count,
+                benchmark=self.experiment_data.config.benchmark,
+            )
+        elif experiment_type == ExperimentType.MEMORY_COMPLEXITY:
+            queries = self._create_memory_complexity_queries(
+                statistics_codes=statistics_codes,
+                sample_sizes=sample_sizes,
+                monte_carlo_count=monte_carlo_count,
             )
         else:
             raise ValueError("Unknown experiment type")
@@ -441,6 +595,7 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         statistics_codes: list[str],
         sample_sizes: list[int],
         monte_carlo_count: int,
+        benchmark: bool = False,
     ) -> list[TimeComplexityQuery]:
         """
         Create time complexity storage queries.
@@ -453,6 +608,8 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
             Sample sizes.
         monte_carlo_count : int
             Monte Carlo iteration count.
+        benchmark : bool, default=False
+            Whether times were measured in benchmarking mode.
 
         Returns
         -------
@@ -467,11 +624,46 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
                     criterion_parameters=[],
                     sample_size=size,
                     monte_carlo_count=monte_carlo_count,
+                    benchmark=benchmark,
                 )
                 queries.append(query)
 
         return queries
 
+    @staticmethod
+    def _create_memory_complexity_queries(
+        statistics_codes: list[str],
+        sample_sizes: list[int],
+        monte_carlo_count: int,
+    ) -> list[MemoryComplexityQuery]:
+        """
+        Create memory complexity storage queries.
+
+        Parameters
+        ----------
+        statistics_codes : list[str]
+            Statistic implementation codes.
+        sample_sizes : list[int]
+            Sample sizes.
+        monte_carlo_count : int
+            Monte Carlo iteration count.
+
+        Returns
+        -------
+        list[MemoryComplexityQuery]
+            Queries identifying memory complexity results.
+        """
+        return [
+            MemoryComplexityQuery(
+                criterion_code=code,
+                criterion_parameters=[],
+                sample_size=size,
+                monte_carlo_count=monte_carlo_count,
+            )
+            for code in statistics_codes
+            for size in sample_sizes
+        ]
+
     def _create_power_queries(
         self,
         statistics_codes: list[str],
@@ -547,11 +739,16 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
 
         significance_levels = []
         alternatives = {}
+        common_random_numbers = False
+        benchmark = False
         if experiment_type == ExperimentType.CRITICAL_VALUE:
             significance_levels = config.significance_levels
         elif experiment_type == ExperimentType.POWER:
             significance_levels = config.significance_levels
             alternatives = {alternative.generator_name: alternative.parameters for alternative in config.alternatives}
+            common_random_numbers = config.common_random_numbers
+        elif experiment_type == ExperimentType.TIME_COMPLEXITY:
+            benchmark = config.benchmark
 
         query = ExperimentQuery(
             experiment_type=experiment_type.value,
@@ -567,7 +764,10 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
             criteria=criteria,
             significance_levels=significance_levels,
             alternatives=alternatives,
-            parallel_workers=config.parallel_workers,
+            parallel_workers=worker_count_record(config.parallel_workers),
+            nested_samples=config.nested_samples,
+            common_random_numbers=common_random_numbers,
+            benchmark=benchmark,
         )
 
         experiment_id = storage.get_experiment_id(query)
@@ -585,12 +785,62 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         IRandomValuesStorage
             Initialized random values storage.
         """
-        storage_connection = self.experiment_data.config.storage_connection
-        data_storage = AlchemyRandomValuesStorage(storage_connection)
+        config = self.experiment_data.config
+        data_storage = AlchemyRandomValuesStorage(config.storage_connection, codec=config.sample_codec)
         data_storage.init()
 
         return data_storage
 
+    def _init_statistic_cache_storage(self) -> IStatisticCacheStorage:
+        """
+        Initialize statistic cache storage.
+
+        Returns
+        -------
+        IStatisticCacheStorage
+            Initialized statistic cache storage.
+        """
+        statistic_cache = AlchemyStatisticCacheStorage(self.experiment_data.config.storage_connection)
+        statistic_cache.init()
+
+        return statistic_cache
+
+    def _get_progress_tracker(self) -> ProgressTracker:
+        """
+        Get tracker reporting progress of experiment steps.
+
+        Returns
+        -------
+        ProgressTracker
+            Tracker shared by the steps of the experiment. It renders
+            progress bars to the rich console and publishes progress to
+            the ``<experiment name>.progress.json`` status file in the
+            results directory.
+        """
+        if self._progress_tracker is None:
+            self._progress_tracker = ProgressTracker(
+                status_path=get_status_path(Path(self.experiment_data.results_path), self.experiment_data.name),
+                experiment_name=self.experiment_data.name,
+                experiment_id=self._experiment_id,
+                console=get_rich_console(stderr=True),
+            )
+
+        return self._progress_tracker
+
+    def _init_task_profile_storage(self) -> ITaskProfileStorage:
+        """
+        Initialize task profile storage.
+
+        Returns
+        -------
+        ITaskProfileStorage
+            Initialized task profile storage.
+        """
+        task_profile_storage = AlchemyTaskProfileStorage(self.experiment_data.config.storage_connection)
+        task_profile_storage.init()
+
+        return task_profile_storage
+
     def _init_experiment_storage(self) -> IExperimentStorage:
         """
         Initialize experiment metadata storage.
@@ -637,6 +887,10 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
             time_complexity_storage = AlchemyTimeComplexityStorage(storage_connection)
             time_complexity_storage.init()
             return cast(RS, time_complexity_storage)
+        elif experiment_type == ExperimentType.MEMORY_COMPLEXITY:
+            memory_complexity_storage = AlchemyMemoryComplexityStorage(storage_connection)
+            memory_complexity_storage.init()
+            return cast(RS, memory_complexity_storage)
         else:
             raise ValueError(f"Unsupported experiment type: {experiment_type}")
 
@@ -668,15 +922,7 @@ class AbstractExperimentFactory(Generic[D, G, E, R, RS], ABC):
         Parameters are passed to the constructor in the same order as
         specified by the experiment configuration.
         """
-        subclasses = AbstractRVSGenerator.__subclasses__()
-        for sub in subclasses:
-            sub_name = sub.__name__.upper()
-            if sub_name == generator_name:
-                # Arguments are passed in the order of the parameters list,
-                # which is set by the user in CLI
-                return cast(type[AbstractRVSGenerator], sub)(*generator_parameters)
-
-        raise ValueError(f"Unknown generator: {generator_name}")
+        return create_generator(generator_name, generator_parameters)
 
 
 # TODO: warnings!!
@@ -6,7 +6,11 @@ constructing all experiment steps required for critical value
 estimation.
 """
 
-from pysatl_criterion.persistence.models.limit_distribution import ILimitDistributionStorage, LimitDistributionQuery
+from pysatl_criterion.persistence.models.limit_distribution import (
+    CriticalValueQuery,
+    ILimitDistributionStorage,
+    LimitDistributionQuery,
+)
 
 from pysatl_experiment.configuration.experiment_data.critical_value import CriticalValueExperimentData
 from pysatl_experiment.experiment_execution.factory.abstract_experiment_factory import AbstractExperimentFactory
@@ -21,6 +25,8 @@ from pysatl_experiment.experiment_execution.step.generation import GenerationSte
 from pysatl_experiment.experiment_execution.step.report_building.critical_value import CriticalValueReportBuildingStep
 from pysatl_experiment.persistence.models.experiment import IExperimentStorage
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllQuery
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 
 
 class CriticalValueExperimentFactory(
@@ -82,7 +88,7 @@ class CriticalValueExperimentFactory(
 
         step_config = []
 
-        for sample_size in config.sample_sizes:
+        for sample_size in self._get_generation_sample_sizes():
             query = RandomValuesAllQuery(
                 generator_name=generator_name,
                 generator_parameters=generator_parameters,
@@ -102,7 +108,9 @@ class CriticalValueExperimentFactory(
             else:
                 continue
 
-        generation_step = GenerationStep(step_config=step_config, data_storage=data_storage)
+        generation_step = GenerationStep(
+            step_config=step_config, data_storage=data_storage, progress=self._get_progress_tracker()
+        )
 
         return generation_step
 
@@ -111,6 +119,8 @@ class CriticalValueExperimentFactory(
         data_storage: IRandomValuesStorage,
         result_storage: ILimitDistributionStorage,
         experiment_storage: IExperimentStorage,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
     ) -> CriticalValueExecutionStep:
         """
         Create a critical value execution step.
@@ -127,6 +137,12 @@ class CriticalValueExperimentFactory(
             Critical value result storage.
         experiment_storage : IExperimentStorage
             Experiment metadata storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Storage of statistic values reused across runs, None to
+            compute all statistic values.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log
+            the profile.
 
         Returns
         -------
@@ -136,7 +152,8 @@ class CriticalValueExperimentFactory(
         Notes
         -----
         Existing critical value distributions are reused and excluded
-        from execution planning.
+        from execution planning. Distributions stored with a smaller
+        Monte-Carlo count are extended with the missing statistic values.
         """
         config = self.experiment_data.config
         experiment_id = self._get_experiment_id(experiment_storage)
@@ -155,7 +172,12 @@ class CriticalValueExperimentFactory(
                 result = result_storage.get_data(query)
                 if result is None:
                     statistics = criterion_config.statistics_class_object
-                    step_data = CriticalValueStepData(statistics=statistics, sample_size=sample_size)
+                    step_data = CriticalValueStepData(
+                        statistics=statistics,
+                        criterion_parameters=criterion_config.criterion.parameters,
+                        sample_size=sample_size,
+                        stored_monte_carlo_count=self._get_extendable_count(result_storage, query),
+                    )
                     step_config.append(step_data)
 
         hypothesis_generator_name, hypothesis_generator_parameters, _ = self._get_hypothesis_generator_metadata()
@@ -164,6 +186,7 @@ class CriticalValueExperimentFactory(
             parameters=hypothesis_generator_parameters,
         )
 
+        workers = self._get_worker_allocation()
         execution_step = CriticalValueExecutionStep(
             experiment_id=experiment_id,
             hypothesis_generator_data=hypothesis_generator_data,
@@ -172,13 +195,45 @@ class CriticalValueExperimentFactory(
             data_storage=data_storage,
             result_storage=result_storage,
             storage_connection=config.storage_connection,
-            parallel_workers=config.parallel_workers,
+            parallel_workers=workers.workers,
+            pool_sample_size=self._get_pool_sample_size(),
+            statistic_cache=statistic_cache,
+            task_profile_storage=task_profile_storage,
+            progress=self._get_progress_tracker(),
+            memory_budget=workers.memory_budget,
         )
 
         # TODO: template method with other factories??
 
         return execution_step
 
+    @staticmethod
+    def _get_extendable_count(result_storage: ILimitDistributionStorage, query: LimitDistributionQuery) -> int:
+        """
+        Get Monte-Carlo count of the stored distribution extendable to the queried one.
+
+        Parameters
+        ----------
+        result_storage : ILimitDistributionStorage
+            Critical value result storage.
+        query : LimitDistributionQuery
+            Query with the requested Monte-Carlo count.
+
+        Returns
+        -------
+        int
+            Monte-Carlo count of the largest complete stored distribution
+            below the requested one, 0 if there is none.
+        """
+        stored = result_storage.get_data_for_cv(
+            CriticalValueQuery(criterion_code=query.criterion_code, sample_size=query.sample_size)
+        )
+        if stored is None or not 0 < stored.monte_carlo_count < query.monte_carlo_count:
+            return 0
+        if len(stored.results_statistics) != stored.monte_carlo_count:
+            return 0
+        return int(stored.monte_carlo_count)
+
     def _create_report_building_step(
         self, result_storage: ILimitDistributionStorage
     ) -> CriticalValueReportBuildingStep:
@@ -207,4 +262,7 @@ class CriticalValueExperimentFactory(
             result_storage=result_storage,
             results_path=self.experiment_data.results_path,
             with_chart=self.experiment_data.config.report_mode,
+            report_format=self.experiment_data.config.report_format,
+            chart_format=self.experiment_data.config.chart_format,
+            storage_connection=self.experiment_data.config.storage_connection,
         )
@@ -0,0 +1,215 @@
+"""
+Memory complexity experiment factory.
+
+This module contains the factory implementation responsible for
+constructing experiment steps required to evaluate memory
+complexity of statistical criteria.
+"""
+
+from pysatl_experiment.configuration.experiment_data.memory_complexity import MemoryComplexityExperimentData
+from pysatl_experiment.experiment_execution.factory.abstract_experiment_factory import AbstractExperimentFactory
+from pysatl_experiment.experiment_execution.step.execution.common.hypothesis_generator_data import (  # noqa: E501
+    HypothesisGeneratorData,
+)
+from pysatl_experiment.experiment_execution.step.execution.memory_complexity import (
+    MemoryComplexityExecutionStep,
+    MemoryComplexityStepData,
+)
+from pysatl_experiment.experiment_execution.step.generation import GenerationStep, GenerationStepData
+from pysatl_experiment.experiment_execution.step.report_building.memory_complexity import (
+    MemoryComplexityReportBuildingStep,
+)
+from pysatl_experiment.persistence.models.experiment import IExperimentStorage
+from pysatl_experiment.persistence.models.memory_complexity import IMemoryComplexityStorage, MemoryComplexityQuery
+from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllQuery
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
+
+
+class MemoryComplexityExperimentFactory(
+    AbstractExperimentFactory[
+        MemoryComplexityExperimentData,
+        GenerationStep,
+        MemoryComplexityExecutionStep,
+        MemoryComplexityReportBuildingStep,
+        IMemoryComplexityStorage,
+    ]
+):
+    """
+    Factory for memory complexity experiments.
+
+    Creates generation, execution and report-building steps required
+    for measuring memory usage of statistical criteria for different
+    sample sizes.
+    """
+
+    def __init__(self, experiment_data: MemoryComplexityExperimentData):
+        """
+        Initialize the factory.
+
+        Parameters
+        ----------
+        experiment_data : MemoryComplexityExperimentData
+            Memory complexity experiment configuration and execution
+            metadata.
+        """
+        super().__init__(experiment_data)
+
+    def _create_generation_step(self, data_storage: IRandomValuesStorage) -> GenerationStep:
+        """
+        Create a sample generation step.
+
+        Determines which samples generated under the configured null
+        hypothesis are missing from storage and creates generation
+        tasks only for the required number of additional samples.
+
+        Parameters
+        ----------
+        data_storage : IRandomValuesStorage
+            Random values storage.
+
+        Returns
+        -------
+        GenerationStep
+            Configured generation step.
+        """
+        config = self.experiment_data.config
+        monte_carlo_count = config.monte_carlo_count
+        generator_name, generator_parameters, generator = self._get_hypothesis_generator_metadata()
+
+        step_config = []
+
+        for sample_size in self._get_generation_sample_sizes():
+            query = RandomValuesAllQuery(
+                generator_name=generator_name,
+                generator_parameters=generator_parameters,
+                sample_size=sample_size,
+            )
+            rvs_count = data_storage.get_rvs_count(query)
+            if rvs_count < monte_carlo_count:
+                needed_rvs_count = monte_carlo_count - rvs_count
+                step_data = GenerationStepData(
+                    generator=generator,
+                    generator_name=generator_name,
+                    generator_parameters=generator_parameters,
+                    sample_size=sample_size,
+                    count=needed_rvs_count,
+                )
+                step_config.append(step_data)
+            else:
+                continue
+
+        generation_step = GenerationStep(
+            step_config=step_config, data_storage=data_storage, progress=self._get_progress_tracker()
+        )
+
+        return generation_step
+
+    def _create_execution_step(
+        self,
+        data_storage: IRandomValuesStorage,
+        result_storage: IMemoryComplexityStorage,
+        experiment_storage: IExperimentStorage,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
+    ) -> MemoryComplexityExecutionStep:
+        """
+        Create a memory complexity execution step.
+
+        Determines which criterion and sample-size combinations do not
+        yet have stored memory measurements and prepares execution tasks
+        for those combinations.
+
+        Parameters
+        ----------
+        data_storage : IRandomValuesStorage
+            Random values storage.
+        result_storage : IMemoryComplexityStorage
+            Memory complexity result storage.
+        experiment_storage : IExperimentStorage
+            Experiment metadata storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Not used, memory usage is always measured.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log
+            the profile.
+
+        Returns
+        -------
+        MemoryComplexityExecutionStep
+            Configured execution step.
+        """
+        config = self.experiment_data.config
+        experiment_id = self._get_experiment_id(experiment_storage)
+        monte_carlo_count = config.monte_carlo_count
+        criteria_config = self._get_criteria_config()
+
+        step_config: list[MemoryComplexityStepData] = []
+        for criterion_config in criteria_config:
+            for sample_size in config.sample_sizes:
+                query = MemoryComplexityQuery(
+                    criterion_code=criterion_config.criterion_code,
+                    criterion_parameters=criterion_config.criterion.parameters,
+                    sample_size=sample_size,
+                    monte_carlo_count=monte_carlo_count,
+                )
+                result = result_storage.get_data(query)
+                if result is None:
+                    statistics = criterion_config.statistics_class_object
+                    step_data = MemoryComplexityStepData(statistics=statistics, sample_size=sample_size)
+                    step_config.append(step_data)
+
+        hypothesis_generator_name, hypothesis_generator_parameters, _ = self._get_hypothesis_generator_metadata()
+        hypothesis_generator_data = HypothesisGeneratorData(
+            generator_name=hypothesis_generator_name,
+            parameters=hypothesis_generator_parameters,
+        )
+
+        workers = self._get_worker_allocation()
+        execution_step = MemoryComplexityExecutionStep(
+            experiment_id=experiment_id,
+            hypothesis_generator_data=hypothesis_generator_data,
+            step_config=step_config,
+            monte_carlo_count=monte_carlo_count,
+            data_storage=data_storage,
+            result_storage=result_storage,
+            storage_connection=config.storage_connection,
+            parallel_workers=workers.workers,
+            pool_sample_size=self._get_pool_sample_size(),
+            task_profile_storage=task_profile_storage,
+            progress=self._get_progress_tracker(),
+            memory_budget=workers.memory_budget,
+        )
+
+        return execution_step
+
+    def _create_report_building_step(
+        self, result_storage: IMemoryComplexityStorage
+    ) -> MemoryComplexityReportBuildingStep:
+        """
+        Create a report-building step.
+
+        Configures report generation using stored memory usage
+        measurements and configured sample sizes.
+
+        Parameters
+        ----------
+        result_storage : IMemoryComplexityStorage
+            Memory complexity result storage.
+
+        Returns
+        -------
+        MemoryComplexityReportBuildingStep
+            Configured report-building step.
+        """
+        return MemoryComplexityReportBuildingStep(
+            report_name=self.experiment_data.name,
+            criteria_config=self._get_criteria_config(),
+            sample_sizes=self.experiment_data.config.sample_sizes,
+            monte_carlo_count=self.experiment_data.config.monte_carlo_count,
+            result_storage=result_storage,
+            results_path=self.experiment_data.results_path,
+            with_chart=self.experiment_data.config.report_mode,
+            report_format=self.experiment_data.config.report_format,
+            chart_format=self.experiment_data.config.chart_format,
+        )
@@ -14,6 +14,8 @@ from pysatl_experiment.experiment_execution.step.report_building.power import Po
 from pysatl_experiment.persistence.models.experiment import IExperimentStorage
 from pysatl_experiment.persistence.models.power import IPowerStorage, PowerQuery
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllQuery
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 
 
 class PowerExperimentFactory(
@@ -51,6 +53,8 @@ class PowerExperimentFactory(
         Determines which samples corresponding to alternative
         distributions are missing from storage and creates generation
         tasks only for the required number of additional samples.
+        In common random numbers mode alternatives supporting
+        ``transform`` share a single uniform sample pool.
 
         Parameters
         ----------
@@ -66,10 +70,8 @@ class PowerExperimentFactory(
         monte_carlo_count = config.monte_carlo_count
 
         step_config = []
-        for sample_size in config.sample_sizes:
-            for alternative in config.alternatives:
-                generator_name = alternative.generator_name
-                generator_parameters = alternative.parameters
+        for sample_size in self._get_generation_sample_sizes():
+            for generator_name, generator_parameters in self._get_alternative_sample_pools():
                 query = RandomValuesAllQuery(
                     generator_name=generator_name,
                     generator_parameters=generator_parameters,
@@ -90,7 +92,9 @@ class PowerExperimentFactory(
                 else:
                     continue
 
-        generation_step = GenerationStep(step_config=step_config, data_storage=data_storage)
+        generation_step = GenerationStep(
+            step_config=step_config, data_storage=data_storage, progress=self._get_progress_tracker()
+        )
 
         return generation_step
 
@@ -99,6 +103,8 @@ class PowerExperimentFactory(
         data_storage: IRandomValuesStorage,
         result_storage: IPowerStorage,
         experiment_storage: IExperimentStorage,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
     ) -> PowerExecutionStep:
         """
         Create a statistical power execution step.
@@ -106,7 +112,8 @@ class PowerExperimentFactory(
         Determines which combinations of criterion, sample size,
         significance level and alternative distribution do not yet
         have stored power estimates and prepares execution tasks for
-        those combinations.
+        those combinations. Estimates stored with a smaller Monte-Carlo
+        count are extended with the missing simulations.
 
         Parameters
         ----------
@@ -116,6 +123,12 @@ class PowerExperimentFactory(
             Power result storage.
         experiment_storage : IExperimentStorage
             Experiment metadata storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Storage of statistic values reused across runs, None to
+            compute all statistic values.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log
+            the profile.
 
         Returns
         -------
@@ -148,12 +161,16 @@ class PowerExperimentFactory(
                             statistics = criterion_config.statistics_class_object
                             step_data = PowerStepData(
                                 statistics=statistics,
+                                criterion_parameters=criterion_config.criterion.parameters,
                                 sample_size=sample_size,
                                 alternative=alternative,
                                 significance_level=significance_level,
+                                from_base_pool=self._uses_base_pool(alternative),
+                                stored_monte_carlo_count=result_storage.get_extendable_count(query),
                             )
                             step_config.append(step_data)
 
+        workers = self._get_worker_allocation()
         execution_step = PowerExecutionStep(
             experiment_id=experiment_id,
             step_config=step_config,
@@ -161,7 +178,12 @@ class PowerExperimentFactory(
             data_storage=data_storage,
             result_storage=result_storage,
             storage_connection=storage_connection,
-            parallel_workers=config.parallel_workers,
+            parallel_workers=workers.workers,
+            pool_sample_size=self._get_pool_sample_size(),
+            statistic_cache=statistic_cache,
+            task_profile_storage=task_profile_storage,
+            progress=self._get_progress_tracker(),
+            memory_budget=workers.memory_budget,
         )
 
         return execution_step
@@ -197,4 +219,6 @@ class PowerExperimentFactory(
             result_storage=result_storage,
             results_path=self.experiment_data.results_path,
             with_chart=self.experiment_data.config.report_mode,
+            report_format=self.experiment_data.config.report_format,
+            chart_format=self.experiment_data.config.chart_format,
         )
@@ -17,8 +17,11 @@ from pysatl_experiment.experiment_execution.step.execution.time_complexity impor
 )
 from pysatl_experiment.experiment_execution.step.generation import GenerationStep, GenerationStepData
 from pysatl_experiment.experiment_execution.step.report_building.time_complexity import TimeComplexityReportBuildingStep
+from pysatl_experiment.experiment_execution.worker.benchmark import BenchmarkSettings
 from pysatl_experiment.persistence.models.experiment import IExperimentStorage
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllQuery
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 from pysatl_experiment.persistence.models.time_complexity import ITimeComplexityStorage, TimeComplexityQuery
 
 
@@ -75,7 +78,7 @@ class TimeComplexityExperimentFactory(
 
         step_config = []
 
-        for sample_size in config.sample_sizes:
+        for sample_size in self._get_generation_sample_sizes():
             query = RandomValuesAllQuery(
                 generator_name=generator_name,
                 generator_parameters=generator_parameters,
@@ -95,7 +98,9 @@ class TimeComplexityExperimentFactory(
             else:
                 continue
 
-        generation_step = GenerationStep(step_config=step_config, data_storage=data_storage)
+        generation_step = GenerationStep(
+            step_config=step_config, data_storage=data_storage, progress=self._get_progress_tracker()
+        )
 
         return generation_step
 
@@ -104,6 +109,8 @@ class TimeComplexityExperimentFactory(
         data_storage: IRandomValuesStorage,
         result_storage: ITimeComplexityStorage,
         experiment_storage: IExperimentStorage,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
     ) -> TimeComplexityExecutionStep:
         """
         Create a time complexity execution step.
@@ -120,6 +127,11 @@ class TimeComplexityExperimentFactory(
             Time complexity result storage.
         experiment_storage : IExperimentStorage
             Experiment metadata storage.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Not used, execution times are always measured.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log
+            the profile.
 
         Returns
         -------
@@ -139,11 +151,16 @@ class TimeComplexityExperimentFactory(
                     criterion_parameters=criterion_config.criterion.parameters,
                     sample_size=sample_size,
                     monte_carlo_count=monte_carlo_count,
+                    benchmark=config.benchmark,
                 )
                 result = result_storage.get_data(query)
                 if result is None:
                     statistics = criterion_config.statistics_class_object
-                    step_data = TimeComplexityStepData(statistics=statistics, sample_size=sample_size)
+                    step_data = TimeComplexityStepData(
+                        statistics=statistics,
+                        sample_size=sample_size,
+                        stored_monte_carlo_count=result_storage.get_extendable_count(query),
+                    )
                     step_config.append(step_data)
 
         hypothesis_generator_name, hypothesis_generator_parameters, _ = self._get_hypothesis_generator_metadata()
@@ -152,6 +169,7 @@ class TimeComplexityExperimentFactory(
             parameters=hypothesis_generator_parameters,
         )
 
+        workers = self._get_worker_allocation()
         execution_step = TimeComplexityExecutionStep(
             experiment_id=experiment_id,
             hypothesis_generator_data=hypothesis_generator_data,
@@ -160,11 +178,36 @@ class TimeComplexityExperimentFactory(
             data_storage=data_storage,
             result_storage=result_storage,
             storage_connection=config.storage_connection,
-            parallel_workers=config.parallel_workers,
+            parallel_workers=workers.workers,
+            pool_sample_size=self._get_pool_sample_size(),
+            task_profile_storage=task_profile_storage,
+            progress=self._get_progress_tracker(),
+            benchmark=self._get_benchmark_settings(),
+            memory_budget=workers.memory_budget,
         )
 
         return execution_step
 
+    def _get_benchmark_settings(self) -> BenchmarkSettings | None:
+        """
+        Get benchmarking mode settings of execution time measurements.
+
+        Returns
+        -------
+        BenchmarkSettings | None
+            Settings from the experiment configuration, None if the
+            benchmarking mode is disabled.
+        """
+        config = self.experiment_data.config
+        if not config.benchmark:
+            return None
+
+        return BenchmarkSettings(
+            warmup_iterations=config.warmup_iterations,
+            min_timing_seconds=config.min_timing_seconds,
+            cpu_affinity=list(config.cpu_affinity),
+        )
+
     def _create_report_building_step(self, result_storage: ITimeComplexityStorage) -> TimeComplexityReportBuildingStep:
         """
         Create a report-building step.
@@ -190,4 +233,7 @@ class TimeComplexityExperimentFactory(
             result_storage=result_storage,
             results_path=self.experiment_data.results_path,
             with_chart=self.experiment_data.config.report_mode,
+            report_format=self.experiment_data.config.report_format,
+            chart_format=self.experiment_data.config.chart_format,
+            benchmark=self.experiment_data.config.benchmark,
         )
@@ -6,7 +6,8 @@ sampling function from ``pysatl_criterion`` and provides:
 
 - unique experiment code generation,
 - unified sample generation API,
-- parameterized distribution configuration.
+- parameterized distribution configuration,
+- inverse transform of uniform values for common random numbers.
 
 All generators inherit from ``AbstractRVSGenerator``.
 
@@ -73,6 +74,10 @@ NormalGenerator
     Normal distribution generator.
 """
 
+from typing import Final, cast
+
+import numpy as np
+from numpy.typing import ArrayLike, NDArray
 from pysatl_criterion.core.distributions.beta import generate_beta
 from pysatl_criterion.core.distributions.cauchy import generate_cauchy
 from pysatl_criterion.core.distributions.chi2 import generate_chi2
@@ -94,11 +99,90 @@ from pysatl_criterion.core.distributions.truncnormal import generate_truncnorm
 from pysatl_criterion.core.distributions.tukey import generate_tukey
 from pysatl_criterion.core.distributions.uniform import generate_uniform
 from pysatl_criterion.core.distributions.weibull import generate_weibull
+from scipy.stats import (
+    beta,
+    cauchy,
+    chi2,
+    expon,
+    exponweib,
+    gamma,
+    gompertz,
+    gumbel_r,
+    invgauss,
+    laplace,
+    logistic,
+    lognorm,
+    norm,
+    rice,
+    t,
+    truncnorm,
+    tukeylambda,
+)
 from typing_extensions import override
 
 from pysatl_experiment.experiment_execution.generator.model import AbstractRVSGenerator
 
 
+BASE_POOL_GENERATOR_NAME: Final[str] = "UNIFORMGENERATOR"
+"""Generator of the uniform pool shared by alternatives in common random numbers mode."""
+
+BASE_POOL_GENERATOR_PARAMETERS: Final[tuple[float, ...]] = (0.0, 1.0)
+"""Parameters of the shared uniform pool generator."""
+
+
+def create_generator(generator_name: str, generator_parameters: list[float]) -> AbstractRVSGenerator:
+    """Create a generator instance by name.
+
+    Parameters
+    ----------
+    generator_name : str
+        Generator class name in upper case.
+    generator_parameters : list[float]
+        Generator constructor parameters in constructor order.
+
+    Returns
+    -------
+    AbstractRVSGenerator
+        Configured generator instance.
+
+    Raises
+    ------
+    ValueError
+        If the generator implementation cannot be found.
+    """
+    for sub in AbstractRVSGenerator.__subclasses__():
+        if sub.__name__.upper() == generator_name:
+            # Arguments are passed in the order of the parameters list,
+            # which is set by the user in CLI
+            return cast(type[AbstractRVSGenerator], sub)(*generator_parameters)
+
+    raise ValueError(f"Unknown generator: {generator_name}")
+
+
+def _open_unit_interval(uniforms: ArrayLike) -> NDArray:
+    """Move uniform values away from the bounds of the unit interval.
+
+    Quantile functions of unbounded distributions are infinite at 0,
+    which is a possible value of stored uniform samples.
+    """
+    eps = np.finfo(np.float64).eps
+    return np.clip(np.asarray(uniforms, dtype=np.float64), eps, 1 - eps)
+
+
+def _contaminated_norm_ppf(uniforms: NDArray, p: float, loc: float, scale: float) -> NDArray:
+    """Quantile transform of the mixture of N(loc, scale^2) with weight p and N(0, 1).
+
+    A single uniform value selects the component, ``u < p``, and is then
+    rescaled to a uniform value inside the selected component.
+    """
+    u = _open_unit_interval(uniforms)
+    result = np.empty_like(u)
+    contaminated = u < p
+    result[contaminated] = norm.ppf(_open_unit_interval(u[contaminated] / p), loc=loc, scale=scale)
+    result[~contaminated] = norm.ppf(_open_unit_interval((u[~contaminated] - p) / (1 - p)))
+    return result
+
+
 class BetaRVSGenerator(AbstractRVSGenerator):
     """Beta distribution random value generator.
 
@@ -125,6 +209,11 @@ class BetaRVSGenerator(AbstractRVSGenerator):
         """Generate beta-distributed random sample."""
         return generate_beta(size=size, a=self.a, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into beta distributed values."""
+        return beta.ppf(_open_unit_interval(uniforms), a=self.a, b=self.b)
+
 
 class CauchyRVSGenerator(AbstractRVSGenerator):
     """Cauchy distribution random value generator.
@@ -152,6 +241,11 @@ class CauchyRVSGenerator(AbstractRVSGenerator):
         """Generate Cauchy-distributed random sample."""
         return generate_cauchy(size=size, t=self.t, s=self.s)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Cauchy distributed values."""
+        return cauchy.ppf(_open_unit_interval(uniforms), loc=self.t, scale=self.s)
+
 
 class LaplaceRVSGenerator(AbstractRVSGenerator):
     """Laplace distribution random value generator.
@@ -179,6 +273,11 @@ class LaplaceRVSGenerator(AbstractRVSGenerator):
         """Generate Laplace-distributed random sample."""
         return generate_laplace(size=size, t=self.t, s=self.s)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Laplace distributed values."""
+        return laplace.ppf(_open_unit_interval(uniforms), loc=self.t, scale=self.s)
+
 
 class LogisticRVSGenerator(AbstractRVSGenerator):
     """Logistic distribution random value generator.
@@ -206,6 +305,11 @@ class LogisticRVSGenerator(AbstractRVSGenerator):
         """Generate logistic-distributed random sample."""
         return generate_logistic(size=size, t=self.t, s=self.s)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into logistic distributed values."""
+        return logistic.ppf(_open_unit_interval(uniforms), loc=self.t, scale=self.s)
+
 
 class TRVSGenerator(AbstractRVSGenerator):
     """Student's t-distribution random value generator.
@@ -230,6 +334,11 @@ class TRVSGenerator(AbstractRVSGenerator):
         """Generate Student's t-distributed random sample."""
         return generate_t(size=size, df=self.df)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Student's t distributed values."""
+        return t.ppf(_open_unit_interval(uniforms), df=self.df)
+
 
 class TukeyRVSGenerator(AbstractRVSGenerator):
     """Tukey distribution random value generator.
@@ -254,6 +363,11 @@ class TukeyRVSGenerator(AbstractRVSGenerator):
         """Generate Tukey-distributed random sample."""
         return generate_tukey(size=size, lam=self.lam)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Tukey distributed values."""
+        return tukeylambda.ppf(_open_unit_interval(uniforms), self.lam)
+
 
 class LognormGenerator(AbstractRVSGenerator):
     """Log-normal distribution random value generator.
@@ -281,6 +395,11 @@ class LognormGenerator(AbstractRVSGenerator):
         """Generate log-normal distributed random sample."""
         return generate_lognorm(size=size, s=self.s, mu=self.mu)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into log-normal distributed values."""
+        return lognorm.ppf(_open_unit_interval(uniforms), s=np.sqrt(self.s), scale=np.exp(self.mu))
+
 
 class GammaGenerator(AbstractRVSGenerator):
     """Gamma distribution random value generator.
@@ -308,6 +427,11 @@ class GammaGenerator(AbstractRVSGenerator):
         """Generate gamma-distributed random sample."""
         return generate_gamma(size=size, alfa=self.alfa, beta=self.beta)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into gamma distributed values."""
+        return gamma.ppf(_open_unit_interval(uniforms), a=self.alfa, scale=1 / self.beta)
+
 
 class TruncnormGenerator(AbstractRVSGenerator):
     """Truncated normal distribution random value generator.
@@ -341,6 +465,11 @@ class TruncnormGenerator(AbstractRVSGenerator):
         """Generate truncated normal random sample."""
         return generate_truncnorm(size=size, mean=self.mean, var=self.var, a=self.a, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into truncated normal distributed values."""
+        return truncnorm.ppf(_open_unit_interval(uniforms), a=self.a, b=self.b, loc=self.mean, scale=np.sqrt(self.var))
+
 
 class Chi2Generator(AbstractRVSGenerator):
     """Chi-squared distribution random value generator.
@@ -365,6 +494,11 @@ class Chi2Generator(AbstractRVSGenerator):
         """Generate chi-squared random sample."""
         return generate_chi2(size=size, df=self.df)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into chi-squared distributed values."""
+        return chi2.ppf(_open_unit_interval(uniforms), df=self.df)
+
 
 class GumbelGenerator(AbstractRVSGenerator):
     """Gumbel distribution random value generator.
@@ -392,6 +526,11 @@ class GumbelGenerator(AbstractRVSGenerator):
         """Generate Gumbel-distributed random sample."""
         return generate_gumbel(size=size, mu=self.mu, beta=self.beta)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Gumbel distributed values."""
+        return gumbel_r.ppf(_open_unit_interval(uniforms), loc=self.mu, scale=self.beta)
+
 
 class WeibullGenerator(AbstractRVSGenerator):
     """Weibull distribution random value generator.
@@ -419,6 +558,11 @@ class WeibullGenerator(AbstractRVSGenerator):
         """Generate Weibull-distributed random sample."""
         return generate_weibull(size=size, a=self.a, k=self.k)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Weibull distributed values."""
+        return exponweib.ppf(_open_unit_interval(uniforms), a=self.a, c=self.k)
+
 
 class LoConNormGenerator(AbstractRVSGenerator):
     """Location-contaminated normal distribution generator.
@@ -446,6 +590,11 @@ class LoConNormGenerator(AbstractRVSGenerator):
         """Generate contaminated normal random sample."""
         return generate_lo_con_norm(size=size, p=self.p, a=self.a)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into contaminated normal distributed values."""
+        return _contaminated_norm_ppf(uniforms, p=self.p, loc=self.a, scale=1)
+
 
 class ScConNormGenerator(AbstractRVSGenerator):
     """Scale-contaminated normal distribution generator.
@@ -473,6 +622,11 @@ class ScConNormGenerator(AbstractRVSGenerator):
         """Generate scale-contaminated normal random sample."""
         return generate_scale_con_norm(size=size, p=self.p, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into scale-contaminated normal distributed values."""
+        return _contaminated_norm_ppf(uniforms, p=self.p, loc=0, scale=self.b)
+
 
 class MixConNormGenerator(AbstractRVSGenerator):
     """Mixed contaminated normal distribution generator.
@@ -503,6 +657,11 @@ class MixConNormGenerator(AbstractRVSGenerator):
         """Generate mixed contaminated normal random sample."""
         return generate_mix_con_norm(size=size, p=self.p, a=self.a, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into mixed contaminated normal distributed values."""
+        return _contaminated_norm_ppf(uniforms, p=self.p, loc=self.a, scale=self.b)
+
 
 class ExponentialGenerator(AbstractRVSGenerator):
     """Exponential distribution random value generator.
@@ -527,6 +686,11 @@ class ExponentialGenerator(AbstractRVSGenerator):
         """Generate exponentially distributed random sample."""
         return generate_expon(size=size, lam=self.lam)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into exponential distributed values."""
+        return expon.ppf(_open_unit_interval(uniforms), scale=1 / self.lam)
+
 
 class InvGaussGenerator(AbstractRVSGenerator):
     """Inverse Gaussian distribution random value generator.
@@ -554,6 +718,11 @@ class InvGaussGenerator(AbstractRVSGenerator):
         """Generate inverse Gaussian random sample."""
         return generate_invgauss(size=size, mu=self.mu, lam=self.lam)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into inverse Gaussian distributed values."""
+        return invgauss.ppf(_open_unit_interval(uniforms), self.mu, scale=self.lam)
+
 
 class RiceGenerator(AbstractRVSGenerator):
     """Rice distribution random value generator.
@@ -581,6 +750,11 @@ class RiceGenerator(AbstractRVSGenerator):
         """Generate Rice-distributed random sample."""
         return generate_rice(size=size, nu=self.nu, sigma=self.sigma)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Rice distributed values."""
+        return rice.ppf(_open_unit_interval(uniforms), self.nu, scale=self.sigma)
+
 
 class GompertzGenerator(AbstractRVSGenerator):
     """Gompertz distribution random value generator.
@@ -608,6 +782,11 @@ class GompertzGenerator(AbstractRVSGenerator):
         """Generate Gompertz-distributed random sample."""
         return generate_gompertz(size=size, eta=self.eta, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into Gompertz distributed values."""
+        return gompertz.ppf(_open_unit_interval(uniforms), self.eta, scale=self.b)
+
 
 class NormalGenerator(AbstractRVSGenerator):
     """Normal distribution random value generator.
@@ -635,6 +814,11 @@ class NormalGenerator(AbstractRVSGenerator):
         """Generate normally distributed random sample."""
         return generate_norm(size=size, mean=self.mean, var=self.var)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into normal distributed values."""
+        return norm.ppf(_open_unit_interval(uniforms), loc=self.mean, scale=np.sqrt(self.var))
+
 
 class UniformGenerator(AbstractRVSGenerator):
     """Uniform distribution random value generator.
@@ -662,5 +846,10 @@ class UniformGenerator(AbstractRVSGenerator):
         """Generate uniform distributed random sample."""
         return generate_uniform(size=size, a=self.a, b=self.b)
 
+    @override
+    def transform(self, uniforms):
+        """Transform uniform values into uniform distributed values."""
+        return self.a + (self.b - self.a) * np.asarray(uniforms, dtype=np.float64)
+
 
 # TODO: refactor generators! rename experiment to pipeline?
@@ -3,6 +3,8 @@
 from abc import ABC, abstractmethod
 from typing import Any
 
+from numpy.typing import ArrayLike, NDArray
+
 
 class AbstractRVSGenerator(ABC):
     """Base interface for all random value sample generators.
@@ -16,6 +18,9 @@ class AbstractRVSGenerator(ABC):
     Notes
     -----
     All concrete generators must implement ``code`` and ``generate``.
+    Generators whose distribution has a closed-form or numerical quantile
+    function may also implement ``transform``, which allows deriving their
+    samples from a shared pool of uniform values.
     """
 
     def __init__(self, **kwargs: Any) -> None:
@@ -66,3 +71,35 @@ class AbstractRVSGenerator(ABC):
             Generated random sample.
         """
         raise NotImplementedError
+
+    def transform(self, uniforms: ArrayLike) -> NDArray:
+        """Transform uniform values into values of generator distribution.
+
+        Parameters
+        ----------
+        uniforms : ArrayLike
+            Values of the uniform distribution on [0, 1) of any shape,
+            e.g. a stored sample decoded as a list or an array.
+
+        Returns
+        -------
+        NDArray
+            Values of generator distribution of the same shape. Each value
+            depends only on the uniform value at the same position.
+
+        Raises
+        ------
+        NotImplementedError
+            If the generator does not support inverse transform sampling.
+        """
+        raise NotImplementedError(f"{type(self).__name__} does not support transform.")
+
+    def supports_transform(self) -> bool:
+        """Check whether the generator implements ``transform``.
+
+        Returns
+        -------
+        bool
+            True if samples can be derived from uniform values.
+        """
+        return type(self).transform is not AbstractRVSGenerator.transform
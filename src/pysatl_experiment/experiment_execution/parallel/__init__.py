@@ -3,10 +3,13 @@
 from .buffered_saver import BufferedSaver
 from .scheduler import Scheduler
 from .universal_worker import universal_execute_task
+from .worker_init import initialize_worker, make_worker_initializer
 
 
 __all__ = [
     "BufferedSaver",
     "Scheduler",
+    "initialize_worker",
+    "make_worker_initializer",
     "universal_execute_task",
 ]
@@ -0,0 +1,95 @@
+"""Low-overhead timers of execution task phases."""
+
+from collections.abc import Iterable, Iterator
+from contextlib import contextmanager
+from time import perf_counter
+from typing import Final, TypeVar
+
+
+T = TypeVar("T")
+
+LOAD_PHASE: Final[str] = "load"
+"""Reading samples and cached statistics from storage."""
+DECODE_PHASE: Final[str] = "decode"
+"""Decoding stored sample blocks."""
+COMPUTE_PHASE: Final[str] = "compute"
+"""Preparing samples and computing statistics."""
+SERIALIZE_PHASE: Final[str] = "serialize"
+"""Building the task result."""
+SAVE_PHASE: Final[str] = "save"
+"""Saving the task result in the parent process."""
+
+PHASES: Final[tuple[str, ...]] = (LOAD_PHASE, DECODE_PHASE, COMPUTE_PHASE, SERIALIZE_PHASE, SAVE_PHASE)
+
+
+class PhaseTimer:
+    """
+    Accumulate wall-clock time spent in task phases.
+
+    Attributes
+    ----------
+    seconds : dict[str, float]
+        Total time in seconds by phase name, see ``PHASES``.
+    """
+
+    __slots__ = ("seconds",)
+
+    def __init__(self) -> None:
+        """Initialize timer with zero time in every phase."""
+        self.seconds: dict[str, float] = dict.fromkeys(PHASES, 0.0)
+
+    def add(self, phase: str, seconds: float) -> None:
+        """
+        Add time to phase.
+
+        Parameters
+        ----------
+        phase : str
+            Phase name.
+        seconds : float
+            Time to add.
+        """
+        self.seconds[phase] = self.seconds.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def measure(self, phase: str) -> Iterator[None]:
+        """
+        Measure time spent in the ``with`` block.
+
+        Parameters
+        ----------
+        phase : str
+            Phase the block belongs to.
+        """
+        start = perf_counter()
+        try:
+            yield
+        finally:
+            self.add(phase, perf_counter() - start)
+
+    def iterate(self, items: Iterable[T], phase: str) -> Iterator[T]:
+        """
+        Iterate over items measuring time spent producing them.
+
+        Parameters
+        ----------
+        items : Iterable[T]
+            Lazily produced items, e.g. samples streamed from storage.
+        phase : str
+            Phase producing items belongs to.
+
+        Yields
+        ------
+        T
+            Items of ``items``.
+        """
+        iterator = iter(items)
+        while True:
+            start = perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(phase, perf_counter() - start)
+                return
+            self.add(phase, perf_counter() - start)
+            yield item
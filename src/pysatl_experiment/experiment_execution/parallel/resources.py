@@ -0,0 +1,167 @@
+"""
+Resource-aware sizing of worker pools.
+
+This module estimates the memory footprint of experiment tasks and
+chooses the number of worker processes from the CPUs available to the
+process, the available memory and the footprint of the tasks.
+"""
+
+import logging
+import os
+from collections.abc import Sequence
+from dataclasses import dataclass
+from typing import Literal
+
+import psutil
+
+from pysatl_experiment.configuration.models.parallel_workers import AUTO_WORKERS
+from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+
+
+logger = logging.getLogger(__name__)
+
+# Resident memory of an idle worker process with NumPy, SciPy and SQLAlchemy imported.
+WORKER_BASE_MEMORY = 128 * 1024**2
+# A sample value held as a Python float in a list plus its encoded copy.
+BYTES_PER_SAMPLE_VALUE = 40
+# A result value held as a Python float in a list.
+BYTES_PER_RESULT_VALUE = 32
+# Share of the available memory the worker pool may use.
+MEMORY_FRACTION = 0.8
+
+
+@dataclass(frozen=True)
+class WorkerAllocation:
+    """
+    Worker pool size and memory budget of an execution step.
+
+    Attributes
+    ----------
+    workers : int
+        Number of worker processes.
+    memory_budget : int | None
+        Bytes the tasks running at the same time may hold together,
+        None to not limit concurrency by memory.
+    """
+
+    workers: int
+    memory_budget: int | None = None
+
+
+def available_cpu_count() -> int:
+    """
+    Return number of CPUs the current process may run on.
+
+    Returns
+    -------
+    int
+        CPUs in the process affinity mask, or all CPUs if the platform
+        does not support affinity.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        return max(1, len(os.sched_getaffinity(0)))
+    return max(1, os.cpu_count() or 1)
+
+
+def worker_count_record(parallel_workers: int | Literal["auto"]) -> int:
+    """
+    Return worker count as stored in experiment metadata.
+
+    Parameters
+    ----------
+    parallel_workers : int | Literal["auto"]
+        Configured number of parallel workers.
+
+    Returns
+    -------
+    int
+        Configured worker count, 0 if workers are sized automatically.
+    """
+    return 0 if parallel_workers == AUTO_WORKERS else int(parallel_workers)
+
+
+def estimate_sample_memory(sample_size: int, monte_carlo_count: int, pool_sample_size: int | None = None) -> int:
+    """
+    Estimate memory held by a task while processing its samples.
+
+    Parameters
+    ----------
+    sample_size : int
+        Sample size of the task.
+    monte_carlo_count : int
+        Number of samples processed by the task.
+    pool_sample_size : int | None, default=None
+        Size of the stored samples whose prefixes are used in nested
+        samples mode, None if samples have the task sample size.
+
+    Returns
+    -------
+    int
+        Estimated footprint in bytes of the samples and result vectors.
+    """
+    stored_size = max(sample_size, pool_sample_size or 0)
+    return monte_carlo_count * (stored_size * BYTES_PER_SAMPLE_VALUE + BYTES_PER_RESULT_VALUE)
+
+
+def estimate_task_memory(spec: TaskSpec) -> int:
+    """
+    Estimate memory held by a worker task.
+
+    Parameters
+    ----------
+    spec : TaskSpec
+        Task specification.
+
+    Returns
+    -------
+    int
+        Estimated footprint in bytes.
+    """
+    return estimate_sample_memory(spec.sample_size, spec.monte_carlo_count, spec.pool_sample_size)
+
+
+def plan_workers(
+    task_memory: Sequence[int],
+    cpu_count: int | None = None,
+    available_memory: int | None = None,
+) -> WorkerAllocation:
+    """
+    Choose worker count and memory budget for tasks of given footprints.
+
+    The pool is sized so that every CPU is used while the smallest tasks
+    fit into memory. Larger tasks are then throttled by the scheduler,
+    which keeps the summed footprint of running tasks within the budget.
+
+    Parameters
+    ----------
+    task_memory : Sequence[int]
+        Estimated footprints of the tasks in bytes.
+    cpu_count : int | None, default=None
+        Available CPUs, None to detect them.
+    available_memory : int | None, default=None
+        Available memory in bytes, None to query it via ``psutil``.
+
+    Returns
+    -------
+    WorkerAllocation
+        Worker count and memory budget of running tasks.
+    """
+    if cpu_count is None:
+        cpu_count = available_cpu_count()
+    if available_memory is None:
+        available_memory = int(psutil.virtual_memory().available)
+
+    usable_memory = int(available_memory * MEMORY_FRACTION)
+    smallest_task = min(task_memory, default=0)
+    memory_workers = usable_memory // (WORKER_BASE_MEMORY + smallest_task)
+    workers = max(1, min(cpu_count, memory_workers))
+    memory_budget = max(usable_memory - workers * WORKER_BASE_MEMORY, 0)
+
+    logger.info(
+        "Using %d parallel workers (%d CPUs, %.1f GiB available, %.1f MiB per smallest task).",
+        workers,
+        cpu_count,
+        available_memory / 1024**3,
+        smallest_task / 1024**2,
+    )
+    return WorkerAllocation(workers=workers, memory_budget=memory_budget)
@@ -1,7 +1,7 @@
 """Parallel task scheduling utilities."""
 
 from collections.abc import Callable, Iterator, Sequence
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
 from typing import Any
 
 
@@ -13,9 +13,26 @@ class Scheduler:
     ----------
     max_workers : int
         Maximum number of parallel worker processes.
+    initializer : Callable[[], None] | None, default=None
+        Function called once at the start of each worker process.
+    memory_budget : int | None, default=None
+        Bytes the running tasks may hold together, None to run
+        ``max_workers`` tasks regardless of their footprint.
+
+    Attributes
+    ----------
+    completed_tasks : int
+        Number of tasks completed by the current ``iterate_results`` call.
+    total_tasks : int
+        Number of tasks passed to the current ``iterate_results`` call.
     """
 
-    def __init__(self, max_workers: int) -> None:
+    def __init__(
+        self,
+        max_workers: int,
+        initializer: Callable[[], None] | None = None,
+        memory_budget: int | None = None,
+    ) -> None:
         """
         Initialize scheduler.
 
@@ -23,8 +40,17 @@ class Scheduler:
         ----------
         max_workers : int
             Maximum number of parallel worker processes.
+        initializer : Callable[[], None] | None, default=None
+            Function called once at the start of each worker process.
+        memory_budget : int | None, default=None
+            Bytes the running tasks may hold together, None to run
+            ``max_workers`` tasks regardless of their footprint.
         """
         self.max_workers = max_workers
+        self.initializer = initializer
+        self.memory_budget = memory_budget
+        self.completed_tasks = 0
+        self.total_tasks = 0
         self._executor: ProcessPoolExecutor | None = None
         self._active = False
 
@@ -53,7 +79,7 @@ class Scheduler:
         if self._active:
             raise RuntimeError("Scheduler is already running.")
 
-        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers, initializer=self.initializer)
         self._active = True
 
     def shutdown(self, wait: bool = True) -> None:
@@ -88,7 +114,11 @@ class Scheduler:
 
         return self._executor.submit(fn, *args, **kwargs)
 
-    def iterate_results(self, tasks: Sequence[Callable[[], Any]]) -> Iterator[Any]:
+    def iterate_results(
+        self,
+        tasks: Sequence[Callable[[], Any]],
+        task_memory: Sequence[int] | None = None,
+    ) -> Iterator[Any]:
         """
         Execute tasks and yield results as they complete.
 
@@ -96,46 +126,48 @@ class Scheduler:
         ----------
         tasks : list[Callable[[], Any]]
             Tasks to execute.
+        task_memory : Sequence[int] | None, default=None
+            Estimated footprint in bytes of each task, None if unknown.
 
         Yields
         ------
         Any
             Task execution results.
+
+        Notes
+        -----
+        Tasks are submitted in order. With a memory budget, a task is
+        held back while its footprint does not fit next to the running
+        tasks, so concurrency drops for large tasks. A task is always
+        submitted when nothing else runs, even if it exceeds the budget.
         """
         if not self._active:
             raise RuntimeError("Use inside 'with' block.")
 
-        task_iter = iter(tasks)
-        futures = {}
-        total = len(tasks)
-        completed = 0  # TODO: not used??
-
-        for _ in range(min(self.max_workers, total)):
-            try:
-                task = next(task_iter)
-                futures[self.submit(task)] = task
-            except StopIteration:
-                break
-
-        while futures:
-            try:
-                for future in as_completed(futures):
-                    try:
-                        result = future.result()
-                        completed += 1
-                        yield result
-
-                        try:
-                            next_task = next(task_iter)
-                            futures[self.submit(next_task)] = next_task
-                        except StopIteration:
-                            pass
-
-                    finally:
-                        del futures[future]
-
-            except TimeoutError:  # TODO: ??
-                continue
+        if task_memory is None or self.memory_budget is None:
+            task_memory = [0] * len(tasks)
+        pending = iter(zip(tasks, task_memory, strict=True))
+        next_task = next(pending, None)
+        futures: dict[Future, int] = {}
+        running_memory = 0
+        self.total_tasks = len(tasks)
+        self.completed_tasks = 0
+
+        while next_task is not None or futures:
+            while next_task is not None and len(futures) < self.max_workers:
+                task, footprint = next_task
+                if futures and self.memory_budget is not None and running_memory + footprint > self.memory_budget:
+                    break
+                futures[self.submit(task)] = footprint
+                running_memory += footprint
+                next_task = next(pending, None)
+
+            done, _ = wait(futures, return_when=FIRST_COMPLETED)
+            for future in done:
+                running_memory -= futures.pop(future)
+                result = future.result()
+                self.completed_tasks += 1
+                yield result
 
     def run(self, tasks: Sequence[Callable[[], Any]]) -> list[Any]:
         """
@@ -25,6 +25,16 @@ class TaskSpec:
     """Monte Carlo iterations count."""
     db_path: str
     """Database connection path."""
+    pool_sample_size: int | None = None
+    """Size of stored samples truncated to sample size, None to read samples of sample size."""
+    cache_statistics: bool = False
+    """Reuse cached statistic values of the first samples and return new ones for caching."""
+    start_sample: int = 0
+    """Number of first samples already processed by a stored run, only the remaining ones are returned."""
+    criterion_parameters: list[float] = field(default_factory=list)
+    """Criterion parameters identifying cached statistic values."""
+    criterion_code: str = ""
+    """Code of the statistic, reported in telemetry events."""
 
     # For critical value & time complexity experiments
     hypothesis_generator: str = ""
@@ -32,6 +42,16 @@ class TaskSpec:
     hypothesis_parameters: list[float] = field(default_factory=list)
     """Hypothesis generator parameters."""
 
+    # For time complexity experiments
+    benchmark: bool = False
+    """Measure execution times in benchmarking mode."""
+    warmup_iterations: int = 0
+    """Untimed statistic calls made before the first measurement in benchmarking mode."""
+    min_timing_seconds: float = 0.0
+    """Minimum duration of the timed inner loop of a sample in benchmarking mode."""
+    cpu_affinity: list[int] = field(default_factory=list)
+    """CPUs the measuring process is pinned to in benchmarking mode, empty to not pin it."""
+
     # For power experiments
     alternative_generator: str = ""
     """Alternative generator name."""
@@ -39,3 +59,7 @@ class TaskSpec:
     """Alternative generator parameters."""
     significance_level: float | None = None
     """Significance level for power experiments."""
+    base_generator: str = ""
+    """Generator of the shared uniform pool transformed into alternative samples, empty to read alternative samples."""
+    base_parameters: list[float] = field(default_factory=list)
+    """Shared uniform pool generator parameters."""
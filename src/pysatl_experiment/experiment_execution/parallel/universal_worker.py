@@ -1,17 +1,46 @@
 """Universal parallel task execution utilities."""
 
 import importlib
+from time import perf_counter
+from typing import TypeVar
+
+import psutil
 
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
+from pysatl_experiment.experiment_execution.generator.generators import create_generator
+from pysatl_experiment.experiment_execution.parallel.phase_timer import (
+    COMPUTE_PHASE,
+    DECODE_PHASE,
+    LOAD_PHASE,
+    SERIALIZE_PHASE,
+    PhaseTimer,
+)
 from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
-from pysatl_experiment.experiment_execution.step.execution.common.utils import get_sample_data_from_storage
+from pysatl_experiment.experiment_execution.step.execution.common.utils import iter_sample_data_from_storage
+from pysatl_experiment.experiment_execution.worker.abstract_worker import IWorker, WorkerResult
+from pysatl_experiment.experiment_execution.worker.benchmark import BenchmarkSettings
 from pysatl_experiment.experiment_execution.worker.critical_value import CriticalValueWorker, CriticalValueWorkerResult
+from pysatl_experiment.experiment_execution.worker.memory_complexity import (
+    MemoryComplexityWorker,
+    MemoryComplexityWorkerResult,
+)
 from pysatl_experiment.experiment_execution.worker.power import PowerWorker, PowerWorkerResult
 from pysatl_experiment.experiment_execution.worker.time_complexity import (
     TimeComplexityWorker,
     TimeComplexityWorkerResult,
 )
+from pysatl_experiment.loggers.telemetry import emit_event, telemetry_enabled
+from pysatl_experiment.persistence.models.statistic_cache import (
+    StatisticCacheModel,
+    StatisticCacheQuery,
+    make_pool_key,
+    make_sample_key,
+)
 from pysatl_experiment.persistence.random_values_storage import AlchemyRandomValuesStorage
+from pysatl_experiment.persistence.statistic_cache_storage import AlchemyStatisticCacheStorage
+
+
+R = TypeVar("R", bound=WorkerResult)
 
 
 def universal_execute_task(spec: TaskSpec):
@@ -27,47 +56,118 @@ def universal_execute_task(spec: TaskSpec):
     -------
     tuple
         Experiment execution result payload with following format:
-         (experiment_type, criterion_code, sample_size, result_data).
+         (experiment_type, criterion_code, sample_size, result_data, ..., phase_seconds).
+        Result data covers samples from ``spec.start_sample`` on.
+        Memory complexity result data is followed by the resident set
+        size changes. Critical value and power payloads are followed by a
+        ``StatisticCacheModel`` holding statistic values to cache,
+        or None if no new values were computed. The payload ends with
+        the time spent by the task in each phase, see ``PhaseTimer``.
+
+    Notes
+    -----
+    If telemetry is set up, ``task_start`` and ``task_end`` events are
+    emitted, see :func:`_emit_task_end`.
     """
+    started = perf_counter()
+    emit_event(
+        "task_start",
+        experiment_type=spec.experiment_type.value,
+        statistic=spec.criterion_code,
+        sample_size=spec.sample_size,
+        monte_carlo_count=spec.monte_carlo_count,
+        start_sample=spec.start_sample,
+    )
+    timer = PhaseTimer()
     storage = AlchemyRandomValuesStorage(spec.db_path)
     storage.init()
+    stored_sample_size = spec.pool_sample_size or spec.sample_size
 
-    match spec.experiment_type:
-        case ExperimentType.CRITICAL_VALUE | ExperimentType.TIME_COMPLEXITY:
-            data = get_sample_data_from_storage(
-                generator_name=spec.hypothesis_generator,
-                generator_parameters=spec.hypothesis_parameters,
-                sample_size=spec.sample_size,
-                count=spec.monte_carlo_count,
-                data_storage=storage,
-            )
-        case ExperimentType.POWER:
-            data = get_sample_data_from_storage(
-                generator_name=spec.alternative_generator,
-                generator_parameters=spec.alternative_parameters,
-                sample_size=spec.sample_size,
-                count=spec.monte_carlo_count,
-                data_storage=storage,
-            )
-        case _:
-            raise ValueError(f"Unknown experiment type: {spec.experiment_type}.")
+    pool_generator, pool_parameters, transform_generator, transform_parameters = _get_sample_source(spec)
 
     stat_module = importlib.import_module(spec.statistic_module)
     stat_class = getattr(stat_module, spec.statistic_class_name)
     statistics = stat_class()
 
+    pool_key = make_pool_key(pool_generator, pool_parameters, stored_sample_size)
+    sample_key = make_sample_key(pool_key, spec.sample_size, transform_generator, transform_parameters)
+    with timer.measure(LOAD_PHASE):
+        cached_statistics = _get_cached_statistics(spec, statistics.code(), sample_key) if spec.cache_statistics else []
+        reused_statistics = cached_statistics[spec.start_sample :]
+        stored_data = iter_sample_data_from_storage(
+            generator_name=pool_generator,
+            generator_parameters=pool_parameters,
+            sample_size=stored_sample_size,
+            count=spec.monte_carlo_count,
+            data_storage=storage,
+            start_sample=spec.start_sample + len(reused_statistics),
+        )
+
+    data = timer.iterate(stored_data, LOAD_PHASE)
+
+    if stored_sample_size != spec.sample_size:
+        data = (sample[: spec.sample_size] for sample in data)
+
+    if transform_generator:
+        alternative = create_generator(transform_generator, transform_parameters)
+        data = (alternative.transform(sample) for sample in data)
+
+    def create_cache_model(results_statistics: list) -> StatisticCacheModel | None:
+        # Cached values must stay a gapless prefix of the sample statistics
+        if not spec.cache_statistics or len(cached_statistics) < spec.start_sample:
+            return None
+        if len(results_statistics) <= len(reused_statistics):
+            return None
+        return StatisticCacheModel(
+            criterion_code=statistics.code(),
+            criterion_parameters=spec.criterion_parameters,
+            pool_key=pool_key,
+            sample_key=sample_key,
+            statistics=[float(value) for value in [*cached_statistics[: spec.start_sample], *results_statistics]],
+        )
+
     match spec.experiment_type:
         case ExperimentType.TIME_COMPLEXITY:
-            time_worker = TimeComplexityWorker(statistics=statistics, sample_data=data)
-            time_result: TimeComplexityWorkerResult = time_worker.execute()
+            time_worker = TimeComplexityWorker(
+                statistics=statistics, sample_data=data, benchmark=_get_benchmark_settings(spec)
+            )
+            time_result: TimeComplexityWorkerResult = _execute_timed(time_worker, timer, storage)
+
+            with timer.measure(SERIALIZE_PHASE):
+                payload: tuple = (
+                    ExperimentType.TIME_COMPLEXITY,
+                    statistics.code(),
+                    spec.sample_size,
+                    time_result.results_times,
+                )
 
-            return ExperimentType.TIME_COMPLEXITY, statistics.code(), spec.sample_size, time_result.results_times
+        case ExperimentType.MEMORY_COMPLEXITY:
+            memory_worker = MemoryComplexityWorker(statistics=statistics, sample_data=data)
+            memory_result: MemoryComplexityWorkerResult = _execute_timed(memory_worker, timer, storage)
+
+            with timer.measure(SERIALIZE_PHASE):
+                payload = (
+                    ExperimentType.MEMORY_COMPLEXITY,
+                    statistics.code(),
+                    spec.sample_size,
+                    memory_result.results_peak_bytes,
+                    memory_result.results_rss_bytes,
+                )
 
         case ExperimentType.CRITICAL_VALUE:
-            crit_worker = CriticalValueWorker(statistics=statistics, sample_data=data)
-            crit_result: CriticalValueWorkerResult = crit_worker.execute()
+            crit_worker = CriticalValueWorker(
+                statistics=statistics, sample_data=data, cached_statistics=reused_statistics
+            )
+            crit_result: CriticalValueWorkerResult = _execute_timed(crit_worker, timer, storage)
 
-            return ExperimentType.CRITICAL_VALUE, statistics.code(), spec.sample_size, crit_result.results_statistics
+            with timer.measure(SERIALIZE_PHASE):
+                payload = (
+                    ExperimentType.CRITICAL_VALUE,
+                    statistics.code(),
+                    spec.sample_size,
+                    crit_result.results_statistics,
+                    create_cache_model(crit_result.results_statistics),
+                )
 
         case ExperimentType.POWER:
             if spec.significance_level is None:
@@ -78,18 +178,183 @@ def universal_execute_task(spec: TaskSpec):
                 sample_data=data,
                 significance_level=spec.significance_level,
                 storage_connection=spec.db_path,
+                sample_size=spec.sample_size,
+                cached_statistics=reused_statistics,
             )
-            power_result: PowerWorkerResult = power_worker.execute()
-
-            return (
-                ExperimentType.POWER,
-                statistics.code(),
-                spec.sample_size,
-                power_result.results_criteria,
-                spec.alternative_generator,
-                spec.alternative_parameters,
-                spec.significance_level,
-            )
+            power_result: PowerWorkerResult = _execute_timed(power_worker, timer, storage)
+
+            with timer.measure(SERIALIZE_PHASE):
+                payload = (
+                    ExperimentType.POWER,
+                    statistics.code(),
+                    spec.sample_size,
+                    power_result.results_criteria,
+                    spec.alternative_generator,
+                    spec.alternative_parameters,
+                    spec.significance_level,
+                    create_cache_model(power_result.results_statistics),
+                )
 
         case _:
             raise ValueError(f"Unsupported experiment type: {spec.experiment_type}.")
+
+    _emit_task_end(spec, payload, timer, storage, len(reused_statistics), perf_counter() - started)
+
+    return (*payload, timer.seconds)
+
+
+def _emit_task_end(
+    spec: TaskSpec,
+    payload: tuple,
+    timer: PhaseTimer,
+    storage: AlchemyRandomValuesStorage,
+    cache_hits: int,
+    duration_seconds: float,
+) -> None:
+    """
+    Emit telemetry event of a completed task if telemetry is set up.
+
+    Parameters
+    ----------
+    spec : TaskSpec
+        Task specification.
+    payload : tuple
+        Task result payload without phase times.
+    timer : PhaseTimer
+        Task phase timer.
+    storage : AlchemyRandomValuesStorage
+        Storage the samples were streamed from.
+    cache_hits : int
+        Number of statistic values reused from the statistic cache.
+    duration_seconds : float
+        Wall-clock duration of the task.
+    """
+    if not telemetry_enabled():
+        return
+
+    results = len(payload[3])
+    emit_event(
+        "task_end",
+        experiment_type=spec.experiment_type.value,
+        statistic=spec.criterion_code,
+        sample_size=spec.sample_size,
+        duration_seconds=duration_seconds,
+        phase_seconds=timer.seconds,
+        results=results,
+        bytes_decoded=storage.decoded_bytes,
+        cache_hits=cache_hits,
+        cache_misses=results - cache_hits if spec.cache_statistics else 0,
+        rss_bytes=psutil.Process().memory_info().rss,
+    )
+
+
+def _execute_timed(worker: IWorker[R], timer: PhaseTimer, storage: AlchemyRandomValuesStorage) -> R:
+    """
+    Execute worker splitting its time between phases.
+
+    Parameters
+    ----------
+    worker : IWorker[R]
+        Worker consuming samples streamed through ``timer.iterate``.
+    timer : PhaseTimer
+        Task phase timer.
+    storage : AlchemyRandomValuesStorage
+        Storage streaming the samples.
+
+    Returns
+    -------
+    R
+        Worker result.
+
+    Notes
+    -----
+    Samples are streamed lazily while the worker runs, so the time spent
+    reading them is moved from the compute phase to the load phase, and
+    the block decoding time from the load phase to the decode phase.
+    """
+    streamed_before = timer.seconds[LOAD_PHASE]
+    with timer.measure(COMPUTE_PHASE):
+        result = worker.execute()
+    timer.add(COMPUTE_PHASE, streamed_before - timer.seconds[LOAD_PHASE])
+    timer.add(LOAD_PHASE, -storage.decode_seconds)
+    timer.add(DECODE_PHASE, storage.decode_seconds)
+    return result
+
+
+def _get_benchmark_settings(spec: TaskSpec) -> BenchmarkSettings | None:
+    """
+    Resolve benchmarking mode settings of a time complexity task.
+
+    Parameters
+    ----------
+    spec : TaskSpec
+        Task specification.
+
+    Returns
+    -------
+    BenchmarkSettings | None
+        Benchmarking mode settings, None if the mode is disabled.
+    """
+    if not spec.benchmark:
+        return None
+    return BenchmarkSettings(
+        warmup_iterations=spec.warmup_iterations,
+        min_timing_seconds=spec.min_timing_seconds,
+        cpu_affinity=list(spec.cpu_affinity),
+    )
+
+
+def _get_sample_source(spec: TaskSpec) -> tuple[str, list[float], str, list[float]]:
+    """
+    Resolve stored sample pool and transform producing task samples.
+
+    Parameters
+    ----------
+    spec : TaskSpec
+        Task specification.
+
+    Returns
+    -------
+    tuple[str, list[float], str, list[float]]
+        Pool generator name and parameters, followed by the name and
+        parameters of the generator transforming stored samples, or an
+        empty name if stored samples are used as is.
+    """
+    match spec.experiment_type:
+        case ExperimentType.CRITICAL_VALUE | ExperimentType.TIME_COMPLEXITY | ExperimentType.MEMORY_COMPLEXITY:
+            return spec.hypothesis_generator, spec.hypothesis_parameters, "", []
+        case ExperimentType.POWER if spec.base_generator:
+            return spec.base_generator, spec.base_parameters, spec.alternative_generator, spec.alternative_parameters
+        case ExperimentType.POWER:
+            return spec.alternative_generator, spec.alternative_parameters, "", []
+        case _:
+            raise ValueError(f"Unknown experiment type: {spec.experiment_type}.")
+
+
+def _get_cached_statistics(spec: TaskSpec, criterion_code: str, sample_key: str) -> list[float]:
+    """
+    Read cached statistic values of the first task samples.
+
+    Parameters
+    ----------
+    spec : TaskSpec
+        Task specification.
+    criterion_code : str
+        Criterion identifier.
+    sample_key : str
+        Fingerprint of task samples.
+
+    Returns
+    -------
+    list[float]
+        Cached statistic values, at most ``spec.monte_carlo_count`` of them.
+    """
+    cache_storage = AlchemyStatisticCacheStorage(spec.db_path)
+    cache_storage.init()
+    query = StatisticCacheQuery(
+        criterion_code=criterion_code, criterion_parameters=spec.criterion_parameters, sample_key=sample_key
+    )
+    cached = cache_storage.get_data(query)
+    if cached is None:
+        return []
+    return [float(value) for value in cached.statistics[: spec.monte_carlo_count]]
@@ -0,0 +1,40 @@
+"""Initialization of experiment worker processes."""
+
+import functools
+from collections.abc import Callable, Mapping
+from multiprocessing.queues import Queue
+from typing import Any
+
+from pysatl_experiment.loggers.queue_logging import configure_worker_logging, get_log_queue, get_worker_log_levels
+from pysatl_experiment.persistence.db_store.db_init import set_read_only_connections
+
+
+def initialize_worker(log_queue: "Queue[Any] | None" = None, log_levels: Mapping[str, int] | None = None) -> None:
+    """
+    Prepare a worker process for experiment tasks.
+
+    Parameters
+    ----------
+    log_queue : Queue | None, default=None
+        Queue of the parent logging listener, None to keep the logging
+        configuration inherited by the worker.
+    log_levels : Mapping[str, int] | None, default=None
+        Levels of the loggers writing to the queue, see
+        :func:`pysatl_experiment.loggers.queue_logging.get_worker_log_levels`.
+    """
+    set_read_only_connections()
+    if log_queue is not None:
+        configure_worker_logging(log_queue, log_levels or {})
+
+
+def make_worker_initializer() -> Callable[[], None]:
+    """
+    Create process pool initializer bound to the current logging setup.
+
+    Returns
+    -------
+    Callable[[], None]
+        Initializer opening databases read-only and, if queue logging is
+        started, sending worker records to the parent listener.
+    """
+    return functools.partial(initialize_worker, get_log_queue(), get_worker_log_levels())
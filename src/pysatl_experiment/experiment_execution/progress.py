@@ -0,0 +1,398 @@
+"""Progress, throughput and ETA reporting of long-running experiment steps."""
+
+import json
+import time
+from collections.abc import Callable, Sequence
+from dataclasses import asdict, dataclass, field
+from datetime import UTC, datetime
+from pathlib import Path
+from typing import Final
+
+from rich.console import Console
+from rich.progress import BarColumn, Progress, TaskID, TaskProgressColumn, TextColumn
+
+
+STATUS_FILE_SUFFIX: Final[str] = ".progress.json"
+"""Suffix of status files written to the experiment results directory."""
+
+
+@dataclass
+class GroupProgress:
+    """
+    Completion of tasks sharing a criterion or generator.
+
+    Attributes
+    ----------
+    completed_tasks : int
+        Number of completed tasks.
+    total_tasks : int
+        Number of planned tasks.
+    completed_samples : int
+        Number of processed samples.
+    total_samples : int
+        Number of planned samples.
+    """
+
+    completed_tasks: int = 0
+    total_tasks: int = 0
+    completed_samples: int = 0
+    total_samples: int = 0
+
+
+@dataclass
+class ProgressSnapshot:
+    """
+    Machine-readable state of a running step.
+
+    Attributes
+    ----------
+    experiment_name : str
+        Name of the experiment.
+    experiment_id : int | None
+        Identifier of the experiment in storage, None if unknown.
+    phase : str
+        Name of the running step.
+    state : str
+        ``running`` or ``finished``.
+    updated_at : str
+        ISO 8601 time of the snapshot.
+    elapsed_seconds : float
+        Time since the step started.
+    completed_tasks : int
+        Number of completed tasks.
+    total_tasks : int
+        Number of planned tasks.
+    completed_samples : int
+        Number of processed samples.
+    total_samples : int
+        Number of planned samples.
+    tasks_per_second : float
+        Average task throughput.
+    samples_per_second : float
+        Average sample throughput.
+    eta_seconds : float | None
+        Estimated time until the step finishes, None until the first
+        task completes.
+    groups : dict[str, GroupProgress]
+        Completion by criterion code or generator name.
+    """
+
+    experiment_name: str
+    experiment_id: int | None
+    phase: str
+    state: str
+    updated_at: str
+    elapsed_seconds: float
+    completed_tasks: int
+    total_tasks: int
+    completed_samples: int
+    total_samples: int
+    tasks_per_second: float
+    samples_per_second: float
+    eta_seconds: float | None
+    groups: dict[str, GroupProgress] = field(default_factory=dict)
+
+
+class ProgressTracker:
+    """
+    Track completion of step tasks, render it and publish it to a status file.
+
+    Parameters
+    ----------
+    status_path : Path | None, default=None
+        JSON file rewritten with the latest :class:`ProgressSnapshot`,
+        None to not publish progress.
+    experiment_name : str, default=""
+        Name of the experiment reported in snapshots.
+    experiment_id : int | None, default=None
+        Identifier of the experiment reported in snapshots.
+    console : Console | None, default=None
+        Rich console progress bars are rendered to, None to not render them.
+    refresh_interval : float, default=1.0
+        Minimum number of seconds between status file updates.
+    clock : Callable[[], float], default=time.monotonic
+        Monotonic clock measuring elapsed time.
+    """
+
+    def __init__(
+        self,
+        status_path: Path | None = None,
+        experiment_name: str = "",
+        experiment_id: int | None = None,
+        console: Console | None = None,
+        refresh_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Initialize tracker.
+
+        Parameters
+        ----------
+        status_path : Path | None, default=None
+            JSON file rewritten with the latest snapshot, None to not publish progress.
+        experiment_name : str, default=""
+            Name of the experiment reported in snapshots.
+        experiment_id : int | None, default=None
+            Identifier of the experiment reported in snapshots.
+        console : Console | None, default=None
+            Rich console progress bars are rendered to, None to not render them.
+        refresh_interval : float, default=1.0
+            Minimum number of seconds between status file updates.
+        clock : Callable[[], float], default=time.monotonic
+            Monotonic clock measuring elapsed time.
+        """
+        self.status_path = status_path
+        self.experiment_name = experiment_name
+        self.experiment_id = experiment_id
+        self.console = console
+        self.refresh_interval = refresh_interval
+        self.clock = clock
+
+        self.phase = ""
+        self.groups: dict[str, GroupProgress] = {}
+        self._started_at = 0.0
+        self._written_at: float | None = None
+        self._progress: Progress | None = None
+        self._progress_tasks: dict[str, TaskID] = {}
+
+    def start(self, phase: str, tasks: Sequence[tuple[str, int]]) -> None:
+        """
+        Start tracking a step.
+
+        Parameters
+        ----------
+        phase : str
+            Name of the step.
+        tasks : Sequence[tuple[str, int]]
+            Criterion code or generator name and number of samples of
+            every planned task.
+        """
+        self.phase = phase
+        self.groups = {}
+        for group, samples in tasks:
+            progress = self.groups.setdefault(group, GroupProgress())
+            progress.total_tasks += 1
+            progress.total_samples += samples
+        self._started_at = self.clock()
+        self._written_at = None
+
+        if self.console is not None and tasks:
+            self._start_rendering()
+        self._publish(force=True)
+
+    def advance(self, group: str, samples: int) -> None:
+        """
+        Record completion of a task.
+
+        Parameters
+        ----------
+        group : str
+            Criterion code or generator name of the task.
+        samples : int
+            Number of samples processed by the task.
+        """
+        progress = self.groups.setdefault(group, GroupProgress(total_tasks=1, total_samples=samples))
+        progress.completed_tasks += 1
+        progress.completed_samples += samples
+        self._publish()
+
+    def finish(self) -> None:
+        """Stop tracking the step and publish its final state."""
+        self._publish(force=True, state="finished")
+        if self._progress is not None:
+            self._progress.stop()
+            self._progress = None
+            self._progress_tasks = {}
+
+    def snapshot(self, state: str = "running") -> ProgressSnapshot:
+        """
+        Build snapshot of the current progress.
+
+        Parameters
+        ----------
+        state : str, default="running"
+            Step state reported in the snapshot.
+
+        Returns
+        -------
+        ProgressSnapshot
+            Current progress.
+        """
+        elapsed = self.clock() - self._started_at
+        completed_tasks = sum(group.completed_tasks for group in self.groups.values())
+        total_tasks = sum(group.total_tasks for group in self.groups.values())
+        completed_samples = sum(group.completed_samples for group in self.groups.values())
+        total_samples = sum(group.total_samples for group in self.groups.values())
+        tasks_per_second = completed_tasks / elapsed if elapsed > 0 else 0.0
+        samples_per_second = completed_samples / elapsed if elapsed > 0 else 0.0
+
+        eta_seconds: float | None = None
+        if samples_per_second > 0:
+            eta_seconds = (total_samples - completed_samples) / samples_per_second
+        elif tasks_per_second > 0:
+            eta_seconds = (total_tasks - completed_tasks) / tasks_per_second
+
+        return ProgressSnapshot(
+            experiment_name=self.experiment_name,
+            experiment_id=self.experiment_id,
+            phase=self.phase,
+            state=state,
+            updated_at=datetime.now(UTC).isoformat(),
+            elapsed_seconds=elapsed,
+            completed_tasks=completed_tasks,
+            total_tasks=total_tasks,
+            completed_samples=completed_samples,
+            total_samples=total_samples,
+            tasks_per_second=tasks_per_second,
+            samples_per_second=samples_per_second,
+            eta_seconds=eta_seconds,
+            groups={name: GroupProgress(**asdict(group)) for name, group in self.groups.items()},
+        )
+
+    def _start_rendering(self) -> None:
+        """Start rendering progress bars of the step and its groups."""
+        self._progress = Progress(
+            TextColumn("{task.description}"),
+            BarColumn(),
+            TaskProgressColumn(),
+            TextColumn("{task.fields[status]}"),
+            console=self.console,
+            transient=False,
+        )
+        self._progress_tasks = {
+            "": self._progress.add_task(
+                self.phase, total=sum(group.total_samples for group in self.groups.values()), status=""
+            ),
+        }
+        for name, group in self.groups.items():
+            self._progress_tasks[name] = self._progress.add_task(f"  {name}", total=group.total_samples, status="")
+        self._progress.start()
+
+    def _publish(self, force: bool = False, state: str = "running") -> None:
+        """
+        Update progress bars and, at most once per refresh interval, the status file.
+
+        Parameters
+        ----------
+        force : bool, default=False
+            Write the status file regardless of the refresh interval.
+        state : str, default="running"
+            Step state reported in the status file.
+        """
+        now = self.clock()
+        due = self._written_at is None or now - self._written_at >= self.refresh_interval
+        if not force and not due and self._progress is None:
+            return
+
+        snapshot = self.snapshot(state)
+        if self._progress is not None:
+            self._render(self._progress, snapshot)
+        if force or due:
+            self._write_status(snapshot)
+            self._written_at = now
+
+    def _render(self, progress: Progress, snapshot: ProgressSnapshot) -> None:
+        """
+        Update progress bars.
+
+        Parameters
+        ----------
+        progress : Progress
+            Rendered progress bars.
+        snapshot : ProgressSnapshot
+            Current progress.
+        """
+        eta = "-" if snapshot.eta_seconds is None else _format_seconds(snapshot.eta_seconds)
+        progress.update(
+            self._progress_tasks[""],
+            completed=snapshot.completed_samples,
+            status=(
+                f"{snapshot.completed_tasks}/{snapshot.total_tasks} tasks, "
+                f"{snapshot.tasks_per_second:.2f} tasks/s, "
+                f"{snapshot.samples_per_second:.0f} samples/s, ETA {eta}"
+            ),
+        )
+        for name, group in snapshot.groups.items():
+            if name in self._progress_tasks:
+                progress.update(
+                    self._progress_tasks[name],
+                    completed=group.completed_samples,
+                    status=f"{group.completed_tasks}/{group.total_tasks} tasks",
+                )
+
+    def _write_status(self, snapshot: ProgressSnapshot) -> None:
+        """
+        Atomically replace the status file with the snapshot.
+
+        Parameters
+        ----------
+        snapshot : ProgressSnapshot
+            Current progress.
+        """
+        if self.status_path is None:
+            return
+
+        self.status_path.parent.mkdir(parents=True, exist_ok=True)
+        temporary_path = self.status_path.with_name(self.status_path.name + ".tmp")
+        temporary_path.write_text(json.dumps(asdict(snapshot), indent=2), encoding="utf-8")
+        temporary_path.replace(self.status_path)
+
+
+def get_status_path(results_path: Path, experiment_name: str) -> Path:
+    """
+    Get status file of an experiment.
+
+    Parameters
+    ----------
+    results_path : Path
+        Experiment results directory.
+    experiment_name : str
+        Name of the experiment.
+
+    Returns
+    -------
+    Path
+        ``<experiment_name>.progress.json`` in the results directory.
+    """
+    return results_path / f"{experiment_name}{STATUS_FILE_SUFFIX}"
+
+
+def read_status(status_path: Path) -> ProgressSnapshot | None:
+    """
+    Read progress published by a running experiment.
+
+    Parameters
+    ----------
+    status_path : Path
+        Status file of the experiment.
+
+    Returns
+    -------
+    ProgressSnapshot | None
+        Latest published progress, None if nothing is published yet.
+    """
+    if not status_path.exists():
+        return None
+
+    data = json.loads(status_path.read_text(encoding="utf-8"))
+    data["groups"] = {name: GroupProgress(**group) for name, group in data["groups"].items()}
+    return ProgressSnapshot(**data)
+
+
+def _format_seconds(seconds: float) -> str:
+    """
+    Format duration as ``H:MM:SS``.
+
+    Parameters
+    ----------
+    seconds : float
+        Duration in seconds.
+
+    Returns
+    -------
+    str
+        Formatted duration.
+    """
+    minutes, secs = divmod(int(round(seconds)), 60)
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}:{minutes:02d}:{secs:02d}"
@@ -1,16 +1,32 @@
 """Execution step data model."""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
 
 
 @dataclass
 class ExecutionStepData:
-    """Data for execution step."""
+    """
+    Data for execution step.
+
+    Attributes
+    ----------
+    statistics : AbstractGoodnessOfFitStatistic
+        Statistic to compute.
+    sample_size : int
+        Sample size.
+    stored_monte_carlo_count : int
+        Monte-Carlo count of a stored result extended by the step,
+        0 to compute the result from scratch.
+    criterion_parameters : list[float]
+        Criterion parameters, part of the statistic cache key.
+    """
 
     statistics: AbstractGoodnessOfFitStatistic
     sample_size: int
+    stored_monte_carlo_count: int = field(default=0, kw_only=True)
+    criterion_parameters: list[float] = field(default_factory=list, kw_only=True)
 
 
 # TODO: refactor step structure! (pipeline?)
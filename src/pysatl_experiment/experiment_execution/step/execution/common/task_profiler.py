@@ -0,0 +1,187 @@
+"""Per-task phase timing collection of execution steps."""
+
+import logging
+from collections.abc import Mapping, Sequence
+
+from pysatl_experiment.experiment_execution.parallel.phase_timer import (
+    COMPUTE_PHASE,
+    DECODE_PHASE,
+    LOAD_PHASE,
+    PHASES,
+    SAVE_PHASE,
+    SERIALIZE_PHASE,
+)
+from pysatl_experiment.loggers.telemetry import emit_event
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage, TaskProfileModel
+
+
+logger = logging.getLogger(__name__)
+
+
+class TaskProfiler:
+    """
+    Collect phase timings returned by execution tasks.
+
+    Parameters
+    ----------
+    experiment_id : int
+        Experiment identifier.
+    storage : ITaskProfileStorage | None, default=None
+        Storage of the experiment profile table, None to only log it.
+    """
+
+    def __init__(self, experiment_id: int, storage: ITaskProfileStorage | None = None) -> None:
+        """
+        Initialize profiler.
+
+        Parameters
+        ----------
+        experiment_id : int
+            Experiment identifier.
+        storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table, None to only log it.
+        """
+        self.experiment_id = experiment_id
+        self.storage = storage
+        self.profiles: list[TaskProfileModel] = []
+
+    def create_model(
+        self,
+        criterion_code: str,
+        sample_size: int,
+        phase_seconds: Mapping[str, float],
+        task_label: str = "",
+    ) -> TaskProfileModel:
+        """
+        Create profile of a completed task.
+
+        Parameters
+        ----------
+        criterion_code : str
+            Criterion identifier.
+        sample_size : int
+            Sample size.
+        phase_seconds : Mapping[str, float]
+            Time spent by the task in each phase.
+        task_label : str, default=""
+            Remaining task identity.
+
+        Returns
+        -------
+        TaskProfileModel
+            Task profile without the save time, which is set by
+            :meth:`record_batch`.
+        """
+        return TaskProfileModel(
+            experiment_id=self.experiment_id,
+            criterion_code=criterion_code,
+            sample_size=sample_size,
+            task_label=task_label,
+            load_seconds=phase_seconds.get(LOAD_PHASE, 0.0),
+            decode_seconds=phase_seconds.get(DECODE_PHASE, 0.0),
+            compute_seconds=phase_seconds.get(COMPUTE_PHASE, 0.0),
+            serialize_seconds=phase_seconds.get(SERIALIZE_PHASE, 0.0),
+            save_seconds=0.0,
+        )
+
+    def record_batch(self, profiles: list[TaskProfileModel], save_seconds: float) -> None:
+        """
+        Record profiles of a batch of tasks saved together.
+
+        Parameters
+        ----------
+        profiles : list[TaskProfileModel]
+            Profiles of saved tasks.
+        save_seconds : float
+            Time spent saving the batch, split evenly between its tasks.
+
+        Notes
+        -----
+        If telemetry is set up, a ``batch_saved`` event with the number of
+        result rows written is emitted.
+        """
+        if not profiles:
+            return
+
+        emit_event("batch_saved", experiment_id=self.experiment_id, rows=len(profiles), save_seconds=save_seconds)
+
+        for profile in profiles:
+            profile.save_seconds = save_seconds / len(profiles)
+        self.profiles.extend(profiles)
+        if self.storage is not None:
+            self.storage.insert_bulk_data(profiles)
+
+    def log_summary(self) -> None:
+        """Log profile table of recorded tasks."""
+        if self.profiles:
+            logger.info(
+                "Execution profile of experiment %s:\n%s", self.experiment_id, format_profile_table(self.profiles)
+            )
+
+
+def format_profile_table(profiles: Sequence[TaskProfileModel]) -> str:
+    """
+    Format task profiles as a table of phase times by criterion.
+
+    Parameters
+    ----------
+    profiles : Sequence[TaskProfileModel]
+        Task profiles, e.g. all profiles of an experiment.
+
+    Returns
+    -------
+    str
+        Plain text table with total seconds spent in each phase per
+        criterion, followed by the overall total and phase shares.
+    """
+    totals: dict[str, list[float]] = {}
+    for profile in profiles:
+        row = totals.setdefault(profile.criterion_code, [0.0] * len(PHASES))
+        for index, seconds in enumerate(_phase_seconds(profile)):
+            row[index] += seconds
+    overall = [sum(row[index] for row in totals.values()) for index in range(len(PHASES))]
+    overall_seconds = sum(overall)
+
+    header = ["criterion", *PHASES, "total"]
+    lines = [[code, *(f"{seconds:.3f}" for seconds in row), f"{sum(row):.3f}"] for code, row in sorted(totals.items())]
+    lines.append(["total", *(f"{seconds:.3f}" for seconds in overall), f"{overall_seconds:.3f}"])
+    lines.append(
+        [
+            "share",
+            *(f"{seconds / overall_seconds:.1%}" if overall_seconds else "-" for seconds in overall),
+            "100.0%" if overall_seconds else "-",
+        ]
+    )
+
+    widths = [max(len(line[column]) for line in [header, *lines]) for column in range(len(header))]
+    return "\n".join(
+        "  ".join(
+            cell.ljust(width) if column == 0 else cell.rjust(width)
+            for column, (cell, width) in enumerate(zip(line, widths, strict=True))
+        )
+        for line in [header, *lines]
+    )
+
+
+def _phase_seconds(profile: TaskProfileModel) -> tuple[float, ...]:
+    """
+    Get task phase times in ``PHASES`` order.
+
+    Parameters
+    ----------
+    profile : TaskProfileModel
+        Task profile.
+
+    Returns
+    -------
+    tuple[float, ...]
+        Seconds spent in each phase.
+    """
+    seconds = {
+        LOAD_PHASE: profile.load_seconds,
+        DECODE_PHASE: profile.decode_seconds,
+        COMPUTE_PHASE: profile.compute_seconds,
+        SERIALIZE_PHASE: profile.serialize_seconds,
+        SAVE_PHASE: profile.save_seconds,
+    }
+    return tuple(seconds[phase] for phase in PHASES)
@@ -1,8 +1,19 @@
 """Utility functions for loading generated samples from storage."""
 
+from collections.abc import Iterator
+
+import numpy as np
 from line_profiler import profile
+from numpy.typing import NDArray
+
+from pysatl_experiment.persistence.models.random_values import (
+    IRandomValuesStorage,
+    RandomValuesAllQuery,
+    RandomValuesCountQuery,
+)
+
 
-from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesCountQuery
+SAMPLE_BATCH_SIZE = 1000
 
 
 @profile
@@ -12,7 +23,7 @@ def get_sample_data_from_storage(
     sample_size: int,
     count: int,
     data_storage: IRandomValuesStorage,
-) -> list[list[float]]:
+) -> list[list[float] | NDArray[np.float64]]:
     """
     Load generated samples from storage.
 
@@ -31,7 +42,7 @@ def get_sample_data_from_storage(
 
     Returns
     -------
-    list[list[float]]
+    list[list[float] | NDArray[np.float64]]
         Loaded samples.
 
     Raises
@@ -39,7 +50,7 @@ def get_sample_data_from_storage(
     ValueError
         If the storage contains fewer samples than requested.
     """
-    data = []
+    data: list[list[float] | NDArray[np.float64]] = []
 
     query = RandomValuesCountQuery(
         generator_name=generator_name,
@@ -57,3 +68,59 @@ def get_sample_data_from_storage(
         data.append(sample)
 
     return data
+
+
+def iter_sample_data_from_storage(
+    generator_name: str,
+    generator_parameters: list[float],
+    sample_size: int,
+    count: int,
+    data_storage: IRandomValuesStorage,
+    batch_size: int = SAMPLE_BATCH_SIZE,
+    start_sample: int = 0,
+) -> Iterator[list[float] | NDArray[np.float64]]:
+    """
+    Stream generated samples from storage.
+
+    Parameters
+    ----------
+    generator_name : str
+        Name of the random value generator.
+    generator_parameters : list[float]
+        Generator parameters used during sample generation.
+    sample_size : int
+        Size of each generated sample.
+    count : int
+        Number of samples to load.
+    data_storage : IRandomValuesStorage
+        Storage backend containing generated random samples.
+    batch_size : int, default=SAMPLE_BATCH_SIZE
+        Number of samples held in memory at once.
+    start_sample : int, default=0
+        Number of first samples skipped without being loaded.
+
+    Returns
+    -------
+    Iterator[list[float] | NDArray[np.float64]]
+        Lazily loaded samples ``start_sample + 1`` to ``count``.
+
+    Raises
+    ------
+    ValueError
+        If the storage contains fewer samples than requested.
+    """
+    count_query = RandomValuesAllQuery(
+        generator_name=generator_name,
+        generator_parameters=generator_parameters,
+        sample_size=sample_size,
+    )
+    if data_storage.get_rvs_count(count_query) < count:
+        raise ValueError("Not enough data in storage.")
+
+    query = RandomValuesCountQuery(
+        generator_name=generator_name,
+        generator_parameters=generator_parameters,
+        sample_size=sample_size,
+        count=count,
+    )
+    return (model.data for model in data_storage.iter_data(query, batch_size, start_sample))
@@ -2,19 +2,30 @@
 
 import functools
 from dataclasses import dataclass
+from time import perf_counter
 
 from line_profiler import profile
-from pysatl_criterion.persistence.models.limit_distribution import ILimitDistributionStorage, LimitDistributionModel
+from pysatl_criterion.persistence.models.limit_distribution import (
+    ILimitDistributionStorage,
+    LimitDistributionModel,
+    LimitDistributionQuery,
+)
 
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
 from pysatl_experiment.experiment_execution.parallel import BufferedSaver, Scheduler, universal_execute_task
+from pysatl_experiment.experiment_execution.parallel.resources import estimate_task_memory
 from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.experiment_execution.progress import ProgressTracker
 from pysatl_experiment.experiment_execution.step.execution.common.execution_step_data import ExecutionStepData
 from pysatl_experiment.experiment_execution.step.execution.common.hypothesis_generator_data import (
     HypothesisGeneratorData,
 )
+from pysatl_experiment.experiment_execution.step.execution.common.task_profiler import TaskProfiler
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage, StatisticCacheModel
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 
 
 @dataclass
@@ -40,6 +51,11 @@ class CriticalValueExecutionStep(IExperimentStep):
         result_storage: ILimitDistributionStorage,
         storage_connection: str,
         parallel_workers: int,
+        pool_sample_size: int | None = None,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
+        progress: ProgressTracker | None = None,
+        memory_budget: int | None = None,
     ) -> None:
         """
         Initialize critical value execution step.
@@ -62,6 +78,22 @@ class CriticalValueExecutionStep(IExperimentStep):
             Database connection string.
         parallel_workers : int
             Number of parallel worker processes.
+        pool_sample_size : int | None, default=None
+            Size of stored samples whose prefixes are used for all
+            sample sizes in nested samples mode. None if every sample
+            size has its own samples.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Storage of statistic values. Workers reuse cached values of
+            the first samples and new values are stored back. None to
+            compute all statistic values.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table with phase timings
+            of every task, None to only log the profile.
+        progress : ProgressTracker | None, default=None
+            Tracker reporting completion of tasks, None to not report it.
+        memory_budget : int | None, default=None
+            Bytes the running tasks may hold together, None to not limit
+            concurrency by memory.
         """
         self.experiment_id = experiment_id
         self.hypothesis_generator_data = hypothesis_generator_data
@@ -71,6 +103,11 @@ class CriticalValueExecutionStep(IExperimentStep):
         self.result_storage = result_storage
         self.storage_connection = storage_connection
         self.parallel_workers = parallel_workers
+        self.pool_sample_size = pool_sample_size
+        self.statistic_cache = statistic_cache
+        self.task_profile_storage = task_profile_storage
+        self.progress = progress
+        self.memory_budget = memory_budget
 
     @profile
     def run(self) -> None:
@@ -86,49 +123,127 @@ class CriticalValueExecutionStep(IExperimentStep):
                 experiment_type=ExperimentType.CRITICAL_VALUE,
                 statistic_class_name=step_data.statistics.__class__.__name__,
                 statistic_module=step_data.statistics.__class__.__module__,
+                criterion_code=step_data.statistics.code(),
                 sample_size=step_data.sample_size,
                 monte_carlo_count=self.monte_carlo_count,
+                criterion_parameters=step_data.criterion_parameters,
                 db_path=self.storage_connection,
+                start_sample=step_data.stored_monte_carlo_count,
+                pool_sample_size=self.pool_sample_size,
+                cache_statistics=self.statistic_cache is not None,
                 hypothesis_generator=self.hypothesis_generator_data.generator_name,
                 hypothesis_parameters=self.hypothesis_generator_data.parameters,
             )
             task_specs.append(spec)
 
         tasks = [functools.partial(universal_execute_task, spec) for spec in task_specs]
+        task_memory = [estimate_task_memory(spec) for spec in task_specs]
+        profiler = TaskProfiler(self.experiment_id, self.task_profile_storage)
 
         def save_batch(results_batch: list):
+            start = perf_counter()
+            models = []
+            profiles = []
+            cache_models: list[StatisticCacheModel] = []
             for res in results_batch:
-                exp_type, criterion_code, sample_size, results_statistics = res
-                self._save_result_to_storage(
-                    experiment_id=self.experiment_id,
-                    criterion_code=criterion_code,
-                    sample_size=sample_size,
-                    monte_carlo_count=self.monte_carlo_count,
-                    results_statistics=results_statistics,
+                exp_type, criterion_code, sample_size, results_statistics, cache_model, phase_seconds = res
+                profiles.append(profiler.create_model(criterion_code, sample_size, phase_seconds))
+                if cache_model is not None:
+                    cache_models.append(cache_model)
+                if len(results_statistics) < self.monte_carlo_count:
+                    results_statistics = [
+                        *self._get_stored_statistics(
+                            criterion_code, sample_size, self.monte_carlo_count - len(results_statistics)
+                        ),
+                        *results_statistics,
+                    ]
+                models.append(
+                    self._create_result_model(
+                        experiment_id=self.experiment_id,
+                        criterion_code=criterion_code,
+                        sample_size=sample_size,
+                        monte_carlo_count=self.monte_carlo_count,
+                        results_statistics=results_statistics,
+                    )
                 )
+            self.result_storage.insert_bulk_data(models)
+            if self.statistic_cache is not None:
+                self.statistic_cache.insert_bulk_data(cache_models)
+            profiler.record_batch(profiles, perf_counter() - start)
 
         total_tasks = len(tasks)
         buffer_size = max(1, min(20, total_tasks // 2))
         saver = BufferedSaver(save_func=save_batch, buffer_size=buffer_size)
 
+        if self.progress is not None:
+            self.progress.start(
+                "execution",
+                [
+                    (step_data.statistics.code(), self.monte_carlo_count - step_data.stored_monte_carlo_count)
+                    for step_data in self.step_config
+                ],
+            )
+
         try:
-            with Scheduler(max_workers=self.parallel_workers) as scheduler:
-                for result in scheduler.iterate_results(tasks):
+            with Scheduler(
+                max_workers=self.parallel_workers,
+                initializer=make_worker_initializer(),
+                memory_budget=self.memory_budget,
+            ) as scheduler:
+                for result in scheduler.iterate_results(tasks, task_memory):
                     saver.add(result)
+                    if self.progress is not None:
+                        self.progress.advance(result[1], len(result[3]))
         finally:
             saver.flush()
+            profiler.log_summary()
+            if self.progress is not None:
+                self.progress.finish()
 
-    @profile
-    def _save_result_to_storage(
-        self,
+    def _get_stored_statistics(self, criterion_code: str, sample_size: int, monte_carlo_count: int) -> list[float]:
+        """
+        Load statistic values of the stored run extended by a task.
+
+        Parameters
+        ----------
+        criterion_code : str
+            Statistical criterion identifier.
+        sample_size : int
+            Sample size.
+        monte_carlo_count : int
+            Monte-Carlo count of the stored run.
+
+        Returns
+        -------
+        list[float]
+            Stored statistic values.
+
+        Raises
+        ------
+        ValueError
+            If the stored run does not exist.
+        """
+        query = LimitDistributionQuery(
+            criterion_code=criterion_code,
+            criterion_parameters=[],
+            sample_size=sample_size,
+            monte_carlo_count=monte_carlo_count,
+        )
+        stored = self.result_storage.get_data(query)
+        if stored is None:
+            raise ValueError(f"No stored limit distribution with monte_carlo_count={monte_carlo_count} to extend.")
+        return list(stored.results_statistics)
+
+    @staticmethod
+    def _create_result_model(
         experiment_id: int,
         criterion_code: str,
         sample_size: int,
         monte_carlo_count: int,
         results_statistics: list[float],
-    ) -> None:
+    ) -> LimitDistributionModel:
         """
-        Save calculated limit distribution to storage.
+        Create limit distribution model from task result.
 
         Parameters
         ----------
@@ -142,8 +257,13 @@ class CriticalValueExecutionStep(IExperimentStep):
             Number of Monte Carlo iterations.
         results_statistics : list[float]
             Calculated statistic values.
+
+        Returns
+        -------
+        LimitDistributionModel
+            Limit distribution to store.
         """
-        data_to_save = LimitDistributionModel(
+        return LimitDistributionModel(
             experiment_id=experiment_id,
             criterion_code=criterion_code,
             criterion_parameters=[],
@@ -151,5 +271,3 @@ class CriticalValueExecutionStep(IExperimentStep):
             monte_carlo_count=monte_carlo_count,
             results_statistics=results_statistics,
         )
-
-        self.result_storage.insert_data(data_to_save)
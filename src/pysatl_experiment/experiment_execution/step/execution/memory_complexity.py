@@ -0,0 +1,169 @@
+"""Memory complexity experiment execution step implementation."""
+
+import functools
+from dataclasses import dataclass
+from time import perf_counter
+
+from line_profiler import profile
+
+from pysatl_experiment.configuration.models.experiment_type import ExperimentType
+from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
+from pysatl_experiment.experiment_execution.parallel import BufferedSaver, Scheduler, universal_execute_task
+from pysatl_experiment.experiment_execution.parallel.resources import estimate_task_memory
+from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.experiment_execution.progress import ProgressTracker
+from pysatl_experiment.experiment_execution.step.execution.common.execution_step_data import ExecutionStepData
+from pysatl_experiment.experiment_execution.step.execution.common.hypothesis_generator_data import (
+    HypothesisGeneratorData,
+)
+from pysatl_experiment.experiment_execution.step.execution.common.task_profiler import TaskProfiler
+from pysatl_experiment.persistence.models.memory_complexity import IMemoryComplexityStorage, MemoryComplexityModel
+from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
+
+
+@dataclass
+class MemoryComplexityStepData(ExecutionStepData):
+    """Data for a single execution step in memory complexity experiment."""
+
+
+class MemoryComplexityExecutionStep(IExperimentStep):
+    """
+    Standard memory complexity experiment execution step.
+
+    The step measures criterion memory usage
+    for different sample sizes.
+    """
+
+    def __init__(
+        self,
+        experiment_id: int,
+        hypothesis_generator_data: HypothesisGeneratorData,
+        step_config: list[MemoryComplexityStepData],
+        monte_carlo_count: int,
+        data_storage: IRandomValuesStorage,
+        result_storage: IMemoryComplexityStorage,
+        storage_connection: str,
+        parallel_workers: int,
+        pool_sample_size: int | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
+        progress: ProgressTracker | None = None,
+        memory_budget: int | None = None,
+    ) -> None:
+        """
+        Initialize memory complexity execution step.
+
+        Parameters
+        ----------
+        experiment_id : int
+            Experiment identifier.
+        hypothesis_generator_data : HypothesisGeneratorData
+            Hypothesis generator configuration.
+        step_config : list[MemoryComplexityStepData]
+            Execution task configurations.
+        monte_carlo_count : int
+            Number of Monte Carlo iterations.
+        data_storage : IRandomValuesStorage
+            Storage with generated random samples.
+        result_storage : IMemoryComplexityStorage
+            Storage for memory usage measurements.
+        storage_connection : str
+            Database connection string.
+        parallel_workers : int
+            Number of parallel worker processes.
+        pool_sample_size : int | None, default=None
+            Size of stored samples whose prefixes are used for all
+            sample sizes in nested samples mode. None if every sample
+            size has its own samples.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table with phase timings
+            of every task, None to only log the profile.
+        progress : ProgressTracker | None, default=None
+            Tracker reporting completion of tasks, None to not report it.
+        memory_budget : int | None, default=None
+            Bytes the running tasks may hold together, None to not limit
+            concurrency by memory.
+        """
+        self.experiment_id = experiment_id
+        self.hypothesis_generator_data = hypothesis_generator_data
+        self.step_config = step_config
+        self.monte_carlo_count = monte_carlo_count
+        self.data_storage = data_storage
+        self.result_storage = result_storage
+        self.storage_connection = storage_connection
+        self.parallel_workers = parallel_workers
+        self.pool_sample_size = pool_sample_size
+        self.task_profile_storage = task_profile_storage
+        self.progress = progress
+        self.memory_budget = memory_budget
+
+    @profile
+    def run(self) -> None:
+        """Execute all memory complexity tasks in parallel."""
+        task_specs = []
+        for step_data in self.step_config:
+            spec = TaskSpec(
+                experiment_type=ExperimentType.MEMORY_COMPLEXITY,
+                statistic_class_name=step_data.statistics.__class__.__name__,
+                statistic_module=step_data.statistics.__class__.__module__,
+                criterion_code=step_data.statistics.code(),
+                sample_size=step_data.sample_size,
+                monte_carlo_count=self.monte_carlo_count,
+                db_path=self.storage_connection,
+                pool_sample_size=self.pool_sample_size,
+                hypothesis_generator=self.hypothesis_generator_data.generator_name,
+                hypothesis_parameters=self.hypothesis_generator_data.parameters,
+            )
+            task_specs.append(spec)
+
+        tasks = [functools.partial(universal_execute_task, spec) for spec in task_specs]
+        task_memory = [estimate_task_memory(spec) for spec in task_specs]
+        profiler = TaskProfiler(self.experiment_id, self.task_profile_storage)
+
+        def save_batch(results_batch: list):
+            start = perf_counter()
+            models = []
+            profiles = []
+            for res in results_batch:
+                exp_type, criterion_code, sample_size, results_peak_bytes, results_rss_bytes, phase_seconds = res
+                profiles.append(profiler.create_model(criterion_code, sample_size, phase_seconds))
+                models.append(
+                    MemoryComplexityModel(
+                        experiment_id=self.experiment_id,
+                        criterion_code=criterion_code,
+                        criterion_parameters=[],
+                        sample_size=sample_size,
+                        monte_carlo_count=self.monte_carlo_count,
+                        results_peak_bytes=results_peak_bytes,
+                        results_rss_bytes=results_rss_bytes,
+                    )
+                )
+            self.result_storage.insert_bulk_data(models)
+            profiler.record_batch(profiles, perf_counter() - start)
+
+        total_tasks = len(tasks)
+        buffer_size = max(1, min(20, total_tasks // 2))
+        saver = BufferedSaver(save_func=save_batch, buffer_size=buffer_size)
+
+        if self.progress is not None:
+            self.progress.start(
+                "execution",
+                [(step_data.statistics.code(), self.monte_carlo_count) for step_data in self.step_config],
+            )
+
+        try:
+            with Scheduler(
+                max_workers=self.parallel_workers,
+                initializer=make_worker_initializer(),
+                memory_budget=self.memory_budget,
+            ) as scheduler:
+                for result in scheduler.iterate_results(tasks, task_memory):
+                    saver.add(result)
+                    if self.progress is not None:
+                        self.progress.advance(result[1], len(result[3]))
+        finally:
+            saver.flush()
+            profiler.log_summary()
+            if self.progress is not None:
+                self.progress.finish()
@@ -2,6 +2,7 @@
 
 import functools
 from dataclasses import dataclass
+from time import perf_counter
 
 from line_profiler import profile
 from typing_extensions import override
@@ -9,11 +10,21 @@ from typing_extensions import override
 from pysatl_experiment.configuration.models.alternative import Alternative
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
+from pysatl_experiment.experiment_execution.generator.generators import (
+    BASE_POOL_GENERATOR_NAME,
+    BASE_POOL_GENERATOR_PARAMETERS,
+)
 from pysatl_experiment.experiment_execution.parallel import BufferedSaver, Scheduler, universal_execute_task
+from pysatl_experiment.experiment_execution.parallel.resources import estimate_task_memory
 from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.experiment_execution.progress import ProgressTracker
 from pysatl_experiment.experiment_execution.step.execution.common.execution_step_data import ExecutionStepData
+from pysatl_experiment.experiment_execution.step.execution.common.task_profiler import TaskProfiler
 from pysatl_experiment.persistence.models.power import IPowerStorage, PowerModel
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage
+from pysatl_experiment.persistence.models.statistic_cache import IStatisticCacheStorage, StatisticCacheModel
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 
 
 @dataclass
@@ -27,10 +38,14 @@ class PowerStepData(ExecutionStepData):
         Alternative distribution configuration.
     significance_level : float
         Significance level used for the criterion.
+    from_base_pool : bool
+        Whether alternative samples are derived from the base uniform pool
+        with the alternative generator ``transform``.
     """
 
     alternative: Alternative
     significance_level: float
+    from_base_pool: bool = False
 
 
 class PowerExecutionStep(IExperimentStep):
@@ -50,6 +65,11 @@ class PowerExecutionStep(IExperimentStep):
         result_storage: IPowerStorage,
         storage_connection: str,
         parallel_workers: int,
+        pool_sample_size: int | None = None,
+        statistic_cache: IStatisticCacheStorage | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
+        progress: ProgressTracker | None = None,
+        memory_budget: int | None = None,
     ) -> None:
         """
         Initialize power execution step.
@@ -70,6 +90,22 @@ class PowerExecutionStep(IExperimentStep):
             Database connection string.
         parallel_workers : int
             Number of parallel worker processes.
+        pool_sample_size : int | None, default=None
+            Size of stored samples whose prefixes are used for all
+            sample sizes in nested samples mode. None if every sample
+            size has its own samples.
+        statistic_cache : IStatisticCacheStorage | None, default=None
+            Storage of statistic values. Workers reuse cached values of
+            the first samples and new values are stored back. None to
+            compute all statistic values.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table with phase timings
+            of every task, None to only log the profile.
+        progress : ProgressTracker | None, default=None
+            Tracker reporting completion of tasks, None to not report it.
+        memory_budget : int | None, default=None
+            Bytes the running tasks may hold together, None to not limit
+            concurrency by memory.
         """
         self.experiment_id = experiment_id
         self.step_config = step_config
@@ -78,6 +114,11 @@ class PowerExecutionStep(IExperimentStep):
         self.result_storage = result_storage
         self.storage_connection = storage_connection
         self.parallel_workers = parallel_workers
+        self.pool_sample_size = pool_sample_size
+        self.statistic_cache = statistic_cache
+        self.task_profile_storage = task_profile_storage
+        self.progress = progress
+        self.memory_budget = memory_budget
 
     @profile
     @override
@@ -89,9 +130,16 @@ class PowerExecutionStep(IExperimentStep):
                 experiment_type=ExperimentType.POWER,
                 statistic_class_name=step_data.statistics.__class__.__name__,
                 statistic_module=step_data.statistics.__class__.__module__,
+                criterion_code=step_data.statistics.code(),
                 sample_size=step_data.sample_size,
                 monte_carlo_count=self.monte_carlo_count,
+                criterion_parameters=step_data.criterion_parameters,
                 db_path=self.storage_connection,
+                start_sample=step_data.stored_monte_carlo_count,
+                pool_sample_size=self.pool_sample_size,
+                cache_statistics=self.statistic_cache is not None,
+                base_generator=BASE_POOL_GENERATOR_NAME if step_data.from_base_pool else "",
+                base_parameters=list(BASE_POOL_GENERATOR_PARAMETERS) if step_data.from_base_pool else [],
                 alternative_generator=step_data.alternative.generator_name,
                 alternative_parameters=step_data.alternative.parameters,
                 significance_level=step_data.significance_level,
@@ -99,8 +147,14 @@ class PowerExecutionStep(IExperimentStep):
             task_specs.append(spec)
 
         tasks = [functools.partial(universal_execute_task, spec) for spec in task_specs]
+        task_memory = [estimate_task_memory(spec) for spec in task_specs]
+        profiler = TaskProfiler(self.experiment_id, self.task_profile_storage)
 
         def save_batch(results_batch: list):
+            start = perf_counter()
+            models = []
+            profiles = []
+            cache_models: list[StatisticCacheModel] = []
             for res in results_batch:
                 (
                     exp_type,
@@ -110,37 +164,75 @@ class PowerExecutionStep(IExperimentStep):
                     alt_generator,
                     alt_parameters,
                     sig_level,
+                    cache_model,
+                    phase_seconds,
                 ) = res
+                profiles.append(
+                    profiler.create_model(
+                        criterion_code, sample_size, phase_seconds, f"{alt_generator}{alt_parameters} alpha={sig_level}"
+                    )
+                )
+                if cache_model is not None:
+                    cache_models.append(cache_model)
                 alternative = Alternative(generator_name=alt_generator, parameters=alt_parameters)
-                self._save_result_to_storage(
-                    criterion_code=criterion_code,
-                    sample_size=sample_size,
-                    alternative=alternative,
-                    significance_level=sig_level,
-                    results_criteria=results_criteria,
+                models.append(
+                    self._create_result_model(
+                        criterion_code=criterion_code,
+                        sample_size=sample_size,
+                        alternative=alternative,
+                        significance_level=sig_level,
+                        results_criteria=results_criteria,
+                    )
                 )
+            self.result_storage.insert_bulk_data(
+                [model for model in models if len(model.results_criteria) == self.monte_carlo_count]
+            )
+            self.result_storage.append_bulk_data(
+                [model for model in models if len(model.results_criteria) < self.monte_carlo_count]
+            )
+            if self.statistic_cache is not None:
+                self.statistic_cache.insert_bulk_data(cache_models)
+            profiler.record_batch(profiles, perf_counter() - start)
 
         total_tasks = len(tasks)
         buffer_size = max(1, min(20, total_tasks // 2))
         saver = BufferedSaver(save_func=save_batch, buffer_size=buffer_size)
 
+        if self.progress is not None:
+            self.progress.start(
+                "execution",
+                [
+                    (step_data.statistics.code(), self.monte_carlo_count - step_data.stored_monte_carlo_count)
+                    for step_data in self.step_config
+                ],
+            )
+
         try:
-            with Scheduler(max_workers=self.parallel_workers) as scheduler:
-                for result in scheduler.iterate_results(tasks):
+            with Scheduler(
+                max_workers=self.parallel_workers,
+                initializer=make_worker_initializer(),
+                memory_budget=self.memory_budget,
+            ) as scheduler:
+                for result in scheduler.iterate_results(tasks, task_memory):
                     saver.add(result)
+                    if self.progress is not None:
+                        self.progress.advance(result[1], len(result[3]))
         finally:
             saver.flush()
+            profiler.log_summary()
+            if self.progress is not None:
+                self.progress.finish()
 
-    def _save_result_to_storage(
+    def _create_result_model(
         self,
         criterion_code: str,
         sample_size: int,
         alternative: Alternative,
         significance_level: float,
         results_criteria: list[bool],
-    ) -> None:
+    ) -> PowerModel:
         """
-        Save power experiment results to storage.
+        Create power model from task result.
 
         Parameters
         ----------
@@ -154,8 +246,13 @@ class PowerExecutionStep(IExperimentStep):
             Significance level.
         results_criteria : list[bool]
             Criterion decisions for generated samples.
+
+        Returns
+        -------
+        PowerModel
+            Power result to store.
         """
-        query = PowerModel(
+        return PowerModel(
             experiment_id=self.experiment_id,
             criterion_code=criterion_code,
             criterion_parameters=[],
@@ -166,6 +263,3 @@ class PowerExecutionStep(IExperimentStep):
             significance_level=significance_level,
             results_criteria=results_criteria,
         )
-
-        storage = self.result_storage
-        storage.insert_data(query)
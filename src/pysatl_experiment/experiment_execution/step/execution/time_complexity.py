@@ -2,18 +2,25 @@
 
 import functools
 from dataclasses import dataclass
+from time import perf_counter
 
 from line_profiler import profile
 
 from pysatl_experiment.configuration.models.experiment_type import ExperimentType
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
 from pysatl_experiment.experiment_execution.parallel import BufferedSaver, Scheduler, universal_execute_task
+from pysatl_experiment.experiment_execution.parallel.resources import estimate_task_memory
 from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.experiment_execution.progress import ProgressTracker
 from pysatl_experiment.experiment_execution.step.execution.common.execution_step_data import ExecutionStepData
 from pysatl_experiment.experiment_execution.step.execution.common.hypothesis_generator_data import (
     HypothesisGeneratorData,
 )
+from pysatl_experiment.experiment_execution.step.execution.common.task_profiler import TaskProfiler
+from pysatl_experiment.experiment_execution.worker.benchmark import BenchmarkSettings
 from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage
+from pysatl_experiment.persistence.models.task_profile import ITaskProfileStorage
 from pysatl_experiment.persistence.models.time_complexity import ITimeComplexityStorage, TimeComplexityModel
 
 
@@ -40,6 +47,11 @@ class TimeComplexityExecutionStep(IExperimentStep):
         result_storage: ITimeComplexityStorage,
         storage_connection: str,
         parallel_workers: int,
+        pool_sample_size: int | None = None,
+        task_profile_storage: ITaskProfileStorage | None = None,
+        progress: ProgressTracker | None = None,
+        benchmark: BenchmarkSettings | None = None,
+        memory_budget: int | None = None,
     ) -> None:
         """
         Initialize time complexity execution step.
@@ -62,6 +74,22 @@ class TimeComplexityExecutionStep(IExperimentStep):
             Database connection string.
         parallel_workers : int
             Number of parallel worker processes.
+        pool_sample_size : int | None, default=None
+            Size of stored samples whose prefixes are used for all
+            sample sizes in nested samples mode. None if every sample
+            size has its own samples.
+        task_profile_storage : ITaskProfileStorage | None, default=None
+            Storage of the experiment profile table with phase timings
+            of every task, None to only log the profile.
+        progress : ProgressTracker | None, default=None
+            Tracker reporting completion of tasks, None to not report it.
+        benchmark : BenchmarkSettings | None, default=None
+            Benchmarking mode settings, None to time a single call per
+            sample. In benchmarking mode tasks are executed one at a time
+            so that measurements are not affected by concurrent tasks.
+        memory_budget : int | None, default=None
+            Bytes the running tasks may hold together, None to not limit
+            concurrency by memory.
         """
         self.experiment_id = experiment_id
         self.hypothesis_generator_data = hypothesis_generator_data
@@ -71,6 +99,11 @@ class TimeComplexityExecutionStep(IExperimentStep):
         self.result_storage = result_storage
         self.storage_connection = storage_connection
         self.parallel_workers = parallel_workers
+        self.pool_sample_size = pool_sample_size
+        self.task_profile_storage = task_profile_storage
+        self.progress = progress
+        self.benchmark = benchmark
+        self.memory_budget = memory_budget
 
     @profile
     def run(self) -> None:
@@ -81,48 +114,92 @@ class TimeComplexityExecutionStep(IExperimentStep):
                 experiment_type=ExperimentType.TIME_COMPLEXITY,
                 statistic_class_name=step_data.statistics.__class__.__name__,
                 statistic_module=step_data.statistics.__class__.__module__,
+                criterion_code=step_data.statistics.code(),
                 sample_size=step_data.sample_size,
                 monte_carlo_count=self.monte_carlo_count,
                 db_path=self.storage_connection,
+                start_sample=step_data.stored_monte_carlo_count,
+                pool_sample_size=self.pool_sample_size,
                 hypothesis_generator=self.hypothesis_generator_data.generator_name,
                 hypothesis_parameters=self.hypothesis_generator_data.parameters,
             )
+            if self.benchmark is not None:
+                spec.benchmark = True
+                spec.warmup_iterations = self.benchmark.warmup_iterations
+                spec.min_timing_seconds = self.benchmark.min_timing_seconds
+                spec.cpu_affinity = list(self.benchmark.cpu_affinity)
             task_specs.append(spec)
 
         tasks = [functools.partial(universal_execute_task, spec) for spec in task_specs]
+        task_memory = [estimate_task_memory(spec) for spec in task_specs]
+        profiler = TaskProfiler(self.experiment_id, self.task_profile_storage)
 
         def save_batch(results_batch: list):
+            start = perf_counter()
+            models = []
+            profiles = []
             for res in results_batch:
-                exp_type, criterion_code, sample_size, results_times = res
-                self._save_result_to_storage(
-                    experiment_id=self.experiment_id,
-                    criterion_code=criterion_code,
-                    sample_size=sample_size,
-                    monte_carlo_count=self.monte_carlo_count,
-                    results_times=results_times,
+                exp_type, criterion_code, sample_size, results_times, phase_seconds = res
+                profiles.append(profiler.create_model(criterion_code, sample_size, phase_seconds))
+                models.append(
+                    self._create_result_model(
+                        experiment_id=self.experiment_id,
+                        criterion_code=criterion_code,
+                        sample_size=sample_size,
+                        monte_carlo_count=self.monte_carlo_count,
+                        results_times=results_times,
+                        benchmark=self.benchmark is not None,
+                    )
                 )
+            self.result_storage.insert_bulk_data(
+                [model for model in models if len(model.results_times) == self.monte_carlo_count]
+            )
+            self.result_storage.append_bulk_data(
+                [model for model in models if len(model.results_times) < self.monte_carlo_count]
+            )
+            profiler.record_batch(profiles, perf_counter() - start)
 
         total_tasks = len(tasks)
         buffer_size = max(1, min(20, total_tasks // 2))
         saver = BufferedSaver(save_func=save_batch, buffer_size=buffer_size)
 
+        if self.progress is not None:
+            self.progress.start(
+                "execution",
+                [
+                    (step_data.statistics.code(), self.monte_carlo_count - step_data.stored_monte_carlo_count)
+                    for step_data in self.step_config
+                ],
+            )
+
+        max_workers = 1 if self.benchmark is not None else self.parallel_workers
         try:
-            with Scheduler(max_workers=self.parallel_workers) as scheduler:
-                for result in scheduler.iterate_results(tasks):
+            with Scheduler(
+                max_workers=max_workers,
+                initializer=make_worker_initializer(),
+                memory_budget=self.memory_budget,
+            ) as scheduler:
+                for result in scheduler.iterate_results(tasks, task_memory):
                     saver.add(result)
+                    if self.progress is not None:
+                        self.progress.advance(result[1], len(result[3]))
         finally:
             saver.flush()
+            profiler.log_summary()
+            if self.progress is not None:
+                self.progress.finish()
 
-    def _save_result_to_storage(
-        self,
+    @staticmethod
+    def _create_result_model(
         experiment_id: int,
         criterion_code: str,
         sample_size: int,
         monte_carlo_count: int,
         results_times: list[float],
-    ) -> None:
+        benchmark: bool = False,
+    ) -> TimeComplexityModel:
         """
-        Save execution time measurements to storage.
+        Create time complexity model from task result.
 
         Parameters
         ----------
@@ -136,14 +213,20 @@ class TimeComplexityExecutionStep(IExperimentStep):
             Number of Monte Carlo iterations.
         results_times : list[float]
             Measured execution times.
+        benchmark : bool, default=False
+            Whether times were measured in benchmarking mode.
+
+        Returns
+        -------
+        TimeComplexityModel
+            Execution time measurements to store.
         """
-        data_to_save = TimeComplexityModel(
+        return TimeComplexityModel(
             experiment_id=experiment_id,
             criterion_code=criterion_code,
             criterion_parameters=[],
             sample_size=sample_size,
             monte_carlo_count=monte_carlo_count,
             results_times=results_times,
+            benchmark=benchmark,
         )
-
-        self.result_storage.insert_data(data_to_save)
@@ -7,7 +7,8 @@ from typing_extensions import override
 
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
 from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
-from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesModel
+from pysatl_experiment.experiment_execution.progress import ProgressTracker
+from pysatl_experiment.persistence.models.random_values import IRandomValuesStorage, RandomValuesAllModel
 
 
 @dataclass
@@ -43,6 +44,7 @@ class GenerationStep(IExperimentStep):
         self,
         step_config: list[GenerationStepData],
         data_storage: IRandomValuesStorage,
+        progress: ProgressTracker | None = None,
     ) -> None:
         """
         Initialize generation step.
@@ -53,17 +55,29 @@ class GenerationStep(IExperimentStep):
             Sample generation configurations.
         data_storage : IRandomValuesStorage
             Storage for generated samples.
+        progress : ProgressTracker | None, default=None
+            Tracker reporting generated samples, None to not report them.
         """
         self.step_config = step_config
         self.data_storage = data_storage
+        self.progress = progress
 
     @profile
     @override
     def run(self) -> None:
         """Execute sample generation step."""
-        for step_data in self.step_config:
-            samples = self._generate_samples(step_data)
-            self._save_samples_to_storage(samples, step_data.sample_size, step_data)
+        if self.progress is not None:
+            self.progress.start("generation", [(data.generator_name, data.count) for data in self.step_config])
+
+        try:
+            for step_data in self.step_config:
+                samples = self._generate_samples(step_data)
+                self._save_samples_to_storage(samples, step_data.sample_size, step_data)
+                if self.progress is not None:
+                    self.progress.advance(step_data.generator_name, step_data.count)
+        finally:
+            if self.progress is not None:
+                self.progress.finish()
 
     @profile
     def _generate_samples(self, step_data: GenerationStepData) -> list[list[float]]:
@@ -93,6 +107,9 @@ class GenerationStep(IExperimentStep):
         """
         Save generated samples to storage.
 
+        Samples are appended after the samples already stored for the
+        generator, so extending an existing pool keeps its samples.
+
         Parameters
         ----------
         samples : list[list[float]]
@@ -102,16 +119,10 @@ class GenerationStep(IExperimentStep):
         step_data : GenerationStepData
             Generation task configuration.
         """
-        for i in range(len(samples)):
-            sample = samples[i]
-            generator_name = step_data.generator_name
-            generator_parameters = step_data.generator_parameters
-            sample_num = i + 1
-            data_to_save = RandomValuesModel(
-                generator_name=generator_name,
-                generator_parameters=generator_parameters,
-                sample_size=sample_size,
-                sample_num=sample_num,
-                data=sample,
-            )
-            self.data_storage.insert_data(data_to_save)
+        data_to_save = RandomValuesAllModel(
+            generator_name=step_data.generator_name,
+            generator_parameters=step_data.generator_parameters,
+            sample_size=sample_size,
+            data=samples,
+        )
+        self.data_storage.append_all_data(data_to_save)
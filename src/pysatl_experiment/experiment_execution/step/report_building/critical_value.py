@@ -2,14 +2,24 @@
 
 from pathlib import Path
 
+import numpy as np
 from line_profiler import profile
-from pysatl_criterion.hypothesis_testing.critical_values.cv_calculator.cv_calculator import CVCalculator
-from pysatl_criterion.persistence.models.limit_distribution import ILimitDistributionStorage, LimitDistributionQuery
+from pysatl_criterion.persistence.models.limit_distribution import (
+    ILimitDistributionStorage,
+    LimitDistributionModel,
+    LimitDistributionQuery,
+)
+from pysatl_criterion.statistics.models import HypothesisType
 from typing_extensions import override
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
+from pysatl_experiment.experiment_execution.critical_values import VectorizedCVCalculator, compute_critical_values
+from pysatl_experiment.persistence.critical_value_storage import AlchemyCriticalValueStorage
+from pysatl_experiment.persistence.models.critical_value import CriticalValueModel
 from pysatl_experiment.report.critical_value import CriticalValueReportBuilder
 
 
@@ -26,6 +36,9 @@ class CriticalValueReportBuildingStep(IExperimentStep):
         result_storage: ILimitDistributionStorage,
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
+        storage_connection: str | None = None,
     ) -> None:
         """
         Initialize critical value report builder step.
@@ -48,6 +61,13 @@ class CriticalValueReportBuildingStep(IExperimentStep):
             Output directory for generated reports.
         with_chart : ReportMode
             Report visualization mode.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
+        storage_connection : str | None, default=None
+            Database connection string. If set, computed critical values
+            are stored in the precomputed critical values table.
         """
         self.criteria_config = criteria_config
         self.report_name = report_name
@@ -57,21 +77,29 @@ class CriticalValueReportBuildingStep(IExperimentStep):
         self.result_storage = result_storage
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
+        self.storage_connection = storage_connection
 
     @profile
     @override
     def run(self) -> None:
-        """Calculate critical values and build report."""
-        cv_values = []
-        for criterion_config in self.criteria_config:
-            for sample_size in self.sizes:
-                cv_calculator = CVCalculator(self.result_storage)
-                for significance_level in self.significance_levels:
-                    cv_value = cv_calculator.calculate_critical_value(
-                        criterion_config.criterion_code, sample_size, significance_level
-                    )
-
-                    cv_values.append(cv_value)
+        """Calculate critical values, store them and build report."""
+        cv_calculator = VectorizedCVCalculator(self.result_storage)
+        limit_distributions = cv_calculator.load_limit_distributions(
+            criterion_codes=[criterion_config.criterion_code for criterion_config in self.criteria_config],
+            sample_sizes=self.sizes,
+        )
+        cv_values = {
+            code: compute_critical_values(
+                [model.results_statistics for model in models],
+                self.significance_levels,
+            )
+            for code, models in limit_distributions.items()
+        }
+
+        if self.storage_connection is not None:
+            self._save_critical_values(self.storage_connection, limit_distributions, cv_values)
 
         report_builder = CriticalValueReportBuilder(
             report_name=self.report_name,
@@ -81,9 +109,50 @@ class CriticalValueReportBuildingStep(IExperimentStep):
             cv_values=cv_values,
             results_path=self.results_path,
             with_chart=self.with_chart,
+            report_format=self.report_format,
+            chart_format=self.chart_format,
         )
         report_builder.build()
 
+    def _save_critical_values(
+        self,
+        storage_connection: str,
+        limit_distributions: dict[str, list[LimitDistributionModel]],
+        cv_values: dict[str, np.ndarray],
+    ) -> None:
+        """
+        Store computed right-tailed critical values for power experiments.
+
+        Parameters
+        ----------
+        storage_connection : str
+            Database connection string.
+        limit_distributions : dict[str, list[LimitDistributionModel]]
+            Limit distributions per criterion ordered as ``self.sizes``.
+        cv_values : dict[str, np.ndarray]
+            Critical values per criterion with shape ``(sizes, levels)``.
+        """
+        models = [
+            CriticalValueModel(
+                experiment_id=distribution.experiment_id,
+                criterion_code=code,
+                criterion_parameters=distribution.criterion_parameters,
+                sample_size=distribution.sample_size,
+                significance_level=float(significance_level),
+                alternative=HypothesisType.RIGHT.value,
+                monte_carlo_count=distribution.monte_carlo_count,
+                lower_value=None,
+                upper_value=float(value),
+            )
+            for code, distributions in limit_distributions.items()
+            for distribution, values in zip(distributions, cv_values[code], strict=True)
+            for significance_level, value in zip(self.significance_levels, values, strict=True)
+        ]
+
+        critical_value_storage = AlchemyCriticalValueStorage(storage_connection)
+        critical_value_storage.init()
+        critical_value_storage.insert_bulk_data(models)
+
     @staticmethod
     def _get_limit_distribution_from_storage(
         storage: ILimitDistributionStorage,
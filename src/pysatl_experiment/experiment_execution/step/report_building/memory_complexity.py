@@ -0,0 +1,171 @@
+"""Memory complexity report building step implementation."""
+
+from pathlib import Path
+
+import numpy as np
+from line_profiler import profile
+from typing_extensions import override
+
+from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
+from pysatl_experiment.configuration.models.report_mode import ReportMode
+from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
+from pysatl_experiment.experiment_execution.complexity import ComplexityFit, fit_complexity
+from pysatl_experiment.persistence.models.memory_complexity import (
+    IMemoryComplexityStorage,
+    MemoryComplexityModel,
+    MemoryComplexityQuery,
+)
+from pysatl_experiment.report.memory_complexity import MemoryComplexityReportBuilder
+
+
+class MemoryComplexityReportBuildingStep(IExperimentStep):
+    """Standard memory complexity experiment report building step."""
+
+    def __init__(
+        self,
+        report_name: str,
+        criteria_config: list[CriterionConfig],
+        sample_sizes: list[int],
+        monte_carlo_count: int,
+        result_storage: IMemoryComplexityStorage,
+        results_path: Path,
+        with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
+        extrapolation_sizes: list[int] | None = None,
+    ) -> None:
+        """
+        Initialize memory complexity report building step.
+
+        Parameters
+        ----------
+        report_name : str
+            Name of the generated report.
+        criteria_config : list[CriterionConfig]
+            Statistical criteria configurations.
+        sample_sizes : list[int]
+            Sample sizes used in experiments.
+        monte_carlo_count : int
+            Number of Monte Carlo iterations.
+        result_storage : IMemoryComplexityStorage
+            Storage with memory usage measurements.
+        results_path : Path
+            Output directory for generated reports.
+        with_chart : ReportMode
+            Report visualization mode.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
+        extrapolation_sizes : list[int] | None, default=None
+            Untested sample sizes peak allocations are extrapolated to,
+            None for 10, 100 and 1000 times the largest sample size.
+        """
+        self.report_name = report_name
+        self.criteria_config = criteria_config
+        self.sizes = sorted(sample_sizes)
+        self.monte_carlo_count = monte_carlo_count
+        self.result_storage = result_storage
+        self.results_path = results_path
+        self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
+        if extrapolation_sizes is None:
+            extrapolation_sizes = [factor * self.sizes[-1] for factor in (10, 100, 1000)] if self.sizes else []
+        self.extrapolation_sizes = sorted(extrapolation_sizes)
+
+    @profile
+    @override
+    def run(self) -> None:
+        """Collect memory statistics, fit complexity models and build report."""
+        results = self._collect_results()
+
+        report_builder = MemoryComplexityReportBuilder(
+            report_name=self.report_name,
+            criteria_config=self.criteria_config,
+            sample_sizes=self.sizes,
+            memory={
+                code: [
+                    (size, float(np.max(result.results_peak_bytes)), float(np.mean(result.results_rss_bytes)))
+                    for size, result in criterion_results
+                ]
+                for code, criterion_results in results.items()
+            },
+            results_path=self.results_path,
+            with_chart=self.with_chart,
+            report_format=self.report_format,
+            chart_format=self.chart_format,
+            fits=self._fit_complexity(results),
+            extrapolation_sizes=self.extrapolation_sizes,
+        )
+        report_builder.build()
+
+    def _collect_results(self) -> dict[str, list[tuple[int, MemoryComplexityModel]]]:
+        """
+        Load memory measurements of each criterion.
+
+        Returns
+        -------
+        dict[str, list[tuple[int, MemoryComplexityModel]]]
+            Mapping of criterion codes to sample sizes and their measurements.
+
+        Raises
+        ------
+        ValueError
+            If measurements are not found.
+        """
+        results = {}
+
+        for criterion in self.criteria_config:
+            criterion_results = []
+
+            for size in self.sizes:
+                query = MemoryComplexityQuery(
+                    criterion_code=criterion.criterion_code,
+                    criterion_parameters=criterion.criterion.parameters,
+                    sample_size=size,
+                    monte_carlo_count=self.monte_carlo_count,
+                )
+                result = self.result_storage.get_data(query)
+                if result is None:
+                    raise ValueError(f"Memory usage for query {query} not found.")
+
+                if result.results_peak_bytes:
+                    criterion_results.append((size, result))
+
+            results[criterion.criterion_code] = criterion_results
+
+        return results
+
+    @staticmethod
+    def _fit_complexity(
+        results: dict[str, list[tuple[int, MemoryComplexityModel]]],
+    ) -> dict[str, ComplexityFit]:
+        """
+        Fit complexity models to peak allocations of each criterion.
+
+        Parameters
+        ----------
+        results : dict[str, list[tuple[int, MemoryComplexityModel]]]
+            Memory measurements of each criterion and sample size.
+
+        Returns
+        -------
+        dict[str, ComplexityFit]
+            Mapping of criterion codes to fitted models. Criteria measured
+            for less than two sample sizes are omitted.
+        """
+        fits = {}
+        for code, criterion_results in results.items():
+            if not criterion_results:
+                continue
+            fit = fit_complexity(
+                [size for size, _ in criterion_results],
+                [[float(peak) for peak in result.results_peak_bytes] for _, result in criterion_results],
+            )
+            if fit is not None:
+                fits[code] = fit
+
+        return fits
@@ -7,6 +7,8 @@ from typing_extensions import override
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
 from pysatl_experiment.configuration.models.alternative import Alternative
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
 from pysatl_experiment.persistence.models.power import IPowerStorage, PowerQuery
@@ -27,6 +29,8 @@ class PowerReportBuildingStep(IExperimentStep):
         result_storage: IPowerStorage,
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
     ) -> None:
         """
         Initialize power report building step.
@@ -51,6 +55,10 @@ class PowerReportBuildingStep(IExperimentStep):
             Output directory for generated reports.
         with_chart : ReportMode
             Report visualization mode.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
         """
         self.report_name = report_name
         self.criteria_config = criteria_config
@@ -61,6 +69,8 @@ class PowerReportBuildingStep(IExperimentStep):
         self.result_storage = result_storage
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
 
     @profile
     @override
@@ -77,6 +87,8 @@ class PowerReportBuildingStep(IExperimentStep):
             power_result=power_data,
             results_path=self.results_path,
             with_chart=self.with_chart,
+            report_format=self.report_format,
+            chart_format=self.chart_format,
         )
         builder.build()
 
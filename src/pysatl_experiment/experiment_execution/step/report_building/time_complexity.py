@@ -7,8 +7,11 @@ from line_profiler import profile
 from typing_extensions import override
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.experiment_execution.abstract_experiment_step import IExperimentStep
+from pysatl_experiment.experiment_execution.complexity import ComplexityFit, fit_complexity
 from pysatl_experiment.persistence.models.time_complexity import ITimeComplexityStorage, TimeComplexityQuery
 from pysatl_experiment.report.time_complexity import TimeComplexityReportBuilder
 
@@ -25,6 +28,10 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
         result_storage: ITimeComplexityStorage,
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
+        extrapolation_sizes: list[int] | None = None,
+        benchmark: bool = False,
     ) -> None:
         """
         Initialize time complexity report building step.
@@ -45,6 +52,15 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
             Output directory for generated reports.
         with_chart : ReportMode
             Report visualization mode.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
+        extrapolation_sizes : list[int] | None, default=None
+            Untested sample sizes execution times are extrapolated to,
+            None for 2, 5 and 10 times the largest sample size.
+        benchmark : bool, default=False
+            Report execution times measured in benchmarking mode.
         """
         self.report_name = report_name
         self.criteria_config = criteria_config
@@ -53,52 +69,109 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
         self.result_storage = result_storage
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
+        if extrapolation_sizes is None:
+            extrapolation_sizes = [factor * self.sizes[-1] for factor in (2, 5, 10)] if self.sizes else []
+        self.extrapolation_sizes = sorted(extrapolation_sizes)
+        self.benchmark = benchmark
 
     @profile
     @override
     def run(self) -> None:
-        """Collect timing statistics and build report."""
-        times_data = self._collect_statistics()
+        """Collect timing statistics, fit complexity models and build report."""
+        times = self._collect_times()
 
         report_builder = TimeComplexityReportBuilder(
             report_name=self.report_name,
             criteria_config=self.criteria_config,
             sample_sizes=self.sizes,
-            times=times_data,
+            times=self._collect_statistics(times),
             results_path=self.results_path,
             with_chart=self.with_chart,
+            report_format=self.report_format,
+            chart_format=self.chart_format,
+            fits=self._fit_complexity(times),
+            extrapolation_sizes=self.extrapolation_sizes,
         )
         report_builder.build()
 
-    def _collect_statistics(self) -> dict[str, list[tuple[int, float]]]:
+    def _collect_times(self) -> dict[str, list[tuple[int, list[float]]]]:
         """
-        Collect average execution times for each criterion.
+        Load execution times of each criterion.
 
         Returns
         -------
-        dict[str, list[tuple[int, float]]]
-            Mapping of criterion codes to average execution times.
+        dict[str, list[tuple[int, list[float]]]]
+            Mapping of criterion codes to sample sizes and their execution times.
         """
-        stats = {}
+        times = {}
 
         for criterion in self.criteria_config:
-            criterion_stats = []
+            criterion_times = []
 
             for size in self.sizes:
-                times = self._get_times_from_storage(
+                size_times = self._get_times_from_storage(
                     storage=self.result_storage,
                     criterion_config=criterion,
                     sample_size=size,
                     monte_carlo_count=self.monte_carlo_count,
+                    benchmark=self.benchmark,
                 )
 
-                if times:
-                    mean = float(np.mean(times))
-                    criterion_stats.append((size, mean))
+                if size_times:
+                    criterion_times.append((size, size_times))
+
+            times[criterion.criterion_code] = criterion_times
+
+        return times
+
+    @staticmethod
+    def _collect_statistics(times: dict[str, list[tuple[int, list[float]]]]) -> dict[str, list[tuple[int, float]]]:
+        """
+        Collect average execution times for each criterion.
+
+        Parameters
+        ----------
+        times : dict[str, list[tuple[int, list[float]]]]
+            Execution times of each criterion and sample size.
+
+        Returns
+        -------
+        dict[str, list[tuple[int, float]]]
+            Mapping of criterion codes to average execution times.
+        """
+        return {
+            code: [(size, float(np.mean(size_times))) for size, size_times in criterion_times]
+            for code, criterion_times in times.items()
+        }
+
+    @staticmethod
+    def _fit_complexity(times: dict[str, list[tuple[int, list[float]]]]) -> dict[str, ComplexityFit]:
+        """
+        Fit complexity models for each criterion.
+
+        Parameters
+        ----------
+        times : dict[str, list[tuple[int, list[float]]]]
+            Execution times of each criterion and sample size.
 
-            stats[criterion.criterion_code] = criterion_stats
+        Returns
+        -------
+        dict[str, ComplexityFit]
+            Mapping of criterion codes to fitted models. Criteria measured
+            for less than two sample sizes are omitted.
+        """
+        fits = {}
+        for code, criterion_times in times.items():
+            if not criterion_times:
+                continue
+            sizes, size_times = zip(*criterion_times, strict=True)
+            fit = fit_complexity(sizes, size_times)
+            if fit is not None:
+                fits[code] = fit
 
-        return stats
+        return fits
 
     @staticmethod
     def _get_times_from_storage(
@@ -106,6 +179,7 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
         criterion_config: CriterionConfig,
         sample_size: int,
         monte_carlo_count: int,
+        benchmark: bool = False,
     ) -> list[float]:
         """
         Load execution time measurements from storage.
@@ -120,6 +194,8 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
             Sample size.
         monte_carlo_count : int
             Number of Monte Carlo iterations.
+        benchmark : bool, default=False
+            Load times measured in benchmarking mode.
 
         Returns
         -------
@@ -136,6 +212,7 @@ class TimeComplexityReportBuildingStep(IExperimentStep):
             criterion_parameters=criterion_config.criterion.parameters,
             sample_size=sample_size,
             monte_carlo_count=monte_carlo_count,
+            benchmark=benchmark,
         )
 
         result = storage.get_data(query)
@@ -0,0 +1,156 @@
+"""
+Benchmarking utilities of time complexity measurements.
+
+The helpers follow the approach of :mod:`timeit`: short calls are repeated
+in an inner loop until the loop runs long enough to be measured reliably,
+the cost of the timing loop itself is calibrated and subtracted, and the
+garbage collector is disabled while timing.
+"""
+
+import gc
+import logging
+import os
+from collections.abc import Callable, Iterator, Sequence
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from time import perf_counter
+
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BenchmarkSettings:
+    """
+    Settings of benchmarking mode of time complexity measurements.
+
+    Attributes
+    ----------
+    warmup_iterations : int
+        Untimed calls made before the first measurement.
+    min_timing_seconds : float
+        Minimum duration of the timed inner loop of a sample, the number
+        of repetitions grows until it is reached.
+    cpu_affinity : list[int]
+        CPUs the measuring process is pinned to, empty to not pin it.
+    """
+
+    warmup_iterations: int = 3
+    min_timing_seconds: float = 0.01
+    cpu_affinity: list[int] = field(default_factory=list)
+
+
+def time_calls(func: Callable[[], object], number: int) -> float:
+    """
+    Measure total time of repeated calls.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        Measured function.
+    number : int
+        Number of calls.
+
+    Returns
+    -------
+    float
+        Time of all calls in seconds.
+    """
+    start = perf_counter()
+    for _ in range(number):
+        func()
+    return perf_counter() - start
+
+
+def autorange(func: Callable[[], object], min_seconds: float) -> tuple[int, float]:
+    """
+    Find number of calls whose total time reaches the minimum duration.
+
+    The number of calls grows in a 1, 2, 5, 10, 20, 50, ... sequence like
+    in :meth:`timeit.Timer.autorange`.
+
+    Parameters
+    ----------
+    func : Callable[[], object]
+        Measured function.
+    min_seconds : float
+        Minimum total time of the calls.
+
+    Returns
+    -------
+    tuple[int, float]
+        Number of calls and their total time in seconds.
+    """
+    scale = 1
+    while True:
+        for multiplier in (1, 2, 5):
+            number = scale * multiplier
+            elapsed = time_calls(func, number)
+            if elapsed >= min_seconds:
+                return number, elapsed
+        scale *= 10
+
+
+def calibrate_timer_overhead(number: int = 10000, repeat: int = 5) -> float:
+    """
+    Estimate cost of a single iteration of the timed loop.
+
+    Parameters
+    ----------
+    number : int, default=10000
+        Number of empty calls timed in each repetition.
+    repeat : int, default=5
+        Number of repetitions, the fastest one is used.
+
+    Returns
+    -------
+    float
+        Overhead of timing one call in seconds.
+    """
+    return min(time_calls(_noop, number) for _ in range(repeat)) / number
+
+
+@contextmanager
+def pinned_to_cpus(cpus: Sequence[int]) -> Iterator[None]:
+    """
+    Pin current process to CPUs for the duration of the context.
+
+    Pinning is skipped with a warning on platforms without
+    ``os.sched_setaffinity``.
+
+    Parameters
+    ----------
+    cpus : Sequence[int]
+        CPU indices, empty to not pin the process.
+    """
+    if not cpus:
+        yield
+        return
+
+    if not hasattr(os, "sched_setaffinity"):
+        logger.warning("CPU pinning is not supported on this platform, timings are measured unpinned.")
+        yield
+        return
+
+    previous = os.sched_getaffinity(0)
+    os.sched_setaffinity(0, set(cpus))
+    try:
+        yield
+    finally:
+        os.sched_setaffinity(0, previous)
+
+
+@contextmanager
+def gc_disabled() -> Iterator[None]:
+    """Disable garbage collector for the duration of the context."""
+    enabled = gc.isenabled()
+    gc.disable()
+    try:
+        yield
+    finally:
+        if enabled:
+            gc.enable()
+
+
+def _noop() -> None:
+    """Do nothing, used to calibrate timing overhead."""
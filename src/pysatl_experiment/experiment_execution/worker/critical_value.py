@@ -6,10 +6,12 @@ statistical values for a set of samples using a specified
 goodness-of-fit statistic.
 """
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
 from line_profiler import profile
 from numpy import float64
+from numpy.typing import NDArray
 from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
 
 from pysatl_experiment.experiment_execution.worker.abstract_worker import IWorker, WorkerResult
@@ -40,18 +42,27 @@ class CriticalValueWorker(IWorker[CriticalValueWorkerResult]):
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistical test or metric used to compute values on each sample.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[float64]]
         Collection of samples. Each inner list represents one dataset.
+    cached_statistics : Sequence[float], default=()
+        Already computed statistic values of samples preceding ``sample_data``.
 
     Attributes
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistic instance used for computations.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[float64]]
         Input samples to process.
+    cached_statistics : Sequence[float]
+        Statistic values prepended to computed ones.
     """
 
-    def __init__(self, statistics: AbstractGoodnessOfFitStatistic, sample_data: list[list[float]]):
+    def __init__(
+        self,
+        statistics: AbstractGoodnessOfFitStatistic,
+        sample_data: Iterable[list[float] | NDArray[float64]],
+        cached_statistics: Sequence[float] = (),
+    ):
         """
         Initialize worker.
 
@@ -59,11 +70,14 @@ class CriticalValueWorker(IWorker[CriticalValueWorkerResult]):
         ----------
         statistics : AbstractGoodnessOfFitStatistic
             Statistic instance used for computation.
-        sample_data : list[list[float]]
+        sample_data : Iterable[list[float] | NDArray[float64]]
             Input datasets.
+        cached_statistics : Sequence[float], default=()
+            Already computed statistic values of preceding samples.
         """
         self.statistics = statistics
         self.sample_data = sample_data
+        self.cached_statistics = cached_statistics
 
     @profile
     def execute(self) -> CriticalValueWorkerResult:
@@ -73,9 +87,10 @@ class CriticalValueWorker(IWorker[CriticalValueWorkerResult]):
         Returns
         -------
         CriticalValueWorkerResult
-            Object containing computed statistic values for all samples.
+            Object containing cached and computed statistic values for all samples.
         """
-        results_statistics = [self.statistics.execute_statistic(rvs=data) for data in self.sample_data]
+        results_statistics: list[float | float64] = list(self.cached_statistics)
+        results_statistics.extend(self.statistics.execute_statistic(rvs=data) for data in self.sample_data)
 
         result = CriticalValueWorkerResult(results_statistics=results_statistics)
 
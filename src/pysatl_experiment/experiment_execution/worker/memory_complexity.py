@@ -0,0 +1,120 @@
+"""
+Memory complexity measurement worker module.
+
+This module implements a worker that profiles memory usage
+of a statistical function over multiple datasets.
+"""
+
+import tracemalloc
+from collections.abc import Iterable
+from dataclasses import dataclass
+
+import numpy as np
+import psutil
+from numpy.typing import NDArray
+from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
+
+from pysatl_experiment.experiment_execution.worker.abstract_worker import IWorker, WorkerResult
+
+
+@dataclass
+class MemoryComplexityWorkerResult(WorkerResult):
+    """
+    Result container for memory complexity worker.
+
+    Attributes
+    ----------
+    results_peak_bytes : list[int]
+        Peak memory (in bytes) allocated by each statistic call.
+    results_rss_bytes : list[int]
+        Change of the process resident set size (in bytes) caused by each
+        statistic call.
+    """
+
+    results_peak_bytes: list[int]
+    results_rss_bytes: list[int]
+
+
+class MemoryComplexityWorker(IWorker[MemoryComplexityWorkerResult]):
+    """
+    Worker for measuring memory usage of a statistic.
+
+    This worker executes a statistical function on multiple samples and
+    records for each call the peak of memory allocations traced by
+    ``tracemalloc`` above the memory held before the call, and the
+    change of the process resident set size reported by ``psutil``.
+
+    Parameters
+    ----------
+    statistics : AbstractGoodnessOfFitStatistic
+        Statistic function to profile.
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
+        Input samples used for memory measurements.
+
+    Attributes
+    ----------
+    statistics : AbstractGoodnessOfFitStatistic
+        Statistic being profiled.
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
+        Input dataset for memory evaluation.
+
+    Notes
+    -----
+    Traced peaks cover allocations made through the Python memory
+    allocators, including NumPy arrays. The resident set size also covers
+    native allocations, but is affected by allocator caching and is
+    therefore a coarse measure.
+    """
+
+    def __init__(
+        self, statistics: AbstractGoodnessOfFitStatistic, sample_data: Iterable[list[float] | NDArray[np.float64]]
+    ):
+        """
+        Initialize memory complexity worker.
+
+        Parameters
+        ----------
+        statistics : AbstractGoodnessOfFitStatistic
+            Statistic instance to profile.
+        sample_data : Iterable[list[float] | NDArray[np.float64]]
+            Input datasets.
+        """
+        self.statistics = statistics
+        self.sample_data = sample_data
+
+    def execute(self) -> MemoryComplexityWorkerResult:
+        """
+        Measure memory usage of the statistic over all samples.
+
+        Returns
+        -------
+        MemoryComplexityWorkerResult
+            Peak traced allocation and resident set size change of each sample.
+        """
+        process = psutil.Process()
+        started_tracing = not tracemalloc.is_tracing()
+        if started_tracing:
+            tracemalloc.start()
+
+        results_peak_bytes = []
+        results_rss_bytes = []
+        try:
+            for data in self.sample_data:
+                tracemalloc.reset_peak()
+                baseline, _ = tracemalloc.get_traced_memory()
+                rss_before = process.memory_info().rss
+
+                _ = self.statistics.execute_statistic(rvs=data)
+
+                rss_after = process.memory_info().rss
+                _, peak = tracemalloc.get_traced_memory()
+                results_peak_bytes.append(max(peak - baseline, 0))
+                results_rss_bytes.append(rss_after - rss_before)
+        finally:
+            if started_tracing:
+                tracemalloc.stop()
+
+        return MemoryComplexityWorkerResult(
+            results_peak_bytes=results_peak_bytes,
+            results_rss_bytes=results_rss_bytes,
+        )
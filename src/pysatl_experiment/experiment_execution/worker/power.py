@@ -6,13 +6,14 @@ statistical power of a hypothesis test using Monte Carlo samples
 and precomputed critical values stored in a database.
 """
 
+from collections.abc import Iterable, Sequence
 from dataclasses import dataclass
 
-from pysatl_criterion import GoodnessOfFitTest
-from pysatl_criterion.hypothesis_testing.critical_values.resolver.storage_resolver import StorageCriticalValueResolver
-from pysatl_criterion.persistence.sqlalchemy.datastorage import AlchemyLimitDistributionStorage
+import numpy as np
+from numpy.typing import NDArray
 from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
 
+from pysatl_experiment.experiment_execution.critical_values import get_process_critical_value_resolver
 from pysatl_experiment.experiment_execution.worker.abstract_worker import IWorker, WorkerResult
 
 
@@ -26,9 +27,12 @@ class PowerWorkerResult(WorkerResult):
     results_criteria : list[bool]
         Boolean outcomes indicating whether hypothesis was rejected
         for each sample.
+    results_statistics : list[float]
+        Statistic values of each sample.
     """
 
     results_criteria: list[bool]
+    results_statistics: list[float]
 
 
 class PowerWorker(IWorker[PowerWorkerResult]):
@@ -43,31 +47,41 @@ class PowerWorker(IWorker[PowerWorkerResult]):
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistic used in hypothesis testing.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
         Generated samples for evaluation.
     significance_level : float
         Significance level (alpha) used for hypothesis testing.
     storage_connection : str
         Connection string to SQLite database containing critical values.
+    sample_size : int
+        Size of samples, used to resolve critical values.
+    cached_statistics : Sequence[float], default=()
+        Already computed statistic values of samples preceding ``sample_data``.
 
     Attributes
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistic instance used in testing.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
         Input samples.
     significance_level : float
         Alpha level for tests.
     storage_connection : str
         Database connection string.
+    sample_size : int
+        Size of samples.
+    cached_statistics : Sequence[float]
+        Statistic values prepended to computed ones.
     """
 
     def __init__(
         self,
         statistics: AbstractGoodnessOfFitStatistic,
-        sample_data: list[list[float]],
+        sample_data: Iterable[list[float] | NDArray[np.float64]],
         significance_level: float,
         storage_connection: str,
+        sample_size: int,
+        cached_statistics: Sequence[float] = (),
     ):
         """
         Initialize power worker.
@@ -76,17 +90,23 @@ class PowerWorker(IWorker[PowerWorkerResult]):
         ----------
         statistics : AbstractGoodnessOfFitStatistic
             Statistic used in testing.
-        sample_data : list[list[float]]
+        sample_data : Iterable[list[float] | NDArray[np.float64]]
             Input datasets.
         significance_level : float
             Alpha level for hypothesis testing.
         storage_connection : str
             SQLAlchemy database connection string.
+        sample_size : int
+            Size of samples.
+        cached_statistics : Sequence[float], default=()
+            Already computed statistic values of preceding samples.
         """
         self.statistics = statistics
         self.sample_data = sample_data
         self.significance_level = significance_level
         self.storage_connection = storage_connection
+        self.sample_size = sample_size
+        self.cached_statistics = cached_statistics
 
     def execute(self) -> PowerWorkerResult:
         """
@@ -96,27 +116,30 @@ class PowerWorker(IWorker[PowerWorkerResult]):
         -------
         PowerWorkerResult
             Results indicating whether hypothesis was rejected for each sample.
-        """
-        storage = AlchemyLimitDistributionStorage(self.storage_connection)
-        storage.init()
 
-        cv_resolver = StorageCriticalValueResolver(storage)
+        Notes
+        -----
+        Critical values are resolved through a resolver shared by all
+        tasks of the worker process, so limit distributions are not
+        reloaded for every task and sample. The critical area is resolved
+        once per task for the right-sided alternative, as done by
+        ``GoodnessOfFitTest``, and applied to all statistic values.
+        """
+        cv_resolver = get_process_critical_value_resolver(self.storage_connection)
 
-        gof_test = GoodnessOfFitTest(
-            statistics=[self.statistics],
-            significance_level=self.significance_level,
-            cv_resolver=cv_resolver,
-        )
+        results_statistics = list(self.cached_statistics)
+        results_statistics.extend(self.statistics.execute_statistic(sample) for sample in self.sample_data)
 
-        results_criteria = []
-        for sample in self.sample_data:
-            result = gof_test.test(sample)
-            results_criteria.append(result)
+        code = self.statistics.code()
+        critical_area = cv_resolver.resolve_bulk([code], self.sample_size, self.significance_level).get(code)
+        results_criteria = [
+            critical_area.contains(statistic) if critical_area is not None else False
+            for statistic in results_statistics
+        ]
 
-        worker_result = PowerWorkerResult(results_criteria=results_criteria)
+        worker_result = PowerWorkerResult(results_criteria=results_criteria, results_statistics=results_statistics)
 
         return worker_result
 
 
-# TODO: wrong types, should be fixed!!!!!!!
 # TODO: check tests with db and w/o
@@ -5,12 +5,22 @@ This module implements a worker that benchmarks execution time
 of a statistical function over multiple datasets.
 """
 
+from collections.abc import Iterable
 from dataclasses import dataclass
 from time import perf_counter
 
+import numpy as np
+from numpy.typing import NDArray
 from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
 
 from pysatl_experiment.experiment_execution.worker.abstract_worker import IWorker, WorkerResult
+from pysatl_experiment.experiment_execution.worker.benchmark import (
+    BenchmarkSettings,
+    autorange,
+    calibrate_timer_overhead,
+    gc_disabled,
+    pinned_to_cpus,
+)
 
 
 @dataclass
@@ -38,18 +48,27 @@ class TimeComplexityWorker(IWorker[TimeComplexityWorkerResult]):
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistic function to benchmark.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
         Input samples used for timing measurements.
+    benchmark : BenchmarkSettings | None, default=None
+        Benchmarking mode settings, None to time a single call per sample.
 
     Attributes
     ----------
     statistics : AbstractGoodnessOfFitStatistic
         Statistic being benchmarked.
-    sample_data : list[list[float]]
+    sample_data : Iterable[list[float] | NDArray[np.float64]]
         Input dataset for performance evaluation.
+    benchmark : BenchmarkSettings | None
+        Benchmarking mode settings.
     """
 
-    def __init__(self, statistics: AbstractGoodnessOfFitStatistic, sample_data: list[list[float]]):
+    def __init__(
+        self,
+        statistics: AbstractGoodnessOfFitStatistic,
+        sample_data: Iterable[list[float] | NDArray[np.float64]],
+        benchmark: BenchmarkSettings | None = None,
+    ):
         """
         Initialize time complexity worker.
 
@@ -57,11 +76,14 @@ class TimeComplexityWorker(IWorker[TimeComplexityWorkerResult]):
         ----------
         statistics : AbstractGoodnessOfFitStatistic
             Statistic instance to benchmark.
-        sample_data : list[list[float]]
+        sample_data : Iterable[list[float] | NDArray[np.float64]]
             Input datasets.
+        benchmark : BenchmarkSettings | None, default=None
+            Benchmarking mode settings, None to time a single call per sample.
         """
         self.statistics = statistics
         self.sample_data = sample_data
+        self.benchmark = benchmark
 
     def execute(self) -> TimeComplexityWorkerResult:
         """
@@ -72,6 +94,9 @@ class TimeComplexityWorker(IWorker[TimeComplexityWorkerResult]):
         TimeComplexityWorkerResult
             List of execution times (in seconds) for each sample.
         """
+        if self.benchmark is not None:
+            return TimeComplexityWorkerResult(results_times=self._execute_benchmark(self.benchmark))
+
         results_times = []
         for data in self.sample_data:
             start = perf_counter()
@@ -83,3 +108,39 @@ class TimeComplexityWorker(IWorker[TimeComplexityWorkerResult]):
         result = TimeComplexityWorkerResult(results_times=results_times)
 
         return result
+
+    def _execute_benchmark(self, benchmark: BenchmarkSettings) -> list[float]:
+        """
+        Measure execution time of the statistic in benchmarking mode.
+
+        The statistic is warmed up on the first sample, every sample is
+        timed in an inner loop long enough to be measured reliably and
+        the calibrated overhead of the loop is subtracted from the time
+        of a single call.
+
+        Parameters
+        ----------
+        benchmark : BenchmarkSettings
+            Benchmarking mode settings.
+
+        Returns
+        -------
+        list[float]
+            Execution time (in seconds) of a single call for each sample.
+        """
+        results_times = []
+        with pinned_to_cpus(benchmark.cpu_affinity), gc_disabled():
+            overhead = calibrate_timer_overhead()
+            for index, data in enumerate(self.sample_data):
+
+                def call(rvs: list[float] | NDArray[np.float64] = data) -> None:
+                    self.statistics.execute_statistic(rvs=rvs)
+
+                if index == 0:
+                    for _ in range(benchmark.warmup_iterations):
+                        call()
+
+                number, elapsed = autorange(call, benchmark.min_timing_seconds)
+                results_times.append(max(elapsed / number - overhead, 0.0))
+
+        return results_times
@@ -12,6 +12,11 @@ Logging initialization is performed in two stages:
    basic console logging before configuration files are loaded.
 2. Full initialization through ``setup_logging()``, which applies user
    configuration and registers all required handlers.
+
+Experiment runs may then move the root handlers to a listener thread
+through ``queue_logging()``, so that worker processes log to the same
+handlers without blocking on them. Structured run telemetry is set up
+separately through ``setup_telemetry()``.
 """
 
 import logging
@@ -20,7 +25,28 @@ from copy import deepcopy
 from typing import Any
 
 from pysatl_experiment.constants import Config
-
+from pysatl_experiment.loggers.queue_logging import (
+    configure_worker_logging,
+    get_log_queue,
+    queue_logging,
+    start_queue_logging,
+    stop_queue_logging,
+)
+from pysatl_experiment.loggers.telemetry import emit_event, setup_telemetry, telemetry_enabled
+
+
+__all__ = [
+    "LOGGING_CONFIG",
+    "configure_worker_logging",
+    "emit_event",
+    "get_log_queue",
+    "queue_logging",
+    "setup_logging",
+    "setup_telemetry",
+    "start_queue_logging",
+    "stop_queue_logging",
+    "telemetry_enabled",
+]
 
 logger = logging.getLogger(__name__)
 LOGFORMAT = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -0,0 +1,217 @@
+"""
+Queue-based logging shared by the parent and worker processes.
+
+Once started, the handlers of the root logger are moved to a
+``QueueListener`` thread of the parent process, and the root logger only
+puts records into a ``multiprocessing`` queue. Worker processes attach
+a ``QueueHandler`` writing to the same queue, so records of all processes
+reach the console, JSON and file handlers of the parent without the
+logging call waiting for formatting, flushing or disk I/O.
+
+Non-propagating loggers listed in ``ROUTED_LOGGERS``, such as the
+telemetry logger, share the queue but keep their own handlers.
+
+Notes
+-----
+Only handlers attached to the root logger and to routed loggers are
+moved to the listener. Handlers configured on other named loggers keep
+running in the calling thread.
+"""
+
+import logging
+import multiprocessing
+from collections.abc import Iterator, Mapping, Sequence
+from contextlib import contextmanager
+from logging.handlers import QueueHandler, QueueListener
+from multiprocessing.queues import Queue
+from typing import Any
+
+from pysatl_experiment.loggers.telemetry import TELEMETRY_LOGGER
+
+
+ROOT_LOGGER = ""
+ROUTED_LOGGERS: tuple[str, ...] = (TELEMETRY_LOGGER,)
+
+_log_queue: "Queue[Any] | None" = None
+_listener: "RoutingQueueListener | None" = None
+_routes: dict[str, list[logging.Handler]] = {}
+
+
+class RoutingQueueListener(QueueListener):
+    """
+    Queue listener passing records to the handlers of their logger.
+
+    Parameters
+    ----------
+    queue : Queue
+        Queue records are read from.
+    routes : Mapping[str, list[logging.Handler]]
+        Handlers by logger name. Records of other loggers are passed to
+        the handlers of the root logger, stored under ``ROOT_LOGGER``.
+    """
+
+    def __init__(self, queue: "Queue[Any]", routes: Mapping[str, list[logging.Handler]]) -> None:
+        """
+        Initialize routing listener.
+
+        Parameters
+        ----------
+        queue : Queue
+            Queue records are read from.
+        routes : Mapping[str, list[logging.Handler]]
+            Handlers by logger name, root handlers under ``ROOT_LOGGER``.
+        """
+        super().__init__(queue, *routes.get(ROOT_LOGGER, []), respect_handler_level=True)
+        self.routes = routes
+
+    def handle(self, record: logging.LogRecord) -> None:
+        """
+        Pass record to the handlers of its logger.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Record read from the queue.
+        """
+        record = self.prepare(record)
+        for handler in self.routes.get(record.name, self.handlers):
+            if record.levelno >= handler.level:
+                handler.handle(record)
+
+
+def get_log_queue() -> "Queue[Any] | None":
+    """
+    Get queue of the running logging listener.
+
+    Returns
+    -------
+    Queue | None
+        Queue worker processes put their records into, or None if
+        queue logging is not started.
+    """
+    return _log_queue
+
+
+def get_worker_log_levels() -> dict[str, int]:
+    """
+    Get levels worker processes apply to the loggers writing to the queue.
+
+    Returns
+    -------
+    dict[str, int]
+        Effective levels of the root logger, stored under ``ROOT_LOGGER``,
+        and of the routed loggers whose handlers the listener serves.
+    """
+    return {name: logging.getLogger(name or None).getEffectiveLevel() for name in [ROOT_LOGGER, *_routes]}
+
+
+def start_queue_logging() -> None:
+    """
+    Move root logger handlers to a listener thread fed by a process queue.
+
+    Notes
+    -----
+    Must be called after :func:`pysatl_experiment.loggers.setup_logging`,
+    since handlers added to the root logger afterwards are not moved to
+    the listener. Calling it again while the listener runs has no effect.
+    """
+    global _log_queue, _listener, _routes
+
+    if _listener is not None:
+        return
+
+    routes = {ROOT_LOGGER: list(logging.getLogger().handlers)}
+    for name in ROUTED_LOGGERS:
+        routed_logger = logging.getLogger(name)
+        if routed_logger.handlers and not routed_logger.propagate:
+            routes[name] = list(routed_logger.handlers)
+
+    _log_queue = multiprocessing.Queue(-1)
+    _listener = RoutingQueueListener(_log_queue, routes)
+    _listener.start()
+
+    for name, handlers in routes.items():
+        _replace_handlers(logging.getLogger(name or None), handlers, [QueueHandler(_log_queue)])
+    _routes = {name: handlers for name, handlers in routes.items() if name != ROOT_LOGGER}
+
+
+def stop_queue_logging() -> None:
+    """
+    Stop listener thread and restore handlers of the served loggers.
+
+    Notes
+    -----
+    Records already queued are handled before the listener stops.
+    """
+    global _log_queue, _listener, _routes
+
+    if _listener is None or _log_queue is None:
+        return
+
+    routes = _listener.routes
+    for name in routes:
+        served_logger = logging.getLogger(name or None)
+        queue_handlers = [
+            handler
+            for handler in served_logger.handlers
+            if isinstance(handler, QueueHandler) and handler.queue is _log_queue
+        ]
+        _replace_handlers(served_logger, queue_handlers, [])
+
+    _listener.stop()
+    for name, handlers in routes.items():
+        _replace_handlers(logging.getLogger(name or None), [], handlers)
+
+    _log_queue.close()
+    _log_queue.join_thread()
+    _log_queue = None
+    _listener = None
+    _routes = {}
+
+
+@contextmanager
+def queue_logging() -> Iterator[None]:
+    """
+    Run the enclosed block with queue logging started.
+
+    Yields
+    ------
+    None
+        Control to the enclosed block.
+    """
+    start_queue_logging()
+    try:
+        yield
+    finally:
+        stop_queue_logging()
+
+
+def configure_worker_logging(log_queue: "Queue[Any]", levels: Mapping[str, int]) -> None:
+    """
+    Send records of the current worker process to the parent listener.
+
+    Parameters
+    ----------
+    log_queue : Queue
+        Queue of the listener running in the parent process.
+    levels : Mapping[str, int]
+        Levels of the loggers served by the listener, see
+        :func:`get_worker_log_levels`.
+    """
+    for name, level in levels.items():
+        worker_logger = logging.getLogger(name or None)
+        _replace_handlers(worker_logger, list(worker_logger.handlers), [QueueHandler(log_queue)])
+        worker_logger.setLevel(level)
+        if name != ROOT_LOGGER:
+            worker_logger.propagate = False
+            worker_logger.disabled = False
+
+
+def _replace_handlers(
+    target: logging.Logger, removed: Sequence[logging.Handler], added: Sequence[logging.Handler]
+) -> None:
+    """Detach handlers from a logger and attach others without closing any."""
+    for handler in removed:
+        target.removeHandler(handler)
+    for handler in added:
+        target.addHandler(handler)
@@ -0,0 +1,227 @@
+"""
+Structured run telemetry.
+
+Telemetry events are records of a dedicated logger, serialized as one
+JSON object per line by :class:`TelemetryFormatter` and written to a
+file or sent as datagrams to a local UDP or Unix socket.
+
+An event is only built if telemetry is set up, and while queue logging
+runs it is serialized and written by the listener thread of the parent
+process, so emitting events from experiment tasks stays cheap.
+
+Targets are given as a file path, ``udp://host:port`` or
+``unix:///path/to/socket``.
+"""
+
+import logging
+import socket
+from datetime import datetime, timezone
+from typing import Any
+from urllib.parse import urlsplit
+
+from pysatl_experiment.loggers.json_formatter import JsonFormatter
+
+
+TELEMETRY_LOGGER = "pysatl_experiment.telemetry"
+TELEMETRY_FIELDS = "telemetry"
+"""``LogRecord`` attribute holding event fields."""
+
+_telemetry_logger = logging.getLogger(TELEMETRY_LOGGER)
+_telemetry_logger.propagate = False
+
+
+class TelemetryFormatter(JsonFormatter):
+    """
+    Format telemetry records as JSON lines.
+
+    Every line holds the ISO 8601 UTC timestamp, event name and process
+    id, followed by the event fields.
+    """
+
+    def __init__(self) -> None:
+        """Initialize telemetry formatter."""
+        super().__init__(fmt_dict={"timestamp": "asctime", "event": "message", "pid": "process"})
+
+    def formatTime(self, record, datefmt=None) -> str:
+        """
+        Format record creation time as an ISO 8601 UTC timestamp.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Telemetry record.
+        datefmt : str | None, default=None
+            Ignored, telemetry timestamps always use one format.
+
+        Returns
+        -------
+        str
+            Timestamp with milliseconds and ``Z`` suffix,
+            e.g. ``2024-05-01T12:00:00.123Z``.
+        """
+        created = datetime.fromtimestamp(record.created, tz=timezone.utc)
+        return created.isoformat(timespec="milliseconds").replace("+00:00", "Z")
+
+    def format_message_dict(self, record) -> dict:
+        """
+        Build a dictionary representation of a telemetry record.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Telemetry record.
+
+        Returns
+        -------
+        dict
+            Timestamp, event name and process id merged with event fields.
+        """
+        return {**super().format_message_dict(record), **getattr(record, TELEMETRY_FIELDS, {})}
+
+
+class DatagramLineHandler(logging.Handler):
+    """
+    Send formatted records as datagrams to a local socket.
+
+    Records are sent without blocking. Records that cannot be sent, e.g.
+    because no collector listens on the socket, are dropped and counted.
+
+    Parameters
+    ----------
+    address : tuple[str, int] | str
+        UDP host and port, or path of a Unix datagram socket.
+
+    Attributes
+    ----------
+    dropped : int
+        Number of records that could not be sent.
+    """
+
+    def __init__(self, address: tuple[str, int] | str) -> None:
+        """
+        Initialize datagram handler.
+
+        Parameters
+        ----------
+        address : tuple[str, int] | str
+            UDP host and port, or path of a Unix datagram socket.
+        """
+        super().__init__()
+        self.address = address
+        self.dropped = 0
+        family = socket.AF_UNIX if isinstance(address, str) else socket.AF_INET
+        self._socket = socket.socket(family, socket.SOCK_DGRAM)
+        self._socket.setblocking(False)
+
+    def emit(self, record) -> None:
+        """
+        Send formatted record terminated by a newline.
+
+        Parameters
+        ----------
+        record : logging.LogRecord
+            Record to send.
+        """
+        try:
+            self._socket.sendto((self.format(record) + "\n").encode("utf-8"), self.address)
+        except OSError:
+            self.dropped += 1
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def close(self) -> None:
+        """Close the socket."""
+        self.acquire()
+        try:
+            self._socket.close()
+        finally:
+            self.release()
+        super().close()
+
+
+def create_telemetry_handler(target: str) -> logging.Handler:
+    """
+    Create handler writing telemetry to a target.
+
+    Parameters
+    ----------
+    target : str
+        File path, ``udp://host:port`` or ``unix:///path/to/socket``.
+
+    Returns
+    -------
+    logging.Handler
+        Handler with :class:`TelemetryFormatter`.
+
+    Raises
+    ------
+    ValueError
+        If a UDP target has no host or port.
+    """
+    url = urlsplit(target)
+    handler: logging.Handler
+    if url.scheme == "udp":
+        if not url.hostname or url.port is None:
+            raise ValueError(f"UDP telemetry target must be 'udp://host:port', got '{target}'.")
+        handler = DatagramLineHandler((url.hostname, url.port))
+    elif url.scheme == "unix":
+        handler = DatagramLineHandler(url.path)
+    else:
+        handler = logging.FileHandler(target, encoding="utf-8", delay=True)
+
+    handler.setFormatter(TelemetryFormatter())
+    return handler
+
+
+def setup_telemetry(target: str) -> None:
+    """
+    Send telemetry events to a target.
+
+    Parameters
+    ----------
+    target : str
+        File path, ``udp://host:port`` or ``unix:///path/to/socket``.
+
+    Notes
+    -----
+    Must be called after :func:`pysatl_experiment.loggers.setup_logging`,
+    which disables loggers it does not configure, and before queue
+    logging is started.
+    """
+    for handler in list(_telemetry_logger.handlers):
+        _telemetry_logger.removeHandler(handler)
+        handler.close()
+
+    _telemetry_logger.addHandler(create_telemetry_handler(target))
+    _telemetry_logger.setLevel(logging.INFO)
+    _telemetry_logger.propagate = False
+    _telemetry_logger.disabled = False
+
+
+def telemetry_enabled() -> bool:
+    """
+    Check whether telemetry events are recorded.
+
+    Returns
+    -------
+    bool
+        True if telemetry is set up in this process.
+    """
+    return bool(_telemetry_logger.handlers) and _telemetry_logger.isEnabledFor(logging.INFO)
+
+
+def emit_event(event: str, **fields: Any) -> None:
+    """
+    Record telemetry event.
+
+    Parameters
+    ----------
+    event : str
+        Event name, e.g. ``task_end``.
+    **fields : Any
+        JSON-serializable event fields.
+    """
+    if telemetry_enabled():
+        _telemetry_logger.info(event, extra={TELEMETRY_FIELDS: fields})
@@ -13,14 +13,26 @@ from __future__ import annotations
 import json
 from typing import ClassVar
 
-from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy import Float, Integer, String, UniqueConstraint, and_, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.db_init import is_read_only_connections
+from pysatl_experiment.persistence.db_store.json_array import append_json_array
+from pysatl_experiment.persistence.db_store.migration import add_parameters_key
 from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.upsert import insert_row_copies, upsert_rows
 from pysatl_experiment.persistence.models.power import IPowerStorage, PowerModel, PowerQuery
 
 
+_POWER_UNIQUE_KEY = ("parameters_key", "sample_size", "monte_carlo_count", "significance_level")
+
+
 class AlchemyPower(ModelBase):
     """
     SQLAlchemy ORM model representing precomputed statistical power results.
@@ -44,13 +56,15 @@ class AlchemyPower(ModelBase):
     criterion_code : str
         Identifier of the statistical test / criterion.
     criterion_parameters : str
-        JSON-encoded parameters of the criterion.
+        Canonical JSON-encoded parameters of the criterion.
     sample_size : int
         Sample size used in simulation.
     alternative_code : str
         Identifier of the alternative hypothesis.
     alternative_parameters : str
-        JSON-encoded parameters of the alternative hypothesis.
+        Canonical JSON-encoded parameters of the alternative hypothesis.
+    parameters_key : str
+        Fixed-width hash of criterion and alternative with their parameters.
     monte_carlo_count : int
         Number of Monte-Carlo simulations performed.
     significance_level : float
@@ -60,35 +74,27 @@ class AlchemyPower(ModelBase):
 
     Notes
     -----
-    This model stores serialized JSON fields as strings, which may require
-    consistent serialization strategy across the system.
+    Lookups match on ``parameters_key`` instead of comparing serialized
+    parameters, so ``1`` and ``1.0`` address the same record. The unique
+    index over (parameters_key, sample_size, monte_carlo_count,
+    significance_level) serves both point lookups and scans by sample size.
     """
 
     __tablename__ = "power"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
     experiment_id: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
-    criterion_code: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    sample_size: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # type: ignore
-    alternative_code: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    alternative_parameters: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # type: ignore
-    significance_level: Mapped[float] = mapped_column(Float, nullable=False, index=True)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    alternative_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    alternative_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    significance_level: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
     results_criteria: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
 
-    __table_args__ = (
-        UniqueConstraint(
-            "criterion_code",
-            "criterion_parameters",
-            "sample_size",
-            "alternative_code",
-            "alternative_parameters",
-            "monte_carlo_count",
-            "significance_level",
-            name="uq_power_unique",
-        ),
-    )
+    __table_args__ = (UniqueConstraint(*_POWER_UNIQUE_KEY, name="uq_power_unique"),)
 
 
 class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
@@ -150,6 +156,13 @@ class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
             If initialization fails at the base storage layer.
         """
         super().init()
+        if not is_read_only_connections():
+            add_parameters_key(
+                AlchemyPowerStorage.session,
+                AlchemyPower.__table__,  # type: ignore[arg-type]
+                [("criterion_code", "criterion_parameters"), ("alternative_code", "alternative_parameters")],
+                "uq_power_unique",
+            )
         self._initialized = True
 
     def _get_session(self) -> SessionType:
@@ -196,22 +209,15 @@ class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
 
         Notes
         -----
-        Matching is performed using JSON-serialized parameter comparison.
-
-        This makes exact match required; semantically equivalent but differently
-        serialized inputs will not match.
+        Matching is performed on the canonical parameters key, so numerically
+        equal parameters match regardless of their Python types.
         """
-        params_json = json.dumps(query.criterion_parameters)
-        alt_params_json = json.dumps(query.alternative_parameters)
         row: AlchemyPower | None = (
             self._get_session()
             .query(AlchemyPower)
             .filter(
-                AlchemyPower.criterion_code == query.criterion_code,
-                AlchemyPower.criterion_parameters == params_json,
+                AlchemyPower.parameters_key == _get_parameters_key(query),
                 AlchemyPower.sample_size == int(query.sample_size),
-                AlchemyPower.alternative_code == query.alternative_code,
-                AlchemyPower.alternative_parameters == alt_params_json,
                 AlchemyPower.monte_carlo_count == int(query.monte_carlo_count),
                 AlchemyPower.significance_level == float(query.significance_level),
             )
@@ -242,46 +248,128 @@ class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
         ----------
         data : PowerModel
             Computed power result to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[PowerModel]) -> None:
+        """
+        Insert or update several power computation results in one transaction.
+
+        Parameters
+        ----------
+        models : list[PowerModel]
+            Computed power results to store.
 
         Notes
         -----
-        This method performs an UPSERT-like behavior implemented manually
-        via SELECT + INSERT/UPDATE.
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_power_unique`` key, replacing ``experiment_id`` and
+        ``results_criteria`` of existing records.
         """
-        # TODO: change to UPSERT (ON CONFLICT DO UPDATE)?
-        params_json = json.dumps(data.criterion_parameters)
-        alt_params_json = json.dumps(data.alternative_parameters)
-        existing: AlchemyPower | None = (
+        if not models:
+            return
+
+        rows = [
+            {
+                "experiment_id": int(data.experiment_id),
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": encode_parameters(data.criterion_parameters),
+                "sample_size": int(data.sample_size),
+                "alternative_code": data.alternative_code,
+                "alternative_parameters": encode_parameters(data.alternative_parameters),
+                "parameters_key": _get_parameters_key(data),
+                "monte_carlo_count": int(data.monte_carlo_count),
+                "significance_level": float(data.significance_level),
+                "results_criteria": json.dumps([bool(x) for x in data.results_criteria]),
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyPower.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_POWER_UNIQUE_KEY,
+            update_columns=("experiment_id", "results_criteria"),
+        )
+        session.commit()
+
+    def get_extendable_count(self, query: PowerQuery) -> int:
+        """
+        Get the largest stored Monte-Carlo count below the requested one.
+
+        Parameters
+        ----------
+        query : PowerQuery
+            Query with the requested Monte-Carlo count.
+
+        Returns
+        -------
+        int
+            Monte-Carlo count of the stored result with the same criterion,
+            alternative, sample size and significance level, 0 if there is none.
+        """
+        count: int | None = (
             self._get_session()
-            .query(AlchemyPower)
+            .query(func.max(AlchemyPower.monte_carlo_count))
             .filter(
-                AlchemyPower.criterion_code == data.criterion_code,
-                AlchemyPower.criterion_parameters == params_json,
-                AlchemyPower.sample_size == int(data.sample_size),
-                AlchemyPower.alternative_code == data.alternative_code,
-                AlchemyPower.alternative_parameters == alt_params_json,
-                AlchemyPower.monte_carlo_count == int(data.monte_carlo_count),
-                AlchemyPower.significance_level == float(data.significance_level),
+                AlchemyPower.parameters_key == _get_parameters_key(query),
+                AlchemyPower.sample_size == int(query.sample_size),
+                AlchemyPower.significance_level == float(query.significance_level),
+                AlchemyPower.monte_carlo_count < int(query.monte_carlo_count),
             )
-            .one_or_none()
+            .scalar()
         )
-        if existing is None:
-            entity = AlchemyPower(
-                experiment_id=int(data.experiment_id),
-                criterion_code=data.criterion_code,
-                criterion_parameters=params_json,
-                sample_size=int(data.sample_size),
-                alternative_code=data.alternative_code,
-                alternative_parameters=alt_params_json,
-                monte_carlo_count=int(data.monte_carlo_count),
-                significance_level=float(data.significance_level),
-                results_criteria=json.dumps([bool(x) for x in data.results_criteria]),
+        return int(count or 0)
+
+    def append_bulk_data(self, models: list[PowerModel]) -> None:
+        """
+        Store extensions of stored simulation results in one transaction.
+
+        Parameters
+        ----------
+        models : list[PowerModel]
+            Models holding only the additional ``results_criteria`` and the
+            new total ``monte_carlo_count``.
+
+        Raises
+        ------
+        ValueError
+            If there is no stored record with
+            ``monte_carlo_count - len(results_criteria)`` simulations.
+
+        Notes
+        -----
+        Each extended result is inserted as a new record with a single
+        ``INSERT ... SELECT`` concatenating the new items to the stored
+        JSON array on the database side, so the stored results are not
+        loaded by the application. The shorter run is kept and stays
+        available for queries with its Monte-Carlo count.
+        """
+        session = self._get_session()
+        for data in models:
+            stored_count = int(data.monte_carlo_count) - len(data.results_criteria)
+            inserted = insert_row_copies(
+                session,
+                AlchemyPower.__table__,  # type: ignore[arg-type]
+                and_(
+                    AlchemyPower.parameters_key == _get_parameters_key(data),
+                    AlchemyPower.sample_size == int(data.sample_size),
+                    AlchemyPower.monte_carlo_count == stored_count,
+                    AlchemyPower.significance_level == float(data.significance_level),
+                ),
+                {
+                    "experiment_id": int(data.experiment_id),
+                    "monte_carlo_count": int(data.monte_carlo_count),
+                    "results_criteria": append_json_array(
+                        AlchemyPower.results_criteria, [bool(x) for x in data.results_criteria]
+                    ),
+                },
             )
-            self._get_session().add(entity)
-        else:
-            existing.experiment_id = int(data.experiment_id)
-            existing.results_criteria = json.dumps([bool(x) for x in data.results_criteria])
-        self._get_session().commit()
+            if inserted == 0:
+                session.rollback()
+                raise ValueError(f"No stored power result with monte_carlo_count={stored_count} to extend.")
+        session.commit()
 
     def delete_data(self, query: PowerQuery) -> None:
         """
@@ -296,17 +384,12 @@ class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
         -----
         Deletion is strict and requires exact parameter match.
         """
-        params_json = json.dumps(query.criterion_parameters)
-        alt_params_json = json.dumps(query.alternative_parameters)
         (
             self._get_session()
             .query(AlchemyPower)
             .filter(
-                AlchemyPower.criterion_code == query.criterion_code,
-                AlchemyPower.criterion_parameters == params_json,
+                AlchemyPower.parameters_key == _get_parameters_key(query),
                 AlchemyPower.sample_size == int(query.sample_size),
-                AlchemyPower.alternative_code == query.alternative_code,
-                AlchemyPower.alternative_parameters == alt_params_json,
                 AlchemyPower.monte_carlo_count == int(query.monte_carlo_count),
                 AlchemyPower.significance_level == float(query.significance_level),
             )
@@ -315,4 +398,23 @@ class AlchemyPowerStorage(AbstractDbStore, IPowerStorage):
         self._get_session().commit()
 
 
-# TODO: add sort_keys= TRUE??
+def _get_parameters_key(data: PowerModel | PowerQuery) -> str:
+    """
+    Build lookup key of criterion and alternative configuration.
+
+    Parameters
+    ----------
+    data : PowerModel | PowerQuery
+        Power result or query.
+
+    Returns
+    -------
+    str
+        Fixed-width parameters key.
+    """
+    return make_parameters_key(
+        data.criterion_code,
+        data.criterion_parameters,
+        data.alternative_code,
+        data.alternative_parameters,
+    )
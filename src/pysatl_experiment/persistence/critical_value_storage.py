@@ -0,0 +1,355 @@
+"""
+Precomputed critical value persistence layer (SQLAlchemy implementation).
+
+This module provides database models and storage implementation for
+critical values derived from limit distributions at the end of critical
+value experiments. Power experiments resolve critical values with a
+single indexed lookup instead of reloading whole limit distributions.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import ClassVar
+
+from sqlalchemy import Float, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.upsert import upsert_rows
+from pysatl_experiment.persistence.models.critical_value import (
+    CriticalValueModel,
+    CriticalValueQuery,
+    ICriticalValueStorage,
+)
+
+
+_CRITICAL_VALUE_UNIQUE_KEY = ("parameters_key", "sample_size", "significance_level", "alternative")
+
+
+class AlchemyCriticalValue(ModelBase):
+    """
+    SQLAlchemy ORM model for precomputed critical values.
+
+    Each row stores the critical value(s) for a unique combination of:
+        - criterion code and its parameters,
+        - sample size,
+        - significance level,
+        - test alternative.
+
+    Uniqueness is enforced via the ``uq_critical_values_unique`` constraint,
+    lookups by criterion, size, level and alternative are served by the
+    ``ix_critical_values_lookup`` index.
+
+    Attributes
+    ----------
+    id : int
+        Primary key.
+    criterion_code : str
+        Identifier of the statistical criterion/test.
+    criterion_parameters : str
+        Canonical JSON-serialized parameters of the criterion.
+    parameters_key : str
+        Fixed-width hash of criterion code and parameters.
+    sample_size : int
+        Sample size.
+    significance_level : float
+        Significance level alpha.
+    alternative : str
+        Test alternative.
+    monte_carlo_count : int
+        Size of the limit distribution the value was derived from.
+    experiment_id : int
+        Identifier of the critical value experiment.
+    lower_value : float | None
+        Left critical value.
+    upper_value : float | None
+        Right critical value.
+    """
+
+    __tablename__ = "critical_values"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    significance_level: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+    alternative: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    experiment_id: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    lower_value: Mapped[float | None] = mapped_column(Float, nullable=True)  # type: ignore
+    upper_value: Mapped[float | None] = mapped_column(Float, nullable=True)  # type: ignore
+
+    __table_args__ = (
+        UniqueConstraint(*_CRITICAL_VALUE_UNIQUE_KEY, name="uq_critical_values_unique"),
+        Index(
+            "ix_critical_values_lookup",
+            "criterion_code",
+            "sample_size",
+            "significance_level",
+            "alternative",
+        ),
+    )
+
+
+class AlchemyCriticalValueStorage(AbstractDbStore, ICriticalValueStorage):
+    """
+    SQLAlchemy-backed storage for precomputed critical values.
+
+    Records are uniquely identified by:
+        - parameters key (criterion code and parameters)
+        - sample_size
+        - significance_level
+        - alternative
+
+    The storage must be explicitly initialized via :meth:`init`
+    before any database operations are performed.
+
+    Attributes
+    ----------
+    session : ClassVar[SessionType]
+        Shared SQLAlchemy session used by all storage instances.
+    _initialized : bool
+        Indicates whether storage has been initialized.
+    """
+
+    session: ClassVar[SessionType]
+
+    def __init__(self, db_url: str):
+        """
+        Initialize critical value storage.
+
+        Parameters
+        ----------
+        db_url : str
+            SQLAlchemy database connection string.
+
+        Notes
+        -----
+        The constructor does not create DB connection immediately.
+        Call :meth:`init` to initialize the storage.
+        """
+        super().__init__(db_url=db_url)
+        self._initialized: bool = False
+
+    def init(self) -> None:
+        """
+        Initialize database engine and SQLAlchemy session.
+
+        This method must be called before using any CRUD operations.
+        """
+        super().init()
+        self._initialized = True
+
+    def _get_session(self) -> SessionType:
+        """
+        Return active SQLAlchemy session.
+
+        Returns
+        -------
+        SessionType
+            Active DB session.
+
+        Raises
+        ------
+        RuntimeError
+            If storage was not initialized via :meth:`init`.
+        """
+        if not getattr(self, "_initialized", False):
+            raise RuntimeError("Storage not initialized. Call init() first.")
+        return AlchemyCriticalValueStorage.session
+
+    def get_data(self, query: CriticalValueQuery) -> CriticalValueModel | None:
+        """
+        Retrieve stored critical value matching query parameters.
+
+        Parameters
+        ----------
+        query : CriticalValueQuery
+            Query defining criterion configuration, sample size,
+            significance level and alternative.
+
+        Returns
+        -------
+        CriticalValueModel | None
+            Matched record or None if not found.
+        """
+        row: AlchemyCriticalValue | None = (
+            self._get_session()
+            .query(AlchemyCriticalValue)
+            .filter(
+                AlchemyCriticalValue.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyCriticalValue.sample_size == int(query.sample_size),
+                AlchemyCriticalValue.significance_level == float(query.significance_level),
+                AlchemyCriticalValue.alternative == query.alternative,
+            )
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return self._to_model(row)
+
+    def get_bulk_data(
+        self,
+        criterion_codes: list[str],
+        sample_size: int,
+        significance_level: float,
+        alternative: str,
+    ) -> list[CriticalValueModel]:
+        """
+        Fetch critical values of several criteria with one query.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_size : int
+            Sample size.
+        significance_level : float
+            Significance level alpha.
+        alternative : str
+            Test alternative.
+
+        Returns
+        -------
+        list[CriticalValueModel]
+            Found critical values, one per criterion code, preferring
+            values derived from the largest limit distribution.
+        """
+        rows: list[AlchemyCriticalValue] = (
+            self._get_session()
+            .query(AlchemyCriticalValue)
+            .filter(
+                AlchemyCriticalValue.criterion_code.in_(criterion_codes),
+                AlchemyCriticalValue.sample_size == int(sample_size),
+                AlchemyCriticalValue.significance_level == float(significance_level),
+                AlchemyCriticalValue.alternative == alternative,
+            )
+            .all()
+        )
+
+        best_rows: dict[str, AlchemyCriticalValue] = {}
+        for row in rows:
+            best = best_rows.get(row.criterion_code)
+            if best is None or row.monte_carlo_count > best.monte_carlo_count:
+                best_rows[row.criterion_code] = row
+
+        return [self._to_model(row) for row in best_rows.values()]
+
+    def insert_data(self, data: CriticalValueModel) -> None:
+        """
+        Insert or update a critical value record.
+
+        Parameters
+        ----------
+        data : CriticalValueModel
+            Critical value to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[CriticalValueModel]) -> None:
+        """
+        Insert or update several critical values in one transaction.
+
+        Parameters
+        ----------
+        models : list[CriticalValueModel]
+            Critical values to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_critical_values_unique`` key. An existing record is only
+        replaced by a value derived from a limit distribution of at least
+        the same size.
+        """
+        if not models:
+            return
+
+        rows = [
+            {
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": encode_parameters(data.criterion_parameters),
+                "parameters_key": make_parameters_key(data.criterion_code, data.criterion_parameters),
+                "sample_size": int(data.sample_size),
+                "significance_level": float(data.significance_level),
+                "alternative": data.alternative,
+                "monte_carlo_count": int(data.monte_carlo_count),
+                "experiment_id": int(data.experiment_id),
+                "lower_value": data.lower_value,
+                "upper_value": data.upper_value,
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyCriticalValue.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_CRITICAL_VALUE_UNIQUE_KEY,
+            update_columns=("monte_carlo_count", "experiment_id", "lower_value", "upper_value"),
+            version_column="monte_carlo_count",
+        )
+        session.commit()
+
+    def delete_data(self, query: CriticalValueQuery) -> None:
+        """
+        Delete critical value record matching query.
+
+        Parameters
+        ----------
+        query : CriticalValueQuery
+            Key identifying record to delete.
+
+        Notes
+        -----
+        Operation is no-op if record does not exist.
+        """
+        (
+            self._get_session()
+            .query(AlchemyCriticalValue)
+            .filter(
+                AlchemyCriticalValue.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyCriticalValue.sample_size == int(query.sample_size),
+                AlchemyCriticalValue.significance_level == float(query.significance_level),
+                AlchemyCriticalValue.alternative == query.alternative,
+            )
+            .delete()
+        )
+        self._get_session().commit()
+
+    @staticmethod
+    def _to_model(row: AlchemyCriticalValue) -> CriticalValueModel:
+        """
+        Convert ORM row to domain model.
+
+        Parameters
+        ----------
+        row : AlchemyCriticalValue
+            Database row.
+
+        Returns
+        -------
+        CriticalValueModel
+            Domain model.
+        """
+        return CriticalValueModel(
+            experiment_id=int(row.experiment_id),
+            criterion_code=row.criterion_code,
+            criterion_parameters=json.loads(row.criterion_parameters),
+            sample_size=int(row.sample_size),
+            significance_level=float(row.significance_level),
+            alternative=row.alternative,
+            monte_carlo_count=int(row.monte_carlo_count),
+            lower_value=row.lower_value,
+            upper_value=row.upper_value,
+        )
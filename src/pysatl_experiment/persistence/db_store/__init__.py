@@ -2,15 +2,36 @@
 
 from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
 from pysatl_experiment.persistence.db_store.critical_value_store import CriticalValueDbStore
-from pysatl_experiment.persistence.db_store.db_init import get_request_or_thread_id, init_db
+from pysatl_experiment.persistence.db_store.db_init import (
+    get_request_or_thread_id,
+    init_db,
+    is_read_only_connections,
+    set_read_only_connections,
+)
+from pysatl_experiment.persistence.db_store.json_array import append_json_array
+from pysatl_experiment.persistence.db_store.migration import add_missing_columns, add_parameters_key
+from pysatl_experiment.persistence.db_store.param_key import encode_parameters, make_parameters_key
 from pysatl_experiment.persistence.db_store.result_store import ResultDbStore
+from pysatl_experiment.persistence.db_store.sample_codec import decode_sample, encode_sample
+from pysatl_experiment.persistence.db_store.upsert import insert_rows, upsert_rows
 
 
 __all__ = [
+    "add_missing_columns",
+    "add_parameters_key",
+    "append_json_array",
     "get_request_or_thread_id",
     "init_db",
+    "is_read_only_connections",
+    "set_read_only_connections",
+    "encode_parameters",
+    "make_parameters_key",
     "CriticalValueDbStore",
     "ModelBase",
     "SessionType",
     "ResultDbStore",
+    "decode_sample",
+    "encode_sample",
+    "insert_rows",
+    "upsert_rows",
 ]
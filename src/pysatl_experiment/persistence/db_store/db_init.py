@@ -1,15 +1,21 @@
 """Database initialization and session-scoping utilities."""
 
 import logging
+import os
 import threading
 from contextvars import ContextVar
 from typing import Any, Final
 
-from sqlalchemy import Engine, create_engine
+from sqlalchemy import Engine, create_engine, event, make_url
 from sqlalchemy.exc import ArgumentError, NoSuchModuleError
 from sqlalchemy.pool import StaticPool
 
 from pysatl_experiment.exceptions import OperationalException
+from pysatl_experiment.persistence.db_store.postgres import (
+    POSTGRES_MAX_OVERFLOW,
+    POSTGRES_POOL_SIZE,
+    POSTGRES_WORKER_POOL_SIZE,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -38,10 +44,59 @@ def get_request_or_thread_id() -> str | None:
 
 _SQL_DOCS_URL = "http://docs.sqlalchemy.org/en/latest/core/engines.html#database-urls"
 
+SQLITE_PRAGMAS: Final[dict[str, str | int]] = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "mmap_size": 268_435_456,
+    "cache_size": -65_536,
+    "busy_timeout": 30_000,
+    "temp_store": "MEMORY",
+}
+"""Pragmas applied to every connection of file-based SQLite databases."""
+
+_engines: dict[tuple[int, str, bool], Engine] = {}
+_read_only_connections = False
+
+
+def set_read_only_connections(enabled: bool = True) -> None:
+    """
+    Open file-based SQLite databases read-only in the current process.
+
+    Used as process pool initializer so experiment workers only read
+    generated samples and limit distributions, while every write goes
+    through the single writer connection of the parent process.
+
+    Parameters
+    ----------
+    enabled : bool, default=True
+        Whether engines created afterwards are read-only.
+    """
+    global _read_only_connections
+    _read_only_connections = enabled
+
+
+def is_read_only_connections() -> bool:
+    """
+    Check whether the current process opens SQLite databases read-only.
+
+    Returns
+    -------
+    bool
+        True inside experiment worker processes.
+    """
+    return _read_only_connections
+
 
 def init_db(db_url: str) -> Engine:
     """Create and configure a SQLAlchemy engine.
 
+    Engines are created once per process and database URL. File-based
+    SQLite databases are tuned with :data:`SQLITE_PRAGMAS`: the parent
+    process writes through a single pooled connection in WAL mode, worker
+    processes marked via :func:`set_read_only_connections` open the
+    database file read-only. PostgreSQL engines get a small pool per
+    process and read-only transactions in worker processes.
+
     Parameters
     ----------
     db_url : str
@@ -62,23 +117,138 @@ def init_db(db_url: str) -> Engine:
     if db_url == "sqlite:///":
         raise OperationalException(f"Bad db-url {db_url}. For in-memory database, please use `sqlite://`.")
     if db_url == "sqlite://":
-        kwargs.update(
-            {
-                "poolclass": StaticPool,
-            }
-        )
+        # Every in-memory engine is a separate database, so it is never cached.
+        return _create_engine(db_url, poolclass=StaticPool, connect_args={"check_same_thread": False})
+    if db_url == "sqlite:///:memory:":
+        return _create_engine(db_url, connect_args={"check_same_thread": False})
+
+    read_only = _read_only_connections
+    key = (os.getpid(), db_url, read_only)
+    engine = _engines.get(key)
+    if engine is not None:
+        return engine
+
+    url = db_url
+    is_sqlite_file = db_url.startswith("sqlite:///")
     # Take care of thread ownership
     if db_url.startswith("sqlite://"):
-        kwargs.update(
+        kwargs["connect_args"] = {"check_same_thread": False}
+    if is_sqlite_file:
+        if read_only:
+            url = _get_read_only_sqlite_url(db_url)
+        else:
+            # Single writer connection: concurrent writes wait for the pool instead of the file lock
+            kwargs.update({"pool_size": 1, "max_overflow": 0})
+    if db_url.startswith("postgresql"):
+        kwargs.update(_get_postgres_engine_options(read_only))
+
+    engine = _create_engine(url, **kwargs)
+    if is_sqlite_file:
+        event.listen(engine, "connect", _get_sqlite_pragma_listener(read_only))
+
+    _engines[key] = engine
+    return engine
+
+
+def _get_postgres_engine_options(read_only: bool) -> dict[str, Any]:
+    """
+    Build PostgreSQL engine options for the current process role.
+
+    Parameters
+    ----------
+    read_only : bool
+        Whether the engine belongs to a worker process.
+
+    Returns
+    -------
+    dict[str, Any]
+        Pool sizing and execution options.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": True}
+    if read_only:
+        options.update(
             {
-                "connect_args": {"check_same_thread": False},
+                "pool_size": POSTGRES_WORKER_POOL_SIZE,
+                "max_overflow": 0,
+                "execution_options": {"postgresql_readonly": True},
             }
         )
+    else:
+        options.update({"pool_size": POSTGRES_POOL_SIZE, "max_overflow": POSTGRES_MAX_OVERFLOW})
+    return options
+
 
+def _create_engine(db_url: str, **kwargs: Any) -> Engine:
+    """
+    Create SQLAlchemy engine validating the database URL.
+
+    Parameters
+    ----------
+    db_url : str
+        Database connection URL.
+    **kwargs : Any
+        Engine options.
+
+    Returns
+    -------
+    Engine
+        Created engine.
+
+    Raises
+    ------
+    OperationalException
+        If the database URL is invalid.
+    """
     try:
-        engine = create_engine(db_url, future=True, **kwargs)
+        return create_engine(db_url, future=True, **kwargs)
     except (ArgumentError, NoSuchModuleError):
         raise OperationalException(
             f"Given value for db_url: '{db_url}' is no valid database URL! (See {_SQL_DOCS_URL})"
         )
-    return engine
+
+
+def _get_read_only_sqlite_url(db_url: str) -> str:
+    """
+    Convert SQLite file URL into read-only URI form.
+
+    Parameters
+    ----------
+    db_url : str
+        SQLite database URL.
+
+    Returns
+    -------
+    str
+        URL opening the same file with ``mode=ro``.
+    """
+    url = make_url(db_url)
+    read_only_url = url.set(database=f"file:{url.database}", query={**url.query, "mode": "ro", "uri": "true"})
+    return read_only_url.render_as_string(hide_password=False)
+
+
+def _get_sqlite_pragma_listener(read_only: bool):
+    """
+    Build connection listener applying SQLite pragmas.
+
+    Parameters
+    ----------
+    read_only : bool
+        Whether connections are read-only. Journal mode is persistent
+        in the database file and can only be switched by writers.
+
+    Returns
+    -------
+    Callable
+        ``connect`` event listener.
+    """
+    pragmas = {name: value for name, value in SQLITE_PRAGMAS.items() if not (read_only and name == "journal_mode")}
+
+    def set_pragmas(dbapi_connection, connection_record) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for name, value in pragmas.items():
+                cursor.execute(f"PRAGMA {name}={value}")
+        finally:
+            cursor.close()
+
+    return set_pragmas
@@ -0,0 +1,35 @@
+"""SQL expressions for results stored as JSON arrays in text columns."""
+
+import json
+from collections.abc import Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, case, func, literal
+
+
+def append_json_array(column: Any, values: Sequence[Any]) -> ColumnElement[str]:
+    """
+    Build expression appending values to a JSON array stored as text.
+
+    The closing bracket of the stored array is cut off on the database
+    side and the new items are concatenated, so the application neither
+    loads the stored value nor sends it back. The database still reads
+    the whole value and writes the result as a new value.
+
+    Parameters
+    ----------
+    column : Any
+        Text column holding a JSON array.
+    values : Sequence[Any]
+        JSON-serializable items to append.
+
+    Returns
+    -------
+    ColumnElement[str]
+        Expression usable as the new column value in ``UPDATE``.
+    """
+    tail = json.dumps(list(values))
+    if tail == "[]":
+        return column
+    appended = func.substr(column, 1, func.length(column) - 1) + literal(", " + tail[1:])
+    return case((column == "[]", literal(tail)), else_=appended)
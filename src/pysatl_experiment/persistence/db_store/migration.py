@@ -0,0 +1,194 @@
+"""Schema upgrades of tables created by earlier versions."""
+
+import json
+from collections.abc import Mapping, Sequence
+
+from sqlalchemy import Table, UniqueConstraint, delete, func, inspect, select, update
+
+from pysatl_experiment.persistence.db_store.base import SessionType
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+
+
+def add_missing_columns(session: SessionType, table_name: str, columns: Mapping[str, str]) -> None:
+    """
+    Add columns missing from an existing table.
+
+    ``create_all`` does not alter existing tables, so columns introduced
+    later are added with ``ALTER TABLE``. Their defaults should describe
+    rows written before the columns existed.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table_name : str
+        Table to upgrade.
+    columns : Mapping[str, str]
+        Column names and their SQL definitions, e.g.
+        ``{"sample_count": "INTEGER NOT NULL DEFAULT 1"}``.
+    """
+    connection = session.connection()
+    existing = {column["name"] for column in inspect(connection).get_columns(table_name)}
+    missing = [name for name in columns if name not in existing]
+    if not missing:
+        return
+
+    preparer = connection.dialect.identifier_preparer
+    for name in missing:
+        connection.exec_driver_sql(
+            f"ALTER TABLE {preparer.quote(table_name)} ADD COLUMN {preparer.quote(name)} {columns[name]}"
+        )
+    session.commit()
+
+
+def add_parameters_key(
+    session: SessionType,
+    table: Table,
+    components: Sequence[tuple[str, str]],
+    unique_constraint: str,
+) -> None:
+    """
+    Add and backfill the ``parameters_key`` column of an existing table.
+
+    Tables created before hashed parameter keys existed identify rows by
+    code and JSON-encoded parameter columns. The key of every distinct
+    combination of those columns is computed with
+    :func:`make_parameters_key`, rows whose keys collide after canonical
+    encoding are collapsed to the most recent one and parameters are
+    rewritten in canonical form. Per-column indexes absent from the model
+    are dropped and the unique constraint is rebuilt over the model's
+    columns.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table : Table
+        Model table with the ``parameters_key`` column.
+    components : Sequence[tuple[str, str]]
+        Pairs of code and encoded parameters columns, in key order,
+        e.g. ``[("criterion_code", "criterion_parameters")]``.
+    unique_constraint : str
+        Name of the model's unique constraint over ``parameters_key``.
+
+    Notes
+    -----
+    The upgrade runs in a single transaction. SQLite cannot drop table
+    constraints, so there the new constraint is created as a unique index
+    of the same name and the old one is kept. It covers the raw parameter
+    strings and is therefore implied by the new one.
+    """
+    connection = session.connection()
+    if "parameters_key" in {column["name"] for column in inspect(connection).get_columns(table.name)}:
+        return
+
+    preparer = connection.dialect.identifier_preparer
+    quoted_table = preparer.quote(table.name)
+    connection.exec_driver_sql(
+        f"ALTER TABLE {quoted_table} ADD COLUMN parameters_key VARCHAR({PARAMETERS_KEY_LENGTH}) NOT NULL DEFAULT ''"
+    )
+
+    source_columns = [table.c[column] for pair in components for column in pair]
+    for values in connection.execute(select(*source_columns).distinct()).all():
+        key_components: list[str | Sequence[float]] = []
+        for code, parameters in zip(values[::2], values[1::2], strict=True):
+            key_components.extend((code, json.loads(parameters)))
+        connection.execute(
+            update(table)
+            .where(*(column == value for column, value in zip(source_columns, values, strict=True)))
+            .values(parameters_key=make_parameters_key(*key_components))
+        )
+
+    constraint = next(
+        item for item in table.constraints if isinstance(item, UniqueConstraint) and item.name == unique_constraint
+    )
+    key_columns = [column.name for column in constraint.columns]
+    latest_ids = select(func.max(table.c.id)).group_by(*(table.c[column] for column in key_columns))
+    connection.execute(delete(table).where(table.c.id.not_in(latest_ids.scalar_subquery())))
+
+    for _, parameters_column in components:
+        column = table.c[parameters_column]
+        for (parameters,) in connection.execute(select(column).distinct()).all():
+            canonical = encode_parameters(json.loads(parameters))
+            if canonical != parameters:
+                connection.execute(update(table).where(column == parameters).values({parameters_column: canonical}))
+
+    declared_indexes = {index.name for index in table.indexes}
+    for index in inspect(connection).get_indexes(table.name):
+        if not index["unique"] and index["name"] not in declared_indexes:
+            connection.exec_driver_sql(f"DROP INDEX {preparer.quote(str(index['name']))}")
+
+    quoted_name = preparer.quote(unique_constraint)
+    column_list = ", ".join(preparer.quote(column) for column in key_columns)
+    if connection.dialect.name == "sqlite":
+        connection.exec_driver_sql(f"CREATE UNIQUE INDEX {quoted_name} ON {quoted_table} ({column_list})")
+    else:
+        connection.exec_driver_sql(f"ALTER TABLE {quoted_table} DROP CONSTRAINT IF EXISTS {quoted_name}")
+        connection.exec_driver_sql(f"ALTER TABLE {quoted_table} ADD CONSTRAINT {quoted_name} UNIQUE ({column_list})")
+    session.commit()
+
+
+def rebuild_unique_constraint(session: SessionType, table: Table, unique_constraint: str) -> None:
+    """
+    Rebuild a unique constraint whose columns differ from the model's.
+
+    Columns added to an identity later are added to its unique
+    constraint, otherwise rows differing only in them could not be
+    stored. Unique indexes of the same name, created by
+    :func:`add_parameters_key` on SQLite, are checked as well.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table : Table
+        Model table with the constraint.
+    unique_constraint : str
+        Name of the model's unique constraint.
+
+    Notes
+    -----
+    The table must already have every column of the model's constraint,
+    see :func:`add_missing_columns`. Constraint columns are expected to
+    only be added, so existing rows stay unique. SQLite cannot alter
+    table constraints, so there the table is recreated with the model's
+    constraints and indexes and its rows are copied, in a single
+    transaction.
+    """
+    connection = session.connection()
+    inspector = inspect(connection)
+    constraint = next(
+        item for item in table.constraints if isinstance(item, UniqueConstraint) and item.name == unique_constraint
+    )
+    key_columns = [column.name for column in constraint.columns]
+    existing = [
+        item["column_names"]
+        for item in [*inspector.get_unique_constraints(table.name), *inspector.get_indexes(table.name)]
+        if item["name"] == unique_constraint
+    ]
+    if all(columns == key_columns for columns in existing):
+        return
+
+    preparer = connection.dialect.identifier_preparer
+    quoted_table = preparer.quote(table.name)
+    if connection.dialect.name == "sqlite":
+        legacy_table = preparer.quote(f"{table.name}_legacy")
+        column_list = ", ".join(preparer.quote(column["name"]) for column in inspector.get_columns(table.name))
+        for index in inspector.get_indexes(table.name):
+            connection.exec_driver_sql(f"DROP INDEX {preparer.quote(str(index['name']))}")
+        connection.exec_driver_sql(f"ALTER TABLE {quoted_table} RENAME TO {legacy_table}")
+        table.create(connection)
+        connection.exec_driver_sql(
+            f"INSERT INTO {quoted_table} ({column_list}) SELECT {column_list} FROM {legacy_table}"
+        )
+        connection.exec_driver_sql(f"DROP TABLE {legacy_table}")
+    else:
+        quoted_name = preparer.quote(unique_constraint)
+        column_list = ", ".join(preparer.quote(column) for column in key_columns)
+        connection.exec_driver_sql(f"ALTER TABLE {quoted_table} DROP CONSTRAINT {quoted_name}")
+        connection.exec_driver_sql(f"ALTER TABLE {quoted_table} ADD CONSTRAINT {quoted_name} UNIQUE ({column_list})")
+    session.commit()
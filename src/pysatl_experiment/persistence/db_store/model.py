@@ -3,12 +3,17 @@
 from abc import ABC
 from typing import ClassVar
 
+from sqlalchemy import Engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 from typing_extensions import override
 
 from pysatl_experiment.persistence import IStore
 from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
-from pysatl_experiment.persistence.db_store.db_init import get_request_or_thread_id, init_db
+from pysatl_experiment.persistence.db_store.db_init import (
+    get_request_or_thread_id,
+    init_db,
+    is_read_only_connections,
+)
 
 
 class AbstractDbStore(IStore, ABC):
@@ -21,6 +26,8 @@ class AbstractDbStore(IStore, ABC):
     """
 
     session: ClassVar[SessionType]
+    _engine: ClassVar[Engine | None] = None
+    _created_tables: ClassVar[frozenset[str]] = frozenset()
 
     def __init__(self, db_url="sqlite:///pysatl.sqlite"):
         """
@@ -41,9 +48,25 @@ class AbstractDbStore(IStore, ABC):
 
         Creates the database engine, configures a scoped SQLAlchemy
         session factory, and creates all registered ORM tables.
+
+        Storages of the same database share the engine and the session,
+        so the process keeps a single connection per thread. Tables are
+        not created by read-only worker processes.
         """
         engine = init_db(self.db_url)
-        AbstractDbStore.session = scoped_session(
-            sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
-        )
-        ModelBase.metadata.create_all(engine)
+        if AbstractDbStore._engine is not engine:
+            AbstractDbStore.session = scoped_session(
+                sessionmaker(bind=engine, autoflush=False), scopefunc=get_request_or_thread_id
+            )
+            AbstractDbStore._engine = engine
+            AbstractDbStore._created_tables = frozenset()
+
+        tables = frozenset(ModelBase.metadata.tables)
+        if is_read_only_connections() or tables <= AbstractDbStore._created_tables:
+            return
+
+        # Go through the session connection, the writer engine has a single connection
+        session = AbstractDbStore.session
+        ModelBase.metadata.create_all(session.connection())
+        session.commit()
+        AbstractDbStore._created_tables = tables
@@ -0,0 +1,54 @@
+"""Canonical parameter encoding and hashed lookup keys for database stores."""
+
+import hashlib
+import json
+from collections.abc import Sequence
+
+
+PARAMETERS_KEY_LENGTH = 32
+"""Length of hexadecimal parameter keys (128-bit BLAKE2b digest)."""
+
+_KEY_SEPARATOR = "\x1f"
+
+
+def encode_parameters(parameters: Sequence[float]) -> str:
+    """
+    Encode numeric parameters into canonical JSON.
+
+    Every value is converted to ``float`` so that equal parameters written
+    as ``1``, ``1.0`` or ``np.float64(1)`` share one representation.
+    Negative zero is normalized to zero.
+
+    Parameters
+    ----------
+    parameters : Sequence[float]
+        Numeric parameters.
+
+    Returns
+    -------
+    str
+        Compact JSON array of floats.
+    """
+    return json.dumps([float(value) + 0.0 for value in parameters], separators=(",", ":"))
+
+
+def make_parameters_key(*components: str | Sequence[float]) -> str:
+    """
+    Build fixed-width lookup key for codes and their parameters.
+
+    Parameters
+    ----------
+    *components : str | Sequence[float]
+        Identifying components, e.g. criterion code followed by
+        criterion parameters. Strings are used as is, numeric
+        sequences are canonically encoded.
+
+    Returns
+    -------
+    str
+        Hexadecimal digest of length :data:`PARAMETERS_KEY_LENGTH`.
+    """
+    canonical = _KEY_SEPARATOR.join(
+        component if isinstance(component, str) else encode_parameters(component) for component in components
+    )
+    return hashlib.blake2b(canonical.encode(), digest_size=PARAMETERS_KEY_LENGTH // 2).hexdigest()
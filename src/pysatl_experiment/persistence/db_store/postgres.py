@@ -0,0 +1,205 @@
+"""PostgreSQL bulk loading helpers based on ``COPY FROM STDIN``."""
+
+import io
+from collections.abc import Iterable, Sequence
+from typing import Any, Final
+
+from sqlalchemy import Table
+
+from pysatl_experiment.persistence.db_store.base import SessionType
+
+
+POSTGRES_POOL_SIZE: Final[int] = 5
+"""Persistent connections of the parent process engine."""
+
+POSTGRES_MAX_OVERFLOW: Final[int] = 5
+"""Additional short-lived connections of the parent process engine."""
+
+POSTGRES_WORKER_POOL_SIZE: Final[int] = 1
+"""Persistent connections of each worker process engine."""
+
+
+def supports_copy(session: SessionType) -> bool:
+    """
+    Check whether the session is bound to a PostgreSQL psycopg2 engine.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+
+    Returns
+    -------
+    bool
+        True if ``COPY FROM STDIN`` can be used.
+    """
+    dialect = session.get_bind().dialect
+    return dialect.name == "postgresql" and dialect.driver == "psycopg2"
+
+
+def format_copy_row(values: Iterable[Any]) -> str:
+    """
+    Format values as a line of ``COPY ... WITH (FORMAT csv)`` input.
+
+    Parameters
+    ----------
+    values : Iterable[Any]
+        Row values. ``None`` becomes NULL, sequences of numbers become
+        ``float8[]`` literals and bytes become ``bytea`` hex literals.
+
+    Returns
+    -------
+    str
+        CSV line terminated with a newline.
+    """
+    return ",".join(_format_copy_value(value) for value in values) + "\n"
+
+
+def copy_rows(session: SessionType, table: Table, rows: Sequence[dict[str, Any]]) -> None:
+    """
+    Bulk load rows with ``COPY FROM STDIN``.
+
+    Parameters
+    ----------
+    session : SessionType
+        Session bound to a PostgreSQL psycopg2 engine.
+    table : Table
+        Target table.
+    rows : Sequence[dict[str, Any]]
+        Column values of rows to load. All rows must have the same keys.
+    """
+    if not rows:
+        return
+
+    columns = list(rows[0])
+    _copy(session, _quote(session, table.name), columns, rows)
+
+
+def copy_upsert_rows(
+    session: SessionType,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    version_column: str | None = None,
+) -> None:
+    """
+    Bulk upsert rows through a temporary table loaded with ``COPY``.
+
+    Parameters
+    ----------
+    session : SessionType
+        Session bound to a PostgreSQL psycopg2 engine.
+    table : Table
+        Target table.
+    rows : Sequence[dict[str, Any]]
+        Column values of rows to store, without duplicate keys.
+    index_elements : Sequence[str]
+        Columns of the unique constraint identifying a row.
+    update_columns : Sequence[str]
+        Columns overwritten when the row already exists.
+    version_column : str | None, default=None
+        If given, an existing row is only updated when the new value
+        of this column is not smaller than the stored one.
+    """
+    if not rows:
+        return
+
+    columns = list(rows[0])
+    target = _quote(session, table.name)
+    staging = _quote(session, f"staging_{table.name}")
+    column_list = ", ".join(_quote(session, column) for column in columns)
+    key_list = ", ".join(_quote(session, column) for column in index_elements)
+    assignments = ", ".join(
+        f"{_quote(session, column)} = EXCLUDED.{_quote(session, column)}" for column in update_columns
+    )
+
+    condition = ""
+    if version_column is not None:
+        quoted_version = _quote(session, version_column)
+        condition = f" WHERE {target}.{quoted_version} <= EXCLUDED.{quoted_version}"
+
+    connection = session.connection()
+    connection.exec_driver_sql(f"CREATE TEMP TABLE {staging} AS SELECT {column_list} FROM {target} WITH NO DATA")
+    _copy(session, staging, columns, rows)
+    connection.exec_driver_sql(
+        f"INSERT INTO {target} ({column_list}) SELECT {column_list} FROM {staging} "
+        f"ON CONFLICT ({key_list}) DO UPDATE SET {assignments}{condition}"
+    )
+    connection.exec_driver_sql(f"DROP TABLE {staging}")
+
+
+def _copy(session: SessionType, quoted_table: str, columns: list[str], rows: Sequence[dict[str, Any]]) -> None:
+    """
+    Stream rows into table using the raw psycopg2 cursor.
+
+    Parameters
+    ----------
+    session : SessionType
+        Session bound to a PostgreSQL psycopg2 engine.
+    quoted_table : str
+        Quoted table name.
+    columns : list[str]
+        Column names in row order.
+    rows : Sequence[dict[str, Any]]
+        Rows to load.
+    """
+    buffer = io.StringIO()
+    for row in rows:
+        buffer.write(format_copy_row(row[column] for column in columns))
+    buffer.seek(0)
+
+    column_list = ", ".join(_quote(session, column) for column in columns)
+    cursor = session.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {quoted_table} ({column_list}) FROM STDIN WITH (FORMAT csv)", buffer)
+    finally:
+        cursor.close()
+
+
+def _quote(session: SessionType, identifier: str) -> str:
+    """
+    Quote SQL identifier for the bound dialect.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    identifier : str
+        Table or column name.
+
+    Returns
+    -------
+    str
+        Quoted identifier.
+    """
+    return session.get_bind().dialect.identifier_preparer.quote(identifier)
+
+
+def _format_copy_value(value: Any) -> str:
+    """
+    Format single value as CSV field.
+
+    Parameters
+    ----------
+    value : Any
+        Value to format.
+
+    Returns
+    -------
+    str
+        Quoted field, or an empty unquoted field for NULL.
+    """
+    if value is None:
+        return ""
+    if isinstance(value, bool):
+        text = "true" if value else "false"
+    elif isinstance(value, bytes | bytearray | memoryview):
+        text = "\\x" + bytes(value).hex()
+    elif isinstance(value, str):
+        text = value
+    elif isinstance(value, Iterable):
+        text = "{" + ",".join(repr(float(item)) for item in value) + "}"
+    else:
+        text = str(value)
+    return '"' + text.replace('"', '""') + '"'
@@ -0,0 +1,174 @@
+"""Binary codecs of stored random value samples."""
+
+import struct
+from collections.abc import Sequence
+from typing import Final
+
+import numpy as np
+import zstandard
+from numpy.typing import NDArray
+
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
+
+
+DEFAULT_SAMPLE_CODEC: Final[SampleCodec] = SampleCodec.RAW_FLOAT64
+"""Codec of newly stored samples unless configured otherwise."""
+
+SAMPLE_CODEC_LENGTH: Final[int] = 32
+"""Maximum length of codec names stored alongside samples."""
+
+_FLOAT32_CODECS = frozenset({SampleCodec.RAW_FLOAT32, SampleCodec.ZSTD_FLOAT32, SampleCodec.LZ4_FLOAT32})
+_ZSTD_CODECS = frozenset({SampleCodec.ZSTD_FLOAT64, SampleCodec.ZSTD_FLOAT32})
+_LZ4_CODECS = frozenset({SampleCodec.LZ4_FLOAT64, SampleCodec.LZ4_FLOAT32})
+
+# CompressedFloatArray header: version(1B), dtype code(1B), length(4B)
+_LEGACY_HEADER = struct.Struct("<BBI")
+_LEGACY_VERSION = 1
+_LEGACY_FLOAT32 = 1
+_LEGACY_FLOAT64 = 2
+
+_ZSTD_LEVEL = 1
+
+
+def encode_sample(values: Sequence[float] | NDArray[np.floating], codec: SampleCodec) -> bytes:
+    """
+    Encode sample into bytes.
+
+    Parameters
+    ----------
+    values : Sequence[float] | NDArray[np.floating]
+        Sample values, or a 2-D block of samples of equal length
+        encoded in row-major order.
+    codec : SampleCodec
+        Target encoding.
+
+    Returns
+    -------
+    bytes
+        Encoded sample.
+
+    Raises
+    ------
+    ImportError
+        If the codec requires the ``lz4`` package and it is not installed.
+    """
+    array = np.asarray(values, dtype=_dtype(codec))
+    payload = array.tobytes()
+
+    if codec == SampleCodec.COMPRESSED_FLOAT_ARRAY:
+        header = _LEGACY_HEADER.pack(_LEGACY_VERSION, _LEGACY_FLOAT64, array.size)
+        return header + zstandard.compress(payload)
+    if codec in _ZSTD_CODECS:
+        return zstandard.compress(payload, _ZSTD_LEVEL)
+    if codec in _LZ4_CODECS:
+        return _lz4_frame().compress(payload)
+    return payload
+
+
+def decode_sample(blob: bytes, codec: SampleCodec, copy: bool = True) -> NDArray[np.float64]:
+    """
+    Decode sample from bytes.
+
+    Parameters
+    ----------
+    blob : bytes
+        Encoded sample.
+    codec : SampleCodec
+        Encoding the sample was stored with.
+    copy : bool, default=True
+        Return a writable array. Otherwise ``raw-float64`` samples are
+        returned as read-only views of ``blob`` without copying.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Sample values.
+
+    Raises
+    ------
+    ValueError
+        If a ``compressed-float-array`` blob has an invalid header.
+    ImportError
+        If the codec requires the ``lz4`` package and it is not installed.
+
+    Notes
+    -----
+    A writable copy is returned by default because some criteria sort
+    samples in place.
+    """
+    if codec == SampleCodec.COMPRESSED_FLOAT_ARRAY:
+        return _decode_legacy(blob)
+
+    if codec in _ZSTD_CODECS:
+        payload = zstandard.decompress(blob)
+    elif codec in _LZ4_CODECS:
+        payload = _lz4_frame().decompress(blob)
+    else:
+        payload = blob
+
+    array = np.frombuffer(payload, dtype=_dtype(codec))
+    return array.astype(np.float64, copy=copy)
+
+
+def _decode_legacy(blob: bytes) -> NDArray[np.float64]:
+    """
+    Decode sample stored by ``CompressedFloatArray``.
+
+    Parameters
+    ----------
+    blob : bytes
+        Header followed by zstd-compressed floats.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Writable sample values.
+    """
+    if len(blob) < _LEGACY_HEADER.size:
+        raise ValueError("Sample blob is too short for header.")
+
+    version, dtype_code, length = _LEGACY_HEADER.unpack_from(blob)
+    if version != _LEGACY_VERSION:
+        raise ValueError(f"Unsupported sample blob version: {version}.")
+
+    dtype = np.dtype("<f4") if dtype_code == _LEGACY_FLOAT32 else np.dtype("<f8")
+    payload = zstandard.decompress(blob[_LEGACY_HEADER.size :])
+    return np.frombuffer(payload, dtype=dtype, count=length).astype(np.float64)
+
+
+def _dtype(codec: SampleCodec) -> np.dtype:
+    """
+    Get little-endian float type of codec.
+
+    Parameters
+    ----------
+    codec : SampleCodec
+        Sample encoding.
+
+    Returns
+    -------
+    np.dtype
+        ``<f4`` for float32 codecs, ``<f8`` otherwise.
+    """
+    return np.dtype("<f4") if codec in _FLOAT32_CODECS else np.dtype("<f8")
+
+
+def _lz4_frame():
+    """
+    Import ``lz4.frame`` on first use.
+
+    Returns
+    -------
+    module
+        The ``lz4.frame`` module.
+
+    Raises
+    ------
+    ImportError
+        If ``lz4`` is not installed.
+    """
+    try:
+        import lz4.frame
+    except ImportError as e:
+        raise ImportError("lz4 sample codecs require the 'lz4' package: pip install pysatl-experiment[lz4]") from e
+    return lz4.frame
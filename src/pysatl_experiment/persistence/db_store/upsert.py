@@ -0,0 +1,156 @@
+"""Dialect-aware bulk INSERT and UPSERT helpers for SQLAlchemy-backed storages."""
+
+from collections.abc import Mapping, Sequence
+from typing import Any
+
+from sqlalchemy import ColumnElement, Table, and_, insert, literal, select, update
+from sqlalchemy.dialects import postgresql, sqlite
+
+from pysatl_experiment.persistence.db_store.base import SessionType
+from pysatl_experiment.persistence.db_store.postgres import copy_rows, copy_upsert_rows, supports_copy
+
+
+def insert_rows(session: SessionType, table: Table, rows: Sequence[dict[str, Any]]) -> None:
+    """
+    Insert rows in bulk.
+
+    PostgreSQL with psycopg2 loads rows via ``COPY FROM STDIN``, other
+    dialects use a single executemany ``INSERT``. The statements are
+    executed in the current transaction, committing is left to the caller.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table : Table
+        Target table.
+    rows : Sequence[dict[str, Any]]
+        Column values of rows to insert.
+    """
+    if not rows:
+        return
+
+    if supports_copy(session):
+        copy_rows(session, table, rows)
+        return
+
+    session.execute(insert(table), list(rows))
+
+
+def insert_row_copies(
+    session: SessionType,
+    table: Table,
+    condition: ColumnElement[bool],
+    values: Mapping[str, Any],
+) -> int:
+    """
+    Insert copies of rows matching a condition with some columns replaced.
+
+    Rows are copied with a single ``INSERT ... SELECT``, so their values
+    are not transferred to the application. The statement is executed in
+    the current transaction, committing is left to the caller.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table : Table
+        Target table with an ``id`` primary key.
+    condition : ColumnElement[bool]
+        Condition selecting rows to copy.
+    values : Mapping[str, Any]
+        Replaced columns and their values, either plain values or SQL
+        expressions over the copied row.
+
+    Returns
+    -------
+    int
+        Number of inserted rows.
+    """
+    columns = [column.name for column in table.columns if column.name != "id"]
+    replacements = {
+        name: value if isinstance(value, ColumnElement) else literal(value, table.c[name].type)
+        for name, value in values.items()
+    }
+    source = select(*(replacements.get(name, table.c[name]) for name in columns)).where(condition)
+    result = session.execute(insert(table).from_select(columns, source))
+    return int(result.rowcount)  # type: ignore[attr-defined]
+
+
+def upsert_rows(
+    session: SessionType,
+    table: Table,
+    rows: Sequence[dict[str, Any]],
+    index_elements: Sequence[str],
+    update_columns: Sequence[str],
+    version_column: str | None = None,
+) -> None:
+    """
+    Insert rows or update existing ones on unique key conflict.
+
+    SQLite and PostgreSQL use native ``INSERT ... ON CONFLICT DO UPDATE``,
+    with PostgreSQL psycopg2 connections staging rows via ``COPY``.
+    Other dialects fall back to ``UPDATE`` followed by ``INSERT`` for rows
+    that did not exist. The statements are executed in the current
+    transaction, committing is left to the caller.
+
+    Parameters
+    ----------
+    session : SessionType
+        Active SQLAlchemy session.
+    table : Table
+        Target table.
+    rows : Sequence[dict[str, Any]]
+        Column values of rows to store.
+    index_elements : Sequence[str]
+        Columns of the unique constraint identifying a row.
+    update_columns : Sequence[str]
+        Columns overwritten when the row already exists.
+    version_column : str | None, default=None
+        If given, an existing row is only updated when the new value
+        of this column is not smaller than the stored one.
+
+    Notes
+    -----
+    Rows with equal keys are collapsed before execution, the last one wins
+    (the last one with the largest ``version_column`` value, if given).
+    PostgreSQL rejects statements updating the same row twice.
+    """
+    keyed_rows: dict[tuple[Any, ...], dict[str, Any]] = {}
+    for row in rows:
+        key = tuple(row[column] for column in index_elements)
+        previous = keyed_rows.get(key)
+        if previous is None or version_column is None or row[version_column] >= previous[version_column]:
+            keyed_rows[key] = row
+    unique_rows = list(keyed_rows.values())
+    if not unique_rows:
+        return
+
+    if supports_copy(session):
+        copy_upsert_rows(session, table, unique_rows, index_elements, update_columns, version_column)
+        return
+
+    dialect_name = session.get_bind().dialect.name
+    if dialect_name in ("sqlite", "postgresql"):
+        dialect_insert = sqlite.insert if dialect_name == "sqlite" else postgresql.insert
+        statement = dialect_insert(table)
+        statement = statement.on_conflict_do_update(
+            index_elements=list(index_elements),
+            set_={column: statement.excluded[column] for column in update_columns},
+            where=(table.c[version_column] <= statement.excluded[version_column]) if version_column else None,
+        )
+        session.execute(statement, unique_rows)
+        return
+
+    for row in unique_rows:
+        condition = and_(*(table.c[column] == row[column] for column in index_elements))
+        update_condition = condition
+        if version_column is not None:
+            update_condition = and_(condition, table.c[version_column] <= row[version_column])
+        result = session.execute(
+            update(table).where(update_condition).values({column: row[column] for column in update_columns})
+        )
+        if result.rowcount > 0:  # type: ignore[attr-defined]
+            continue
+        if version_column is None or session.execute(select(1).where(condition)).first() is None:
+            session.execute(insert(table).values(row))
@@ -16,7 +16,8 @@ from typing import ClassVar
 from sqlalchemy import JSON, Integer, String, UniqueConstraint, select
 from sqlalchemy.orm import Mapped, mapped_column
 
-from pysatl_experiment.persistence.db_store import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store import ModelBase, SessionType, is_read_only_connections
+from pysatl_experiment.persistence.db_store.migration import add_missing_columns, rebuild_unique_constraint
 from pysatl_experiment.persistence.db_store.model import AbstractDbStore
 from pysatl_experiment.persistence.models.experiment import ExperimentModel, ExperimentQuery, IExperimentStorage
 
@@ -72,7 +73,8 @@ class AlchemyExperiment(ModelBase):
         Significance levels used in testing.
 
     parallel_workers : int
-        Number of parallel workers used for execution.
+        Number of parallel workers used for execution, 0 if sized
+        automatically.
 
     is_generation_done : bool
         Whether generation step is completed.
@@ -83,6 +85,17 @@ class AlchemyExperiment(ModelBase):
     is_report_building_done : bool
         Whether report building step is completed.
 
+    nested_samples : bool
+        Whether samples of smaller sizes are prefixes of the largest-size
+        samples.
+
+    common_random_numbers : bool
+        Whether alternative samples are derived from a shared uniform
+        sample pool.
+
+    benchmark : bool
+        Whether execution times are measured in benchmarking mode.
+
     Notes
     -----
     Uniqueness is enforced via a composite key over all configuration fields.
@@ -119,6 +132,10 @@ class AlchemyExperiment(ModelBase):
     is_execution_done: Mapped[bool] = mapped_column(Integer, default=0)
     is_report_building_done: Mapped[bool] = mapped_column(Integer, default=0)
 
+    nested_samples: Mapped[bool] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    common_random_numbers: Mapped[bool] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+    benchmark: Mapped[bool] = mapped_column(Integer, nullable=False, default=0, server_default="0")
+
     __table_args__ = (
         UniqueConstraint(
             "experiment_type",
@@ -134,6 +151,9 @@ class AlchemyExperiment(ModelBase):
             "criteria",
             "alternatives",
             "significance_levels",
+            "nested_samples",
+            "common_random_numbers",
+            "benchmark",
             name="uix_limit_distribution",
         ),
     )
@@ -186,6 +206,21 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
         Must be called before any database operations.
         """
         super().init()
+        if not is_read_only_connections():
+            add_missing_columns(
+                AlchemyExperimentStorage.session,
+                AlchemyExperiment.__tablename__,
+                {
+                    "nested_samples": "INTEGER NOT NULL DEFAULT 0",
+                    "common_random_numbers": "INTEGER NOT NULL DEFAULT 0",
+                    "benchmark": "INTEGER NOT NULL DEFAULT 0",
+                },
+            )
+            rebuild_unique_constraint(
+                AlchemyExperimentStorage.session,
+                AlchemyExperiment.__table__,  # type: ignore[arg-type]
+                "uix_limit_distribution",
+            )
         self._initialized = True
 
     @staticmethod
@@ -221,6 +256,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
             is_generation_done=int(model.is_generation_done),
             is_execution_done=int(model.is_execution_done),
             is_report_building_done=int(model.is_report_building_done),
+            nested_samples=int(model.nested_samples),
+            common_random_numbers=int(model.common_random_numbers),
+            benchmark=int(model.benchmark),
         )
 
     @staticmethod
@@ -256,6 +294,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
             is_generation_done=bool(orm.is_generation_done),
             is_execution_done=bool(orm.is_execution_done),
             is_report_building_done=bool(orm.is_report_building_done),
+            nested_samples=bool(orm.nested_samples),
+            common_random_numbers=bool(orm.common_random_numbers),
+            benchmark=bool(orm.benchmark),
         )
 
     def insert_data(self, model: ExperimentModel) -> None:
@@ -287,6 +328,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
                 AlchemyExperiment.criteria == model.criteria,
                 AlchemyExperiment.alternatives == model.alternatives,
                 AlchemyExperiment.significance_levels == model.significance_levels,
+                AlchemyExperiment.nested_samples == int(model.nested_samples),
+                AlchemyExperiment.common_random_numbers == int(model.common_random_numbers),
+                AlchemyExperiment.benchmark == int(model.benchmark),
             )
 
             existing = session.execute(stmt).scalar_one_or_none()
@@ -334,6 +378,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
                 AlchemyExperiment.criteria == query.criteria,
                 AlchemyExperiment.alternatives == query.alternatives,
                 AlchemyExperiment.significance_levels == query.significance_levels,
+                AlchemyExperiment.nested_samples == int(query.nested_samples),
+                AlchemyExperiment.common_random_numbers == int(query.common_random_numbers),
+                AlchemyExperiment.benchmark == int(query.benchmark),
             )
 
             result = session.execute(stmt).scalar_one_or_none()
@@ -361,6 +408,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
                 AlchemyExperiment.criteria == query.criteria,
                 AlchemyExperiment.alternatives == query.alternatives,
                 AlchemyExperiment.significance_levels == query.significance_levels,
+                AlchemyExperiment.nested_samples == int(query.nested_samples),
+                AlchemyExperiment.common_random_numbers == int(query.common_random_numbers),
+                AlchemyExperiment.benchmark == int(query.benchmark),
             )
 
             obj = session.execute(stmt).scalar_one_or_none()
@@ -399,6 +449,9 @@ class AlchemyExperimentStorage(AbstractDbStore, IExperimentStorage):
                 AlchemyExperiment.criteria == query.criteria,
                 AlchemyExperiment.alternatives == query.alternatives,
                 AlchemyExperiment.significance_levels == query.significance_levels,
+                AlchemyExperiment.nested_samples == int(query.nested_samples),
+                AlchemyExperiment.common_random_numbers == int(query.common_random_numbers),
+                AlchemyExperiment.benchmark == int(query.benchmark),
             )
 
             result = session.execute(stmt).scalar_one_or_none()
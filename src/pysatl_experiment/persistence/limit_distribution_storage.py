@@ -0,0 +1,125 @@
+"""
+Limit distribution persistence layer (SQLAlchemy implementation).
+
+This module extends the limit distribution storage of pysatl-criterion,
+which merges stored records one by one, with bulk upserts of the
+distributions computed by critical value experiments.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import cast
+
+from pysatl_criterion.persistence.models.limit_distribution import LimitDistributionModel
+from pysatl_criterion.persistence.sqlalchemy.alchemy_decorator import CompressedFloatArray
+from pysatl_criterion.persistence.sqlalchemy.datastorage import (
+    AlchemyLimitDistributionStorage as CriterionLimitDistributionStorage,
+)
+from pysatl_criterion.persistence.sqlalchemy.models.limit_distribution_orm import LimitDistributionORM
+from sqlalchemy import Column, Integer, LargeBinary, MetaData, Table, Text
+from sqlalchemy.orm import scoped_session
+
+from pysatl_experiment.persistence.db_store.base import SessionType
+from pysatl_experiment.persistence.db_store.upsert import upsert_rows
+
+
+_LIMIT_DISTRIBUTION_KEY = (
+    "experiment_id",
+    "criterion_code",
+    "criterion_parameters",
+    "sample_size",
+    "monte_carlo_count",
+)
+
+_LIMIT_DISTRIBUTION_ROWS = Table(
+    LimitDistributionORM.__tablename__,
+    MetaData(),
+    Column("experiment_id", Integer, primary_key=True),
+    Column("criterion_code", Text, primary_key=True),
+    Column("criterion_parameters", Text, primary_key=True),
+    Column("sample_size", Integer, primary_key=True),
+    Column("monte_carlo_count", Integer, primary_key=True),
+    Column("results_statistics", LargeBinary),
+)
+"""Limit distribution table with statistics written as already encoded bytes."""
+
+
+class AlchemyLimitDistributionStorage(CriterionLimitDistributionStorage):
+    """
+    Limit distribution storage writing batches with a single upsert.
+
+    Reads are inherited from the pysatl-criterion storage. Records are
+    identified by its primary key: experiment, criterion code and
+    parameters, sample size and Monte-Carlo count.
+
+    Parameters
+    ----------
+    connection_string : str
+        SQLAlchemy database connection string.
+    """
+
+    def __init__(self, connection_string: str):
+        """
+        Initialize limit distribution storage.
+
+        Parameters
+        ----------
+        connection_string : str
+            SQLAlchemy database connection string.
+        """
+        super().__init__(connection_string)
+        self._session: SessionType = scoped_session(self.Session)
+
+    def insert_data(self, data: LimitDistributionModel) -> None:
+        """
+        Insert or update a limit distribution.
+
+        Parameters
+        ----------
+        data : LimitDistributionModel
+            Limit distribution to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[LimitDistributionModel]) -> None:
+        """
+        Insert or update several limit distributions in one transaction.
+
+        Parameters
+        ----------
+        models : list[LimitDistributionModel]
+            Limit distributions to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the primary key instead of a ``SELECT`` and a write per record.
+        Statistics are encoded with the column type of the pysatl-criterion
+        model, so they are read back by the inherited methods.
+        """
+        if not models:
+            return
+
+        session = self._session
+        statistics_type = cast(CompressedFloatArray, LimitDistributionORM.__table__.c.results_statistics.type)
+        dialect = session.get_bind().dialect
+        rows = [
+            {
+                "experiment_id": int(data.experiment_id),
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": json.dumps(data.criterion_parameters),
+                "sample_size": int(data.sample_size),
+                "monte_carlo_count": int(data.monte_carlo_count),
+                "results_statistics": statistics_type.process_bind_param(data.results_statistics, dialect),
+            }
+            for data in models
+        ]
+        upsert_rows(
+            session,
+            _LIMIT_DISTRIBUTION_ROWS,
+            rows,
+            index_elements=_LIMIT_DISTRIBUTION_KEY,
+            update_columns=("results_statistics",),
+        )
+        session.commit()
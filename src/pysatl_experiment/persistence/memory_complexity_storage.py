@@ -0,0 +1,271 @@
+"""
+Memory complexity persistence layer (SQLAlchemy implementation).
+
+This module provides database models and storage implementation for
+persisting memory usage measurements of statistical criteria under
+different experiment configurations.
+
+The module ensures uniqueness of stored records via a composite database
+constraint and provides CRUD operations for memory complexity results.
+"""
+
+from __future__ import annotations
+
+import json
+from typing import ClassVar
+
+from sqlalchemy import Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.upsert import upsert_rows
+from pysatl_experiment.persistence.models.memory_complexity import (
+    IMemoryComplexityStorage,
+    MemoryComplexityModel,
+    MemoryComplexityQuery,
+)
+
+
+_MEMORY_COMPLEXITY_UNIQUE_KEY = ("parameters_key", "sample_size", "monte_carlo_count")
+
+
+class AlchemyMemoryComplexity(ModelBase):
+    """
+    SQLAlchemy ORM model for memory usage measurements of statistical criteria under experiment configurations.
+
+    Each row stores memory results for a unique combination of:
+        - criterion code and its parameters,
+        - sample size,
+        - Monte-Carlo repetition count.
+
+    Uniqueness is enforced via the ``uq_memory_complexity_unique`` constraint.
+
+    Attributes
+    ----------
+    id : int
+        Primary key.
+    criterion_code : str
+        Identifier of the statistical criterion/test.
+    criterion_parameters : str
+        Canonical JSON-serialized parameters of the criterion.
+    parameters_key : str
+        Fixed-width hash of criterion code and parameters.
+    sample_size : int
+        Sample size used in evaluation.
+    monte_carlo_count : int
+        Number of Monte-Carlo simulations.
+    experiment_id : int
+        Identifier of the experiment run.
+    results_peak_bytes : str
+        JSON-serialized peak traced allocations.
+    results_rss_bytes : str
+        JSON-serialized resident set size changes.
+
+    Notes
+    -----
+    All structured fields (parameters and results) are stored as JSON strings.
+    Lookups match on ``parameters_key`` rather than on serialized parameters.
+    """
+
+    __tablename__ = "memory_complexity"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    experiment_id: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    results_peak_bytes: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    results_rss_bytes: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+
+    __table_args__ = (UniqueConstraint(*_MEMORY_COMPLEXITY_UNIQUE_KEY, name="uq_memory_complexity_unique"),)
+
+
+class AlchemyMemoryComplexityStorage(AbstractDbStore, IMemoryComplexityStorage):
+    """
+    SQLAlchemy-backed storage for memory complexity measurements.
+
+    Records are uniquely identified by:
+        - criterion_code
+        - criterion_parameters (JSON-serialized)
+        - sample_size
+        - monte_carlo_count
+
+    The storage must be explicitly initialized via :meth:`init`
+    before any database operations are performed.
+
+    Attributes
+    ----------
+    session : ClassVar[SessionType]
+        Shared SQLAlchemy session used by all storage instances.
+    _initialized : bool
+        Indicates whether storage has been initialized.
+    """
+
+    session: ClassVar[SessionType]
+
+    def __init__(self, db_url: str):
+        """
+        Initialize memory complexity storage.
+
+        Parameters
+        ----------
+        db_url : str
+            SQLAlchemy database connection string.
+
+        Notes
+        -----
+        The constructor does not create DB connection immediately.
+        Call :meth:`init` to initialize the storage.
+        """
+        super().__init__(db_url=db_url)
+        self._initialized: bool = False
+
+    def init(self) -> None:
+        """
+        Initialize database engine and SQLAlchemy session.
+
+        This method must be called before using any CRUD operations.
+        """
+        super().init()
+        self._initialized = True
+
+    def _get_session(self) -> SessionType:
+        """
+        Return active SQLAlchemy session.
+
+        Returns
+        -------
+        SessionType
+            Active DB session.
+
+        Raises
+        ------
+        RuntimeError
+            If storage was not initialized via :meth:`init`.
+        """
+        if not getattr(self, "_initialized", False):
+            raise RuntimeError("Storage not initialized. Call init() first.")
+        return AlchemyMemoryComplexityStorage.session
+
+    def get_data(self, query: MemoryComplexityQuery) -> MemoryComplexityModel | None:
+        """
+        Retrieve stored memory complexity result matching query parameters.
+
+        Parameters
+        ----------
+        query : MemoryComplexityQuery
+            Query defining criterion configuration, sample size and
+            Monte-Carlo count.
+
+        Returns
+        -------
+        MemoryComplexityModel | None
+            Matched record or None if not found.
+        """
+        row: AlchemyMemoryComplexity | None = (
+            self._get_session()
+            .query(AlchemyMemoryComplexity)
+            .filter(
+                AlchemyMemoryComplexity.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyMemoryComplexity.sample_size == int(query.sample_size),
+                AlchemyMemoryComplexity.monte_carlo_count == int(query.monte_carlo_count),
+            )
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return MemoryComplexityModel(
+            experiment_id=int(row.experiment_id),
+            criterion_code=query.criterion_code,
+            criterion_parameters=query.criterion_parameters,
+            sample_size=query.sample_size,
+            monte_carlo_count=query.monte_carlo_count,
+            results_peak_bytes=json.loads(row.results_peak_bytes),
+            results_rss_bytes=json.loads(row.results_rss_bytes),
+        )
+
+    def insert_data(self, data: MemoryComplexityModel) -> None:
+        """
+        Insert or update a memory complexity record.
+
+        Parameters
+        ----------
+        data : MemoryComplexityModel
+            Memory complexity measurement to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[MemoryComplexityModel]) -> None:
+        """
+        Insert or update several memory complexity records in one transaction.
+
+        Parameters
+        ----------
+        models : list[MemoryComplexityModel]
+            Memory complexity measurements to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_memory_complexity_unique`` key.
+        """
+        if not models:
+            return
+
+        rows = [
+            {
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": encode_parameters(data.criterion_parameters),
+                "parameters_key": make_parameters_key(data.criterion_code, data.criterion_parameters),
+                "sample_size": int(data.sample_size),
+                "monte_carlo_count": int(data.monte_carlo_count),
+                "experiment_id": int(data.experiment_id),
+                "results_peak_bytes": json.dumps(data.results_peak_bytes),
+                "results_rss_bytes": json.dumps(data.results_rss_bytes),
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyMemoryComplexity.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_MEMORY_COMPLEXITY_UNIQUE_KEY,
+            update_columns=("experiment_id", "results_peak_bytes", "results_rss_bytes"),
+        )
+        session.commit()
+
+    def delete_data(self, query: MemoryComplexityQuery) -> None:
+        """
+        Delete memory complexity record matching query.
+
+        Parameters
+        ----------
+        query : MemoryComplexityQuery
+            Key identifying record to delete.
+
+        Notes
+        -----
+        Operation is no-op if record does not exist.
+        """
+        (
+            self._get_session()
+            .query(AlchemyMemoryComplexity)
+            .filter(
+                AlchemyMemoryComplexity.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyMemoryComplexity.sample_size == int(query.sample_size),
+                AlchemyMemoryComplexity.monte_carlo_count == int(query.monte_carlo_count),
+            )
+            .delete()
+        )
+        self._get_session().commit()
@@ -0,0 +1,112 @@
+"""Precomputed critical value storage models and interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
+
+
+@dataclass
+class CriticalValueModel(DataModel):
+    """
+    Precomputed critical value model.
+
+    Parameters
+    ----------
+    experiment_id : int
+        Identifier of the critical value experiment.
+    criterion_code : str
+        Statistical criterion code.
+    criterion_parameters : list[float]
+        Parameters of criterion.
+    sample_size : int
+        Sample size.
+    significance_level : float
+        Significance level alpha.
+    alternative : str
+        Test alternative (``HypothesisType`` value).
+    monte_carlo_count : int
+        Size of the limit distribution the value was derived from.
+    lower_value : float | None
+        Left critical value, set for left-tailed and two-tailed tests.
+    upper_value : float | None
+        Right critical value, set for right-tailed and two-tailed tests.
+    """
+
+    experiment_id: int
+    criterion_code: str
+    criterion_parameters: list[float]
+    sample_size: int
+    significance_level: float
+    alternative: str
+    monte_carlo_count: int
+    lower_value: float | None
+    upper_value: float | None
+
+
+@dataclass
+class CriticalValueQuery(DataQuery):
+    """
+    Query for retrieving a precomputed critical value.
+
+    Parameters
+    ----------
+    criterion_code : str
+    criterion_parameters : list[float]
+    sample_size : int
+    significance_level : float
+    alternative : str
+    """
+
+    criterion_code: str
+    criterion_parameters: list[float]
+    sample_size: int
+    significance_level: float
+    alternative: str
+
+
+class ICriticalValueStorage(IDataStorage[CriticalValueModel, CriticalValueQuery], ABC):
+    """Precomputed critical value storage interface."""
+
+    @abstractmethod
+    def get_bulk_data(
+        self,
+        criterion_codes: list[str],
+        sample_size: int,
+        significance_level: float,
+        alternative: str,
+    ) -> list[CriticalValueModel]:
+        """
+        Fetch critical values of several criteria with one query.
+
+        Parameters
+        ----------
+        criterion_codes : list[str]
+            Criterion codes.
+        sample_size : int
+            Sample size.
+        significance_level : float
+            Significance level alpha.
+        alternative : str
+            Test alternative.
+
+        Returns
+        -------
+        list[CriticalValueModel]
+            Found critical values, one per criterion code. When several
+            records exist for a code, the one derived from the largest
+            limit distribution is returned.
+        """
+        pass
+
+    @abstractmethod
+    def insert_bulk_data(self, models: list[CriticalValueModel]) -> None:
+        """
+        Insert or update several critical values in one transaction.
+
+        Parameters
+        ----------
+        models : list[CriticalValueModel]
+            Critical values to store.
+        """
+        pass
@@ -44,13 +44,21 @@ class ExperimentModel(DataModel):
     significance_levels : list[float]
         Significance levels (alpha values).
     parallel_workers : int
-        Number of parallel workers.
+        Number of parallel workers, 0 if sized automatically.
     is_generation_done : bool
         Whether generation step is completed.
     is_execution_done : bool
         Whether execution step is completed.
     is_report_building_done : bool
         Whether report building step is completed.
+    nested_samples : bool
+        Whether samples of smaller sizes are prefixes of the
+        largest-size samples.
+    common_random_numbers : bool
+        Whether alternative samples are derived from a shared uniform
+        sample pool.
+    benchmark : bool
+        Whether execution times are measured in benchmarking mode.
     """
 
     experiment_type: str
@@ -70,6 +78,9 @@ class ExperimentModel(DataModel):
     is_generation_done: bool
     is_execution_done: bool
     is_report_building_done: bool
+    nested_samples: bool = False
+    common_random_numbers: bool = False
+    benchmark: bool = False
 
 
 @dataclass
@@ -106,7 +117,15 @@ class ExperimentQuery(DataQuery):
     report_mode : str
         Report mode.
     parallel_workers : int
-        Number of workers.
+        Number of workers, 0 if sized automatically.
+    nested_samples : bool
+        Whether samples of smaller sizes are prefixes of the
+        largest-size samples.
+    common_random_numbers : bool
+        Whether alternative samples are derived from a shared uniform
+        sample pool.
+    benchmark : bool
+        Whether execution times are measured in benchmarking mode.
     """
 
     experiment_type: str
@@ -123,6 +142,9 @@ class ExperimentQuery(DataQuery):
     significance_levels: list[float]
     report_mode: str
     parallel_workers: int
+    nested_samples: bool = False
+    common_random_numbers: bool = False
+    benchmark: bool = False
 
 
 class IExperimentStorage(IDataStorage[ExperimentModel, ExperimentQuery], ABC):
@@ -0,0 +1,78 @@
+"""Memory complexity storage models and interface."""
+
+from abc import ABC
+from dataclasses import dataclass
+
+from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
+
+
+@dataclass
+class MemoryComplexityModel(DataModel):
+    """
+    Memory complexity measurement model.
+
+    Parameters
+    ----------
+    experiment_id : int
+        Experiment identifier.
+    criterion_code : str
+        Criterion identifier.
+    criterion_parameters : list[float]
+        Criterion parameters.
+    sample_size : int
+        Sample size.
+    monte_carlo_count : int
+        Number of simulations.
+    results_peak_bytes : list[int]
+        Peak memory allocated by each statistic call, traced by ``tracemalloc``.
+    results_rss_bytes : list[int]
+        Change of the process resident set size caused by each statistic call.
+    """
+
+    experiment_id: int
+    criterion_code: str
+    criterion_parameters: list[float]
+    sample_size: int
+    monte_carlo_count: int
+    results_peak_bytes: list[int]
+    results_rss_bytes: list[int]
+
+
+@dataclass
+class MemoryComplexityQuery(DataQuery):
+    """
+    Query for memory complexity data.
+
+    Parameters
+    ----------
+    criterion_code : str
+    criterion_parameters : list[float]
+    sample_size : int
+    monte_carlo_count : int
+    """
+
+    criterion_code: str
+    criterion_parameters: list[float]
+    sample_size: int
+    monte_carlo_count: int
+
+
+class IMemoryComplexityStorage(IDataStorage[MemoryComplexityModel, MemoryComplexityQuery], ABC):
+    """Memory complexity storage interface."""
+
+    def insert_bulk_data(self, models: list[MemoryComplexityModel]) -> None:
+        """
+        Insert or update several memory complexity measurements.
+
+        Parameters
+        ----------
+        models : list[MemoryComplexityModel]
+            Results to store.
+
+        Notes
+        -----
+        The default implementation stores models one by one,
+        database-backed storages override it with a single transaction.
+        """
+        for model in models:
+            self.insert_data(model)
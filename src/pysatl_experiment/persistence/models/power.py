@@ -1,7 +1,7 @@
 """Power storage models and interface."""
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
 
@@ -72,4 +72,74 @@ class PowerQuery(DataQuery):
 class IPowerStorage(IDataStorage[PowerModel, PowerQuery], ABC):
     """Power storage interface."""
 
-    pass
+    def insert_bulk_data(self, models: list[PowerModel]) -> None:
+        """
+        Insert or update several power results.
+
+        Parameters
+        ----------
+        models : list[PowerModel]
+            Results to store.
+
+        Notes
+        -----
+        The default implementation stores models one by one,
+        database-backed storages override it with a single transaction.
+        """
+        for model in models:
+            self.insert_data(model)
+
+    def get_extendable_count(self, query: PowerQuery) -> int:
+        """
+        Get the largest stored Monte-Carlo count below the requested one.
+
+        Parameters
+        ----------
+        query : PowerQuery
+            Query with the requested Monte-Carlo count.
+
+        Returns
+        -------
+        int
+            Monte-Carlo count of the stored result that can be extended
+            to the requested one, 0 if there is none.
+
+        Notes
+        -----
+        The default implementation reports no extendable results,
+        so experiments are recomputed from scratch.
+        """
+        return 0
+
+    def append_bulk_data(self, models: list[PowerModel]) -> None:
+        """
+        Extend stored simulation results with smaller Monte-Carlo counts.
+
+        Parameters
+        ----------
+        models : list[PowerModel]
+            Models holding only the additional ``results_criteria`` and the new
+            total ``monte_carlo_count``. The extended result is the one
+            stored with ``monte_carlo_count - len(results_criteria)``.
+
+        Notes
+        -----
+        The extended result is stored as a new record, the shorter run
+        stays available. The default implementation reads the stored
+        result and stores the combined one.
+        """
+        for model in models:
+            stored_count = model.monte_carlo_count - len(model.results_criteria)
+            stored_query = PowerQuery(
+                criterion_code=model.criterion_code,
+                criterion_parameters=model.criterion_parameters,
+                sample_size=model.sample_size,
+                alternative_code=model.alternative_code,
+                alternative_parameters=model.alternative_parameters,
+                monte_carlo_count=stored_count,
+                significance_level=model.significance_level,
+            )
+            stored = self.get_data(stored_query)
+            if stored is None:
+                raise ValueError(f"No stored result with monte_carlo_count={stored_count} to extend.")
+            self.insert_data(replace(model, results_criteria=[*stored.results_criteria, *model.results_criteria]))
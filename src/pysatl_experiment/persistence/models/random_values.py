@@ -1,8 +1,12 @@
 """Random values storage models and interface."""
 
 from abc import ABC, abstractmethod
+from collections.abc import Iterator
 from dataclasses import dataclass
+from itertools import islice
 
+import numpy as np
+from numpy.typing import NDArray
 from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
 
 
@@ -21,15 +25,15 @@ class RandomValuesModel(DataModel):
         Size of each sample.
     sample_num : int
         Sample index.
-    data : list[float]
-        Generated random values.
+    data : list[float] | NDArray[np.float64]
+        Generated random values. Samples read from storage are arrays.
     """
 
     generator_name: str
     generator_parameters: list[float]
     sample_size: int
     sample_num: int
-    data: list[float]
+    data: list[float] | NDArray[np.float64]
 
 
 @dataclass
@@ -131,6 +135,37 @@ class IRandomValuesStorage(IDataStorage[RandomValuesModel, RandomValuesQuery], A
         """
         pass
 
+    def append_all_data(self, query: RandomValuesAllModel) -> None:
+        """
+        Append samples after the samples already stored for generator config.
+
+        Parameters
+        ----------
+        query : RandomValuesAllModel
+            Samples to append, numbered after the stored ones.
+
+        Notes
+        -----
+        The default implementation inserts samples one by one,
+        database-backed storages insert them in bulk.
+        """
+        count_query = RandomValuesAllQuery(
+            generator_name=query.generator_name,
+            generator_parameters=query.generator_parameters,
+            sample_size=query.sample_size,
+        )
+        first_num = self.get_rvs_count(count_query) + 1
+        for offset, data in enumerate(query.data):
+            self.insert_data(
+                RandomValuesModel(
+                    generator_name=query.generator_name,
+                    generator_parameters=query.generator_parameters,
+                    sample_size=query.sample_size,
+                    sample_num=first_num + offset,
+                    data=data,
+                )
+            )
+
     @abstractmethod
     def get_all_data(self, query: RandomValuesAllQuery) -> list[RandomValuesModel] | None:
         """
@@ -171,3 +206,31 @@ class IRandomValuesStorage(IDataStorage[RandomValuesModel, RandomValuesQuery], A
         list[RandomValuesModel] | None
         """
         pass
+
+    def iter_data(
+        self, query: RandomValuesCountQuery, batch_size: int = 1000, start_sample: int = 0
+    ) -> Iterator[RandomValuesModel]:
+        """
+        Iterate over samples ordered by sample number.
+
+        Parameters
+        ----------
+        query : RandomValuesCountQuery
+            Generator configuration and maximum number of samples.
+        batch_size : int, default=1000
+            Number of samples fetched from storage at once.
+        start_sample : int, default=0
+            Number of first samples not returned, i.e. only samples
+            ``start_sample + 1`` to ``query.count`` are returned.
+
+        Yields
+        ------
+        RandomValuesModel
+            Stored samples.
+
+        Notes
+        -----
+        The default implementation loads all requested samples at once,
+        database-backed storages stream them in batches.
+        """
+        yield from islice(self.get_count_data(query) or [], start_sample, None)
@@ -0,0 +1,137 @@
+"""Statistic cache storage models and interface."""
+
+from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from dataclasses import dataclass
+
+import numpy as np
+from numpy.typing import NDArray
+from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
+
+from pysatl_experiment.persistence.db_store.param_key import make_parameters_key
+
+
+def make_pool_key(generator_name: str, generator_parameters: Sequence[float], sample_size: int) -> str:
+    """
+    Build fingerprint of a stored sample pool.
+
+    Parameters
+    ----------
+    generator_name : str
+        Name of generator of stored samples.
+    generator_parameters : Sequence[float]
+        Generator parameters.
+    sample_size : int
+        Size of stored samples.
+
+    Returns
+    -------
+    str
+        Fixed-width pool fingerprint.
+    """
+    return make_parameters_key(generator_name, generator_parameters, [sample_size])
+
+
+def make_sample_key(
+    pool_key: str,
+    sample_size: int,
+    transform_name: str = "",
+    transform_parameters: Sequence[float] = (),
+) -> str:
+    """
+    Build fingerprint of samples derived from a stored sample pool.
+
+    Parameters
+    ----------
+    pool_key : str
+        Fingerprint of the stored sample pool.
+    sample_size : int
+        Size of samples, stored samples are truncated to it.
+    transform_name : str, default=""
+        Generator whose ``transform`` is applied to stored samples,
+        empty if samples are used as stored.
+    transform_parameters : Sequence[float], default=()
+        Parameters of the transforming generator.
+
+    Returns
+    -------
+    str
+        Fixed-width sample fingerprint.
+    """
+    return make_parameters_key(pool_key, [sample_size], transform_name, transform_parameters)
+
+
+@dataclass
+class StatisticCacheModel(DataModel):
+    """
+    Cached statistic values of consecutive samples of a pool.
+
+    Parameters
+    ----------
+    criterion_code : str
+        Criterion identifier.
+    criterion_parameters : list[float]
+        Criterion parameters.
+    pool_key : str
+        Fingerprint of the stored sample pool.
+    sample_key : str
+        Fingerprint of the samples the statistic was computed on.
+    statistics : list[float] | NDArray[np.float64]
+        Statistic values of samples starting from the first one of the pool.
+    """
+
+    criterion_code: str
+    criterion_parameters: list[float]
+    pool_key: str
+    sample_key: str
+    statistics: list[float] | NDArray[np.float64]
+
+
+@dataclass
+class StatisticCacheQuery(DataQuery):
+    """
+    Query for cached statistic values.
+
+    Parameters
+    ----------
+    criterion_code : str
+    criterion_parameters : list[float]
+    sample_key : str
+    """
+
+    criterion_code: str
+    criterion_parameters: list[float]
+    sample_key: str
+
+
+class IStatisticCacheStorage(IDataStorage[StatisticCacheModel, StatisticCacheQuery], ABC):
+    """Statistic cache storage interface."""
+
+    def insert_bulk_data(self, models: list[StatisticCacheModel]) -> None:
+        """
+        Insert or update several cached statistic vectors.
+
+        Parameters
+        ----------
+        models : list[StatisticCacheModel]
+            Statistic vectors to store.
+
+        Notes
+        -----
+        The default implementation stores models one by one,
+        database-backed storages override it with a single transaction.
+        """
+        for model in models:
+            self.insert_data(model)
+
+    @abstractmethod
+    def delete_pool_data(self, pool_key: str) -> None:
+        """
+        Delete statistic vectors computed on samples of a pool.
+
+        Parameters
+        ----------
+        pool_key : str
+            Fingerprint of the stored sample pool.
+        """
+        pass
@@ -0,0 +1,102 @@
+"""Task profile storage models and interface."""
+
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+
+from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
+
+
+@dataclass
+class TaskProfileModel(DataModel):
+    """
+    Time spent by a single execution task in each phase.
+
+    Parameters
+    ----------
+    experiment_id : int
+        Experiment identifier.
+    criterion_code : str
+        Criterion identifier.
+    sample_size : int
+        Sample size.
+    task_label : str
+        Remaining task identity, e.g. alternative and significance level
+        of power tasks. Empty if criterion and sample size identify the task.
+    load_seconds : float
+        Time spent reading samples and cached statistics from storage.
+    decode_seconds : float
+        Time spent decoding stored sample blocks.
+    compute_seconds : float
+        Time spent preparing samples and computing statistics.
+    serialize_seconds : float
+        Time spent building the task result.
+    save_seconds : float
+        Time spent saving the task result in the parent process.
+    """
+
+    experiment_id: int
+    criterion_code: str
+    sample_size: int
+    task_label: str
+    load_seconds: float
+    decode_seconds: float
+    compute_seconds: float
+    serialize_seconds: float
+    save_seconds: float
+
+
+@dataclass
+class TaskProfileQuery(DataQuery):
+    """
+    Query for task profile.
+
+    Parameters
+    ----------
+    experiment_id : int
+    criterion_code : str
+    sample_size : int
+    task_label : str
+    """
+
+    experiment_id: int
+    criterion_code: str
+    sample_size: int
+    task_label: str
+
+
+class ITaskProfileStorage(IDataStorage[TaskProfileModel, TaskProfileQuery], ABC):
+    """Task profile storage interface."""
+
+    def insert_bulk_data(self, models: list[TaskProfileModel]) -> None:
+        """
+        Insert or update several task profiles.
+
+        Parameters
+        ----------
+        models : list[TaskProfileModel]
+            Profiles to store.
+
+        Notes
+        -----
+        The default implementation stores models one by one,
+        database-backed storages override it with a single transaction.
+        """
+        for model in models:
+            self.insert_data(model)
+
+    @abstractmethod
+    def get_experiment_data(self, experiment_id: int) -> list[TaskProfileModel]:
+        """
+        Get profiles of all tasks of an experiment.
+
+        Parameters
+        ----------
+        experiment_id : int
+            Experiment identifier.
+
+        Returns
+        -------
+        list[TaskProfileModel]
+            Task profiles.
+        """
+        pass
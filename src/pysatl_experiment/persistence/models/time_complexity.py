@@ -1,7 +1,7 @@
 """Time complexity storage models and interface."""
 
 from abc import ABC
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 
 from pysatl_criterion.persistence.models.base import DataModel, DataQuery, IDataStorage
 
@@ -25,6 +25,8 @@ class TimeComplexityModel(DataModel):
         Number of simulations.
     results_times : list[float]
         Execution time measurements.
+    benchmark : bool
+        Whether times were measured in benchmarking mode.
     """
 
     experiment_id: int
@@ -33,6 +35,7 @@ class TimeComplexityModel(DataModel):
     sample_size: int
     monte_carlo_count: int
     results_times: list[float]
+    benchmark: bool = False
 
 
 @dataclass
@@ -46,15 +49,86 @@ class TimeComplexityQuery(DataQuery):
     criterion_parameters : list[float]
     sample_size : int
     monte_carlo_count : int
+    benchmark : bool
+        Whether times were measured in benchmarking mode.
     """
 
     criterion_code: str
     criterion_parameters: list[float]
     sample_size: int
     monte_carlo_count: int
+    benchmark: bool = False
 
 
 class ITimeComplexityStorage(IDataStorage[TimeComplexityModel, TimeComplexityQuery], ABC):
     """Time complexity storage interface."""
 
-    pass
+    def insert_bulk_data(self, models: list[TimeComplexityModel]) -> None:
+        """
+        Insert or update several time complexity measurements.
+
+        Parameters
+        ----------
+        models : list[TimeComplexityModel]
+            Results to store.
+
+        Notes
+        -----
+        The default implementation stores models one by one,
+        database-backed storages override it with a single transaction.
+        """
+        for model in models:
+            self.insert_data(model)
+
+    def get_extendable_count(self, query: TimeComplexityQuery) -> int:
+        """
+        Get the largest stored Monte-Carlo count below the requested one.
+
+        Parameters
+        ----------
+        query : TimeComplexityQuery
+            Query with the requested Monte-Carlo count.
+
+        Returns
+        -------
+        int
+            Monte-Carlo count of the stored result that can be extended
+            to the requested one, 0 if there is none.
+
+        Notes
+        -----
+        The default implementation reports no extendable results,
+        so experiments are recomputed from scratch.
+        """
+        return 0
+
+    def append_bulk_data(self, models: list[TimeComplexityModel]) -> None:
+        """
+        Extend stored time measurements with smaller Monte-Carlo counts.
+
+        Parameters
+        ----------
+        models : list[TimeComplexityModel]
+            Models holding only the additional ``results_times`` and the new
+            total ``monte_carlo_count``. The extended result is the one
+            stored with ``monte_carlo_count - len(results_times)``.
+
+        Notes
+        -----
+        The extended result is stored as a new record, the shorter run
+        stays available. The default implementation reads the stored
+        result and stores the combined one.
+        """
+        for model in models:
+            stored_count = model.monte_carlo_count - len(model.results_times)
+            stored_query = TimeComplexityQuery(
+                criterion_code=model.criterion_code,
+                criterion_parameters=model.criterion_parameters,
+                sample_size=model.sample_size,
+                monte_carlo_count=stored_count,
+                benchmark=model.benchmark,
+            )
+            stored = self.get_data(stored_query)
+            if stored is None:
+                raise ValueError(f"No stored result with monte_carlo_count={stored_count} to extend.")
+            self.insert_data(replace(model, results_times=[*stored.results_times, *model.results_times]))
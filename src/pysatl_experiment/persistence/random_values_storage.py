@@ -7,16 +7,34 @@ random value samples generated by configurable generators.
 
 from __future__ import annotations
 
-import json
-from typing import ClassVar
-
-from pysatl_criterion.persistence.sqlalchemy.alchemy_decorator import CompressedFloatArray
-from sqlalchemy import Integer, String, UniqueConstraint
+from collections.abc import Callable, Iterator, Sequence
+from itertools import islice
+from time import perf_counter
+from typing import Any, ClassVar
+
+import numpy as np
+from numpy.typing import NDArray
+from sqlalchemy import Integer, LargeBinary, String, UniqueConstraint, func, select
 from sqlalchemy.orm import Mapped, mapped_column
 from typing_extensions import override
 
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
 from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.db_init import is_read_only_connections
+from pysatl_experiment.persistence.db_store.migration import add_missing_columns, add_parameters_key
 from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.sample_codec import (
+    DEFAULT_SAMPLE_CODEC,
+    SAMPLE_CODEC_LENGTH,
+    decode_sample,
+    encode_sample,
+)
+from pysatl_experiment.persistence.db_store.upsert import insert_rows
 from pysatl_experiment.persistence.models.random_values import (
     IRandomValuesStorage,
     RandomValuesAllModel,
@@ -27,9 +45,21 @@ from pysatl_experiment.persistence.models.random_values import (
 )
 
 
+DEFAULT_BLOCK_VALUES = 32768
+"""Number of values stored in one row, i.e. 256 KiB of float64 samples."""
+
+_STREAM_BATCH_SIZE = 1000
+
+# Columns added to tables created by earlier versions, with values matching old rows
+_LEGACY_COLUMNS = {
+    "codec": f"VARCHAR({SAMPLE_CODEC_LENGTH}) NOT NULL DEFAULT '{SampleCodec.COMPRESSED_FLOAT_ARRAY.value}'",
+    "sample_count": "INTEGER NOT NULL DEFAULT 1",
+}
+
+
 class AlchemyRandomValues(ModelBase):
     """
-    SQLAlchemy ORM model for stored random value samples.
+    SQLAlchemy ORM model for stored blocks of random value samples.
 
     Attributes
     ----------
@@ -38,55 +68,83 @@ class AlchemyRandomValues(ModelBase):
     generator_name : str
         Name of generator.
     generator_parameters : str
-        JSON-encoded generator parameters.
+        Canonical JSON-encoded generator parameters.
+    parameters_key : str
+        Fixed-width hash of generator name and parameters.
     sample_size : int
         Size of generated sample.
     sample_num : int
-        Sequential sample index.
-    data : list[float]
-        Generated random values.
+        Number of the first sample in the block.
+    sample_count : int
+        Number of samples in the block, which holds samples
+        ``sample_num`` to ``sample_num + sample_count - 1``.
+    codec : str
+        Name of the :class:`SampleCodec` the block is encoded with.
+    data : bytes
+        Encoded samples of equal length, concatenated in order.
 
     Notes
     -----
-    Uniqueness is enforced by (generator_name, generator_parameters,
-    sample_size, sample_num).
+    Uniqueness is enforced by (parameters_key, sample_size, sample_num).
+    The unique index also serves lookups of whole generator
+    configurations by (parameters_key, sample_size) and of the block
+    containing a given sample.
+
+    Rows written before blocks and codecs existed hold a single
+    ``CompressedFloatArray`` sample, the column defaults describe them.
     """
 
     __tablename__ = "random_values"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
-    generator_name: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    generator_parameters: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    sample_size: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # type: ignore
+    generator_name: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    generator_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
     sample_num: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
-    data: Mapped[list[float]] = mapped_column(CompressedFloatArray(), nullable=False)  # type: ignore
-
-    __table_args__ = (
-        UniqueConstraint(
-            "generator_name",
-            "generator_parameters",
-            "sample_size",
-            "sample_num",
-            name="uq_random_values_unique",
-        ),
+    sample_count: Mapped[int] = mapped_column(Integer, nullable=False, server_default="1")  # type: ignore
+    codec: Mapped[str] = mapped_column(  # type: ignore
+        String(SAMPLE_CODEC_LENGTH),
+        nullable=False,
+        server_default=SampleCodec.COMPRESSED_FLOAT_ARRAY.value,
     )
+    data: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # type: ignore
+
+    __table_args__ = (UniqueConstraint("parameters_key", "sample_size", "sample_num", name="uq_random_values_unique"),)
 
 
 class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
     """
     SQLAlchemy storage for random value samples.
 
+    Samples are stored in blocks of consecutive samples, one row per
+    block, so the number of rows and index entries does not grow with
+    every sample.
+
     Attributes
     ----------
     session : SessionType
         Shared SQLAlchemy session.
     _initialized : bool
         Initialization flag.
+    codec : SampleCodec
+        Encoding of newly stored samples.
+    block_values : int
+        Maximum number of values in a block of newly stored samples.
+    decode_seconds : float
+        Total time spent decoding blocks of streamed samples.
+    decoded_bytes : int
+        Total size of decoded blocks of streamed samples.
     """
 
     session: ClassVar[SessionType]
 
-    def __init__(self, db_url: str):
+    def __init__(
+        self,
+        db_url: str,
+        codec: SampleCodec = DEFAULT_SAMPLE_CODEC,
+        block_values: int = DEFAULT_BLOCK_VALUES,
+    ):
         """
         Initialize random values storage.
 
@@ -94,8 +152,18 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         ----------
         db_url : str
             Database connection string.
+        codec : SampleCodec, default=SampleCodec.RAW_FLOAT64
+            Encoding of newly stored samples. Stored samples are decoded
+            with the codec recorded in their row.
+        block_values : int, default=DEFAULT_BLOCK_VALUES
+            Maximum number of values in a block. A block holds at least
+            one sample regardless of its size.
         """
         super().__init__(db_url=db_url)
+        self.codec = codec
+        self.block_values = block_values
+        self.decode_seconds = 0.0
+        self.decoded_bytes = 0
         self._initialized: bool = False
 
     def init(self) -> None:
@@ -107,6 +175,14 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         """
         # Initialize engine and scoped session via AbstractDbStore
         super().init()
+        if not is_read_only_connections():
+            add_missing_columns(AlchemyRandomValuesStorage.session, AlchemyRandomValues.__tablename__, _LEGACY_COLUMNS)
+            add_parameters_key(
+                AlchemyRandomValuesStorage.session,
+                AlchemyRandomValues.__table__,  # type: ignore[arg-type]
+                [("generator_name", "generator_parameters")],
+                "uq_random_values_unique",
+            )
         self._initialized = True
 
     def _get_session(self) -> SessionType:
@@ -143,26 +219,18 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         RandomValuesModel | None
             Stored sample if found, otherwise None.
         """
-        params_json = json.dumps(query.generator_parameters)
-        row: AlchemyRandomValues | None = (
-            self._get_session()
-            .query(AlchemyRandomValues)
-            .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
-                AlchemyRandomValues.sample_size == int(query.sample_size),
-                AlchemyRandomValues.sample_num == int(query.sample_num),
-            )
-            .one_or_none()
-        )
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
+        row = self._get_block(parameters_key, int(query.sample_size), int(query.sample_num))
         if row is None:
             return None
+
+        block = _decode_block(row.data, row.codec, row.sample_count)
         return RandomValuesModel(
             generator_name=query.generator_name,
             generator_parameters=query.generator_parameters,
             sample_size=query.sample_size,
             sample_num=query.sample_num,
-            data=row.data,
+            data=block[int(query.sample_num) - row.sample_num],
         )
 
     def insert_data(self, data: RandomValuesModel) -> None:
@@ -177,30 +245,26 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         Returns
         -------
         None
+
+        Notes
+        -----
+        Updating a sample rewrites the block containing it.
         """
-        params_json = json.dumps(data.generator_parameters)
-        entity = AlchemyRandomValues(
-            generator_name=data.generator_name,
-            generator_parameters=params_json,
-            sample_size=int(data.sample_size),
-            sample_num=int(data.sample_num),
-            data=data.data,
-        )
-        existing: AlchemyRandomValues | None = (
-            self._get_session()
-            .query(AlchemyRandomValues)
-            .filter(
-                AlchemyRandomValues.generator_name == entity.generator_name,
-                AlchemyRandomValues.generator_parameters == entity.generator_parameters,
-                AlchemyRandomValues.sample_size == entity.sample_size,
-                AlchemyRandomValues.sample_num == entity.sample_num,
-            )
-            .one_or_none()
-        )
-        if existing is None:
-            self._get_session().add(entity)
+        parameters_key = make_parameters_key(data.generator_name, data.generator_parameters)
+        sample_size = int(data.sample_size)
+        sample_num = int(data.sample_num)
+        sample = np.asarray(data.data, dtype=np.float64)
+
+        row = self._get_block(parameters_key, sample_size, sample_num)
+        if row is None:
+            first_num, samples = sample_num, [sample]
         else:
-            existing.data = entity.data
+            first_num, samples = row.sample_num, list(_decode_block(row.data, row.codec, row.sample_count))
+            samples[sample_num - row.sample_num] = sample
+            self._delete_block(row)
+
+        rows = self._block_rows(data.generator_name, data.generator_parameters, sample_size, samples, first_num)
+        insert_rows(self._get_session(), AlchemyRandomValues.__table__, rows)  # type: ignore[arg-type]
         self._get_session().commit()
 
     def delete_data(self, query: RandomValuesQuery) -> None:
@@ -215,19 +279,30 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         Returns
         -------
         None
+
+        Notes
+        -----
+        Remaining samples of the block are stored as two blocks
+        around the deleted sample.
         """
-        params_json = json.dumps(query.generator_parameters)
-        (
-            self._get_session()
-            .query(AlchemyRandomValues)
-            .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
-                AlchemyRandomValues.sample_size == int(query.sample_size),
-                AlchemyRandomValues.sample_num == int(query.sample_num),
-            )
-            .delete()
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
+        sample_size = int(query.sample_size)
+        sample_num = int(query.sample_num)
+
+        row = self._get_block(parameters_key, sample_size, sample_num)
+        if row is None:
+            return
+
+        samples = list(_decode_block(row.data, row.codec, row.sample_count))
+        index = sample_num - row.sample_num
+        self._delete_block(row)
+
+        rows = self._block_rows(
+            query.generator_name, query.generator_parameters, sample_size, samples[:index], row.sample_num
+        ) + self._block_rows(
+            query.generator_name, query.generator_parameters, sample_size, samples[index + 1 :], sample_num + 1
         )
+        insert_rows(self._get_session(), AlchemyRandomValues.__table__, rows)  # type: ignore[arg-type]
         self._get_session().commit()
 
     @override
@@ -245,17 +320,17 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         int
             Number of samples.
         """
-        params_json = json.dumps(query.generator_parameters)
-        return (
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
+        count = (
             self._get_session()
-            .query(AlchemyRandomValues)
+            .query(func.sum(AlchemyRandomValues.sample_count))
             .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
+                AlchemyRandomValues.parameters_key == parameters_key,
                 AlchemyRandomValues.sample_size == int(query.sample_size),
             )
-            .count()
+            .scalar()
         )
+        return int(count or 0)
 
     @override
     def insert_all_data(self, query: RandomValuesAllModel) -> None:
@@ -270,30 +345,54 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         Returns
         -------
         None
+
+        Notes
+        -----
+        Blocks are inserted in bulk, via ``COPY FROM STDIN`` on PostgreSQL.
         """
-        params_json = json.dumps(query.generator_parameters)
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
         # delete existing
         (
             self._get_session()
             .query(AlchemyRandomValues)
             .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
+                AlchemyRandomValues.parameters_key == parameters_key,
                 AlchemyRandomValues.sample_size == int(query.sample_size),
             )
             .delete()
         )
         # insert new
-        for i, sample in enumerate(query.data, start=1):
-            self._get_session().add(
-                AlchemyRandomValues(
-                    generator_name=query.generator_name,
-                    generator_parameters=params_json,
-                    sample_size=int(query.sample_size),
-                    sample_num=i,
-                    data=sample,
-                )
-            )
+        rows = self._block_rows(
+            query.generator_name, query.generator_parameters, int(query.sample_size), query.data, first_num=1
+        )
+        insert_rows(self._get_session(), AlchemyRandomValues.__table__, rows)  # type: ignore[arg-type]
+        self._get_session().commit()
+
+    @override
+    def append_all_data(self, query: RandomValuesAllModel) -> None:
+        """
+        Append samples after the samples already stored for generator config.
+
+        Parameters
+        ----------
+        query : RandomValuesAllModel
+            Samples to append.
+
+        Notes
+        -----
+        Stored blocks are left untouched, appended samples are written
+        as new blocks starting after the last stored sample.
+        """
+        count_query = RandomValuesAllQuery(
+            generator_name=query.generator_name,
+            generator_parameters=query.generator_parameters,
+            sample_size=query.sample_size,
+        )
+        first_num = self.get_rvs_count(count_query) + 1
+        rows = self._block_rows(
+            query.generator_name, query.generator_parameters, int(query.sample_size), query.data, first_num=first_num
+        )
+        insert_rows(self._get_session(), AlchemyRandomValues.__table__, rows)  # type: ignore[arg-type]
         self._get_session().commit()
 
     @override
@@ -311,28 +410,18 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         list[RandomValuesModel]
             Ordered list of samples.
         """
-        params_json = json.dumps(query.generator_parameters)
-        rows = (
-            self._get_session()
-            .query(AlchemyRandomValues)
-            .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
-                AlchemyRandomValues.sample_size == int(query.sample_size),
-            )
-            .order_by(AlchemyRandomValues.sample_num)
-            .all()
-        )
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
+        samples = self._iter_samples(parameters_key, int(query.sample_size), _STREAM_BATCH_SIZE)
 
         return [
             RandomValuesModel(
                 generator_name=query.generator_name,
                 generator_parameters=query.generator_parameters,
                 sample_size=query.sample_size,
-                sample_num=row.sample_num,
-                data=row.data,
+                sample_num=sample_num,
+                data=sample,
             )
-            for row in rows
+            for sample_num, sample in samples
         ]
 
     @override
@@ -349,13 +438,12 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         -------
         None
         """
-        params_json = json.dumps(query.generator_parameters)
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
         (
             self._get_session()
             .query(AlchemyRandomValues)
             .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
+                AlchemyRandomValues.parameters_key == parameters_key,
                 AlchemyRandomValues.sample_size == int(query.sample_size),
             )
             .delete()
@@ -377,26 +465,260 @@ class AlchemyRandomValuesStorage(AbstractDbStore, IRandomValuesStorage):
         list[RandomValuesModel]
             Up to `count` samples.
         """
-        params_json = json.dumps(query.generator_parameters)
-        rows = (
+        return list(self.iter_data(query))
+
+    @override
+    def iter_data(
+        self, query: RandomValuesCountQuery, batch_size: int = _STREAM_BATCH_SIZE, start_sample: int = 0
+    ) -> Iterator[RandomValuesModel]:
+        """
+        Stream samples ordered by sample number.
+
+        Parameters
+        ----------
+        query : RandomValuesCountQuery
+            Generator config and limit.
+        batch_size : int, default=1000
+            Approximate number of samples fetched and decoded at once.
+        start_sample : int, default=0
+            Number of first samples not returned.
+
+        Yields
+        ------
+        RandomValuesModel
+            Stored samples ``start_sample + 1`` to ``count``.
+
+        Notes
+        -----
+        Blocks are fetched with ``yield_per``, i.e. through a server-side
+        cursor where the driver supports it, so memory usage is bounded
+        by ``batch_size`` rather than by the number of samples. Samples
+        are numbered consecutively from 1, blocks holding only skipped
+        samples are neither fetched nor decoded.
+        """
+        parameters_key = make_parameters_key(query.generator_name, query.generator_parameters)
+        sample_size = int(query.sample_size)
+        blocks_per_batch = max(1, batch_size // self._samples_per_block(sample_size))
+        samples = self._iter_samples(parameters_key, sample_size, blocks_per_batch, start_sample + 1)
+
+        for sample_num, sample in islice(samples, max(int(query.count) - start_sample, 0)):
+            yield RandomValuesModel(
+                generator_name=query.generator_name,
+                generator_parameters=query.generator_parameters,
+                sample_size=query.sample_size,
+                sample_num=sample_num,
+                data=sample,
+            )
+
+    def _get_block(self, parameters_key: str, sample_size: int, sample_num: int) -> AlchemyRandomValues | None:
+        """
+        Find block containing sample.
+
+        Parameters
+        ----------
+        parameters_key : str
+            Hashed generator name and parameters.
+        sample_size : int
+            Size of generated sample.
+        sample_num : int
+            Sample number.
+
+        Returns
+        -------
+        AlchemyRandomValues | None
+            Block row if the sample is stored, otherwise None.
+        """
+        row: AlchemyRandomValues | None = (
             self._get_session()
             .query(AlchemyRandomValues)
             .filter(
-                AlchemyRandomValues.generator_name == query.generator_name,
-                AlchemyRandomValues.generator_parameters == params_json,
-                AlchemyRandomValues.sample_size == int(query.sample_size),
+                AlchemyRandomValues.parameters_key == parameters_key,
+                AlchemyRandomValues.sample_size == sample_size,
+                AlchemyRandomValues.sample_num <= sample_num,
+            )
+            .order_by(AlchemyRandomValues.sample_num.desc())
+            .first()
+        )
+        if row is None or sample_num >= row.sample_num + row.sample_count:
+            return None
+        return row
+
+    def _delete_block(self, row: AlchemyRandomValues) -> None:
+        """
+        Delete block row in the current transaction.
+
+        Parameters
+        ----------
+        row : AlchemyRandomValues
+            Block to delete.
+        """
+        self._get_session().query(AlchemyRandomValues).filter(AlchemyRandomValues.id == row.id).delete()
+
+    def _iter_samples(
+        self, parameters_key: str, sample_size: int, blocks_per_batch: int, first_num: int = 1
+    ) -> Iterator[tuple[int, NDArray[np.float64]]]:
+        """
+        Iterate over stored samples block by block.
+
+        Parameters
+        ----------
+        parameters_key : str
+            Hashed generator name and parameters.
+        sample_size : int
+            Size of generated sample.
+        blocks_per_batch : int
+            Number of blocks fetched at once.
+        first_num : int, default=1
+            Number of the first returned sample.
+
+        Yields
+        ------
+        tuple[int, NDArray[np.float64]]
+            Sample number and sample values.
+        """
+        first_block = self._get_block(parameters_key, sample_size, first_num) if first_num > 1 else None
+        start_num = first_block.sample_num if first_block is not None else first_num
+        statement = (
+            select(
+                AlchemyRandomValues.sample_num,
+                AlchemyRandomValues.sample_count,
+                AlchemyRandomValues.codec,
+                AlchemyRandomValues.data,
+            )
+            .where(
+                AlchemyRandomValues.parameters_key == parameters_key,
+                AlchemyRandomValues.sample_size == sample_size,
+                AlchemyRandomValues.sample_num >= start_num,
             )
             .order_by(AlchemyRandomValues.sample_num)
-            .limit(int(query.count))
-            .all()
+            .execution_options(yield_per=blocks_per_batch)
         )
+        result = self._get_session().execute(statement)
+        try:
+            for block_num, sample_count, codec, data in result:
+                start = perf_counter()
+                block = _decode_block(data, codec, sample_count)
+                self.decode_seconds += perf_counter() - start
+                self.decoded_bytes += len(data)
+                for offset, sample in enumerate(block):
+                    if block_num + offset >= first_num:
+                        yield block_num + offset, sample
+        finally:
+            result.close()
+
+    def _block_rows(
+        self,
+        generator_name: str,
+        generator_parameters: list[float],
+        sample_size: int,
+        samples: Sequence[Sequence[float] | NDArray[np.float64]],
+        first_num: int,
+    ) -> list[dict[str, Any]]:
+        """
+        Build block rows for consecutive samples.
+
+        Parameters
+        ----------
+        generator_name : str
+            Name of generator.
+        generator_parameters : list[float]
+            Generator parameters.
+        sample_size : int
+            Size of generated sample.
+        samples : Sequence[Sequence[float] | NDArray[np.float64]]
+            Samples to store.
+        first_num : int
+            Number of the first sample.
+
+        Returns
+        -------
+        list[dict[str, Any]]
+            Column values of block rows.
+        """
+        params_json = encode_parameters(generator_parameters)
+        parameters_key = make_parameters_key(generator_name, generator_parameters)
+
         return [
-            RandomValuesModel(
-                generator_name=query.generator_name,
-                generator_parameters=query.generator_parameters,
-                sample_size=query.sample_size,
-                sample_num=row.sample_num,
-                data=row.data,
-            )
-            for row in rows
+            {
+                "generator_name": generator_name,
+                "generator_parameters": params_json,
+                "parameters_key": parameters_key,
+                "sample_size": sample_size,
+                "sample_num": sample_num,
+                "sample_count": len(block),
+                "codec": self.codec.value,
+                "data": encode_sample(block, self.codec),
+            }
+            for sample_num, block in _split_blocks(samples, first_num, self._samples_per_block)
         ]
+
+    def _samples_per_block(self, length: int) -> int:
+        """
+        Get maximum number of samples of given length in a block.
+
+        Parameters
+        ----------
+        length : int
+            Number of values in each sample.
+
+        Returns
+        -------
+        int
+            Block capacity, at least one.
+        """
+        return max(1, self.block_values // max(length, 1))
+
+
+def _split_blocks(
+    samples: Sequence[Sequence[float] | NDArray[np.float64]],
+    first_num: int,
+    samples_per_block: Callable[[int], int],
+) -> Iterator[tuple[int, NDArray[np.float64]]]:
+    """
+    Split consecutive samples into blocks of samples of equal length.
+
+    Parameters
+    ----------
+    samples : Sequence[Sequence[float] | NDArray[np.float64]]
+        Samples to split.
+    first_num : int
+        Number of the first sample.
+    samples_per_block : Callable[[int], int]
+        Block capacity for samples of given length.
+
+    Yields
+    ------
+    tuple[int, NDArray[np.float64]]
+        Number of the first sample in block and 2-D array of its samples.
+    """
+    start = 0
+    while start < len(samples):
+        length = len(samples[start])
+        limit = samples_per_block(length)
+        end = start + 1
+        while end < len(samples) and end - start < limit and len(samples[end]) == length:
+            end += 1
+        yield first_num + start, np.asarray(samples[start:end], dtype=np.float64).reshape(end - start, length)
+        start = end
+
+
+def _decode_block(data: bytes, codec: str, sample_count: int) -> NDArray[np.float64]:
+    """
+    Decode block into 2-D array with a sample per row.
+
+    Parameters
+    ----------
+    data : bytes
+        Encoded block.
+    codec : str
+        Name of the block codec.
+    sample_count : int
+        Number of samples in block.
+
+    Returns
+    -------
+    NDArray[np.float64]
+        Writable array of shape (sample_count, sample length).
+    """
+    values = decode_sample(data, SampleCodec(codec))
+    return values.reshape(sample_count, values.size // sample_count)
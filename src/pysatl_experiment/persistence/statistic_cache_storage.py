@@ -0,0 +1,261 @@
+"""
+Statistic cache persistence layer (SQLAlchemy implementation).
+
+This module provides database models and storage implementation for
+statistic values of stored samples, which allows reusing them across
+experiments computing the same criterion on the same samples.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from sqlalchemy import Integer, LargeBinary, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
+from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.sample_codec import decode_sample, encode_sample
+from pysatl_experiment.persistence.db_store.upsert import upsert_rows
+from pysatl_experiment.persistence.models.statistic_cache import (
+    IStatisticCacheStorage,
+    StatisticCacheModel,
+    StatisticCacheQuery,
+)
+
+
+_STATISTIC_CACHE_UNIQUE_KEY = ("parameters_key", "sample_key")
+
+
+class AlchemyStatisticCache(ModelBase):
+    """
+    SQLAlchemy ORM model for cached statistic values.
+
+    Each row stores statistic values of the first ``statistic_count``
+    samples for a unique combination of:
+        - criterion code and its parameters,
+        - samples derived from a stored sample pool.
+
+    Attributes
+    ----------
+    id : int
+        Primary key.
+    criterion_code : str
+        Identifier of the statistical criterion.
+    criterion_parameters : str
+        Canonical JSON-serialized parameters of the criterion.
+    parameters_key : str
+        Fixed-width hash of criterion code and parameters.
+    pool_key : str
+        Fingerprint of the stored sample pool.
+    sample_key : str
+        Fingerprint of the samples derived from the pool.
+    statistic_count : int
+        Number of cached statistic values.
+    statistics : bytes
+        Statistic values encoded as raw float64.
+    """
+
+    __tablename__ = "statistic_cache"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    pool_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False, index=True)  # type: ignore
+    sample_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    statistic_count: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    statistics: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)  # type: ignore
+
+    __table_args__ = (UniqueConstraint(*_STATISTIC_CACHE_UNIQUE_KEY, name="uq_statistic_cache_unique"),)
+
+
+class AlchemyStatisticCacheStorage(AbstractDbStore, IStatisticCacheStorage):
+    """
+    SQLAlchemy-backed storage for cached statistic values.
+
+    Records are uniquely identified by:
+        - criterion_code
+        - criterion_parameters (JSON-serialized)
+        - sample_key
+
+    The storage must be explicitly initialized via :meth:`init`
+    before any database operations are performed.
+
+    Attributes
+    ----------
+    session : ClassVar[SessionType]
+        Shared SQLAlchemy session used by all storage instances.
+    _initialized : bool
+        Indicates whether storage has been initialized.
+    """
+
+    session: ClassVar[SessionType]
+
+    def __init__(self, db_url: str):
+        """
+        Initialize statistic cache storage.
+
+        Parameters
+        ----------
+        db_url : str
+            SQLAlchemy database connection string.
+
+        Notes
+        -----
+        The constructor does not create DB connection immediately.
+        Call :meth:`init` to initialize the storage.
+        """
+        super().__init__(db_url=db_url)
+        self._initialized: bool = False
+
+    def init(self) -> None:
+        """
+        Initialize database engine and SQLAlchemy session.
+
+        This method must be called before using any CRUD operations.
+        """
+        super().init()
+        self._initialized = True
+
+    def _get_session(self) -> SessionType:
+        """
+        Return active SQLAlchemy session.
+
+        Returns
+        -------
+        SessionType
+            Active DB session.
+
+        Raises
+        ------
+        RuntimeError
+            If storage was not initialized via :meth:`init`.
+        """
+        if not getattr(self, "_initialized", False):
+            raise RuntimeError("Storage not initialized. Call init() first.")
+        return AlchemyStatisticCacheStorage.session
+
+    def get_data(self, query: StatisticCacheQuery) -> StatisticCacheModel | None:
+        """
+        Retrieve cached statistic values matching query.
+
+        Parameters
+        ----------
+        query : StatisticCacheQuery
+            Criterion configuration and sample fingerprint.
+
+        Returns
+        -------
+        StatisticCacheModel | None
+            Cached values or None if nothing is cached.
+        """
+        row: AlchemyStatisticCache | None = (
+            self._get_session()
+            .query(AlchemyStatisticCache)
+            .filter(
+                AlchemyStatisticCache.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyStatisticCache.sample_key == query.sample_key,
+            )
+            .one_or_none()
+        )
+        if row is None:
+            return None
+        return StatisticCacheModel(
+            criterion_code=query.criterion_code,
+            criterion_parameters=query.criterion_parameters,
+            pool_key=row.pool_key,
+            sample_key=row.sample_key,
+            statistics=decode_sample(row.statistics, SampleCodec.RAW_FLOAT64),
+        )
+
+    def insert_data(self, data: StatisticCacheModel) -> None:
+        """
+        Insert or update cached statistic values.
+
+        Parameters
+        ----------
+        data : StatisticCacheModel
+            Statistic values to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[StatisticCacheModel]) -> None:
+        """
+        Insert or update several cached statistic vectors in one transaction.
+
+        Parameters
+        ----------
+        models : list[StatisticCacheModel]
+            Statistic values to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_statistic_cache_unique`` key, so stored vectors are
+        replaced by their extended versions.
+        """
+        if not models:
+            return
+
+        rows = [
+            {
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": encode_parameters(data.criterion_parameters),
+                "parameters_key": make_parameters_key(data.criterion_code, data.criterion_parameters),
+                "pool_key": data.pool_key,
+                "sample_key": data.sample_key,
+                "statistic_count": len(data.statistics),
+                "statistics": encode_sample(data.statistics, SampleCodec.RAW_FLOAT64),
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyStatisticCache.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_STATISTIC_CACHE_UNIQUE_KEY,
+            update_columns=("pool_key", "statistic_count", "statistics"),
+        )
+        session.commit()
+
+    def delete_data(self, query: StatisticCacheQuery) -> None:
+        """
+        Delete cached statistic values matching query.
+
+        Parameters
+        ----------
+        query : StatisticCacheQuery
+            Key identifying record to delete.
+        """
+        (
+            self._get_session()
+            .query(AlchemyStatisticCache)
+            .filter(
+                AlchemyStatisticCache.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyStatisticCache.sample_key == query.sample_key,
+            )
+            .delete()
+        )
+        self._get_session().commit()
+
+    def delete_pool_data(self, pool_key: str) -> None:
+        """
+        Delete statistic values computed on samples of a pool.
+
+        Parameters
+        ----------
+        pool_key : str
+            Fingerprint of the stored sample pool.
+        """
+        self._get_session().query(AlchemyStatisticCache).filter(AlchemyStatisticCache.pool_key == pool_key).delete()
+        self._get_session().commit()
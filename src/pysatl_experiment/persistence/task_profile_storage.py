@@ -0,0 +1,292 @@
+"""
+Task profile persistence layer (SQLAlchemy implementation).
+
+This module provides database models and storage implementation for
+per-task phase timings of experiment execution, which form the profile
+table of an experiment.
+"""
+
+from __future__ import annotations
+
+from typing import ClassVar
+
+from sqlalchemy import Float, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+
+from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.upsert import upsert_rows
+from pysatl_experiment.persistence.models.task_profile import (
+    ITaskProfileStorage,
+    TaskProfileModel,
+    TaskProfileQuery,
+)
+
+
+_TASK_PROFILE_UNIQUE_KEY = ("experiment_id", "criterion_code", "sample_size", "task_label")
+_TASK_PROFILE_TIMES = ("load_seconds", "decode_seconds", "compute_seconds", "serialize_seconds", "save_seconds")
+
+
+class AlchemyTaskProfile(ModelBase):
+    """
+    SQLAlchemy ORM model for task phase timings.
+
+    Each row stores the time a single execution task spent in every phase
+    for a unique combination of:
+        - experiment,
+        - criterion code,
+        - sample size,
+        - task label.
+
+    Attributes
+    ----------
+    id : int
+        Primary key.
+    experiment_id : int
+        Identifier of the experiment.
+    criterion_code : str
+        Identifier of the statistical criterion.
+    sample_size : int
+        Sample size.
+    task_label : str
+        Remaining task identity.
+    load_seconds : float
+        Time spent reading from storage.
+    decode_seconds : float
+        Time spent decoding sample blocks.
+    compute_seconds : float
+        Time spent computing statistics.
+    serialize_seconds : float
+        Time spent building the task result.
+    save_seconds : float
+        Time spent saving the task result.
+    """
+
+    __tablename__ = "task_profile"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
+    experiment_id: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    task_label: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    load_seconds: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+    decode_seconds: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+    compute_seconds: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+    serialize_seconds: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+    save_seconds: Mapped[float] = mapped_column(Float, nullable=False)  # type: ignore
+
+    __table_args__ = (UniqueConstraint(*_TASK_PROFILE_UNIQUE_KEY, name="uq_task_profile_unique"),)
+
+    def to_model(self) -> TaskProfileModel:
+        """
+        Convert row to task profile model.
+
+        Returns
+        -------
+        TaskProfileModel
+            Stored task profile.
+        """
+        return TaskProfileModel(
+            experiment_id=int(self.experiment_id),
+            criterion_code=self.criterion_code,
+            sample_size=int(self.sample_size),
+            task_label=self.task_label,
+            load_seconds=float(self.load_seconds),
+            decode_seconds=float(self.decode_seconds),
+            compute_seconds=float(self.compute_seconds),
+            serialize_seconds=float(self.serialize_seconds),
+            save_seconds=float(self.save_seconds),
+        )
+
+
+class AlchemyTaskProfileStorage(AbstractDbStore, ITaskProfileStorage):
+    """
+    SQLAlchemy-backed storage for task phase timings.
+
+    Records are uniquely identified by:
+        - experiment_id
+        - criterion_code
+        - sample_size
+        - task_label
+
+    The storage must be explicitly initialized via :meth:`init`
+    before any database operations are performed.
+
+    Attributes
+    ----------
+    session : ClassVar[SessionType]
+        Shared SQLAlchemy session used by all storage instances.
+    _initialized : bool
+        Indicates whether storage has been initialized.
+    """
+
+    session: ClassVar[SessionType]
+
+    def __init__(self, db_url: str):
+        """
+        Initialize task profile storage.
+
+        Parameters
+        ----------
+        db_url : str
+            SQLAlchemy database connection string.
+
+        Notes
+        -----
+        The constructor does not create DB connection immediately.
+        Call :meth:`init` to initialize the storage.
+        """
+        super().__init__(db_url=db_url)
+        self._initialized: bool = False
+
+    def init(self) -> None:
+        """
+        Initialize database engine and SQLAlchemy session.
+
+        This method must be called before using any CRUD operations.
+        """
+        super().init()
+        self._initialized = True
+
+    def _get_session(self) -> SessionType:
+        """
+        Return active SQLAlchemy session.
+
+        Returns
+        -------
+        SessionType
+            Active DB session.
+
+        Raises
+        ------
+        RuntimeError
+            If storage was not initialized via :meth:`init`.
+        """
+        if not getattr(self, "_initialized", False):
+            raise RuntimeError("Storage not initialized. Call init() first.")
+        return AlchemyTaskProfileStorage.session
+
+    def get_data(self, query: TaskProfileQuery) -> TaskProfileModel | None:
+        """
+        Retrieve profile of a single task.
+
+        Parameters
+        ----------
+        query : TaskProfileQuery
+            Task identity.
+
+        Returns
+        -------
+        TaskProfileModel | None
+            Stored profile or None if not found.
+        """
+        row: AlchemyTaskProfile | None = (
+            self._get_session()
+            .query(AlchemyTaskProfile)
+            .filter(
+                AlchemyTaskProfile.experiment_id == int(query.experiment_id),
+                AlchemyTaskProfile.criterion_code == query.criterion_code,
+                AlchemyTaskProfile.sample_size == int(query.sample_size),
+                AlchemyTaskProfile.task_label == query.task_label,
+            )
+            .one_or_none()
+        )
+        return None if row is None else row.to_model()
+
+    def get_experiment_data(self, experiment_id: int) -> list[TaskProfileModel]:
+        """
+        Get profiles of all tasks of an experiment.
+
+        Parameters
+        ----------
+        experiment_id : int
+            Experiment identifier.
+
+        Returns
+        -------
+        list[TaskProfileModel]
+            Task profiles ordered by criterion, sample size and label.
+        """
+        rows = (
+            self._get_session()
+            .query(AlchemyTaskProfile)
+            .filter(AlchemyTaskProfile.experiment_id == int(experiment_id))
+            .order_by(AlchemyTaskProfile.criterion_code, AlchemyTaskProfile.sample_size, AlchemyTaskProfile.task_label)
+            .all()
+        )
+        return [row.to_model() for row in rows]
+
+    def insert_data(self, data: TaskProfileModel) -> None:
+        """
+        Insert or update task profile.
+
+        Parameters
+        ----------
+        data : TaskProfileModel
+            Profile to store.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[TaskProfileModel]) -> None:
+        """
+        Insert or update several task profiles in one transaction.
+
+        Parameters
+        ----------
+        models : list[TaskProfileModel]
+            Profiles to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_task_profile_unique`` key, so rerun tasks replace
+        their previous timings.
+        """
+        if not models:
+            return
+
+        rows = [
+            {
+                "experiment_id": int(data.experiment_id),
+                "criterion_code": data.criterion_code,
+                "sample_size": int(data.sample_size),
+                "task_label": data.task_label,
+                "load_seconds": float(data.load_seconds),
+                "decode_seconds": float(data.decode_seconds),
+                "compute_seconds": float(data.compute_seconds),
+                "serialize_seconds": float(data.serialize_seconds),
+                "save_seconds": float(data.save_seconds),
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyTaskProfile.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_TASK_PROFILE_UNIQUE_KEY,
+            update_columns=_TASK_PROFILE_TIMES,
+        )
+        session.commit()
+
+    def delete_data(self, query: TaskProfileQuery) -> None:
+        """
+        Delete task profile matching query.
+
+        Parameters
+        ----------
+        query : TaskProfileQuery
+            Key identifying record to delete.
+        """
+        (
+            self._get_session()
+            .query(AlchemyTaskProfile)
+            .filter(
+                AlchemyTaskProfile.experiment_id == int(query.experiment_id),
+                AlchemyTaskProfile.criterion_code == query.criterion_code,
+                AlchemyTaskProfile.sample_size == int(query.sample_size),
+                AlchemyTaskProfile.task_label == query.task_label,
+            )
+            .delete()
+        )
+        self._get_session().commit()
@@ -14,11 +14,24 @@ from __future__ import annotations
 import json
 from typing import ClassVar
 
-from sqlalchemy import Integer, String, UniqueConstraint
+from sqlalchemy import Integer, String, UniqueConstraint, and_, func
 from sqlalchemy.orm import Mapped, mapped_column
 
 from pysatl_experiment.persistence.db_store.base import ModelBase, SessionType
+from pysatl_experiment.persistence.db_store.db_init import is_read_only_connections
+from pysatl_experiment.persistence.db_store.json_array import append_json_array
+from pysatl_experiment.persistence.db_store.migration import (
+    add_missing_columns,
+    add_parameters_key,
+    rebuild_unique_constraint,
+)
 from pysatl_experiment.persistence.db_store.model import AbstractDbStore
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+from pysatl_experiment.persistence.db_store.upsert import insert_row_copies, upsert_rows
 from pysatl_experiment.persistence.models.time_complexity import (
     ITimeComplexityStorage,
     TimeComplexityModel,
@@ -26,6 +39,9 @@ from pysatl_experiment.persistence.models.time_complexity import (
 )
 
 
+_TIME_COMPLEXITY_UNIQUE_KEY = ("parameters_key", "sample_size", "monte_carlo_count", "benchmark")
+
+
 class AlchemyTimeComplexity(ModelBase):
     """
     SQLAlchemy ORM model for execution time measurements of statistical criteria under experiment configurations.
@@ -33,7 +49,8 @@ class AlchemyTimeComplexity(ModelBase):
     Each row stores timing results for a unique combination of:
         - criterion code and its parameters,
         - sample size,
-        - Monte-Carlo repetition count.
+        - Monte-Carlo repetition count,
+        - timing mode.
 
     Uniqueness is enforced via the ``uq_time_complexity_unique`` constraint.
 
@@ -44,11 +61,15 @@ class AlchemyTimeComplexity(ModelBase):
     criterion_code : str
         Identifier of the statistical criterion/test.
     criterion_parameters : str
-        JSON-serialized parameters of the criterion.
+        Canonical JSON-serialized parameters of the criterion.
+    parameters_key : str
+        Fixed-width hash of criterion code and parameters.
     sample_size : int
         Sample size used in evaluation.
     monte_carlo_count : int
         Number of Monte-Carlo simulations.
+    benchmark : bool
+        Whether times were measured in benchmarking mode.
     experiment_id : int
         Identifier of the experiment run.
     results_times : str
@@ -57,28 +78,22 @@ class AlchemyTimeComplexity(ModelBase):
     Notes
     -----
     All structured fields (parameters and results) are stored as JSON strings.
-    Consistent serialization is required for correct querying.
+    Lookups match on ``parameters_key`` rather than on serialized parameters.
     """
 
     __tablename__ = "time_complexity"
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True)  # type: ignore
-    criterion_code: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False, index=True)  # type: ignore
-    sample_size: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # type: ignore
-    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False, index=True)  # type: ignore
+    criterion_code: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    criterion_parameters: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
+    parameters_key: Mapped[str] = mapped_column(String(PARAMETERS_KEY_LENGTH), nullable=False)  # type: ignore
+    sample_size: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    monte_carlo_count: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
+    benchmark: Mapped[bool] = mapped_column(Integer, nullable=False, default=0, server_default="0")  # type: ignore
     experiment_id: Mapped[int] = mapped_column(Integer, nullable=False)  # type: ignore
     results_times: Mapped[str] = mapped_column(String, nullable=False)  # type: ignore
 
-    __table_args__ = (
-        UniqueConstraint(
-            "criterion_code",
-            "criterion_parameters",
-            "sample_size",
-            "monte_carlo_count",
-            name="uq_time_complexity_unique",
-        ),
-    )
+    __table_args__ = (UniqueConstraint(*_TIME_COMPLEXITY_UNIQUE_KEY, name="uq_time_complexity_unique"),)
 
 
 class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
@@ -93,6 +108,7 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
         - criterion_parameters (JSON-serialized)
         - sample_size
         - monte_carlo_count
+        - benchmark
 
     The storage must be explicitly initialized via :meth:`init`
     before any database operations are performed.
@@ -137,6 +153,23 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
         - Sets internal initialization flag
         """
         super().init()
+        if not is_read_only_connections():
+            add_missing_columns(
+                AlchemyTimeComplexityStorage.session,
+                AlchemyTimeComplexity.__tablename__,
+                {"benchmark": "INTEGER NOT NULL DEFAULT 0"},
+            )
+            add_parameters_key(
+                AlchemyTimeComplexityStorage.session,
+                AlchemyTimeComplexity.__table__,  # type: ignore[arg-type]
+                [("criterion_code", "criterion_parameters")],
+                "uq_time_complexity_unique",
+            )
+            rebuild_unique_constraint(
+                AlchemyTimeComplexityStorage.session,
+                AlchemyTimeComplexity.__table__,  # type: ignore[arg-type]
+                "uq_time_complexity_unique",
+            )
         self._initialized = True
 
     def _get_session(self) -> SessionType:
@@ -180,17 +213,17 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
 
         Notes
         -----
-        Matching is strict and relies on JSON-serialized parameter equality.
+        Matching is strict and relies on the canonical parameters key.
         """
-        params_json = json.dumps(query.criterion_parameters)
         row: AlchemyTimeComplexity | None = (
             self._get_session()
             .query(AlchemyTimeComplexity)
             .filter(
-                AlchemyTimeComplexity.criterion_code == query.criterion_code,
-                AlchemyTimeComplexity.criterion_parameters == params_json,
+                AlchemyTimeComplexity.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
                 AlchemyTimeComplexity.sample_size == int(query.sample_size),
                 AlchemyTimeComplexity.monte_carlo_count == int(query.monte_carlo_count),
+                AlchemyTimeComplexity.benchmark == int(query.benchmark),
             )
             .one_or_none()
         )
@@ -203,6 +236,7 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
             sample_size=query.sample_size,
             monte_carlo_count=query.monte_carlo_count,
             results_times=json.loads(row.results_times),
+            benchmark=query.benchmark,
         )
 
     def insert_data(self, data: TimeComplexityModel) -> None:
@@ -222,35 +256,125 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
         - Existing records update:
             - experiment_id
             - results_times
-        - criterion_parameters and results_times are JSON-serialized.
+        - criterion_parameters are canonically encoded, results_times
+          are JSON-serialized.
+        """
+        self.insert_bulk_data([data])
+
+    def insert_bulk_data(self, models: list[TimeComplexityModel]) -> None:
+        """
+        Insert or update several time complexity records in one transaction.
+
+        Parameters
+        ----------
+        models : list[TimeComplexityModel]
+            Time complexity measurements to store.
+
+        Notes
+        -----
+        Rows are written with a single ``INSERT ... ON CONFLICT DO UPDATE``
+        on the ``uq_time_complexity_unique`` key.
         """
-        params_json = json.dumps(data.criterion_parameters)
-        existing: AlchemyTimeComplexity | None = (
+        if not models:
+            return
+
+        rows = [
+            {
+                "criterion_code": data.criterion_code,
+                "criterion_parameters": encode_parameters(data.criterion_parameters),
+                "parameters_key": make_parameters_key(data.criterion_code, data.criterion_parameters),
+                "sample_size": int(data.sample_size),
+                "monte_carlo_count": int(data.monte_carlo_count),
+                "benchmark": int(data.benchmark),
+                "experiment_id": int(data.experiment_id),
+                "results_times": json.dumps(data.results_times),
+            }
+            for data in models
+        ]
+        session = self._get_session()
+        upsert_rows(
+            session,
+            AlchemyTimeComplexity.__table__,  # type: ignore[arg-type]
+            rows,
+            index_elements=_TIME_COMPLEXITY_UNIQUE_KEY,
+            update_columns=("experiment_id", "results_times"),
+        )
+        session.commit()
+
+    def get_extendable_count(self, query: TimeComplexityQuery) -> int:
+        """
+        Get the largest stored Monte-Carlo count below the requested one.
+
+        Parameters
+        ----------
+        query : TimeComplexityQuery
+            Query with the requested Monte-Carlo count.
+
+        Returns
+        -------
+        int
+            Monte-Carlo count of the stored record with the same criterion,
+            sample size and timing mode, 0 if there is none.
+        """
+        count: int | None = (
             self._get_session()
-            .query(AlchemyTimeComplexity)
+            .query(func.max(AlchemyTimeComplexity.monte_carlo_count))
             .filter(
-                AlchemyTimeComplexity.criterion_code == data.criterion_code,
-                AlchemyTimeComplexity.criterion_parameters == params_json,
-                AlchemyTimeComplexity.sample_size == int(data.sample_size),
-                AlchemyTimeComplexity.monte_carlo_count == int(data.monte_carlo_count),
+                AlchemyTimeComplexity.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
+                AlchemyTimeComplexity.sample_size == int(query.sample_size),
+                AlchemyTimeComplexity.monte_carlo_count < int(query.monte_carlo_count),
+                AlchemyTimeComplexity.benchmark == int(query.benchmark),
             )
-            .one_or_none()
+            .scalar()
         )
-        if existing is None:
-            entity = AlchemyTimeComplexity(
-                criterion_code=data.criterion_code,
-                criterion_parameters=params_json,
-                sample_size=int(data.sample_size),
-                monte_carlo_count=int(data.monte_carlo_count),
-                experiment_id=int(data.experiment_id),
-                results_times=json.dumps(data.results_times),
+        return int(count or 0)
+
+    def append_bulk_data(self, models: list[TimeComplexityModel]) -> None:
+        """
+        Store extensions of stored time measurements in one transaction.
+
+        Parameters
+        ----------
+        models : list[TimeComplexityModel]
+            Models holding only the additional ``results_times`` and the
+            new total ``monte_carlo_count``.
+
+        Raises
+        ------
+        ValueError
+            If there is no stored record with
+            ``monte_carlo_count - len(results_times)`` measurements.
+
+        Notes
+        -----
+        Each extended result is inserted as a new record with a single
+        ``INSERT ... SELECT`` concatenating the new items to the stored
+        JSON array on the database side. The shorter run is kept.
+        """
+        session = self._get_session()
+        for data in models:
+            stored_count = int(data.monte_carlo_count) - len(data.results_times)
+            inserted = insert_row_copies(
+                session,
+                AlchemyTimeComplexity.__table__,  # type: ignore[arg-type]
+                and_(
+                    AlchemyTimeComplexity.parameters_key
+                    == make_parameters_key(data.criterion_code, data.criterion_parameters),
+                    AlchemyTimeComplexity.sample_size == int(data.sample_size),
+                    AlchemyTimeComplexity.monte_carlo_count == stored_count,
+                    AlchemyTimeComplexity.benchmark == int(data.benchmark),
+                ),
+                {
+                    "experiment_id": int(data.experiment_id),
+                    "monte_carlo_count": int(data.monte_carlo_count),
+                    "results_times": append_json_array(AlchemyTimeComplexity.results_times, data.results_times),
+                },
             )
-            self._get_session().add(entity)
-        else:
-            # replace experiment_id and results_times for the unique key
-            existing.experiment_id = int(data.experiment_id)
-            existing.results_times = json.dumps(data.results_times)
-        self._get_session().commit()
+            if inserted == 0:
+                session.rollback()
+                raise ValueError(f"No stored time complexity with monte_carlo_count={stored_count} to extend.")
+        session.commit()
 
     def delete_data(self, query: TimeComplexityQuery) -> None:
         """
@@ -264,17 +388,17 @@ class AlchemyTimeComplexityStorage(AbstractDbStore, ITimeComplexityStorage):
         Notes
         -----
         Operation is no-op if record does not exist.
-        Matching is strict (exact JSON + numeric equality).
+        Matching is strict (parameters key + numeric equality).
         """
-        params_json = json.dumps(query.criterion_parameters)
         (
             self._get_session()
             .query(AlchemyTimeComplexity)
             .filter(
-                AlchemyTimeComplexity.criterion_code == query.criterion_code,
-                AlchemyTimeComplexity.criterion_parameters == params_json,
+                AlchemyTimeComplexity.parameters_key
+                == make_parameters_key(query.criterion_code, query.criterion_parameters),
                 AlchemyTimeComplexity.sample_size == int(query.sample_size),
                 AlchemyTimeComplexity.monte_carlo_count == int(query.monte_carlo_count),
+                AlchemyTimeComplexity.benchmark == int(query.benchmark),
             )
             .delete()
         )
@@ -0,0 +1,112 @@
+"""
+Direct PDF report rendering.
+
+This module provides a lightweight PDF writer built on ``fpdf2``.
+Unlike :func:`pysatl_experiment.report.common.utils.convert_html_to_pdf`,
+it does not lay out HTML: tables and chart images are drawn directly,
+which keeps generation fast and memory usage flat for large reports.
+"""
+
+from pathlib import Path
+
+from fpdf import FPDF
+from fpdf.fonts import FontFace
+from matplotlib import get_data_path
+
+
+_FONT_FAMILY = "DejaVu"
+_FONT_DIR = Path(get_data_path()) / "fonts" / "ttf"
+
+
+class FpdfReportWriter:
+    """
+    PDF writer drawing report tables and charts with ``fpdf2``.
+
+    The writer mirrors the structure of the HTML report templates:
+    a header with title and date followed by captioned tables,
+    each optionally accompanied by a chart image.
+
+    Notes
+    -----
+    The DejaVu Sans font shipped with matplotlib is embedded so that
+    non-Latin symbols used in captions (e.g. ``α``) are rendered.
+    """
+
+    def __init__(self, title: str, timestamp: str):
+        """
+        Initialize PDF writer.
+
+        Parameters
+        ----------
+        title : str
+            Report title printed in the page header.
+        timestamp : str
+            Report date printed in the page header.
+        """
+        self.pdf = FPDF(orientation="portrait", unit="mm", format="A4")
+        self.pdf.set_auto_page_break(auto=True, margin=15)
+        self.pdf.add_font(_FONT_FAMILY, style="", fname=_FONT_DIR / "DejaVuSans.ttf")
+        self.pdf.add_font(_FONT_FAMILY, style="B", fname=_FONT_DIR / "DejaVuSans-Bold.ttf")
+        self.pdf.add_page()
+
+        self.pdf.set_font(_FONT_FAMILY, style="B", size=12)
+        self.pdf.cell(w=self.pdf.epw / 2, text=title)
+        self.pdf.cell(w=self.pdf.epw / 2, text=timestamp, align="R", new_x="LMARGIN", new_y="NEXT")
+        self.pdf.ln(4)
+
+    def add_table(self, caption: str, header: list[str], rows: list[list[str]]) -> None:
+        """
+        Draw a captioned table.
+
+        Parameters
+        ----------
+        caption : str
+            Table caption.
+        header : list[str]
+            Column titles.
+        rows : list[list[str]]
+            Table rows with already formatted cell values.
+        """
+        self.pdf.set_font(_FONT_FAMILY, style="B", size=10)
+        self.pdf.cell(text=caption, new_x="LMARGIN", new_y="NEXT")
+        self.pdf.ln(1)
+
+        self.pdf.set_font(_FONT_FAMILY, size=8)
+        with self.pdf.table(
+            headings_style=FontFace(emphasis="BOLD"),
+            borders_layout="HORIZONTAL_LINES",
+            text_align="LEFT",
+            line_height=5,
+        ) as table:
+            for row_values in [header, *rows]:
+                row = table.row()
+                for value in row_values:
+                    row.cell(value)
+        self.pdf.ln(4)
+
+    def add_image(self, image_path: Path) -> None:
+        """
+        Draw a chart image scaled to the page width.
+
+        Parameters
+        ----------
+        image_path : Path
+            Path to a PNG or SVG image.
+        """
+        self.pdf.image(image_path, w=self.pdf.epw)
+        self.pdf.ln(4)
+
+    def output(self, output_path: Path) -> None:
+        """
+        Write the PDF document.
+
+        Parameters
+        ----------
+        output_path : Path
+            Destination path of the generated PDF file.
+
+        Notes
+        -----
+        Existing files at the target location are overwritten.
+        """
+        self.pdf.output(str(output_path))
@@ -2,8 +2,9 @@
 Utility functions for report generation.
 
 This module provides helper functions used across report builders,
-including PDF generation from HTML templates and extraction of
-human-readable criterion names from configuration objects.
+including PDF generation from HTML templates, standalone HTML output
+and extraction of human-readable criterion names from configuration
+objects.
 """
 
 from pathlib import Path
@@ -44,6 +45,67 @@ def convert_html_to_pdf(html: str, output_path: Path) -> None:
         raise RuntimeError(f"PDF generation failed: {pisa_status.err}")
 
 
+def write_html_report(html: str, output_path: Path) -> None:
+    """
+    Save rendered HTML content as a standalone report.
+
+    Parameters
+    ----------
+    html : str
+        Rendered HTML content.
+    output_path : Path
+        Destination path of the HTML file.
+
+    Notes
+    -----
+    Charts are expected to be referenced by paths relative to
+    ``output_path``, so the report and its assets directory
+    can be moved together.
+    """
+    output_path.write_text(html, encoding="utf-8")
+
+
+def get_assets_dir(results_path: Path, report_name: str) -> Path:
+    """
+    Return the directory holding external assets of an HTML report.
+
+    Parameters
+    ----------
+    results_path : Path
+        Report output directory.
+    report_name : str
+        Name of the generated report.
+
+    Returns
+    -------
+    Path
+        Assets directory located next to the report file.
+    """
+    return results_path / f"{report_name}_assets"
+
+
+def get_asset_src(asset_path: str | None, results_path: Path) -> str | None:
+    """
+    Convert an absolute asset path into a report-relative reference.
+
+    Parameters
+    ----------
+    asset_path : str | None
+        Absolute path to a generated asset, or None if absent.
+    results_path : Path
+        Report output directory.
+
+    Returns
+    -------
+    str | None
+        POSIX path of the asset relative to ``results_path``,
+        or None if no asset was generated.
+    """
+    if asset_path is None:
+        return None
+    return Path(asset_path).relative_to(results_path.resolve()).as_posix()
+
+
 def get_criterion_names(criteria_config: list[CriterionConfig]) -> list[str]:
     """
     Extract simplified criterion names from configuration objects.
@@ -1,8 +1,8 @@
 """
 Critical value report generation.
 
-This module provides a report builder that generates PDF reports
-containing critical values of statistical criteria for different
+This module provides a report builder that generates PDF or standalone
+HTML reports containing critical values of statistical criteria for different
 sample sizes and significance levels.
 
 Optional visualizations may be included as charts.
@@ -17,8 +17,16 @@ from jinja2 import Environment, FileSystemLoader
 from matplotlib import pyplot as plt
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
-from pysatl_experiment.report.common.utils import convert_html_to_pdf
+from pysatl_experiment.report.common.fpdf_report import FpdfReportWriter
+from pysatl_experiment.report.common.utils import (
+    convert_html_to_pdf,
+    get_asset_src,
+    get_assets_dir,
+    write_html_report,
+)
 
 
 class CriticalValueReportBuilder:
@@ -29,7 +37,8 @@ class CriticalValueReportBuilder:
     and optionally includes charts illustrating how critical values
     change with sample size.
 
-    Reports are rendered from Jinja2 templates and exported as PDF.
+    Reports are rendered from Jinja2 templates and exported as PDF,
+    or saved as standalone HTML with external chart assets.
     """
 
     def __init__(
@@ -38,9 +47,11 @@ class CriticalValueReportBuilder:
         criteria_config: list[CriterionConfig],
         sample_sizes: list[int],
         significance_levels: list[float],
-        cv_values: list[float | tuple[float, float]],
+        cv_values: dict[str, np.ndarray],
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
     ):
         """
         Initialize report builder.
@@ -55,12 +66,18 @@ class CriticalValueReportBuilder:
             Evaluated sample sizes.
         significance_levels : list[float]
             Significance levels.
-        cv_values : list[float | tuple[float, float]]
-            Computed critical values.
+        cv_values : dict[str, np.ndarray]
+            Computed critical values per criterion code, shaped
+            ``(sample sizes, significance levels)``.
         results_path : Path
             Directory for report output.
         with_chart : ReportMode
             Determines whether charts should be included.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets. PDF reports
+            rendered from HTML always embed PNG charts.
         """
         self.report_name = report_name
         self.criteria_config = criteria_config
@@ -69,8 +86,12 @@ class CriticalValueReportBuilder:
         self.cv_values = cv_values
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format if report_format != ReportFormat.PDF else ChartFormat.PNG
         template_dir = Path(__file__).parent / "report_templates"  # TODO: common constant?
         self.pdf_path = self.results_path / f"{report_name}.pdf"
+        self.html_path = self.results_path / f"{report_name}.html"
+        self.assets_dir = get_assets_dir(self.results_path, report_name)
 
         self.template_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
 
@@ -80,16 +101,28 @@ class CriticalValueReportBuilder:
 
         Notes
         -----
-        Temporary chart files are created during report generation
-        and removed automatically afterward.
+        For PDF output, temporary chart files are created during report
+        generation and removed automatically afterward. For HTML output,
+        charts are kept in an assets directory next to the report.
         """
-        with TemporaryDirectory(prefix="cv_charts_") as temp_dir:
-            charts_dir = Path(temp_dir)
+        if self.report_format == ReportFormat.PDF:
+            with TemporaryDirectory(prefix="cv_charts_") as temp_dir:
+                charts_dir = Path(temp_dir)
 
-            html_content = self._generate_html(charts_dir)
+                html_content = self._generate_html(charts_dir)
 
-            self.results_path.mkdir(parents=True, exist_ok=True)
-            convert_html_to_pdf(html_content, self.pdf_path)
+                self.results_path.mkdir(parents=True, exist_ok=True)
+                convert_html_to_pdf(html_content, self.pdf_path)
+            return
+
+        self.assets_dir.mkdir(parents=True, exist_ok=True)
+        tables = self._generate_tables(self.assets_dir)
+
+        html_tables = [{**table, "chart": get_asset_src(table["chart"], self.results_path)} for table in tables]
+        write_html_report(self._render_html(html_tables), self.html_path)
+
+        if self.report_format == ReportFormat.HTML_PDF:
+            self._generate_fpdf(tables)
 
     def _generate_html(self, charts_dir: Path) -> str:
         """
@@ -105,6 +138,65 @@ class CriticalValueReportBuilder:
         str
             Rendered HTML document.
         """
+        return self._render_html(self._generate_tables(charts_dir))
+
+    def _render_html(self, tables: list[dict]) -> str:
+        """
+        Render HTML representation of the report.
+
+        Parameters
+        ----------
+        tables : list[dict]
+            Report sections produced by :meth:`_generate_tables`.
+
+        Returns
+        -------
+        str
+            Rendered HTML document.
+        """
+        html = self.template_env.get_template("cv_template.html").render(
+            tables=tables,
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+        return html
+
+    def _generate_fpdf(self, tables: list[dict]) -> None:
+        """
+        Draw the report directly into a PDF document.
+
+        Parameters
+        ----------
+        tables : list[dict]
+            Report sections produced by :meth:`_generate_tables`.
+        """
+        writer = FpdfReportWriter(
+            title="Critical Values Report",
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+
+        for table in tables:
+            rows = [[str(row["size"]), *[f"{value:.3f}" for value in row["values"]]] for row in table["rows"]]
+            writer.add_table(caption=table["title"], header=["Size", *table["levels"]], rows=rows)
+            if table["chart"]:
+                writer.add_image(Path(table["chart"]))
+
+        writer.output(self.pdf_path)
+
+    def _generate_tables(self, charts_dir: Path) -> list[dict]:
+        """
+        Generate report sections.
+
+        Parameters
+        ----------
+        charts_dir : Path
+            Directory for generated chart images.
+
+        Returns
+        -------
+        list[dict]
+            One section per criterion, holding table rows
+            and an optional chart path.
+        """
         tables = []
         for config in self.criteria_config:
             table_data = self._generate_table_data(config.criterion_code)
@@ -125,11 +217,7 @@ class CriticalValueReportBuilder:
                 }
             )
 
-        html = self.template_env.get_template("cv_template.html").render(
-            tables=tables,
-            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
-        )
-        return html
+        return tables
 
     def _generate_table_data(self, criterion_code: str) -> dict[str, object]:
         """
@@ -146,13 +234,7 @@ class CriticalValueReportBuilder:
             Structure containing rows and values
             used for template rendering.
         """
-        values = next(
-            values
-            for cfg, values in zip(self.criteria_config, self._chunk_cv_values(), strict=True)
-            if cfg.criterion_code == criterion_code
-        )
-
-        values_2d = np.array(values).reshape(len(self.sizes), len(self.significance_levels))
+        values_2d = self.cv_values[criterion_code]
 
         rows = []
         for i, size in enumerate(self.sizes):
@@ -176,15 +258,12 @@ class CriticalValueReportBuilder:
         -------
         str
         """
-        chart_path = charts_dir / f"{criterion_code}.png"
+        chart_format = self.chart_format.value
+        chart_path = charts_dir / f"{criterion_code}.{chart_format}"
 
         plt.figure(figsize=(8, 5), dpi=100)
 
-        chunked_values = self._chunk_cv_values()
-
-        idx = next(i for i, cfg in enumerate(self.criteria_config) if cfg.criterion_code == criterion_code)
-        values = chunked_values[idx]
-        values_2d = np.array(values).reshape(len(self.sizes), len(self.significance_levels))
+        values_2d = self.cv_values[criterion_code]
 
         for j, alpha in enumerate(self.significance_levels):
             cv_values = values_2d[:, j]
@@ -199,19 +278,7 @@ class CriticalValueReportBuilder:
 
         plt.tight_layout(rect=(0, 0, 0.85, 1))
 
-        plt.savefig(chart_path, format="png", dpi=150, bbox_inches="tight")
+        plt.savefig(chart_path, format=chart_format, dpi=150, bbox_inches="tight")
         plt.close()
 
         return str(chart_path.resolve().as_posix())
-
-    def _chunk_cv_values(self) -> list[list[float | tuple[float, float]]]:
-        """
-        Split critical value sequence into criterion-specific groups.
-
-        Returns
-        -------
-        list[list[float | tuple[float, float]]]
-            Critical values grouped by criterion.
-        """
-        chunk_size = len(self.sizes) * len(self.significance_levels)
-        return [self.cv_values[i : i + chunk_size] for i in range(0, len(self.cv_values), chunk_size)]
@@ -0,0 +1,353 @@
+"""
+Memory complexity report generation.
+
+This module provides functionality for generating PDF or standalone
+HTML reports containing memory usage measurements of statistical criteria.
+
+Reports may include both tabular data and graphical visualizations
+of peak memory allocation versus sample size.
+"""
+
+import base64
+from io import BytesIO
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from jinja2 import Environment, FileSystemLoader
+from matplotlib import pyplot as plt
+
+from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
+from pysatl_experiment.configuration.models.report_mode import ReportMode
+from pysatl_experiment.experiment_execution.complexity import ComplexityFit
+from pysatl_experiment.report.common.fpdf_report import FpdfReportWriter
+from pysatl_experiment.report.common.utils import (
+    convert_html_to_pdf,
+    get_asset_src,
+    get_assets_dir,
+    get_criterion_names,
+    write_html_report,
+)
+
+
+class MemoryComplexityReportBuilder:
+    """
+    Builder for memory complexity reports.
+
+    The builder produces reports containing peak memory allocations and
+    resident set size changes of statistical criteria across different
+    sample sizes, together with complexity models fitted to the peaks.
+
+    Charts may optionally be embedded directly into PDF reports
+    or stored as external assets of standalone HTML reports.
+    """
+
+    def __init__(
+        self,
+        report_name: str,
+        criteria_config: list[CriterionConfig],
+        sample_sizes: list[int],
+        memory: dict[str, list[tuple[int, float, float]]],
+        results_path: Path,
+        with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
+        fits: dict[str, ComplexityFit] | None = None,
+        extrapolation_sizes: list[int] | None = None,
+    ):
+        """
+        Initialize memory complexity report builder.
+
+        Parameters
+        ----------
+        report_name : str
+            Name of the generated report.
+        criteria_config : list[CriterionConfig]
+            Criteria included in the report.
+        sample_sizes : list[int]
+            Evaluated sample sizes.
+        memory : dict[str, list[tuple[int, float, float]]]
+            Sample size, maximum peak allocation and mean resident set
+            size change in bytes of each criterion.
+        results_path : Path
+            Output directory.
+        with_chart : ReportMode
+            Determines whether charts should be generated.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
+        fits : dict[str, ComplexityFit] | None, default=None
+            Complexity models fitted to peak allocations of each criterion,
+            None to omit the complexity section.
+        extrapolation_sizes : list[int] | None, default=None
+            Untested sample sizes peak allocations are extrapolated to.
+        """
+        self.report_name = report_name
+        self.criteria_config = criteria_config
+        self.sample_sizes = sample_sizes
+        self.memory = memory
+        self.results_path = results_path
+        self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
+        self.fits = fits or {}
+        self.extrapolation_sizes = extrapolation_sizes or []
+        self.assets_dir = get_assets_dir(self.results_path, report_name)
+
+        template_dir = Path(__file__).parent / "report_templates"
+        self.template_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
+
+    def build(self) -> None:
+        """
+        Generate and save the memory complexity report.
+
+        Notes
+        -----
+        The report is rendered from a Jinja2 template and exported as PDF
+        with an inlined chart, or saved as standalone HTML referencing
+        the chart stored in an assets directory.
+        """
+        self.results_path.mkdir(parents=True, exist_ok=True)
+        pdf_path = self.results_path / f"{self.report_name}.pdf"
+
+        if self.report_format == ReportFormat.PDF:
+            convert_html_to_pdf(self._render_html(self._generate_chart_data()), pdf_path)
+            return
+
+        chart_path = None
+        if self.with_chart == ReportMode.WITH_CHART:
+            try:
+                chart_path = self._generate_chart_file(self.assets_dir)
+            except Exception as e:
+                print(f"Failed to generate plot: {e}")
+                chart_path = None
+
+        html_content = self._render_html(get_asset_src(chart_path, self.results_path))
+        write_html_report(html_content, self.results_path / f"{self.report_name}.html")
+
+        if self.report_format == ReportFormat.HTML_PDF:
+            self._generate_fpdf(chart_path, pdf_path)
+
+    def _plot_chart(self) -> None:
+        """
+        Draw peak memory chart on a new matplotlib figure.
+
+        Notes
+        -----
+        The chart displays peak allocation as a function of sample size
+        for all configured criteria, with fitted models drawn dashed.
+        """
+        plt.figure(figsize=(10, 7))
+
+        for criterion, data in self.memory.items():
+            if not data:
+                continue
+            sizes = np.array([item[0] for item in data])
+            peaks_kib = np.array([item[1] for item in data]) / 1024
+
+            line = plt.plot(sizes, peaks_kib, marker="o", linestyle="-", label=criterion)[0]
+
+            fit = self.fits.get(criterion)
+            if fit is not None:
+                fitted_sizes = np.linspace(sizes.min(), sizes.max(), 100)
+                fitted_kib = [fit.predict(int(size)) / 1024 for size in fitted_sizes]
+                plt.plot(
+                    fitted_sizes, fitted_kib, linestyle="--", color=line.get_color(), label=f"{criterion} {fit.model}"
+                )
+
+        plt.xlabel("Sample Size")
+        plt.ylabel("Peak allocation (KiB)")
+        plt.title("Memory Complexity of Criteria")
+        plt.grid(True, which="both", linestyle="--", linewidth=0.5)
+        plt.legend(bbox_to_anchor=(1.02, 1), loc="upper left", borderaxespad=0.0)
+        plt.tight_layout(rect=(0, 0, 0.85, 1))
+
+    def _generate_chart_file(self, charts_dir: Path) -> str:
+        """
+        Generate peak memory chart as an image file.
+
+        Parameters
+        ----------
+        charts_dir : Path
+            Directory for the chart image.
+
+        Returns
+        -------
+        str
+            Absolute path to generated chart image.
+        """
+        charts_dir.mkdir(parents=True, exist_ok=True)
+        chart_path = charts_dir / f"memory_complexity.{self.chart_format.value}"
+
+        self._plot_chart()
+        plt.savefig(chart_path, format=self.chart_format.value, dpi=150)
+        plt.close()
+
+        return str(chart_path.resolve().as_posix())
+
+    def _generate_chart_data(self) -> str | None:
+        """
+        Generate peak memory chart inlined as a data URL.
+
+        Returns
+        -------
+        str | None
+            Base64-encoded PNG image, or None if charts are disabled or
+            chart generation fails.
+        """
+        if self.with_chart != ReportMode.WITH_CHART:
+            return None
+
+        try:
+            buf = BytesIO()
+            self._plot_chart()
+            plt.savefig(buf, format="png", dpi=150)
+            plt.close()
+        except Exception as e:
+            print(f"Failed to generate plot: {e}")
+            return None
+
+        image_base64 = base64.b64encode(buf.getvalue()).decode("utf-8")
+        return f"data:image/png;base64,{image_base64}"
+
+    def _generate_fpdf(self, chart_path: str | None, pdf_path: Path) -> None:
+        """
+        Draw the report directly into a PDF document.
+
+        Parameters
+        ----------
+        chart_path : str | None
+            Absolute path to the chart image, if generated.
+        pdf_path : Path
+            Destination path of the PDF file.
+        """
+        writer = FpdfReportWriter(
+            title="Memory Complexity Report",
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+        writer.add_table(caption="Memory usage", header=self._memory_header(), rows=self._memory_rows())
+        if self.fits:
+            writer.add_table(caption="Complexity", header=self._complexity_header(), rows=self._complexity_rows())
+        if chart_path:
+            writer.add_image(Path(chart_path))
+
+        writer.output(pdf_path)
+
+    def _memory_header(self) -> list[str]:
+        """
+        Build header of the memory usage table.
+
+        Returns
+        -------
+        list[str]
+            Column titles.
+        """
+        return ["Size", *[f"{criterion} Test" for criterion in get_criterion_names(self.criteria_config)]]
+
+    def _memory_rows(self) -> list[list[str]]:
+        """
+        Build rows of the memory usage table.
+
+        Returns
+        -------
+        list[list[str]]
+            Peak allocation and resident set size change of every
+            criterion for each sample size.
+        """
+        rows = []
+        for size in self.sample_sizes:
+            row = [str(size)]
+            for criterion in self.memory:
+                cells = [
+                    f"{_format_bytes(peak)} (RSS {_format_bytes(rss)})"
+                    for item_size, peak, rss in self.memory[criterion]
+                    if item_size == size
+                ]
+                row.append(" ".join(cells))
+            rows.append(row)
+        return rows
+
+    def _complexity_header(self) -> list[str]:
+        """
+        Build header of the complexity table.
+
+        Returns
+        -------
+        list[str]
+            Column titles.
+        """
+        return ["Criterion", "Model", "Exponent", "R²", *[f"n = {size}" for size in self.extrapolation_sizes]]
+
+    def _complexity_rows(self) -> list[list[str]]:
+        """
+        Build rows of the complexity table.
+
+        Returns
+        -------
+        list[list[str]]
+            Selected model, power law exponent, its R² and extrapolated
+            peak allocations of every criterion.
+        """
+        rows = []
+        for criterion, fit in self.fits.items():
+            exponent = f"{fit.exponent:.2f}"
+            if fit.exponent_interval is not None:
+                exponent += f" [{fit.exponent_interval[0]:.2f}, {fit.exponent_interval[1]:.2f}]"
+            rows.append(
+                [
+                    criterion,
+                    fit.model,
+                    exponent,
+                    f"{fit.r_squared:.3f}",
+                    *[_format_bytes(fit.predict(size)) for size in self.extrapolation_sizes],
+                ]
+            )
+        return rows
+
+    def _render_html(self, plot_image: str | None) -> str:
+        """
+        Render HTML representation of the report.
+
+        Parameters
+        ----------
+        plot_image : str | None
+            Chart reference: a data URL or a report-relative path.
+
+        Returns
+        -------
+        str
+            Rendered HTML document.
+        """
+        return self.template_env.get_template("mc_template.html").render(
+            memory_header=self._memory_header(),
+            memory_rows=self._memory_rows(),
+            complexity_header=self._complexity_header() if self.fits else [],
+            complexity_rows=self._complexity_rows(),
+            plot_image=plot_image,
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+
+
+def _format_bytes(value: float) -> str:
+    """
+    Format number of bytes with a binary unit.
+
+    Parameters
+    ----------
+    value : float
+        Number of bytes, negative for released memory.
+
+    Returns
+    -------
+    str
+        Formatted amount, e.g. ``1.50 MiB``.
+    """
+    amount = float(value)
+    for unit in ("B", "KiB", "MiB", "GiB"):
+        if abs(amount) < 1024 or unit == "GiB":
+            return f"{amount:.0f} {unit}" if unit == "B" else f"{amount:.2f} {unit}"
+        amount /= 1024
+    return f"{amount:.2f} GiB"
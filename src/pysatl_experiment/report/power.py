@@ -1,9 +1,9 @@
 """
 Statistical power report generation.
 
-This module provides a report builder capable of generating PDF reports
-containing power estimates for statistical criteria under various
-alternative hypotheses and significance levels.
+This module provides a report builder capable of generating PDF or
+standalone HTML reports containing power estimates for statistical
+criteria under various alternative hypotheses and significance levels.
 
 Charts may optionally be included in the report.
 """
@@ -18,8 +18,17 @@ from jinja2 import Environment, FileSystemLoader
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
 from pysatl_experiment.configuration.models.alternative import Alternative
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
-from pysatl_experiment.report.common.utils import convert_html_to_pdf, get_criterion_names
+from pysatl_experiment.report.common.fpdf_report import FpdfReportWriter
+from pysatl_experiment.report.common.utils import (
+    convert_html_to_pdf,
+    get_asset_src,
+    get_assets_dir,
+    get_criterion_names,
+    write_html_report,
+)
 
 
 class PowerReportBuilder:
@@ -29,7 +38,8 @@ class PowerReportBuilder:
     The report contains power tables and optional charts showing
     the relationship between statistical power and sample size.
 
-    Reports are rendered from HTML templates and exported as PDF.
+    Reports are rendered from HTML templates and exported as PDF,
+    or saved as standalone HTML with external chart assets.
     """
 
     def __init__(
@@ -42,6 +52,8 @@ class PowerReportBuilder:
         power_result: dict[str, dict[tuple[str, float], dict[int, list[bool]]]],
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
     ):
         """
         Initialize power report builder.
@@ -64,6 +76,11 @@ class PowerReportBuilder:
             Output directory.
         with_chart : ReportMode
             Determines whether charts should be generated.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets. PDF reports
+            rendered from HTML always embed PNG charts.
         """
         self.criteria_config = criteria_config
         self.sample_sizes = sample_sizes
@@ -72,9 +89,13 @@ class PowerReportBuilder:
         self.power_result = power_result
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format if report_format != ReportFormat.PDF else ChartFormat.PNG
 
         template_dir = Path(__file__).parent / "report_templates"  # TODO: common constant?
         self.pdf_path = self.results_path / f"{report_name}.pdf"
+        self.html_path = self.results_path / f"{report_name}.html"
+        self.assets_dir = get_assets_dir(self.results_path, report_name)
 
         self.template_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
 
@@ -84,16 +105,28 @@ class PowerReportBuilder:
 
         Notes
         -----
-        Temporary chart files are created during report generation
-        and deleted automatically afterward.
+        For PDF output, temporary chart files are created during report
+        generation and deleted automatically afterward. For HTML output,
+        charts are kept in an assets directory next to the report.
         """
-        with tempfile.TemporaryDirectory(prefix="power_charts_") as temp_dir:
-            charts_dir = Path(temp_dir) / "charts"
+        if self.report_format == ReportFormat.PDF:
+            with tempfile.TemporaryDirectory(prefix="power_charts_") as temp_dir:
+                charts_dir = Path(temp_dir) / "charts"
 
-            html_content = self._generate_html(charts_dir)
+                html_content = self._generate_html(charts_dir)
 
-            self.results_path.mkdir(parents=True, exist_ok=True)
-            convert_html_to_pdf(html_content, self.pdf_path)
+                self.results_path.mkdir(parents=True, exist_ok=True)
+                convert_html_to_pdf(html_content, self.pdf_path)
+            return
+
+        self.results_path.mkdir(parents=True, exist_ok=True)
+        tables = self._generate_tables(self.assets_dir)
+
+        html_tables = [{**table, "chart": get_asset_src(table["chart"], self.results_path)} for table in tables]
+        write_html_report(self._render_html(html_tables), self.html_path)
+
+        if self.report_format == ReportFormat.HTML_PDF:
+            self._generate_fpdf(tables)
 
     def _generate_html(self, charts_dir: Path) -> str:
         """
@@ -109,6 +142,74 @@ class PowerReportBuilder:
         str
             Rendered HTML document.
         """
+        return self._render_html(self._generate_tables(charts_dir))
+
+    def _render_html(self, tables: list[dict]) -> str:
+        """
+        Render HTML report content.
+
+        Parameters
+        ----------
+        tables : list[dict]
+            Report sections produced by :meth:`_generate_tables`.
+
+        Returns
+        -------
+        str
+            Rendered HTML document.
+        """
+        html = self.template_env.get_template("power_template.html").render(
+            tables=tables,
+            criteria=get_criterion_names(self.criteria_config),
+            sample_sizes=self.sample_sizes,
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+        return html
+
+    def _generate_fpdf(self, tables: list[dict]) -> None:
+        """
+        Draw the report directly into a PDF document.
+
+        Parameters
+        ----------
+        tables : list[dict]
+            Report sections produced by :meth:`_generate_tables`.
+        """
+        criteria = get_criterion_names(self.criteria_config)
+        writer = FpdfReportWriter(title="Power Report", timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"))
+
+        for table_data in tables:
+            rows = [
+                [criterion, *[f"{table_data['table'][size][criterion]:.3f}" for size in self.sample_sizes]]
+                for criterion in criteria
+            ]
+            writer.add_table(
+                caption=(
+                    f"Alternative: {table_data['alternative'].generator_name} | (α): {table_data['significance_level']}"
+                ),
+                header=["Test", *[str(size) for size in self.sample_sizes]],
+                rows=rows,
+            )
+            if table_data["chart"]:
+                writer.add_image(Path(table_data["chart"]))
+
+        writer.output(self.pdf_path)
+
+    def _generate_tables(self, charts_dir: Path) -> list[dict]:
+        """
+        Generate report sections.
+
+        Parameters
+        ----------
+        charts_dir : Path
+            Directory for generated charts.
+
+        Returns
+        -------
+        list[dict]
+            One section per alternative and significance level,
+            holding table data and an optional chart path.
+        """
         tables = []
         for alternative in self.alternatives:
             for significance_level in self.significance_levels:
@@ -129,13 +230,7 @@ class PowerReportBuilder:
                     }
                 )
 
-        html = self.template_env.get_template("power_template.html").render(
-            tables=tables,
-            criteria=get_criterion_names(self.criteria_config),
-            sample_sizes=self.sample_sizes,
-            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
-        )
-        return html
+        return tables
 
     def _generate_table_data(
         self,
@@ -198,7 +293,8 @@ class PowerReportBuilder:
         """
         charts_dir.mkdir(parents=True, exist_ok=True)
 
-        chart_path = charts_dir / f"{alternative.generator_name}_{significance_level}.png"
+        chart_format = self.chart_format.value
+        chart_path = charts_dir / f"{alternative.generator_name}_{significance_level}.{chart_format}"
 
         plt.figure(figsize=(10, 6), dpi=100)
 
@@ -221,7 +317,7 @@ class PowerReportBuilder:
         plt.legend(bbox_to_anchor=(1.05, 1), loc="upper left", fontsize="small")
         plt.tight_layout(rect=(0, 0, 0.85, 1))
 
-        plt.savefig(chart_path, format="png", dpi=100, bbox_inches="tight")
+        plt.savefig(chart_path, format=chart_format, dpi=100, bbox_inches="tight")
         plt.close()
 
         return str(chart_path.resolve().as_posix())
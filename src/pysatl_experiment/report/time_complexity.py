@@ -1,8 +1,8 @@
 """
 Time complexity report generation.
 
-This module provides functionality for generating PDF reports
-containing execution time measurements of statistical criteria.
+This module provides functionality for generating PDF or standalone
+HTML reports containing execution time measurements of statistical criteria.
 
 Reports may include both tabular data and graphical visualizations
 of execution time versus sample size.
@@ -18,8 +18,18 @@ from jinja2 import Environment, FileSystemLoader
 from matplotlib import pyplot as plt
 
 from pysatl_experiment.configuration.criteria_config import CriterionConfig
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
-from pysatl_experiment.report.common.utils import convert_html_to_pdf, get_criterion_names
+from pysatl_experiment.experiment_execution.complexity import ComplexityFit
+from pysatl_experiment.report.common.fpdf_report import FpdfReportWriter
+from pysatl_experiment.report.common.utils import (
+    convert_html_to_pdf,
+    get_asset_src,
+    get_assets_dir,
+    get_criterion_names,
+    write_html_report,
+)
 
 
 class TimeComplexityReportBuilder:
@@ -30,7 +40,8 @@ class TimeComplexityReportBuilder:
     measurements for statistical criteria across different
     sample sizes.
 
-    Charts may optionally be embedded directly into the report.
+    Charts may optionally be embedded directly into PDF reports
+    or stored as external assets of standalone HTML reports.
     """
 
     def __init__(
@@ -41,6 +52,10 @@ class TimeComplexityReportBuilder:
         times: dict[str, list[tuple[int, float]]],
         results_path: Path,
         with_chart: ReportMode,
+        report_format: ReportFormat = ReportFormat.PDF,
+        chart_format: ChartFormat = ChartFormat.SVG,
+        fits: dict[str, ComplexityFit] | None = None,
+        extrapolation_sizes: list[int] | None = None,
     ):
         """
         Initialize time complexity report builder.
@@ -59,6 +74,15 @@ class TimeComplexityReportBuilder:
             Output directory.
         with_chart : ReportMode
             Determines whether charts should be generated.
+        report_format : ReportFormat
+            Output format of the report.
+        chart_format : ChartFormat
+            Image format of external chart assets.
+        fits : dict[str, ComplexityFit] | None, default=None
+            Complexity models fitted for each criterion, None to omit
+            the complexity section.
+        extrapolation_sizes : list[int] | None, default=None
+            Untested sample sizes execution times are extrapolated to.
         """
         self.report_name = report_name
         self.criteria_config = criteria_config
@@ -66,6 +90,11 @@ class TimeComplexityReportBuilder:
         self.times = times
         self.results_path = results_path
         self.with_chart = with_chart
+        self.report_format = report_format
+        self.chart_format = chart_format
+        self.fits = fits or {}
+        self.extrapolation_sizes = extrapolation_sizes or []
+        self.assets_dir = get_assets_dir(self.results_path, report_name)
 
         template_dir = Path(__file__).parent / "report_templates"  # TODO: common constant?
         self.template_env = Environment(loader=FileSystemLoader(template_dir), autoescape=True)
@@ -76,29 +105,41 @@ class TimeComplexityReportBuilder:
 
         Notes
         -----
-        The report is rendered from a Jinja2 template and exported as PDF.
+        The report is rendered from a Jinja2 template and exported as PDF
+        with an inlined chart, or saved as standalone HTML referencing
+        the chart stored in an assets directory.
         """
         self.results_path.mkdir(parents=True, exist_ok=True)
-        html_content = self._generate_html()
         pdf_path = self.results_path / f"{self.report_name}.pdf"
-        convert_html_to_pdf(html_content, pdf_path)
 
-    def _generate_chart(self) -> str | None:
-        """
-        Generate execution time chart.
+        if self.report_format == ReportFormat.PDF:
+            html_content = self._generate_html()
+            convert_html_to_pdf(html_content, pdf_path)
+            return
 
-        Returns
-        -------
-        str | None
-            Base64-encoded image embedded as a data URL,
-            or None if chart generation fails.
+        chart_path = None
+        if self.with_chart == ReportMode.WITH_CHART:
+            try:
+                chart_path = self._generate_chart_file(self.assets_dir)
+            except Exception as e:
+                print(f"Failed to generate plot: {e}")
+                chart_path = None
+
+        html_content = self._render_html(get_asset_src(chart_path, self.results_path))
+        write_html_report(html_content, self.results_path / f"{self.report_name}.html")
+
+        if self.report_format == ReportFormat.HTML_PDF:
+            self._generate_fpdf(chart_path, pdf_path)
+
+    def _plot_chart(self) -> None:
+        """
+        Draw execution time chart on a new matplotlib figure.
 
         Notes
         -----
         The chart displays execution time as a function
         of sample size for all configured criteria.
         """
-        buf = BytesIO()
         plt.figure(figsize=(10, 7))
 
         for criterion in self.times.keys():
@@ -109,7 +150,15 @@ class TimeComplexityReportBuilder:
             sizes = tuple(np.array(sizes))
             times_ms = np.array(times_list) * 1000
 
-            plt.plot(sizes, times_ms, marker="o", linestyle="-", label=criterion)
+            line = plt.plot(sizes, times_ms, marker="o", linestyle="-", label=criterion)[0]
+
+            fit = self.fits.get(criterion)
+            if fit is not None:
+                fitted_sizes = np.linspace(min(sizes), max(sizes), 100)
+                fitted_ms = [fit.predict(int(size)) * 1000 for size in fitted_sizes]
+                plt.plot(
+                    fitted_sizes, fitted_ms, linestyle="--", color=line.get_color(), label=f"{criterion} {fit.model}"
+                )
 
         plt.xlabel("Sample Size")
         plt.ylabel("Time (ms)")
@@ -132,6 +181,130 @@ class TimeComplexityReportBuilder:
         plt.tick_params(which="major", length=6, width=1)
         plt.tight_layout(rect=(0, 0, 0.85, 1))
 
+    def _generate_chart_file(self, charts_dir: Path) -> str:
+        """
+        Generate execution time chart as an image file.
+
+        Parameters
+        ----------
+        charts_dir : Path
+            Directory for the chart image.
+
+        Returns
+        -------
+        str
+            Absolute path to generated chart image.
+        """
+        charts_dir.mkdir(parents=True, exist_ok=True)
+        chart_path = charts_dir / f"time_complexity.{self.chart_format.value}"
+
+        self._plot_chart()
+        plt.savefig(chart_path, format=self.chart_format.value, dpi=150)
+        plt.close()
+
+        return str(chart_path.resolve().as_posix())
+
+    def _generate_fpdf(self, chart_path: str | None, pdf_path: Path) -> None:
+        """
+        Draw the report directly into a PDF document.
+
+        Parameters
+        ----------
+        chart_path : str | None
+            Absolute path to the chart image, if generated.
+        pdf_path : Path
+            Destination path of the PDF file.
+        """
+        criteria = get_criterion_names(self.criteria_config)
+        writer = FpdfReportWriter(
+            title="Time Complexity Report",
+            timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+        )
+
+        rows = []
+        for size in self.sample_sizes:
+            row = [str(size)]
+            for criterion in self.times:
+                times = [f"{time * 1000:.2f} ms" for item_size, time in self.times[criterion] if item_size == size]
+                row.append(" ".join(times))
+            rows.append(row)
+
+        writer.add_table(
+            caption="Execution time",
+            header=["Size", *[f"{criterion} Test" for criterion in criteria]],
+            rows=rows,
+        )
+        if self.fits:
+            writer.add_table(
+                caption="Complexity",
+                header=self._complexity_header(),
+                rows=self._complexity_rows(),
+            )
+        if chart_path:
+            writer.add_image(Path(chart_path))
+
+        writer.output(pdf_path)
+
+    def _complexity_header(self) -> list[str]:
+        """
+        Build header of the complexity table.
+
+        Returns
+        -------
+        list[str]
+            Column titles.
+        """
+        return [
+            "Criterion",
+            "Model",
+            "Exponent",
+            "Constant",
+            "R²",
+            *[f"n = {size}" for size in self.extrapolation_sizes],
+        ]
+
+    def _complexity_rows(self) -> list[list[str]]:
+        """
+        Build rows of the complexity table.
+
+        Returns
+        -------
+        list[list[str]]
+            Selected model, power law exponent and constant of the
+            selected model with confidence intervals, R² of the power
+            law and extrapolated execution times of every criterion.
+        """
+        rows = []
+        for criterion, fit in self.fits.items():
+            rows.append(
+                [
+                    criterion,
+                    fit.model,
+                    _format_estimate(fit.exponent, fit.exponent_interval, "{:.2f}"),
+                    _format_estimate(fit.model_constant, fit.model_constant_interval, "{:.2e}"),
+                    f"{fit.r_squared:.3f}",
+                    *[f"{fit.predict(size) * 1000:.2f} ms" for size in self.extrapolation_sizes],
+                ]
+            )
+        return rows
+
+    def _generate_chart(self) -> str | None:
+        """
+        Generate execution time chart.
+
+        Returns
+        -------
+        str | None
+            Base64-encoded image embedded as a data URL,
+            or None if chart generation fails.
+
+        Notes
+        -----
+        The chart is inlined into the HTML used for PDF conversion.
+        """
+        buf = BytesIO()
+        self._plot_chart()
+
         plt.savefig(buf, format="png", dpi=150)
         plt.close()
 
@@ -159,10 +332,52 @@ class TimeComplexityReportBuilder:
                 print(f"Failed to generate plot: {e}")
                 plot_data = None
 
+        return self._render_html(plot_data)
+
+    def _render_html(self, plot_image: str | None) -> str:
+        """
+        Render HTML representation of the report.
+
+        Parameters
+        ----------
+        plot_image : str | None
+            Chart reference: a data URL or a report-relative path.
+
+        Returns
+        -------
+        str
+            Rendered HTML document.
+        """
         return self.template_env.get_template("tc_template.html").render(
             criteria=get_criterion_names(self.criteria_config),
             report_data=self.times,
             sizes=self.sample_sizes,
-            plot_image=plot_data,
+            plot_image=plot_image,
             timestamp=pd.Timestamp.now().strftime("%Y-%m-%d"),
+            complexity_header=self._complexity_header() if self.fits else [],
+            complexity_rows=self._complexity_rows(),
         )
+
+
+def _format_estimate(value: float, interval: tuple[float, float] | None, value_format: str) -> str:
+    """
+    Format estimate with its confidence interval.
+
+    Parameters
+    ----------
+    value : float
+        Point estimate.
+    interval : tuple[float, float] | None
+        Confidence interval, None if it is unknown.
+    value_format : str
+        Format of the numbers.
+
+    Returns
+    -------
+    str
+        Estimate followed by the interval in brackets.
+    """
+    text = value_format.format(value)
+    if interval is None:
+        return text
+    return f"{text} [{value_format.format(interval[0])}, {value_format.format(interval[1])}]"
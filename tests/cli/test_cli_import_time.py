@@ -0,0 +1,80 @@
+"""Import-time regression benchmark of CLI commands based on ``python -X importtime``."""
+
+import subprocess
+import sys
+
+import pytest
+
+
+HEAVY_PACKAGES = {"matplotlib", "pandas", "xhtml2pdf", "sqlalchemy", "scipy", "pysatl_criterion"}
+"""Top-level packages that lightweight commands must not import."""
+
+STARTUP_BUDGET_US = 500_000
+"""Generous bound on cumulative import time of the CLI and one lightweight command."""
+
+
+def _run(code: str, *options: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run([sys.executable, *options, "-c", code], capture_output=True, text=True, check=True)
+
+
+def _import_times(module: str) -> dict[str, int]:
+    """
+    Import the CLI and one command module in a fresh interpreter.
+
+    Returns
+    -------
+    dict[str, int]
+        Cumulative import time in microseconds of every imported module.
+    """
+    completed = _run(f"import pysatl_experiment.cli.cli, {module}", "-X", "importtime")
+
+    times = {}
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+def _loaded_command_modules(*commands: str) -> list[str]:
+    code = (
+        "import sys, click; from pysatl_experiment.cli.cli import cli; ctx = click.Context(cli); "
+        "cli.list_commands(ctx); "
+        f"[cli.get_command(ctx, name) for name in {list(commands)!r}]; "
+        "print(*sorted(m for m in sys.modules if m.startswith('pysatl_experiment.cli.commands.')))"
+    )
+    return _run(code).stdout.split()
+
+
+@pytest.mark.parametrize("command", ["show", "create"])
+def test_lightweight_commands_do_not_import_heavy_dependencies(command: str) -> None:
+    module = f"pysatl_experiment.cli.commands.{command}"
+
+    times = _import_times(module)
+
+    assert not {name.split(".")[0] for name in times} & HEAVY_PACKAGES
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("command", ["show", "create"])
+def test_lightweight_commands_start_within_budget(command: str) -> None:
+    module = f"pysatl_experiment.cli.commands.{command}"
+
+    times = _import_times(module)
+
+    assert times["pysatl_experiment.cli.cli"] + times[module] < STARTUP_BUDGET_US
+
+
+def test_configure_does_not_import_report_or_storage_dependencies() -> None:
+    times = _import_times("pysatl_experiment.cli.commands.configure")
+
+    assert not {name.split(".")[0] for name in times} & {"matplotlib", "pandas", "xhtml2pdf", "sqlalchemy"}
+
+
+def test_commands_are_imported_on_first_use() -> None:
+    assert _loaded_command_modules() == ["pysatl_experiment.cli.commands.common"]
+    assert _loaded_command_modules("show") == [
+        "pysatl_experiment.cli.commands.common",
+        "pysatl_experiment.cli.commands.show",
+    ]
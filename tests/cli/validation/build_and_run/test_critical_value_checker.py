@@ -0,0 +1,69 @@
+"""Tests for validation-time critical value checks."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from pysatl_experiment.cli.validation.commands.common.checker import SQLiteCriticalValueChecker
+from pysatl_experiment.cli.validation.schemas.experiment import PowerConfig
+from pysatl_experiment.persistence.db_store.db_init import init_db
+
+
+@pytest.fixture
+def checker(tmp_path: Path) -> SQLiteCriticalValueChecker:
+    db_path = tmp_path / "critical_values.sqlite"
+    with sqlite3.connect(db_path) as conn:
+        conn.execute("CREATE TABLE limit_distributions (criterion_code TEXT, sample_size INTEGER)")
+        conn.executemany(
+            "INSERT INTO limit_distributions VALUES (?, ?)",
+            [
+                ("KS_NORMALITY_GOODNESS_OF_FIT", 10),
+                ("KS_NORMALITY_GOODNESS_OF_FIT", 20),
+                ("AD_NORMALITY_GOODNESS_OF_FIT", 10),
+            ],
+        )
+    return SQLiteCriticalValueChecker(f"sqlite:///{db_path}")
+
+
+def test_checker_uses_shared_engine(checker: SQLiteCriticalValueChecker) -> None:
+    assert checker.engine is init_db(checker.connection_string)
+
+
+def test_find_missing_returns_all_missing_pairs(checker: SQLiteCriticalValueChecker) -> None:
+    missing = checker.find_missing(
+        ["KS_NORMALITY_GOODNESS_OF_FIT", "AD_NORMALITY_GOODNESS_OF_FIT", "SW_NORMALITY_GOODNESS_OF_FIT"],
+        [10, 20],
+    )
+
+    assert missing == {
+        ("AD_NORMALITY_GOODNESS_OF_FIT", 20),
+        ("SW_NORMALITY_GOODNESS_OF_FIT", 10),
+        ("SW_NORMALITY_GOODNESS_OF_FIT", 20),
+    }
+    assert checker.find_missing([], [10]) == set()
+
+
+def test_check_exists(checker: SQLiteCriticalValueChecker) -> None:
+    assert checker.check_exists("KS_NORMALITY_GOODNESS_OF_FIT", 20)
+    assert not checker.check_exists("AD_NORMALITY_GOODNESS_OF_FIT", 20)
+
+
+def test_power_config_reports_every_missing_pair(checker: SQLiteCriticalValueChecker) -> None:
+    config = {
+        "experiment_type": "power",
+        "hypothesis": "normal",
+        "criteria": [{"criterion_code": "KS", "parameters": []}, {"criterion_code": "AD", "parameters": []}],
+        "sample_sizes": [10, 20, 30],
+        "significance_levels": [0.05],
+    }
+
+    with pytest.raises(ValidationError) as error:
+        PowerConfig.model_validate(config, context={"critical_value_checker": checker})
+
+    message = str(error.value)
+    assert "Criterion: KS, Sample Size: 30" in message
+    assert "Criterion: AD, Sample Size: 20" in message
+    assert "Criterion: AD, Sample Size: 30" in message
+    assert "Criterion: KS, Sample Size: 10" not in message
@@ -0,0 +1,77 @@
+"""Tests for benchmarking mode options validation."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pysatl_experiment.cli.commands.configure import configure
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture to create a CliRunner instance."""
+    return CliRunner()
+
+
+def _invoke(runner: CliRunner, experiment_type: str, *options: str):
+    return runner.invoke(
+        configure,
+        [
+            "my-test-experiment",
+            *options,
+            "-cr",
+            "KS",
+            "-s",
+            "23",
+            "-c",
+            "154",
+            "-h",
+            "normal",
+            "-expt",
+            experiment_type,
+            "-con",
+            "sqlite:///pysatl.sqlite",
+        ],
+    )
+
+
+@patch("pysatl_experiment.cli.commands.configure.save_experiment_config")
+@patch("pysatl_experiment.cli.commands.configure.read_experiment_data")
+@patch("pysatl_experiment.cli.commands.configure.if_experiment_exists", return_value=True)
+def test_benchmark_options_are_saved(
+    if_experiment_exists: MagicMock,
+    read_experiment_data: MagicMock,
+    save_experiment_config: MagicMock,
+    runner: CliRunner,
+) -> None:
+    read_experiment_data.return_value = {"name": "my-test-experiment", "config": {"hypothesis": "normal"}}
+
+    result = _invoke(
+        runner, "time_complexity", "--benchmark", "--warmup", "5", "--min-time", "0.02", "--cpu", "0", "--cpu", "1"
+    )
+
+    assert result.exit_code == 0, result.output
+    saved_config = save_experiment_config.call_args[0][1]
+    assert saved_config["benchmark"] is True
+    assert saved_config["warmup_iterations"] == 5
+    assert saved_config["min_timing_seconds"] == 0.02
+    assert saved_config["cpu_affinity"] == [0, 1]
+
+
+@patch("pysatl_experiment.cli.commands.configure.save_experiment_config")
+@patch("pysatl_experiment.cli.commands.configure.read_experiment_data")
+@patch("pysatl_experiment.cli.commands.configure.if_experiment_exists", return_value=True)
+def test_benchmark_is_rejected_for_other_experiments(
+    if_experiment_exists: MagicMock,
+    read_experiment_data: MagicMock,
+    save_experiment_config: MagicMock,
+    runner: CliRunner,
+) -> None:
+    read_experiment_data.return_value = {"name": "my-test-experiment", "config": {"hypothesis": "normal"}}
+
+    result = _invoke(runner, "critical_value", "-l", "0.05", "--benchmark")
+
+    assert result.exit_code != 0
+    assert "time complexity experiments only" in result.output
+    save_experiment_config.assert_not_called()
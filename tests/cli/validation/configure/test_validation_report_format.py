@@ -0,0 +1,118 @@
+"""Tests for report format validation."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pysatl_experiment.cli.commands.configure import configure
+from pysatl_experiment.configuration.models.report_format import ReportFormat
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture to create a CliRunner instance."""
+    return CliRunner()
+
+
+@patch("pysatl_experiment.cli.commands.configure.get_experiment_config")
+def test_report_format_with_invalid_format(get_experiment_config: MagicMock, runner: CliRunner) -> None:
+    """Tests the `report_format` option logic in isolation with an invalid argument.
+
+    This test verifies that when the `report_format` option is invoked with a string
+    that does not correspond to any valid `ReportFormat` enum value, it behaves
+    correctly by:
+    1.  Exiting with a non-zero status code to indicate failure.
+    2.  Printing a user-friendly error message that includes the invalid input.
+    3.  Suggesting the list of valid options to the user.
+    4.  Not calling the function to save the configuration, thus preventing
+        any side effects.
+    """
+    invalid_format = "this-is-not-a-valid-format"
+    experiment_name = "my-test-experiment"
+    get_experiment_config.return_value = (experiment_name, {"some_key": "some_value"})
+
+    result = runner.invoke(
+        configure,
+        [
+            experiment_name,
+            "-rf",
+            invalid_format,
+            "-cr",
+            "KS",
+            "-l",
+            "0.05",
+            "-s",
+            "23",
+            "-c",
+            "154",
+            "-h",
+            "normal",
+            "-expt",
+            "critical_value",
+            "-con",
+            "sqlite:///pysatl.sqlite",
+            "-rm",
+            "reuse",
+        ],
+    )
+
+    assert result.exit_code != 0
+    assert isinstance(result.exception, SystemExit)
+
+
+@patch("pysatl_experiment.cli.commands.configure.save_experiment_config")
+@patch("pysatl_experiment.cli.commands.configure.read_experiment_data")
+@patch("pysatl_experiment.cli.commands.configure.if_experiment_exists", return_value=True)
+@pytest.mark.parametrize("valid_format", [e for e in ReportFormat])
+def test_report_format_with_valid_format(
+    if_experiment_exists: MagicMock,
+    read_experiment_data: MagicMock,
+    save_experiment_config: MagicMock,
+    runner: CliRunner,
+    valid_format: ReportFormat,
+) -> None:
+    """Tests the `report_format` option logic in isolation with valid arguments.
+
+    This test verifies that when the command is invoked with any valid `ReportFormat`
+    enum value, it behaves correctly by:
+    1.  Exiting with a zero status code to indicate success.
+    2.  Calling the configuration saving function exactly once.
+    3.  Updating the configuration dictionary with the correct key and value.
+    4.  Printing a confirmation message to the user.
+    """
+    experiment_name = "my-test-experiment"
+    initial_config = {"hypothesis": "normal"}
+    read_experiment_data.return_value = {"name": experiment_name, "config": initial_config}
+
+    result = runner.invoke(
+        configure,
+        [
+            experiment_name,
+            "-rf",
+            valid_format.value,
+            "-cr",
+            "KS",
+            "-l",
+            "0.05",
+            "-s",
+            "23",
+            "-c",
+            "154",
+            "-h",
+            "normal",
+            "-expt",
+            "critical_value",
+            "-con",
+            "sqlite:///pysatl.sqlite",
+            "-rm",
+            "reuse",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert result.exception is None
+
+    save_experiment_config.assert_called_once()
+    saved_config = save_experiment_config.call_args[0][1]
+    assert saved_config["report_format"] == valid_format.value
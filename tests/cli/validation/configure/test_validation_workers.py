@@ -0,0 +1,79 @@
+"""Tests for parallel workers validation."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from click.testing import CliRunner
+
+from pysatl_experiment.cli.commands.configure import configure
+
+
+@pytest.fixture
+def runner() -> CliRunner:
+    """Fixture to create a CliRunner instance."""
+    return CliRunner()
+
+
+def _invoke(runner: CliRunner, workers: str):
+    return runner.invoke(
+        configure,
+        [
+            "my-test-experiment",
+            "-w",
+            workers,
+            "-cr",
+            "KS",
+            "-l",
+            "0.05",
+            "-s",
+            "23",
+            "-c",
+            "154",
+            "-h",
+            "normal",
+            "-expt",
+            "critical_value",
+            "-con",
+            "sqlite:///pysatl.sqlite",
+        ],
+    )
+
+
+@pytest.mark.parametrize(("workers", "expected"), [("1", 1), ("auto", "auto"), ("AUTO", "auto")])
+@patch("pysatl_experiment.cli.commands.configure.save_experiment_config")
+@patch("pysatl_experiment.cli.commands.configure.read_experiment_data")
+@patch("pysatl_experiment.cli.commands.configure.if_experiment_exists", return_value=True)
+def test_workers_are_saved(
+    if_experiment_exists: MagicMock,
+    read_experiment_data: MagicMock,
+    save_experiment_config: MagicMock,
+    workers: str,
+    expected: int | str,
+    runner: CliRunner,
+) -> None:
+    read_experiment_data.return_value = {"name": "my-test-experiment", "config": {"hypothesis": "normal"}}
+
+    result = _invoke(runner, workers)
+
+    assert result.exit_code == 0, result.output
+    assert save_experiment_config.call_args[0][1]["parallel_workers"] == expected
+
+
+@pytest.mark.parametrize("workers", ["0", "many"])
+@patch("pysatl_experiment.cli.commands.configure.save_experiment_config")
+@patch("pysatl_experiment.cli.commands.configure.read_experiment_data")
+@patch("pysatl_experiment.cli.commands.configure.if_experiment_exists", return_value=True)
+def test_invalid_workers_are_rejected(
+    if_experiment_exists: MagicMock,
+    read_experiment_data: MagicMock,
+    save_experiment_config: MagicMock,
+    workers: str,
+    runner: CliRunner,
+) -> None:
+    read_experiment_data.return_value = {"name": "my-test-experiment", "config": {"hypothesis": "normal"}}
+
+    result = _invoke(runner, workers)
+
+    assert result.exit_code != 0
+    assert f"Cannot set parallel workers to {workers}" in result.output
+    save_experiment_config.assert_not_called()
@@ -0,0 +1,67 @@
+"""Tests for empirical complexity fitting."""
+
+import numpy as np
+import pytest
+
+from pysatl_experiment.experiment_execution.complexity import fit_complexity
+
+
+SIZES = [10, 20, 50, 100, 200, 500, 1000]
+
+
+def _measure(growth, scale: float, seed: int = 0) -> list[list[float]]:
+    rng = np.random.default_rng(seed)
+    return [list(scale * growth(size) * rng.lognormal(0.0, 0.05, 200)) for size in SIZES]
+
+
+@pytest.mark.parametrize(
+    ("growth", "model", "exponent"),
+    [
+        (lambda n: n, "O(n)", 1.0),
+        (lambda n: n * np.log(n), "O(n log n)", 1.2),
+        (lambda n: n**2, "O(n^2)", 2.0),
+    ],
+)
+def test_fit_selects_generating_model(growth, model: str, exponent: float) -> None:
+    fit = fit_complexity(SIZES, _measure(growth, 1e-8))
+
+    assert fit is not None
+    assert fit.model == model
+    assert fit.exponent == pytest.approx(exponent, abs=0.1)
+    assert fit.exponent_interval is not None
+    assert fit.exponent_interval[0] < fit.exponent < fit.exponent_interval[1]
+    assert fit.model_constant == pytest.approx(1e-8, rel=0.05)
+    assert fit.r_squared > 0.99
+
+
+def test_predict_extrapolates_selected_model() -> None:
+    fit = fit_complexity(SIZES, _measure(lambda n: n**2, 1e-8))
+
+    assert fit is not None
+    assert fit.predict(10000) == pytest.approx(1.0, rel=0.05)
+
+
+def test_fit_requires_two_sizes_with_positive_times() -> None:
+    assert fit_complexity([10, 20], [[1e-3], [0.0]]) is None
+
+
+def test_two_sizes_have_no_exponent_interval() -> None:
+    fit = fit_complexity([10, 20], [[1e-3], [2e-3]])
+
+    assert fit is not None
+    assert fit.exponent == pytest.approx(1.0)
+    assert fit.exponent_interval is None
+
+
+def test_classes_vanishing_at_size_one_are_not_fitted() -> None:
+    sizes = [1, *SIZES]
+    rng = np.random.default_rng(0)
+    times = [list(1e-8 * size * rng.lognormal(0.0, 0.05, 200)) for size in sizes]
+
+    fit = fit_complexity(sizes, times)
+
+    assert fit is not None
+    assert fit.model == "O(n)"
+    assert "O(log n)" not in fit.aic
+    assert "O(n log n)" not in fit.aic
+    assert all(np.isfinite(value) for value in fit.aic.values())
@@ -0,0 +1,79 @@
+"""Tests for the cached criteria registry."""
+
+import json
+from collections.abc import Iterator
+from pathlib import Path
+
+import pytest
+from pysatl_criterion import DistributionType
+from pysatl_criterion.statistics.normal import AbstractNormalityGofStatistic
+
+from pysatl_experiment.configuration.criteria_registry import (
+    CACHE_DIR_ENV,
+    CriteriaRegistry,
+    get_cache_path,
+    get_criteria_registry,
+)
+
+
+@pytest.fixture
+def cache_dir(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> Iterator[Path]:
+    monkeypatch.setenv(CACHE_DIR_ENV, str(tmp_path))
+    get_criteria_registry.cache_clear()
+    yield tmp_path
+    get_criteria_registry.cache_clear()
+
+
+def test_build_registers_concrete_statistics_of_every_hypothesis() -> None:
+    registry = CriteriaRegistry.build()
+
+    assert set(registry.hypotheses) == {member.value for member in DistributionType}
+    entry = registry.get(DistributionType.NORMAL.value, "KS")
+    assert entry is not None
+    statistic_class = entry.load_class()
+    assert issubclass(statistic_class, AbstractNormalityGofStatistic)
+    assert statistic_class.code() == entry.code
+    assert registry.criteria_of_base_class(AbstractNormalityGofStatistic)["KS"] == entry
+
+
+def test_unknown_hypothesis_raises_value_error() -> None:
+    with pytest.raises(ValueError):
+        CriteriaRegistry.build().short_codes("invalid_distribution")
+
+
+def test_registry_round_trips_through_dict() -> None:
+    registry = CriteriaRegistry.build()
+
+    restored = CriteriaRegistry.from_dict(registry.to_dict())
+
+    assert restored.hypotheses == registry.hypotheses
+
+
+def test_registry_is_cached_on_disk_per_criteria_version(cache_dir: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cache_path = get_cache_path()
+    assert cache_path is not None
+    assert cache_path.parent == cache_dir
+
+    registry = get_criteria_registry()
+    assert cache_path.is_file()
+
+    get_criteria_registry.cache_clear()
+
+    def fail_build() -> CriteriaRegistry:
+        raise AssertionError("registry must be read from the cache")
+
+    monkeypatch.setattr(CriteriaRegistry, "build", fail_build)
+    assert get_criteria_registry().hypotheses == registry.hypotheses
+
+
+def test_unreadable_cache_is_rebuilt(cache_dir: Path) -> None:
+    cache_path = get_cache_path()
+    assert cache_path is not None
+    cache_path.write_text("{not json", encoding="utf-8")
+
+    registry = get_criteria_registry()
+
+    assert registry.short_codes(DistributionType.NORMAL.value)
+    assert CriteriaRegistry.from_dict(json.loads(cache_path.read_text(encoding="utf-8"))).hypotheses == (
+        registry.hypotheses
+    )
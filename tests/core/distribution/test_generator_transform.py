@@ -0,0 +1,84 @@
+"""Tests for inverse transforms of random value generators."""
+
+import numpy as np
+import pytest
+from scipy import stats
+
+from pysatl_experiment.experiment_execution.generator.generators import (
+    GammaGenerator,
+    LognormGenerator,
+    MixConNormGenerator,
+    NormalGenerator,
+    ScConNormGenerator,
+    UniformGenerator,
+    WeibullGenerator,
+    create_generator,
+)
+from pysatl_experiment.experiment_execution.generator.model import AbstractRVSGenerator
+
+
+class OpaqueGenerator(AbstractRVSGenerator):
+    def code(self):
+        return "opaque"
+
+    def generate(self, size):
+        return [0.0] * size
+
+
+@pytest.mark.parametrize(
+    ("generator", "distribution"),
+    [
+        (NormalGenerator(mean=1, var=4), stats.norm(loc=1, scale=2)),
+        (GammaGenerator(alfa=3, beta=2), stats.gamma(a=3, scale=0.5)),
+        (LognormGenerator(s=1, mu=0.5), stats.lognorm(s=1, scale=np.exp(0.5))),
+        (WeibullGenerator(a=2, k=3.4), stats.exponweib(a=2, c=3.4)),
+        (UniformGenerator(a=-1, b=3), stats.uniform(loc=-1, scale=4)),
+    ],
+)
+def test_transform_is_quantile_function(generator, distribution):
+    uniforms = np.array([[0.1, 0.5], [0.75, 0.9]])
+
+    values = generator.transform(uniforms)
+
+    assert values.shape == uniforms.shape
+    np.testing.assert_allclose(values, distribution.ppf(uniforms))
+
+
+def test_transform_keeps_bounds_of_unit_interval_finite():
+    values = NormalGenerator().transform(np.array([0.0, 1.0]))
+
+    assert np.all(np.isfinite(values))
+
+
+@pytest.mark.parametrize(
+    ("generator", "p", "loc", "scale"),
+    [
+        (MixConNormGenerator(p=0.3, a=3, b=0.25), 0.3, 3, 0.25),
+        (ScConNormGenerator(p=0.1, b=4), 0.1, 0, 4),
+    ],
+)
+def test_contaminated_normal_transform_has_mixture_distribution(generator, p, loc, scale):
+    uniforms = (np.arange(10000) + 0.5) / 10000
+
+    values = generator.transform(uniforms)
+
+    def mixture_cdf(x):
+        return p * stats.norm.cdf(x, loc=loc, scale=scale) + (1 - p) * stats.norm.cdf(x)
+
+    assert stats.kstest(values, mixture_cdf).statistic < 1e-3
+
+
+def test_supports_transform():
+    assert NormalGenerator().supports_transform()
+    assert not OpaqueGenerator().supports_transform()
+    with pytest.raises(NotImplementedError):
+        OpaqueGenerator().transform(np.array([0.5]))
+
+
+def test_create_generator_by_upper_case_class_name():
+    generator = create_generator("NORMALGENERATOR", [1.0, 4.0])
+
+    assert isinstance(generator, NormalGenerator)
+    assert (generator.mean, generator.var) == (1.0, 4.0)
+    with pytest.raises(ValueError, match="Unknown generator"):
+        create_generator("MISSING", [])
@@ -0,0 +1,110 @@
+"""Tests for cached critical value resolution."""
+
+from unittest.mock import Mock
+
+import pytest
+from pysatl_criterion.hypothesis_testing.critical_values.critical_area.critical_areas import (
+    RightCriticalArea,
+    TwoSidedCriticalArea,
+)
+from pysatl_criterion.persistence.models.limit_distribution import LimitDistributionModel
+from pysatl_criterion.statistics.models import HypothesisType
+
+from pysatl_experiment.experiment_execution.critical_values import (
+    CachedCriticalValueResolver,
+    VectorizedCriticalValueResolver,
+    create_critical_area,
+)
+from pysatl_experiment.persistence.models.critical_value import CriticalValueModel
+
+
+def _limit_storage() -> Mock:
+    models = {
+        "KS": LimitDistributionModel(
+            experiment_id=1,
+            criterion_code="KS",
+            criterion_parameters=[],
+            sample_size=10,
+            monte_carlo_count=100,
+            results_statistics=[float(i) for i in range(100)],
+        )
+    }
+    storage = Mock()
+    storage.get_bulk_data.side_effect = lambda codes, size, sample_size_error=0: [
+        models[code] for code in codes if code in models
+    ]
+    return storage
+
+
+def _stored_value(code: str, lower_value: float | None, upper_value: float | None) -> CriticalValueModel:
+    return CriticalValueModel(
+        experiment_id=1,
+        criterion_code=code,
+        criterion_parameters=[],
+        sample_size=10,
+        significance_level=0.05,
+        alternative="right",
+        monte_carlo_count=100,
+        lower_value=lower_value,
+        upper_value=upper_value,
+    )
+
+
+def test_cache_loads_limit_distribution_once():
+    limit_storage = _limit_storage()
+    resolver = CachedCriticalValueResolver(limit_storage)
+
+    for _ in range(5):
+        result = resolver.resolve_bulk(["KS", "XX"], 10, 0.05)
+
+    expected = VectorizedCriticalValueResolver(_limit_storage()).resolve_bulk(["KS"], 10, 0.05)
+    assert result == expected
+    assert limit_storage.get_bulk_data.call_count == 1
+
+
+def test_stored_values_skip_limit_distributions():
+    limit_storage = _limit_storage()
+    critical_value_storage = Mock()
+    critical_value_storage.get_bulk_data.return_value = [_stored_value("KS", None, 42.0)]
+    resolver = CachedCriticalValueResolver(limit_storage, critical_value_storage)
+
+    assert resolver.resolve_bulk(["KS"], 10, 0.05) == {"KS": RightCriticalArea(42.0)}
+    assert resolver.resolve_bulk(["KS"], 10, 0.05) == {"KS": RightCriticalArea(42.0)}
+
+    critical_value_storage.get_bulk_data.assert_called_once_with(["KS"], 10, 0.05, "right")
+    limit_storage.get_bulk_data.assert_not_called()
+
+
+def test_incomplete_stored_values_fall_back_to_limit_distributions():
+    limit_storage = _limit_storage()
+    critical_value_storage = Mock()
+    critical_value_storage.get_bulk_data.return_value = [_stored_value("KS", None, 42.0)]
+    resolver = CachedCriticalValueResolver(limit_storage, critical_value_storage)
+
+    result = resolver.resolve_bulk(["KS"], 10, 0.05, HypothesisType.TWO_TAILED)
+
+    assert isinstance(result["KS"], TwoSidedCriticalArea)
+    limit_storage.get_bulk_data.assert_called_once()
+
+
+def test_cache_evicts_least_recently_used():
+    limit_storage = _limit_storage()
+    resolver = CachedCriticalValueResolver(limit_storage, maxsize=1)
+
+    resolver.resolve_bulk(["KS"], 10, 0.05)
+    resolver.resolve_bulk(["KS"], 10, 0.1)
+    resolver.resolve_bulk(["KS"], 10, 0.05)
+
+    assert limit_storage.get_bulk_data.call_count == 3
+
+
+def test_cache_size_must_be_positive():
+    with pytest.raises(ValueError):
+        CachedCriticalValueResolver(_limit_storage(), maxsize=0)
+
+
+def test_critical_area_requires_values_matching_alternative():
+    with pytest.raises(ValueError):
+        create_critical_area(1.0, HypothesisType.TWO_TAILED)
+    with pytest.raises(ValueError):
+        create_critical_area((1.0, 2.0), HypothesisType.RIGHT)
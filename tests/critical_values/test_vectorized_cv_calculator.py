@@ -0,0 +1,89 @@
+"""Tests for vectorized critical value calculation."""
+
+from unittest.mock import Mock
+
+import numpy as np
+import pytest
+from pysatl_criterion.hypothesis_testing.critical_values.cv_calculator.cv_calculator import CVCalculator
+from pysatl_criterion.hypothesis_testing.critical_values.resolver.storage_resolver import StorageCriticalValueResolver
+from pysatl_criterion.persistence.models.limit_distribution import LimitDistributionModel
+from pysatl_criterion.statistics.models import HypothesisType
+
+from pysatl_experiment.experiment_execution.critical_values import (
+    VectorizedCriticalValueResolver,
+    VectorizedCVCalculator,
+    compute_critical_values,
+)
+
+
+SIGNIFICANCE_LEVELS = [0.01, 0.05, 0.1, 0.5]
+
+
+def _model(code: str, size: int, statistics: list[float]) -> LimitDistributionModel:
+    return LimitDistributionModel(
+        experiment_id=1,
+        criterion_code=code,
+        criterion_parameters=[],
+        sample_size=size,
+        monte_carlo_count=len(statistics),
+        results_statistics=statistics,
+    )
+
+
+@pytest.fixture
+def storage():
+    rng = np.random.default_rng(42)
+    models = {
+        ("KS", 10): _model("KS", 10, rng.normal(size=500).tolist()),
+        ("KS", 20): _model("KS", 20, rng.normal(size=500).tolist()),
+        ("AD", 10): _model("AD", 10, np.round(rng.normal(size=500), 1).tolist()),
+        ("AD", 20): _model("AD", 20, rng.exponential(size=300).tolist()),
+    }
+
+    storage = Mock()
+    storage.get_bulk_data.side_effect = lambda codes, size, sample_size_error=0: [
+        models[(code, size)] for code in codes if (code, size) in models
+    ]
+    storage.get_data_for_cv.side_effect = lambda query: models.get((query.criterion_code, query.sample_size))
+    return storage
+
+
+@pytest.mark.parametrize("alternative", list(HypothesisType))
+def test_calculator_matches_cv_calculator(storage, alternative):
+    result = VectorizedCVCalculator(storage).calculate_critical_values(
+        ["KS", "AD"], [10, 20], SIGNIFICANCE_LEVELS, alternative
+    )
+
+    reference = CVCalculator(storage)
+    for code in ["KS", "AD"]:
+        for i, size in enumerate([10, 20]):
+            for j, sl in enumerate(SIGNIFICANCE_LEVELS):
+                expected = reference.calculate_critical_value(code, size, sl, alternative)
+                assert np.array_equal(result[code][i, j], expected)
+
+
+def test_calculator_loads_each_sample_size_once(storage):
+    VectorizedCVCalculator(storage).calculate_critical_values(["KS", "AD"], [10, 20], SIGNIFICANCE_LEVELS)
+
+    assert storage.get_bulk_data.call_count == 2
+
+
+def test_calculator_reports_all_missing_pairs(storage):
+    with pytest.raises(ValueError, match=r"\(KS, 30\), \(AD, 30\)"):
+        VectorizedCVCalculator(storage).calculate_critical_values(["KS", "AD"], [10, 30], SIGNIFICANCE_LEVELS)
+
+
+@pytest.mark.parametrize("alternative", list(HypothesisType))
+def test_resolver_matches_storage_resolver(storage, alternative):
+    vectorized = VectorizedCriticalValueResolver(storage).resolve_bulk(["KS", "AD", "XX"], 10, 0.05, alternative)
+    expected = StorageCriticalValueResolver(storage).resolve_bulk(["KS", "AD", "XX"], 10, 0.05, alternative)
+
+    assert vectorized == expected
+
+
+def test_compute_critical_values_shapes():
+    distributions = np.arange(20, dtype=float).reshape(2, 10)
+
+    assert compute_critical_values(distributions, [0.05, 0.1]).shape == (2, 2)
+    assert compute_critical_values(distributions, [0.05, 0.1], HypothesisType.TWO_TAILED).shape == (2, 2, 2)
+    assert compute_critical_values([], [0.05]).shape == (0, 1)
@@ -64,6 +64,14 @@ class FakeResultStorage:
         pass
 
 
+class FakeStatisticCacheStorage:
+    def __init__(self):
+        self.deleted_pool_keys = []
+
+    def delete_pool_data(self, pool_key):
+        self.deleted_pool_keys.append(pool_key)
+
+
 class FakeExperimentStorage:
     def __init__(self, experiment_id: int = 123):
         self._id = experiment_id
@@ -103,6 +111,7 @@ class ConcreteFactory(
         self._ds = data_storage
         self._rs = result_storage
         self._es = experiment_storage
+        self._sc = FakeStatisticCacheStorage()
 
     # Deterministic overrides
     def _get_hypothesis_generator_metadata(self):  # type: ignore[override]
@@ -126,11 +135,19 @@ class ConcreteFactory(
     def _init_experiment_storage(self):  # type: ignore[override]
         return self._es
 
+    def _init_statistic_cache_storage(self):  # type: ignore[override]
+        return self._sc
+
+    def _init_task_profile_storage(self):  # type: ignore[override]
+        return None
+
     # Step creators
     def _create_generation_step(self, data_storage):  # type: ignore[override]
         return DummyStep("generation")
 
-    def _create_execution_step(self, data_storage, result_storage, experiment_storage):  # type: ignore[override]
+    def _create_execution_step(  # type: ignore[override]
+        self, data_storage, result_storage, experiment_storage, statistic_cache=None, task_profile_storage=None
+    ):
         return DummyStep("execution")
 
     def _create_report_building_step(self, result_storage):  # type: ignore[override]
@@ -198,8 +215,9 @@ def test_create_experiment_steps_overwrite_deletes_and_respects_steps_done(tmp_r
 
     steps = factory.create_experiment_steps()
 
-    # Overwrite triggers deletion of sample data for each sample size
+    # Overwrite triggers deletion of sample data and their cached statistics for each sample size
     assert len(ds.deleted_all_queries) == len(data.config.sample_sizes)
+    assert len(factory._sc.deleted_pool_keys) == len(data.config.sample_sizes)
     # Overwrite triggers deletion of result queries (1 criterion code × sizes)
     assert len(rs.deleted_queries) == len(data.config.sample_sizes)
 
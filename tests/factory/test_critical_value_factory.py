@@ -261,3 +261,18 @@ def test_report_building_step_sets_expected_fields(tmp_results_path: Path):
     assert rb_step.result_storage is limit_storage
     assert rb_step.results_path == data.results_path
     assert rb_step.with_chart == data.config.report_mode
+
+
+def test_nested_samples_generate_largest_size_only(tmp_results_path: Path):
+    data = build_cv_data(tmp_results_path)
+    data.config.nested_samples = True
+    factory = DeterministicCVFactory(data, FakeGenerator())
+
+    rvs_storage = FakeRandomValuesStorage(counts_by_size={10: 0, 20: 1})
+    gen_step = factory._create_generation_step(rvs_storage)
+    assert [(s.sample_size, s.count) for s in gen_step.step_config] == [(20, 4)]
+
+    limit_storage = FakeLimitDistributionStorage(has_result=set())
+    exec_step = factory._create_execution_step(rvs_storage, limit_storage, FakeExperimentStorage(experiment_id=1))
+    assert [s.sample_size for s in exec_step.step_config] == [10, 20]
+    assert exec_step.pool_sample_size == 20
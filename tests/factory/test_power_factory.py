@@ -19,6 +19,7 @@ from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.configuration.models.run_mode import RunMode
 from pysatl_experiment.configuration.models.step_type import StepType
 from pysatl_experiment.experiment_execution.factory import PowerExperimentFactory
+from pysatl_experiment.experiment_execution.generator import AbstractRVSGenerator
 from pysatl_experiment.experiment_execution.step.execution.power import PowerExecutionStep
 from pysatl_experiment.experiment_execution.step.generation import GenerationStep
 from pysatl_experiment.experiment_execution.step.report_building.power import PowerReportBuildingStep
@@ -265,6 +266,26 @@ def test_execution_step_includes_missing_results_combinations(tmp_results_path:
     assert ("ALT_B", (0.2,), 0.1) in combo_set
 
 
+class ExtendablePowerStorage(FakePowerStorage):
+    def get_extendable_count(self, query):
+        return 3 if query.alternative_code == "ALT_B" else 0
+
+
+def test_execution_step_extends_results_with_smaller_count(tmp_results_path: Path):
+    data = build_power_data(tmp_results_path)
+    factory = DeterministicPowerFactory(data, FakeGenerator())
+
+    exec_step = factory._create_execution_step(
+        FakeRandomValuesStorage(counts_by_key={}), ExtendablePowerStorage(has_result=set()), FakeExperimentStorage(7)
+    )
+
+    stored_counts = {
+        (sd.alternative.generator_name, sd.significance_level): sd.stored_monte_carlo_count
+        for sd in exec_step.step_config
+    }
+    assert stored_counts == {("ALT_A", 0.05): 0, ("ALT_A", 0.1): 0, ("ALT_B", 0.05): 3, ("ALT_B", 0.1): 3}
+
+
 def test_report_building_step_sets_expected_fields(tmp_results_path: Path):
     data = build_power_data(tmp_results_path)
     fake_gen = FakeGenerator()
@@ -282,3 +303,49 @@ def test_report_building_step_sets_expected_fields(tmp_results_path: Path):
     assert rb_step.result_storage is power_storage
     assert rb_step.results_path == data.results_path
     assert rb_step.with_chart == data.config.report_mode
+
+
+class CommonRandomNumbersPowerFactory(PowerExperimentFactory):
+    """Factory with real generators and a fake criterion."""
+
+    def _get_criteria_config(self):  # type: ignore[override]
+        crit = Criterion(criterion_code="FAKE", parameters=[0.0])
+        return [
+            CriterionConfig(
+                criterion=crit, criterion_code=FakeStatistics.code(), statistics_class_object=FakeStatistics()
+            )
+        ]
+
+
+class OpaqueTestGenerator(AbstractRVSGenerator):
+    def __init__(self, x=0, **kwargs):
+        super().__init__(**kwargs)
+
+    def code(self):
+        return "opaque"
+
+    def generate(self, size):  # pragma: no cover
+        return [0.0] * size
+
+
+def test_common_random_numbers_share_base_pool(tmp_results_path: Path):
+    data = build_power_data(tmp_results_path)
+    data.config.common_random_numbers = True
+    data.config.alternatives = [
+        Alternative(generator_name="NORMALGENERATOR", parameters=[0.0, 1.0]),
+        Alternative(generator_name="CAUCHYRVSGENERATOR", parameters=[0.0, 1.0]),
+        Alternative(generator_name="OPAQUETESTGENERATOR", parameters=[0.3]),
+    ]
+    factory = CommonRandomNumbersPowerFactory(data)
+
+    gen_step = factory._create_generation_step(FakeRandomValuesStorage(counts_by_key={}))
+
+    pools = [(step.generator_name, step.generator_parameters) for step in gen_step.step_config]
+    assert pools == [("UNIFORMGENERATOR", [0.0, 1.0]), ("OPAQUETESTGENERATOR", [0.3])]
+
+    exec_step = factory._create_execution_step(
+        FakeRandomValuesStorage(counts_by_key={}), FakePowerStorage(has_result=set()), FakeExperimentStorage(1)
+    )
+
+    from_base_pool = {sd.alternative.generator_name: sd.from_base_pool for sd in exec_step.step_config}
+    assert from_base_pool == {"NORMALGENERATOR": True, "CAUCHYRVSGENERATOR": True, "OPAQUETESTGENERATOR": False}
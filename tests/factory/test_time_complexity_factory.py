@@ -245,6 +245,24 @@ def test_create_execution_step_includes_missing_results(tmp_results_path: Path):
     sd = exec_step.step_config[0]
     assert sd.sample_size == 20
     assert sd.statistics.code() == "FAKE_CODE"
+    assert exec_step.benchmark is None
+
+
+def test_execution_step_receives_benchmark_settings(tmp_results_path: Path):
+    data = build_time_complexity_data(tmp_results_path)
+    data.config.benchmark = True
+    data.config.warmup_iterations = 7
+    data.config.cpu_affinity = [1]
+    factory = DeterministicTCFactory(data, FakeGenerator())
+
+    rvs_storage = cast(IRandomValuesStorage, FakeRandomValuesStorage(counts_by_size={10: 5, 20: 5}))
+    tc_storage = FakeTimeComplexityStorage(has_result=set())
+    exec_step = factory._create_execution_step(rvs_storage, tc_storage, FakeExperimentStorage(experiment_id=1))
+
+    assert exec_step.benchmark is not None
+    assert exec_step.benchmark.warmup_iterations == 7
+    assert exec_step.benchmark.min_timing_seconds == data.config.min_timing_seconds
+    assert exec_step.benchmark.cpu_affinity == [1]
 
 
 def test_create_report_building_step_sets_expected_fields(tmp_results_path: Path):
@@ -0,0 +1,62 @@
+"""Tests for queue-based logging of the parent and worker processes."""
+
+import logging
+from concurrent.futures import ProcessPoolExecutor
+from logging.handlers import QueueHandler
+
+import pytest
+
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.loggers import get_log_queue, queue_logging
+
+
+class CollectingHandler(logging.Handler):
+    def __init__(self) -> None:
+        super().__init__()
+        self.records: list[logging.LogRecord] = []
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+
+def _log_from_worker(message: str) -> None:
+    logging.getLogger("pysatl_experiment.test_worker").info(message)
+
+
+@pytest.fixture
+def collecting_handler():
+    root = logging.getLogger()
+    handler = CollectingHandler()
+    level = root.level
+    root.addHandler(handler)
+    root.setLevel(logging.INFO)
+    yield handler
+    root.removeHandler(handler)
+    root.setLevel(level)
+
+
+def test_queue_logging_moves_root_handlers_to_listener(collecting_handler):
+    with queue_logging():
+        root_handlers = list(logging.getLogger().handlers)
+        logging.getLogger("pysatl_experiment.test_parent").info("from parent")
+
+    assert len(root_handlers) == 1
+    assert isinstance(root_handlers[0], QueueHandler)
+    assert collecting_handler in logging.getLogger().handlers
+    assert [record.getMessage() for record in collecting_handler.records] == ["from parent"]
+    assert get_log_queue() is None
+
+
+def test_queue_logging_collects_worker_records(collecting_handler):
+    with queue_logging():
+        with ProcessPoolExecutor(max_workers=2, initializer=make_worker_initializer()) as executor:
+            list(executor.map(_log_from_worker, ["first", "second"]))
+
+    messages = sorted(record.getMessage() for record in collecting_handler.records)
+    assert messages == ["first", "second"]
+
+
+def test_worker_initializer_without_queue_logging_has_no_queue():
+    initializer = make_worker_initializer()
+
+    assert initializer.args[0] is None
@@ -0,0 +1,108 @@
+"""Tests for JSON-lines run telemetry."""
+
+import json
+import logging
+import socket
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+import pytest
+
+from pysatl_experiment.experiment_execution.parallel.worker_init import make_worker_initializer
+from pysatl_experiment.loggers import emit_event, queue_logging, setup_telemetry, telemetry_enabled
+from pysatl_experiment.loggers.telemetry import TELEMETRY_LOGGER, DatagramLineHandler, create_telemetry_handler
+
+
+def _emit_from_worker(index: int) -> None:
+    emit_event("task_end", index=index)
+
+
+@pytest.fixture(autouse=True)
+def reset_telemetry_logger():
+    telemetry_logger = logging.getLogger(TELEMETRY_LOGGER)
+    yield
+    for handler in list(telemetry_logger.handlers):
+        telemetry_logger.removeHandler(handler)
+        handler.close()
+    telemetry_logger.setLevel(logging.NOTSET)
+
+
+def _read_events(path) -> list[dict]:
+    return [json.loads(line) for line in path.read_text(encoding="utf-8").splitlines()]
+
+
+def test_telemetry_is_disabled_by_default():
+    assert not telemetry_enabled()
+
+
+def test_setup_telemetry_writes_json_lines_to_file(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    setup_telemetry(str(path))
+
+    emit_event("batch_saved", experiment_id=1, rows=3, save_seconds=0.5)
+    emit_event("task_end", phase_seconds={"load": 0.1})
+
+    events = _read_events(path)
+    assert [event["event"] for event in events] == ["batch_saved", "task_end"]
+    assert events[0]["rows"] == 3
+    assert events[0]["pid"] > 0
+    assert events[0]["timestamp"].endswith("Z")
+    timestamp = datetime.fromisoformat(events[0]["timestamp"].replace("Z", "+00:00"))
+    assert abs(timestamp.timestamp() - time.time()) < 60
+    assert events[1]["phase_seconds"] == {"load": 0.1}
+
+
+def test_datagram_handler_sends_udp_lines():
+    receiver = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+    receiver.bind(("127.0.0.1", 0))
+    receiver.settimeout(5)
+    host, port = receiver.getsockname()
+    handler = create_telemetry_handler(f"udp://{host}:{port}")
+    record = logging.LogRecord(TELEMETRY_LOGGER, logging.INFO, __file__, 0, "task_start", None, None)
+    record.telemetry = {"sample_size": 10}
+
+    try:
+        handler.handle(record)
+        line = receiver.recv(65536).decode("utf-8")
+    finally:
+        handler.close()
+        receiver.close()
+
+    assert line.endswith("\n")
+    assert json.loads(line)["sample_size"] == 10
+
+
+def test_datagram_handler_drops_records_without_collector(tmp_path):
+    handler = DatagramLineHandler(str(tmp_path / "missing.sock"))
+    record = logging.LogRecord(TELEMETRY_LOGGER, logging.INFO, __file__, 0, "task_start", None, None)
+
+    handler.handle(record)
+    handler.close()
+
+    assert handler.dropped == 1
+
+
+def test_create_telemetry_handler_rejects_udp_target_without_port():
+    with pytest.raises(ValueError, match="udp://host:port"):
+        create_telemetry_handler("udp://localhost")
+
+
+def test_worker_telemetry_is_routed_to_telemetry_handlers(tmp_path):
+    path = tmp_path / "telemetry.jsonl"
+    setup_telemetry(str(path))
+    root = logging.getLogger()
+    root_records: list[logging.LogRecord] = []
+    root_handler = logging.Handler()
+    root_handler.emit = root_records.append  # type: ignore[method-assign]
+    root.addHandler(root_handler)
+
+    try:
+        with queue_logging():
+            with ProcessPoolExecutor(max_workers=2, initializer=make_worker_initializer()) as executor:
+                list(executor.map(_emit_from_worker, [1, 2]))
+    finally:
+        root.removeHandler(root_handler)
+
+    assert sorted(event["index"] for event in _read_events(path)) == [1, 2]
+    assert not [record for record in root_records if record.name == TELEMETRY_LOGGER]
@@ -0,0 +1,25 @@
+"""Tests for task phase timers."""
+
+from pysatl_experiment.experiment_execution.parallel.phase_timer import (
+    COMPUTE_PHASE,
+    LOAD_PHASE,
+    PHASES,
+    PhaseTimer,
+)
+
+
+def test_timer_starts_with_all_phases_at_zero() -> None:
+    assert PhaseTimer().seconds == dict.fromkeys(PHASES, 0.0)
+
+
+def test_measure_and_iterate_accumulate_time() -> None:
+    timer = PhaseTimer()
+
+    with timer.measure(COMPUTE_PHASE):
+        sum(range(1000))
+    items = list(timer.iterate(iter([1, 2, 3]), LOAD_PHASE))
+    timer.add(LOAD_PHASE, 1.0)
+
+    assert items == [1, 2, 3]
+    assert timer.seconds[COMPUTE_PHASE] > 0.0
+    assert timer.seconds[LOAD_PHASE] > 1.0
@@ -0,0 +1,74 @@
+"""Tests for progress reporting of experiment steps."""
+
+from pathlib import Path
+
+from pysatl_experiment.experiment_execution.progress import GroupProgress, ProgressTracker, get_status_path, read_status
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_snapshot_reports_throughput_eta_and_groups() -> None:
+    clock = FakeClock()
+    tracker = ProgressTracker(clock=clock)
+    tracker.start("execution", [("KS", 100), ("KS", 100), ("AD", 200)])
+
+    clock.now = 2.0
+    tracker.advance("KS", 100)
+    snapshot = tracker.snapshot()
+
+    assert (snapshot.completed_tasks, snapshot.total_tasks) == (1, 3)
+    assert (snapshot.completed_samples, snapshot.total_samples) == (100, 400)
+    assert snapshot.tasks_per_second == 0.5
+    assert snapshot.samples_per_second == 50.0
+    assert snapshot.eta_seconds == 6.0
+    assert snapshot.groups == {
+        "KS": GroupProgress(completed_tasks=1, total_tasks=2, completed_samples=100, total_samples=200),
+        "AD": GroupProgress(completed_tasks=0, total_tasks=1, completed_samples=0, total_samples=200),
+    }
+
+
+def test_eta_is_unknown_before_first_task() -> None:
+    clock = FakeClock()
+    tracker = ProgressTracker(clock=clock)
+    tracker.start("generation", [("normal", 10)])
+    clock.now = 1.0
+
+    assert tracker.snapshot().eta_seconds is None
+
+
+def test_status_file_is_throttled_and_finished(tmp_path: Path) -> None:
+    clock = FakeClock()
+    status_path = get_status_path(tmp_path, "my-exp")
+    tracker = ProgressTracker(
+        status_path=status_path, experiment_name="my-exp", experiment_id=7, refresh_interval=10.0, clock=clock
+    )
+
+    assert read_status(status_path) is None
+
+    tracker.start("execution", [("KS", 10), ("KS", 10)])
+    clock.now = 1.0
+    tracker.advance("KS", 10)
+    published = read_status(status_path)
+    assert published is not None
+    assert published.completed_tasks == 0
+    assert (published.experiment_name, published.experiment_id) == ("my-exp", 7)
+
+    clock.now = 2.0
+    tracker.advance("KS", 10)
+    tracker.finish()
+    published = read_status(status_path)
+    assert published is not None
+    assert published.state == "finished"
+    assert published.completed_tasks == 2
+    assert published.groups["KS"].completed_samples == 20
+
+
+def test_status_file_is_named_after_experiment(tmp_path: Path) -> None:
+    assert get_status_path(tmp_path, "first") == tmp_path / "first.progress.json"
+    assert get_status_path(tmp_path, "first") != get_status_path(tmp_path, "second")
@@ -0,0 +1,68 @@
+"""Tests for resource-aware sizing of worker pools."""
+
+import pytest
+
+from pysatl_experiment.configuration.models.experiment_type import ExperimentType
+from pysatl_experiment.experiment_execution.parallel.resources import (
+    BYTES_PER_RESULT_VALUE,
+    BYTES_PER_SAMPLE_VALUE,
+    MEMORY_FRACTION,
+    WORKER_BASE_MEMORY,
+    available_cpu_count,
+    estimate_sample_memory,
+    estimate_task_memory,
+    plan_workers,
+    worker_count_record,
+)
+from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+
+
+GIB = 1024**3
+
+
+def test_available_cpu_count_is_positive() -> None:
+    assert available_cpu_count() >= 1
+
+
+def test_estimate_sample_memory_uses_pool_size_in_nested_mode() -> None:
+    assert estimate_sample_memory(10, 100) == 100 * (10 * BYTES_PER_SAMPLE_VALUE + BYTES_PER_RESULT_VALUE)
+    assert estimate_sample_memory(10, 100, pool_sample_size=50) == estimate_sample_memory(50, 100)
+
+
+def test_estimate_task_memory_reads_spec() -> None:
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name="Statistic",
+        statistic_module="module",
+        sample_size=20,
+        monte_carlo_count=1000,
+        db_path="sqlite://",
+    )
+
+    assert estimate_task_memory(spec) == estimate_sample_memory(20, 1000)
+
+
+def test_plan_workers_uses_all_cpus_when_memory_suffices() -> None:
+    allocation = plan_workers([1024], cpu_count=8, available_memory=64 * GIB)
+
+    assert allocation.workers == 8
+    assert allocation.memory_budget == int(64 * GIB * MEMORY_FRACTION) - 8 * WORKER_BASE_MEMORY
+
+
+def test_plan_workers_is_limited_by_memory_of_smallest_task() -> None:
+    task_memory = [GIB, 10 * GIB]
+
+    allocation = plan_workers(task_memory, cpu_count=64, available_memory=10 * GIB)
+
+    assert allocation.workers == int(10 * GIB * MEMORY_FRACTION) // (WORKER_BASE_MEMORY + GIB)
+
+
+def test_plan_workers_keeps_one_worker() -> None:
+    allocation = plan_workers([100 * GIB], cpu_count=4, available_memory=GIB)
+
+    assert allocation.workers == 1
+
+
+@pytest.mark.parametrize(("parallel_workers", "expected"), [(3, 3), ("auto", 0)])
+def test_worker_count_record(parallel_workers: int | str, expected: int) -> None:
+    assert worker_count_record(parallel_workers) == expected  # type: ignore[arg-type]
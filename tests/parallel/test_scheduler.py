@@ -42,10 +42,17 @@ def _test_simple_task(i):
     return i
 
 
+def _test_timed_task(duration):
+    start = time.monotonic()
+    time.sleep(duration)
+    return start, time.monotonic()
+
+
 class TestAdaptiveScheduler:
     def test_successful_task_execution(self):
         with Scheduler(max_workers=2) as scheduler:
             results = scheduler.run([_test_task_simple, _test_task_simple])
+            assert (scheduler.completed_tasks, scheduler.total_tasks) == (2, 2)
         assert results == [42, 42]
 
     def test_exception_in_task(self):
@@ -102,3 +109,24 @@ class TestAdaptiveScheduler:
 
         assert len(results) == 5
         assert set(results) == {0, 1, 2, 3, 4}
+
+    def test_memory_budget_serializes_large_tasks(self):
+        tasks = [functools.partial(_test_timed_task, 0.2) for _ in range(2)]
+
+        with Scheduler(max_workers=2, memory_budget=100) as scheduler:
+            (first_start, first_end), (second_start, second_end) = sorted(
+                scheduler.iterate_results(tasks, task_memory=[80, 80])
+            )
+            assert (scheduler.completed_tasks, scheduler.total_tasks) == (2, 2)
+
+        assert second_start >= first_end
+
+    def test_memory_budget_runs_small_tasks_in_parallel(self):
+        tasks = [functools.partial(_test_timed_task, 0.2) for _ in range(2)]
+
+        with Scheduler(max_workers=2, memory_budget=100) as scheduler:
+            (first_start, first_end), (second_start, second_end) = sorted(
+                scheduler.iterate_results(tasks, task_memory=[50, 50])
+            )
+
+        assert second_start < first_end
@@ -0,0 +1,204 @@
+"""Tests for universal task execution."""
+
+import json
+import logging
+from pathlib import Path
+
+from pysatl_experiment.configuration.models.experiment_type import ExperimentType
+from pysatl_experiment.experiment_execution.parallel.phase_timer import DECODE_PHASE, LOAD_PHASE, PHASES, SAVE_PHASE
+from pysatl_experiment.experiment_execution.parallel.task_spec import TaskSpec
+from pysatl_experiment.experiment_execution.parallel.universal_worker import universal_execute_task
+from pysatl_experiment.loggers import setup_telemetry
+from pysatl_experiment.loggers.telemetry import TELEMETRY_LOGGER
+from pysatl_experiment.persistence.models.random_values import RandomValuesAllModel
+from pysatl_experiment.persistence.models.statistic_cache import StatisticCacheModel, make_pool_key, make_sample_key
+from pysatl_experiment.persistence.random_values_storage import AlchemyRandomValuesStorage
+from pysatl_experiment.persistence.statistic_cache_storage import AlchemyStatisticCacheStorage
+
+
+class SumStatistic:
+    @staticmethod
+    def code():
+        return "SUM"
+
+    def execute_statistic(self, rvs, **kwargs):
+        return float(sum(rvs))
+
+
+def test_nested_samples_use_prefixes_of_pool(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 4, [[1.0, 2.0, 3.0, 4.0], [5.0, 6.0, 7.0, 8.0]]))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        sample_size=2,
+        monte_carlo_count=2,
+        db_path=db_url,
+        pool_sample_size=4,
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+
+    _, code, sample_size, statistics, _, _ = universal_execute_task(spec)
+
+    assert (code, sample_size) == ("SUM", 2)
+    assert sorted(statistics) == [3.0, 11.0]
+
+
+def test_cached_statistics_are_reused_and_extended(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 2, [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+    cache = AlchemyStatisticCacheStorage(db_url)
+    cache.init()
+    pool_key = make_pool_key("norm", [0.0, 1.0], 2)
+    sample_key = make_sample_key(pool_key, 2)
+    # Deliberately differs from the sum of the first sample to detect reuse
+    cache.insert_data(StatisticCacheModel("SUM", [], pool_key, sample_key, [-1.0]))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        sample_size=2,
+        monte_carlo_count=3,
+        db_path=db_url,
+        cache_statistics=True,
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+
+    _, _, _, statistics, cache_model, _ = universal_execute_task(spec)
+
+    assert statistics == [-1.0, 7.0, 11.0]
+    assert cache_model is not None
+    assert (cache_model.sample_key, cache_model.statistics) == (sample_key, [-1.0, 7.0, 11.0])
+
+    cache.insert_data(cache_model)
+    *_, cache_model, _ = universal_execute_task(spec)
+
+    assert cache_model is None
+
+
+def test_cached_statistics_are_keyed_by_criterion_parameters(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 2, [[1.0, 2.0], [3.0, 4.0]]))
+    cache = AlchemyStatisticCacheStorage(db_url)
+    cache.init()
+    pool_key = make_pool_key("norm", [0.0, 1.0], 2)
+    cache.insert_data(StatisticCacheModel("SUM", [1.0], pool_key, make_sample_key(pool_key, 2), [-1.0, -2.0]))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        sample_size=2,
+        monte_carlo_count=2,
+        db_path=db_url,
+        cache_statistics=True,
+        criterion_parameters=[2.0],
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+
+    _, _, _, statistics, cache_model, _ = universal_execute_task(spec)
+
+    assert statistics == [3.0, 7.0]
+    assert cache_model is not None
+    assert cache_model.criterion_parameters == [2.0]
+
+
+def test_start_sample_returns_only_additional_statistics(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 2, [[1.0, 2.0], [3.0, 4.0], [5.0, 6.0]]))
+    cache = AlchemyStatisticCacheStorage(db_url)
+    cache.init()
+    pool_key = make_pool_key("norm", [0.0, 1.0], 2)
+    sample_key = make_sample_key(pool_key, 2)
+    cache.insert_data(StatisticCacheModel("SUM", [], pool_key, sample_key, [-1.0, -2.0]))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        sample_size=2,
+        monte_carlo_count=3,
+        db_path=db_url,
+        cache_statistics=True,
+        start_sample=1,
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+
+    _, _, _, statistics, cache_model, _ = universal_execute_task(spec)
+
+    assert statistics == [-2.0, 11.0]
+    assert cache_model is not None
+    assert cache_model.statistics == [-1.0, -2.0, 11.0]
+
+
+def test_task_returns_phase_timings(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 2, [[1.0, 2.0], [3.0, 4.0]]))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.TIME_COMPLEXITY,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        sample_size=2,
+        monte_carlo_count=2,
+        db_path=db_url,
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+
+    *_, results_times, phase_seconds = universal_execute_task(spec)
+
+    assert len(results_times) == 2
+    assert set(phase_seconds) == set(PHASES)
+    assert phase_seconds[LOAD_PHASE] > 0.0
+    assert phase_seconds[DECODE_PHASE] > 0.0
+    assert phase_seconds[SAVE_PHASE] == 0.0
+    assert all(seconds >= 0.0 for seconds in phase_seconds.values())
+
+
+def test_task_events_report_criterion_code(tmp_path: Path) -> None:
+    db_url = f"sqlite:///{tmp_path / 'rvs.sqlite'}"
+    storage = AlchemyRandomValuesStorage(db_url)
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("norm", [0.0, 1.0], 2, [[1.0, 2.0]]))
+    telemetry_path = tmp_path / "telemetry.jsonl"
+    setup_telemetry(str(telemetry_path))
+
+    spec = TaskSpec(
+        experiment_type=ExperimentType.CRITICAL_VALUE,
+        statistic_class_name=SumStatistic.__name__,
+        statistic_module=__name__,
+        criterion_code=SumStatistic.code(),
+        sample_size=2,
+        monte_carlo_count=1,
+        db_path=db_url,
+        hypothesis_generator="norm",
+        hypothesis_parameters=[0.0, 1.0],
+    )
+    try:
+        universal_execute_task(spec)
+    finally:
+        telemetry_logger = logging.getLogger(TELEMETRY_LOGGER)
+        for handler in list(telemetry_logger.handlers):
+            telemetry_logger.removeHandler(handler)
+            handler.close()
+
+    events = [json.loads(line) for line in telemetry_path.read_text(encoding="utf-8").splitlines()]
+    assert [(event["event"], event["statistic"]) for event in events] == [("task_start", "SUM"), ("task_end", "SUM")]
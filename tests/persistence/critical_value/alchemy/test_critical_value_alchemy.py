@@ -0,0 +1,95 @@
+"""Tests for SQLAlchemy precomputed critical value storage implementation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from pysatl_experiment.persistence.critical_value_storage import AlchemyCriticalValueStorage
+from pysatl_experiment.persistence.models.critical_value import CriticalValueModel, CriticalValueQuery
+
+
+def _model(code: str = "KS", monte_carlo_count: int = 100, upper_value: float = 1.5) -> CriticalValueModel:
+    return CriticalValueModel(
+        experiment_id=1,
+        criterion_code=code,
+        criterion_parameters=[],
+        sample_size=10,
+        significance_level=0.05,
+        alternative="right",
+        monte_carlo_count=monte_carlo_count,
+        lower_value=None,
+        upper_value=upper_value,
+    )
+
+
+def _query(code: str = "KS") -> CriticalValueQuery:
+    return CriticalValueQuery(
+        criterion_code=code,
+        criterion_parameters=[],
+        sample_size=10,
+        significance_level=0.05,
+        alternative="right",
+    )
+
+
+@pytest.fixture()
+def storage() -> AlchemyCriticalValueStorage:
+    store = AlchemyCriticalValueStorage(db_url="sqlite://")
+    store.init()
+    return store
+
+
+def test_guard_requires_init(tmp_path: Path) -> None:
+    store = AlchemyCriticalValueStorage(str(tmp_path / "critical_values.sqlite"))
+    with pytest.raises(RuntimeError):
+        _ = store.get_data(_query())
+
+
+def test_insert_and_get(storage: AlchemyCriticalValueStorage) -> None:
+    storage.insert_data(_model())
+
+    assert storage.get_data(_query()) == _model()
+    assert storage.get_data(_query("AD")) is None
+
+
+def test_insert_keeps_value_from_largest_distribution(storage: AlchemyCriticalValueStorage) -> None:
+    storage.insert_data(_model(monte_carlo_count=1000, upper_value=2.0))
+    storage.insert_data(_model(monte_carlo_count=100, upper_value=1.0))
+
+    got = storage.get_data(_query())
+    assert got is not None
+    assert got.upper_value == 2.0
+
+    storage.insert_data(_model(monte_carlo_count=5000, upper_value=3.0))
+
+    got = storage.get_data(_query())
+    assert got is not None
+    assert got.upper_value == 3.0
+
+
+def test_bulk_insert_and_get(storage: AlchemyCriticalValueStorage) -> None:
+    storage.insert_bulk_data([_model("KS", upper_value=1.0), _model("AD", upper_value=2.0)])
+
+    got = storage.get_bulk_data(["KS", "AD", "XX"], 10, 0.05, "right")
+
+    assert {model.criterion_code: model.upper_value for model in got} == {"KS": 1.0, "AD": 2.0}
+    assert storage.get_bulk_data(["KS"], 10, 0.05, "left") == []
+
+
+def test_delete_data(storage: AlchemyCriticalValueStorage) -> None:
+    storage.insert_data(_model())
+
+    storage.delete_data(_query())
+
+    assert storage.get_data(_query()) is None
+
+
+def test_bulk_insert_keeps_value_from_largest_distribution(storage: AlchemyCriticalValueStorage) -> None:
+    storage.insert_bulk_data([_model(monte_carlo_count=1000, upper_value=2.0), _model(upper_value=1.0)])
+    storage.insert_bulk_data([_model(upper_value=0.5), _model("AD", upper_value=4.0)])
+
+    got = storage.get_bulk_data(["KS", "AD"], 10, 0.05, "right")
+
+    assert {model.criterion_code: model.upper_value for model in got} == {"KS": 2.0, "AD": 4.0}
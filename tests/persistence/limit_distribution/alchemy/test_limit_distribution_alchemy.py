@@ -0,0 +1,69 @@
+"""Tests for SQLAlchemy limit distribution storage implementation."""
+
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+from pysatl_criterion.persistence.models.limit_distribution import LimitDistributionModel, LimitDistributionQuery
+from sqlalchemy import event
+
+from pysatl_experiment.persistence.limit_distribution_storage import AlchemyLimitDistributionStorage
+
+
+def _model(code: str = "KS", statistics: list[float] | None = None) -> LimitDistributionModel:
+    return LimitDistributionModel(
+        experiment_id=1,
+        criterion_code=code,
+        criterion_parameters=[0.5],
+        sample_size=10,
+        monte_carlo_count=3,
+        results_statistics=statistics if statistics is not None else [0.125, 0.25, 0.5],
+    )
+
+
+def _query(code: str = "KS") -> LimitDistributionQuery:
+    return LimitDistributionQuery(
+        criterion_code=code,
+        criterion_parameters=[0.5],
+        sample_size=10,
+        monte_carlo_count=3,
+    )
+
+
+@pytest.fixture()
+def storage(tmp_path: Path) -> AlchemyLimitDistributionStorage:
+    store = AlchemyLimitDistributionStorage(f"sqlite:///{tmp_path / 'limit_distributions.sqlite'}")
+    store.init()
+    return store
+
+
+def test_insert_bulk_and_get(storage: AlchemyLimitDistributionStorage) -> None:
+    storage.insert_bulk_data([_model("KS"), _model("AD", [1.0, 2.0, 3.0])])
+
+    assert storage.get_data(_query("KS")) == _model("KS")
+    assert storage.get_data(_query("AD")) == _model("AD", [1.0, 2.0, 3.0])
+    assert storage.get_data(_query("CVM")) is None
+
+
+def test_insert_bulk_updates_existing_rows(storage: AlchemyLimitDistributionStorage) -> None:
+    storage.insert_bulk_data([_model()])
+    storage.insert_data(_model(statistics=[0.75, 1.5, 3.0]))
+
+    assert storage.get_data(_query()) == _model(statistics=[0.75, 1.5, 3.0])
+
+
+def test_insert_bulk_issues_no_selects(storage: AlchemyLimitDistributionStorage) -> None:
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+        statements.append(statement)
+
+    event.listen(storage.engine, "before_cursor_execute", record)
+    try:
+        storage.insert_bulk_data([_model("KS"), _model("AD")])
+    finally:
+        event.remove(storage.engine, "before_cursor_execute", record)
+
+    assert statements
+    assert not [statement for statement in statements if statement.lstrip().upper().startswith("SELECT")]
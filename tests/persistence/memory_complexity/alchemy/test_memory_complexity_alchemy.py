@@ -0,0 +1,64 @@
+"""Tests for SQLAlchemy memory complexity storage implementation."""
+
+from __future__ import annotations
+
+import pytest
+
+from pysatl_experiment.persistence.memory_complexity_storage import AlchemyMemoryComplexityStorage
+from pysatl_experiment.persistence.models.memory_complexity import MemoryComplexityModel, MemoryComplexityQuery
+
+
+@pytest.fixture()
+def storage() -> AlchemyMemoryComplexityStorage:
+    store = AlchemyMemoryComplexityStorage(db_url="sqlite:///:memory:")
+    store.init()
+    return store
+
+
+def _query(code: str = "crit_A") -> MemoryComplexityQuery:
+    return MemoryComplexityQuery(
+        criterion_code=code,
+        criterion_parameters=[0.1],
+        sample_size=10,
+        monte_carlo_count=3,
+    )
+
+
+def _model(code: str = "crit_A", experiment_id: int = 1, peaks: list[int] | None = None) -> MemoryComplexityModel:
+    return MemoryComplexityModel(
+        experiment_id=experiment_id,
+        criterion_code=code,
+        criterion_parameters=[0.1],
+        sample_size=10,
+        monte_carlo_count=3,
+        results_peak_bytes=peaks or [80, 96, 88],
+        results_rss_bytes=[0, 4096, 0],
+    )
+
+
+def test_insert_and_get(storage: AlchemyMemoryComplexityStorage) -> None:
+    model = _model()
+    storage.insert_data(model)
+
+    got = storage.get_data(_query())
+
+    assert got == model
+
+
+def test_insert_bulk_data_upserts(storage: AlchemyMemoryComplexityStorage) -> None:
+    storage.insert_bulk_data([_model("crit_A"), _model("crit_B")])
+    storage.insert_bulk_data([_model("crit_A", experiment_id=2, peaks=[1, 2, 3])])
+
+    got = storage.get_data(_query("crit_A"))
+    assert got is not None
+    assert got.experiment_id == 2
+    assert got.results_peak_bytes == [1, 2, 3]
+    assert storage.get_data(_query("crit_B")) == _model("crit_B")
+
+
+def test_delete_data(storage: AlchemyMemoryComplexityStorage) -> None:
+    storage.insert_data(_model())
+
+    storage.delete_data(_query())
+
+    assert storage.get_data(_query()) is None
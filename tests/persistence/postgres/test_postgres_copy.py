@@ -0,0 +1,20 @@
+"""Tests for PostgreSQL COPY formatting and schema."""
+
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.schema import CreateTable
+
+from pysatl_experiment.persistence.db_store.postgres import format_copy_row
+from pysatl_experiment.persistence.random_values_storage import AlchemyRandomValues
+
+
+def test_format_copy_row() -> None:
+    row = format_copy_row(["KS", 'say "hi"', 10, 0.5, None, [1, 2.5], True, b"\x01\xff"])
+
+    assert row == '"KS","say ""hi""","10","0.5",,"{1.0,2.5}","true","\\x01ff"\n'
+
+
+def test_random_values_store_encoded_bytes() -> None:
+    ddl = str(CreateTable(AlchemyRandomValues.__table__).compile(dialect=postgresql.dialect()))
+
+    assert "data BYTEA NOT NULL" in ddl
+    assert "codec VARCHAR(32) DEFAULT 'compressed-float-array' NOT NULL" in ddl
@@ -128,3 +128,104 @@ def test_delete_data(storage: AlchemyPowerStorage) -> None:
         )
         is None
     )
+
+
+def test_insert_bulk_data_upserts(storage: AlchemyPowerStorage) -> None:
+    def model(code: str, experiment_id: int, results: list[bool]) -> PowerModel:
+        return PowerModel(
+            experiment_id=experiment_id,
+            criterion_code=code,
+            criterion_parameters=[],
+            sample_size=10,
+            alternative_code="alt_A",
+            alternative_parameters=[1.0],
+            monte_carlo_count=3,
+            significance_level=0.05,
+            results_criteria=results,
+        )
+
+    storage.insert_bulk_data([model("crit_A", 1, [True, True, True]), model("crit_B", 1, [False, False, False])])
+    storage.insert_bulk_data([model("crit_A", 2, [False, True, False]), model("crit_C", 2, [True, False, True])])
+
+    def query(code: str) -> PowerQuery:
+        return PowerQuery(
+            criterion_code=code,
+            criterion_parameters=[],
+            sample_size=10,
+            alternative_code="alt_A",
+            alternative_parameters=[1.0],
+            monte_carlo_count=3,
+            significance_level=0.05,
+        )
+
+    updated = storage.get_data(query("crit_A"))
+    assert updated is not None
+    assert updated.experiment_id == 2
+    assert updated.results_criteria == [False, True, False]
+
+    kept = storage.get_data(query("crit_B"))
+    assert kept is not None
+    assert kept.results_criteria == [False, False, False]
+
+    assert storage.get_data(query("crit_C")) is not None
+
+
+def test_numerically_equal_parameters_match(storage: AlchemyPowerStorage) -> None:
+    storage.insert_data(
+        PowerModel(
+            experiment_id=1,
+            criterion_code="crit_A",
+            criterion_parameters=[1, 2],
+            sample_size=10,
+            alternative_code="alt_A",
+            alternative_parameters=[0],
+            monte_carlo_count=1,
+            significance_level=0.05,
+            results_criteria=[True],
+        )
+    )
+
+    got = storage.get_data(
+        PowerQuery(
+            criterion_code="crit_A",
+            criterion_parameters=[1.0, 2.0],
+            sample_size=10,
+            alternative_code="alt_A",
+            alternative_parameters=[0.0],
+            monte_carlo_count=1,
+            significance_level=0.05,
+        )
+    )
+
+    assert got is not None
+    assert got.results_criteria == [True]
+
+
+def test_append_bulk_data_extends_smaller_run(storage: AlchemyPowerStorage) -> None:
+    storage.insert_bulk_data(
+        [
+            PowerModel(1, "crit_X", [], 20, "alt_X", [2.0], 2, 0.05, [True, False]),
+            PowerModel(1, "crit_X", [], 20, "alt_X", [2.0], 3, 0.05, []),
+        ]
+    )
+    query = PowerQuery("crit_X", [], 20, "alt_X", [2.0], 6, 0.05)
+    assert storage.get_extendable_count(query) == 3
+    assert storage.get_extendable_count(PowerQuery("crit_X", [], 20, "alt_X", [2.0], 6, 0.1)) == 0
+
+    storage.append_bulk_data(
+        [
+            PowerModel(2, "crit_X", [], 20, "alt_X", [2.0], 4, 0.05, [False, True]),
+            PowerModel(2, "crit_X", [], 20, "alt_X", [2.0], 6, 0.05, [True, True, False]),
+        ]
+    )
+
+    extended = storage.get_data(PowerQuery("crit_X", [], 20, "alt_X", [2.0], 4, 0.05))
+    assert extended is not None
+    assert extended.experiment_id == 2
+    assert extended.results_criteria == [True, False, False, True]
+    from_empty = storage.get_data(query)
+    assert from_empty is not None
+    assert from_empty.results_criteria == [True, True, False]
+    shorter = storage.get_data(PowerQuery("crit_X", [], 20, "alt_X", [2.0], 2, 0.05))
+    assert shorter is not None
+    assert (shorter.experiment_id, shorter.results_criteria) == (1, [True, False])
@@ -2,11 +2,15 @@
 
 from __future__ import annotations
 
+import sqlite3
 from pathlib import Path
 
 import numpy as np
 import pytest
+from pysatl_criterion.persistence.sqlalchemy.alchemy_decorator import CompressedFloatArray
 
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
+from pysatl_experiment.persistence.db_store.param_key import make_parameters_key
 from pysatl_experiment.persistence.models.random_values import (
     RandomValuesAllModel,
     RandomValuesAllQuery,
@@ -201,3 +205,127 @@ def test_delete_all_data(storage: AlchemyRandomValuesStorage) -> None:
         )
     )
     assert all_data_after == []
+
+
+def test_iter_data_streams_in_order_with_limit(storage: AlchemyRandomValuesStorage) -> None:
+    all_model = RandomValuesAllModel(
+        generator_name="gen_F",
+        generator_parameters=[0.5],
+        sample_size=1,
+        data=[[float(i)] for i in range(10)],
+    )
+    storage.insert_all_data(all_model)
+
+    iterator = storage.iter_data(
+        RandomValuesCountQuery(
+            generator_name="gen_F",
+            generator_parameters=[0.5],
+            sample_size=1,
+            count=7,
+        ),
+        batch_size=3,
+    )
+
+    assert not isinstance(iterator, list)
+    samples = list(iterator)
+    assert [m.sample_num for m in samples] == list(range(1, 8))
+    assert [m.data for m in samples] == [[float(i)] for i in range(7)]
+    assert all(m.generator_name == "gen_F" for m in samples)
+
+
+def test_codec_is_recorded_per_row(db_path: Path) -> None:
+    samples = [[0.1, 0.2], [0.3, 0.4]]
+    storage = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}")
+    storage.init()
+    storage.insert_all_data(RandomValuesAllModel("gen_G", [1.0], 2, samples))
+    float32_storage = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}", codec=SampleCodec.ZSTD_FLOAT32)
+    float32_storage.init()
+    float32_storage.insert_data(RandomValuesModel("gen_G", [1.0], 2, 3, [0.5, 0.6]))
+
+    got = storage.get_all_data(RandomValuesAllQuery("gen_G", [1.0], 2))
+
+    assert [m.data.tolist() for m in got[:2]] == samples
+    assert np.allclose(got[2].data, [0.5, 0.6], atol=1e-7)
+
+
+def test_legacy_table_gets_codec_column(db_path: Path) -> None:
+    url = f"sqlite:///{db_path}"
+    legacy_blob = CompressedFloatArray().process_bind_param([1.5, 2.5], None)
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE random_values (id INTEGER PRIMARY KEY, generator_name VARCHAR NOT NULL, "
+            "generator_parameters VARCHAR NOT NULL, parameters_key VARCHAR(32) NOT NULL, "
+            "sample_size INTEGER NOT NULL, sample_num INTEGER NOT NULL, data BLOB NOT NULL)"
+        )
+        connection.execute(
+            "INSERT INTO random_values VALUES (1, 'gen_H', '[1.0]', ?, 2, 1, ?)",
+            (make_parameters_key("gen_H", [1.0]), legacy_blob),
+        )
+
+    store = AlchemyRandomValuesStorage(db_url=url)
+    store.init()
+
+    got = store.get_data(RandomValuesQuery("gen_H", [1.0], 2, 1))
+    assert got is not None
+    assert got.data.tolist() == [1.5, 2.5]
+
+
+def test_samples_are_stored_in_blocks(db_path: Path) -> None:
+    store = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}", block_values=6)
+    store.init()
+    samples = [[float(i), float(i) + 0.5] for i in range(7)]
+    store.insert_all_data(RandomValuesAllModel("gen_I", [1.0], 2, samples))
+
+    with sqlite3.connect(db_path) as connection:
+        blocks = connection.execute("SELECT sample_num, sample_count FROM random_values ORDER BY sample_num").fetchall()
+    assert blocks == [(1, 3), (4, 3), (7, 1)]
+
+    assert store.get_rvs_count(RandomValuesAllQuery("gen_I", [1.0], 2)) == 7
+    assert [m.data.tolist() for m in store.get_all_data(RandomValuesAllQuery("gen_I", [1.0], 2))] == samples
+    limited = store.get_count_data(RandomValuesCountQuery("gen_I", [1.0], 2, 5))
+    assert [m.sample_num for m in limited] == [1, 2, 3, 4, 5]
+    got = store.get_data(RandomValuesQuery("gen_I", [1.0], 2, 5))
+    assert got is not None
+    assert got.data.tolist() == samples[4]
+    assert store.get_data(RandomValuesQuery("gen_I", [1.0], 2, 8)) is None
+
+
+def test_iter_data_skips_blocks_before_start_sample(db_path: Path) -> None:
+    store = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}", block_values=6)
+    store.init()
+    samples = [[float(i), float(i) + 0.5] for i in range(7)]
+    store.insert_all_data(RandomValuesAllModel("gen_S", [1.0], 2, samples))
+
+    got = list(store.iter_data(RandomValuesCountQuery("gen_S", [1.0], 2, 6), start_sample=4))
+
+    assert [m.sample_num for m in got] == [5, 6]
+    assert [m.data.tolist() for m in got] == samples[4:6]
+    # Only the second block of three samples was fetched and decoded
+    assert store.decoded_bytes == 3 * 2 * 8
+
+
+def test_update_and_delete_inside_block(db_path: Path) -> None:
+    store = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}", block_values=4)
+    store.init()
+    store.insert_all_data(RandomValuesAllModel("gen_J", [1.0], 1, [[1.0], [2.0], [3.0], [4.0]]))
+
+    store.insert_data(RandomValuesModel("gen_J", [1.0], 1, 2, [20.0]))
+    store.delete_data(RandomValuesQuery("gen_J", [1.0], 1, 3))
+
+    got = store.get_all_data(RandomValuesAllQuery("gen_J", [1.0], 1))
+    assert [(m.sample_num, m.data.tolist()) for m in got] == [(1, [1.0]), (2, [20.0]), (4, [4.0])]
+    assert store.get_rvs_count(RandomValuesAllQuery("gen_J", [1.0], 1)) == 3
+
+
+def test_append_all_data_numbers_after_stored_samples(db_path: Path) -> None:
+    store = AlchemyRandomValuesStorage(db_url=f"sqlite:///{db_path}", block_values=2)
+    store.init()
+    store.insert_all_data(RandomValuesAllModel("gen_K", [1.0], 1, [[1.0], [2.0], [3.0]]))
+
+    store.append_all_data(RandomValuesAllModel("gen_K", [1.0], 1, [[4.0], [5.0]]))
+
+    with sqlite3.connect(db_path) as connection:
+        blocks = connection.execute("SELECT sample_num, sample_count FROM random_values ORDER BY sample_num").fetchall()
+    assert blocks == [(1, 2), (3, 1), (4, 2)]
+    got = store.get_all_data(RandomValuesAllQuery("gen_K", [1.0], 1))
+    assert [(m.sample_num, m.data.tolist()) for m in got] == [(i, [float(i)]) for i in range(1, 6)]
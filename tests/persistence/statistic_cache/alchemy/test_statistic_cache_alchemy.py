@@ -0,0 +1,62 @@
+"""Tests for SQLAlchemy statistic cache storage implementation."""
+
+from __future__ import annotations
+
+import pytest
+
+from pysatl_experiment.persistence.models.statistic_cache import (
+    StatisticCacheModel,
+    StatisticCacheQuery,
+    make_pool_key,
+    make_sample_key,
+)
+from pysatl_experiment.persistence.statistic_cache_storage import AlchemyStatisticCacheStorage
+
+
+@pytest.fixture()
+def storage() -> AlchemyStatisticCacheStorage:
+    store = AlchemyStatisticCacheStorage(db_url="sqlite:///:memory:")
+    store.init()
+    return store
+
+
+def _model(pool_key: str, sample_key: str, statistics: list[float]) -> StatisticCacheModel:
+    return StatisticCacheModel(
+        criterion_code="KS",
+        criterion_parameters=[],
+        pool_key=pool_key,
+        sample_key=sample_key,
+        statistics=statistics,
+    )
+
+
+def test_sample_key_depends_on_pool_size_and_transform() -> None:
+    pool_key = make_pool_key("NORMALGENERATOR", [0, 1], 100)
+
+    assert pool_key == make_pool_key("NORMALGENERATOR", [0.0, 1.0], 100)
+    assert pool_key != make_pool_key("NORMALGENERATOR", [0.0, 1.0], 50)
+    assert make_sample_key(pool_key, 100) != make_sample_key(pool_key, 50)
+    assert make_sample_key(pool_key, 100) != make_sample_key(pool_key, 100, "CAUCHYRVSGENERATOR", [0.0, 1.0])
+
+
+def test_insert_extends_and_get(storage: AlchemyStatisticCacheStorage) -> None:
+    storage.insert_data(_model("pool", "sample", [1.0, 2.0]))
+    storage.insert_data(_model("pool", "sample", [1.0, 2.0, 3.0]))
+
+    got = storage.get_data(StatisticCacheQuery(criterion_code="KS", criterion_parameters=[], sample_key="sample"))
+
+    assert got is not None
+    assert got.pool_key == "pool"
+    assert got.statistics.tolist() == [1.0, 2.0, 3.0]
+    assert (
+        storage.get_data(StatisticCacheQuery(criterion_code="AD", criterion_parameters=[], sample_key="sample")) is None
+    )
+
+
+def test_delete_pool_data(storage: AlchemyStatisticCacheStorage) -> None:
+    storage.insert_bulk_data([_model("pool_a", "sample_a", [1.0]), _model("pool_b", "sample_b", [2.0])])
+
+    storage.delete_pool_data("pool_a")
+
+    assert storage.get_data(StatisticCacheQuery("KS", [], "sample_a")) is None
+    assert storage.get_data(StatisticCacheQuery("KS", [], "sample_b")) is not None
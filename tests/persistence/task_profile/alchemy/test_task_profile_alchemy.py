@@ -0,0 +1,54 @@
+"""Tests for SQLAlchemy task profile storage and execution profile table."""
+
+from __future__ import annotations
+
+import pytest
+
+from pysatl_experiment.experiment_execution.parallel.phase_timer import COMPUTE_PHASE, LOAD_PHASE
+from pysatl_experiment.experiment_execution.step.execution.common.task_profiler import (
+    TaskProfiler,
+    format_profile_table,
+)
+from pysatl_experiment.persistence.models.task_profile import TaskProfileModel, TaskProfileQuery
+from pysatl_experiment.persistence.task_profile_storage import AlchemyTaskProfileStorage
+
+
+@pytest.fixture()
+def storage() -> AlchemyTaskProfileStorage:
+    store = AlchemyTaskProfileStorage(db_url="sqlite:///:memory:")
+    store.init()
+    return store
+
+
+def test_insert_get_and_upsert(storage: AlchemyTaskProfileStorage) -> None:
+    storage.insert_data(TaskProfileModel(1, "KS", 10, "", 1.0, 0.5, 2.0, 0.1, 0.2))
+    storage.insert_data(TaskProfileModel(1, "KS", 10, "", 3.0, 0.5, 2.0, 0.1, 0.2))
+
+    got = storage.get_data(TaskProfileQuery(1, "KS", 10, ""))
+    assert got is not None
+    assert got.load_seconds == 3.0
+
+    storage.delete_data(TaskProfileQuery(1, "KS", 10, ""))
+    assert storage.get_data(TaskProfileQuery(1, "KS", 10, "")) is None
+
+
+def test_profiler_stores_experiment_profile(storage: AlchemyTaskProfileStorage) -> None:
+    profiler = TaskProfiler(experiment_id=5, storage=storage)
+    profiles = [
+        profiler.create_model("KS", 10, {LOAD_PHASE: 1.0, COMPUTE_PHASE: 3.0}),
+        profiler.create_model("AD", 20, {LOAD_PHASE: 2.0, COMPUTE_PHASE: 1.0}, "NORM[0, 1] alpha=0.05"),
+    ]
+
+    profiler.record_batch(profiles, save_seconds=1.0)
+
+    stored = storage.get_experiment_data(5)
+    assert [(p.criterion_code, p.task_label, p.save_seconds) for p in stored] == [
+        ("AD", "NORM[0, 1] alpha=0.05", 0.5),
+        ("KS", "", 0.5),
+    ]
+    assert storage.get_experiment_data(6) == []
+
+    table = format_profile_table(stored).splitlines()
+    assert table[0].split() == ["criterion", "load", "decode", "compute", "serialize", "save", "total"]
+    assert table[-2].split() == ["total", "3.000", "0.000", "4.000", "0.000", "1.000", "8.000"]
+    assert table[-1].split() == ["share", "37.5%", "0.0%", "50.0%", "0.0%", "12.5%", "100.0%"]
@@ -0,0 +1,47 @@
+"""Tests for database engine initialization."""
+
+from pathlib import Path
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import OperationalError
+
+from pysatl_experiment.persistence.db_store.db_init import init_db, set_read_only_connections
+
+
+@pytest.fixture()
+def db_url(tmp_path: Path) -> str:
+    return f"sqlite:///{tmp_path / 'engine.sqlite'}"
+
+
+@pytest.fixture()
+def read_only():
+    set_read_only_connections(True)
+    yield
+    set_read_only_connections(False)
+
+
+def test_engine_is_created_once_per_url(db_url: str) -> None:
+    assert init_db(db_url) is init_db(db_url)
+    assert init_db("sqlite://") is not init_db("sqlite://")
+
+
+def test_sqlite_file_pragmas(db_url: str) -> None:
+    with init_db(db_url).connect() as connection:
+        assert connection.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+        assert connection.execute(text("PRAGMA synchronous")).scalar() == 1
+        assert connection.execute(text("PRAGMA busy_timeout")).scalar() == 30_000
+
+
+def test_read_only_connections_reject_writes(db_url: str, read_only) -> None:
+    set_read_only_connections(False)
+    with init_db(db_url).begin() as connection:
+        connection.execute(text("CREATE TABLE numbers (value INTEGER)"))
+        connection.execute(text("INSERT INTO numbers VALUES (1)"))
+
+    set_read_only_connections(True)
+    engine = init_db(db_url)
+    with engine.connect() as connection:
+        assert connection.execute(text("SELECT value FROM numbers")).scalar() == 1
+        with pytest.raises(OperationalError, match="readonly"):
+            connection.execute(text("INSERT INTO numbers VALUES (2)"))
@@ -0,0 +1,192 @@
+"""Tests for upgrades of tables created by earlier versions."""
+
+import sqlite3
+from pathlib import Path
+
+import pytest
+from pysatl_criterion.persistence.sqlalchemy.alchemy_decorator import CompressedFloatArray
+
+from pysatl_experiment.persistence.criterion_power_storage import AlchemyPowerStorage
+from pysatl_experiment.persistence.db_store.param_key import make_parameters_key
+from pysatl_experiment.persistence.experiment_storage import AlchemyExperimentStorage
+from pysatl_experiment.persistence.models.experiment import ExperimentModel, ExperimentQuery
+from pysatl_experiment.persistence.models.power import PowerModel, PowerQuery
+from pysatl_experiment.persistence.models.random_values import RandomValuesAllQuery, RandomValuesModel
+from pysatl_experiment.persistence.models.time_complexity import TimeComplexityModel, TimeComplexityQuery
+from pysatl_experiment.persistence.random_values_storage import AlchemyRandomValuesStorage
+from pysatl_experiment.persistence.time_complexity_storage import AlchemyTimeComplexityStorage
+
+
+def _power_query() -> PowerQuery:
+    return PowerQuery("KS", [], 10, "norm", [0.0, 1.0], 100, 0.05)
+
+
+def _experiment_query(**flags: bool) -> ExperimentQuery:
+    return ExperimentQuery(
+        "power",
+        "db",
+        "reuse",
+        "norm",
+        "default",
+        "sequential",
+        "pdf",
+        [10],
+        100,
+        {"KS": []},
+        {"norm": [0, 1]},
+        [0.05],
+        "with_chart",
+        1,
+        **flags,
+    )
+
+
+def _create_legacy_power(db_path: Path) -> None:
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE power (id INTEGER NOT NULL, experiment_id INTEGER NOT NULL, "
+            "criterion_code VARCHAR NOT NULL, criterion_parameters VARCHAR NOT NULL, "
+            "sample_size INTEGER NOT NULL, alternative_code VARCHAR NOT NULL, "
+            "alternative_parameters VARCHAR NOT NULL, monte_carlo_count INTEGER NOT NULL, "
+            "significance_level FLOAT NOT NULL, results_criteria VARCHAR NOT NULL, PRIMARY KEY (id), "
+            "CONSTRAINT uq_power_unique UNIQUE (criterion_code, criterion_parameters, sample_size, "
+            "alternative_code, alternative_parameters, monte_carlo_count, significance_level))"
+        )
+        connection.execute("CREATE INDEX ix_power_criterion_code ON power (criterion_code)")
+        connection.executemany(
+            "INSERT INTO power VALUES (?, 1, 'KS', '[]', 10, 'norm', ?, 100, 0.05, ?)",
+            [(1, "[0, 1]", "[true, false]"), (2, "[0.0, 1.0]", "[true, true]")],
+        )
+
+
+def test_legacy_power_table_gets_parameters_key(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.sqlite"
+    _create_legacy_power(db_path)
+
+    storage = AlchemyPowerStorage(f"sqlite:///{db_path}")
+    storage.init()
+
+    got = storage.get_data(_power_query())
+    assert got is not None
+    assert got.alternative_parameters == [0.0, 1.0]
+    assert got.results_criteria == [True, True]
+
+    storage.insert_data(PowerModel(2, "KS", [], 10, "norm", [0, 1], 100, 0.05, [False]))
+    got = storage.get_data(_power_query())
+    assert got is not None
+    assert got.results_criteria == [False]
+
+    with sqlite3.connect(db_path) as connection:
+        indexes = {row[0] for row in connection.execute("SELECT name FROM sqlite_master WHERE type = 'index'")}
+        assert connection.execute("SELECT COUNT(*) FROM power").fetchone() == (1,)
+    assert "ix_power_criterion_code" not in indexes
+    assert "uq_power_unique" in indexes
+
+
+def test_legacy_random_values_table_is_readable(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE random_values (id INTEGER NOT NULL, generator_name VARCHAR NOT NULL, "
+            "generator_parameters VARCHAR NOT NULL, sample_size INTEGER NOT NULL, sample_num INTEGER NOT NULL, "
+            "data BLOB NOT NULL, PRIMARY KEY (id), CONSTRAINT uq_random_values_unique "
+            "UNIQUE (generator_name, generator_parameters, sample_size, sample_num))"
+        )
+        connection.executemany(
+            "INSERT INTO random_values VALUES (?, 'norm', '[0, 1]', 2, ?, ?)",
+            [(num, num, CompressedFloatArray().process_bind_param([num, 0.5], None)) for num in (1, 2)],
+        )
+
+    storage = AlchemyRandomValuesStorage(f"sqlite:///{db_path}")
+    storage.init()
+    storage.insert_data(RandomValuesModel("norm", [0.0, 1.0], 2, 3, [3.0, 0.5]))
+
+    got = storage.get_all_data(RandomValuesAllQuery("norm", [0.0, 1.0], 2))
+    assert [model.data.tolist() for model in got] == [[1.0, 0.5], [2.0, 0.5], [3.0, 0.5]]
+
+
+def test_legacy_experiments_table_gets_identity_flags(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE experiments (id INTEGER NOT NULL, experiment_type VARCHAR NOT NULL, "
+            "storage_connection VARCHAR NOT NULL, run_mode VARCHAR NOT NULL, report_mode VARCHAR NOT NULL, "
+            "hypothesis VARCHAR NOT NULL, generator_type VARCHAR NOT NULL, executor_type VARCHAR NOT NULL, "
+            "report_builder_type VARCHAR NOT NULL, sample_sizes JSON NOT NULL, monte_carlo_count INTEGER NOT NULL, "
+            "criteria JSON NOT NULL, alternatives JSON NOT NULL, significance_levels JSON NOT NULL, "
+            "parallel_workers INTEGER NOT NULL, is_generation_done INTEGER, is_execution_done INTEGER, "
+            "is_report_building_done INTEGER, PRIMARY KEY (id), CONSTRAINT uix_limit_distribution "
+            "UNIQUE (experiment_type, storage_connection, run_mode, report_mode, hypothesis, generator_type, "
+            "executor_type, report_builder_type, sample_sizes, monte_carlo_count, criteria, alternatives, "
+            "significance_levels))"
+        )
+        connection.execute(
+            "INSERT INTO experiments VALUES (7, 'power', 'db', 'reuse', 'with_chart', 'norm', 'default', "
+            "'sequential', 'pdf', '[10]', 100, '{\"KS\": []}', '{\"norm\": [0, 1]}', '[0.05]', 1, 1, 1, 1)"
+        )
+
+    storage = AlchemyExperimentStorage(f"sqlite:///{db_path}")
+    storage.init()
+
+    assert storage.get_experiment_id(_experiment_query()) == 7
+    assert storage.get_data(_experiment_query(nested_samples=True)) is None
+    assert storage.get_data(_experiment_query(benchmark=True)) is None
+
+    nested = ExperimentModel(
+        "power",
+        "db",
+        "reuse",
+        "with_chart",
+        "norm",
+        "default",
+        "sequential",
+        "pdf",
+        [10],
+        100,
+        {"KS": []},
+        {"norm": [0, 1]},
+        [0.05],
+        1,
+        False,
+        False,
+        False,
+        nested_samples=True,
+    )
+    storage.insert_data(nested)
+
+    got = storage.get_data(_experiment_query(nested_samples=True))
+    assert got is not None
+    assert not got.is_execution_done
+    legacy = storage.get_data(_experiment_query())
+    assert legacy is not None
+    assert legacy.is_execution_done
+    assert not legacy.nested_samples
+    with pytest.raises(ValueError, match="not found"):
+        storage.get_experiment_id(_experiment_query(common_random_numbers=True))
+
+
+def test_legacy_time_complexity_table_keys_results_by_timing_mode(tmp_path: Path) -> None:
+    db_path = tmp_path / "legacy.sqlite"
+    with sqlite3.connect(db_path) as connection:
+        connection.execute(
+            "CREATE TABLE time_complexity (id INTEGER NOT NULL, criterion_code VARCHAR NOT NULL, "
+            "criterion_parameters VARCHAR NOT NULL, parameters_key VARCHAR(32) NOT NULL, "
+            "sample_size INTEGER NOT NULL, monte_carlo_count INTEGER NOT NULL, experiment_id INTEGER NOT NULL, "
+            "results_times VARCHAR NOT NULL, PRIMARY KEY (id), CONSTRAINT uq_time_complexity_unique "
+            "UNIQUE (parameters_key, sample_size, monte_carlo_count))"
+        )
+        connection.execute(
+            "INSERT INTO time_complexity VALUES (1, 'KS', '[]', ?, 10, 2, 1, '[0.1, 0.2]')",
+            (make_parameters_key("KS", []),),
+        )
+
+    storage = AlchemyTimeComplexityStorage(f"sqlite:///{db_path}")
+    storage.init()
+    storage.insert_data(TimeComplexityModel(2, "KS", [], 10, 2, [0.01, 0.02], benchmark=True))
+
+    plain = storage.get_data(TimeComplexityQuery("KS", [], 10, 2))
+    assert plain is not None
+    assert plain.results_times == [0.1, 0.2]
+    benchmark = storage.get_data(TimeComplexityQuery("KS", [], 10, 2, benchmark=True))
+    assert benchmark is not None
+    assert benchmark.results_times == [0.01, 0.02]
@@ -0,0 +1,24 @@
+"""Tests for canonical parameter encoding and hashed keys."""
+
+import numpy as np
+
+from pysatl_experiment.persistence.db_store.param_key import (
+    PARAMETERS_KEY_LENGTH,
+    encode_parameters,
+    make_parameters_key,
+)
+
+
+def test_encode_parameters_is_type_independent() -> None:
+    assert encode_parameters([1, 2.5]) == encode_parameters([1.0, np.float64(2.5)]) == "[1.0,2.5]"
+    assert encode_parameters([-0.0]) == encode_parameters([0])
+
+
+def test_parameters_key_is_fixed_width_and_canonical() -> None:
+    key = make_parameters_key("KS", [1, 2])
+
+    assert len(key) == PARAMETERS_KEY_LENGTH
+    assert key == make_parameters_key("KS", [1.0, 2.0])
+    assert key != make_parameters_key("KS", [2.0, 1.0])
+    assert key != make_parameters_key("AD", [1.0, 2.0])
+    assert make_parameters_key("KS", [], "norm", [1.0]) != make_parameters_key("KS", [1.0], "norm", [])
@@ -0,0 +1,46 @@
+"""Tests for stored sample codecs."""
+
+import numpy as np
+import pytest
+from pysatl_criterion.persistence.sqlalchemy.alchemy_decorator import CompressedFloatArray
+
+from pysatl_experiment.configuration.models.sample_codec import SampleCodec
+from pysatl_experiment.persistence.db_store.sample_codec import decode_sample, encode_sample
+
+
+SAMPLE = [0.1, -2.5, 1e-300, 3.0]
+
+LOSSLESS_CODECS = [SampleCodec.RAW_FLOAT64, SampleCodec.ZSTD_FLOAT64, SampleCodec.COMPRESSED_FLOAT_ARRAY]
+
+
+@pytest.mark.parametrize("codec", LOSSLESS_CODECS)
+def test_float64_codecs_round_trip_exactly(codec: SampleCodec) -> None:
+    decoded = decode_sample(encode_sample(SAMPLE, codec), codec)
+
+    assert decoded.dtype == np.float64
+    assert decoded.tolist() == SAMPLE
+    assert decoded.flags.writeable
+
+
+@pytest.mark.parametrize("codec", [SampleCodec.RAW_FLOAT32, SampleCodec.ZSTD_FLOAT32])
+def test_float32_codecs_downcast(codec: SampleCodec) -> None:
+    blob = encode_sample([0.1, 2.0], codec)
+    decoded = decode_sample(blob, codec)
+
+    assert decoded.dtype == np.float64
+    assert np.allclose(decoded, [0.1, 2.0], atol=1e-7)
+
+
+def test_raw_float64_is_little_endian_and_decodes_without_copy() -> None:
+    blob = encode_sample(SAMPLE, SampleCodec.RAW_FLOAT64)
+
+    assert blob == np.asarray(SAMPLE, dtype="<f8").tobytes()
+    view = decode_sample(blob, SampleCodec.RAW_FLOAT64, copy=False)
+    assert not view.flags.writeable
+    assert view.tolist() == SAMPLE
+
+
+def test_reads_compressed_float_array_blobs() -> None:
+    blob = CompressedFloatArray().process_bind_param(SAMPLE, None)
+
+    assert decode_sample(blob, SampleCodec.COMPRESSED_FLOAT_ARRAY).tolist() == SAMPLE
@@ -105,3 +105,67 @@ def test_delete_data(storage: AlchemyTimeComplexityStorage) -> None:
         )
         is None
     )
+
+
+def test_insert_bulk_data_upserts(storage: AlchemyTimeComplexityStorage) -> None:
+    def model(code: str, experiment_id: int, times: list[float]) -> TimeComplexityModel:
+        return TimeComplexityModel(
+            experiment_id=experiment_id,
+            criterion_code=code,
+            criterion_parameters=[],
+            sample_size=10,
+            monte_carlo_count=2,
+            results_times=times,
+        )
+
+    def query(code: str) -> TimeComplexityQuery:
+        return TimeComplexityQuery(criterion_code=code, criterion_parameters=[], sample_size=10, monte_carlo_count=2)
+
+    storage.insert_bulk_data(
+        [model("crit_A", 1, [1.0, 2.0]), model("crit_A", 2, [3.0, 4.0]), model("crit_B", 1, [5.0])]
+    )
+
+    got = storage.get_data(query("crit_A"))
+    assert got is not None
+    assert got.experiment_id == 2
+    assert got.results_times == [3.0, 4.0]
+    assert storage.get_data(query("crit_B")) is not None
+
+
+def test_append_bulk_data_extends_smaller_run(storage: AlchemyTimeComplexityStorage) -> None:
+    storage.insert_data(TimeComplexityModel(1, "crit_E", [0.5], 15, 2, [0.1, 0.2]))
+    query = TimeComplexityQuery("crit_E", [0.5], 15, 5)
+    assert storage.get_extendable_count(query) == 2
+
+    storage.append_bulk_data([TimeComplexityModel(2, "crit_E", [0.5], 15, 5, [0.3, 0.4, 0.5])])
+
+    got = storage.get_data(query)
+    assert got is not None
+    assert got.experiment_id == 2
+    assert got.results_times == [0.1, 0.2, 0.3, 0.4, 0.5]
+    shorter = storage.get_data(TimeComplexityQuery("crit_E", [0.5], 15, 2))
+    assert shorter is not None
+    assert shorter.results_times == [0.1, 0.2]
+    assert storage.get_extendable_count(TimeComplexityQuery("crit_E", [0.5], 15, 6)) == 5
+
+
+def test_append_bulk_data_requires_stored_run(storage: AlchemyTimeComplexityStorage) -> None:
+    with pytest.raises(ValueError):
+        storage.append_bulk_data([TimeComplexityModel(1, "crit_F", [], 15, 5, [0.3])])
+
+
+def test_benchmark_times_are_stored_apart_from_plain_times(storage: AlchemyTimeComplexityStorage) -> None:
+    storage.insert_data(TimeComplexityModel(1, "crit_G", [], 15, 2, [0.1, 0.2]))
+    benchmark_query = TimeComplexityQuery("crit_G", [], 15, 2, benchmark=True)
+    assert storage.get_data(benchmark_query) is None
+    assert storage.get_extendable_count(TimeComplexityQuery("crit_G", [], 15, 5, benchmark=True)) == 0
+    with pytest.raises(ValueError):
+        storage.append_bulk_data([TimeComplexityModel(2, "crit_G", [], 15, 5, [0.3, 0.4, 0.5], benchmark=True)])
+
+    storage.insert_data(TimeComplexityModel(2, "crit_G", [], 15, 2, [0.01, 0.02], benchmark=True))
+
+    plain = storage.get_data(TimeComplexityQuery("crit_G", [], 15, 2))
+    benchmark = storage.get_data(benchmark_query)
+    assert plain is not None and plain.results_times == [0.1, 0.2]
+    assert benchmark is not None and benchmark.results_times == [0.01, 0.02]
+    assert benchmark.benchmark
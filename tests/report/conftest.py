@@ -3,6 +3,7 @@
 from collections.abc import Generator
 from unittest.mock import MagicMock
 
+import numpy as np
 import pytest
 from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
 
@@ -89,7 +90,7 @@ def without_chart():
 
 @pytest.fixture
 def cv_values():
-    return [1.0] * 8  # 2 criteria × 2 sizes × 2 alphas
+    return {"KS_": np.ones((2, 2)), "AD_": np.ones((2, 2))}  # 2 criteria × (2 sizes × 2 alphas)
 
 
 @pytest.fixture
@@ -2,40 +2,27 @@
 
 from unittest.mock import MagicMock, patch
 
+import numpy as np
 import pytest
 
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.report.critical_value import CriticalValueReportBuilder
 
 
 class TestCriticalValueReportBuilder:
-    @patch("pysatl_experiment.report.critical_value.plt")
-    def test_chunk_cv_values_splits_correctly(self, mock_criterion_config, cv_values):
+    def test_generate_table_data_reads_criterion_values(self, mock_criterion_config, results_path):
         builder = CriticalValueReportBuilder(
             report_name="test",
             criteria_config=[mock_criterion_config, MagicMock(criterion_code="AD_")],
             sample_sizes=[10, 20],
             significance_levels=[0.05, 0.01],
-            cv_values=cv_values,
-            results_path=MagicMock(),
-            with_chart=ReportMode.WITH_CHART,
-        )
-        result = builder._chunk_cv_values()
-        assert len(result) == 2
-        assert all(len(chunk) == 4 for chunk in result)
-
-    @patch("pysatl_experiment.report.critical_value.plt")
-    def test_chunk_cv_values_empty(self, mock_criterion_config):
-        builder = CriticalValueReportBuilder(
-            report_name="test",
-            criteria_config=[mock_criterion_config],
-            sample_sizes=[10, 20],
-            significance_levels=[0.05, 0.01],
-            cv_values=[],
-            results_path=MagicMock(),
+            cv_values={"KS_": np.array([[1.0, 2.0], [3.0, 4.0]]), "AD_": np.zeros((2, 2))},
+            results_path=results_path,
             with_chart=ReportMode.WITH_CHART,
         )
-        assert builder._chunk_cv_values() == []
+        data = builder._generate_table_data("KS_")
+        assert data["rows"] == [{"size": 10, "values": [1.0, 2.0]}, {"size": 20, "values": [3.0, 4.0]}]
 
     @pytest.mark.parametrize("chart_mode", [ReportMode.WITH_CHART, ReportMode.WITHOUT_CHART])
     @patch("pysatl_experiment.report.critical_value.convert_html_to_pdf")
@@ -105,3 +92,22 @@ class TestCriticalValueReportBuilder:
         )
         data = builder._generate_table_data("KS_")
         assert len(data["rows"][0]["values"]) == 2
+
+    @patch("pysatl_experiment.report.critical_value.convert_html_to_pdf")
+    def test_build_html_pdf_writes_both_reports(self, mock_convert, mock_criterion_config, cv_values, results_path):
+        builder = CriticalValueReportBuilder(
+            report_name="test",
+            criteria_config=[mock_criterion_config, MagicMock(criterion_code="AD_")],
+            sample_sizes=[10, 20],
+            significance_levels=[0.05, 0.01],
+            cv_values=cv_values,
+            results_path=results_path,
+            with_chart=ReportMode.WITHOUT_CHART,
+            report_format=ReportFormat.HTML_PDF,
+        )
+
+        builder.build()
+
+        mock_convert.assert_not_called()
+        assert "α = 0.05" in (results_path / "test.html").read_text(encoding="utf-8")
+        assert (results_path / "test.pdf").read_bytes().startswith(b"%PDF")
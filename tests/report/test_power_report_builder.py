@@ -6,6 +6,8 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
 from pysatl_experiment.report.power import PowerReportBuilder
 
@@ -140,3 +142,52 @@ class TestPowerReportBuilder:
             builder.build()
 
         mock_convert.assert_called_once()
+
+    @patch("pysatl_experiment.report.power.convert_html_to_pdf")
+    def test_build_html_writes_report_with_external_assets(
+        self, mock_convert, mock_criterion_config, mock_alternative, power_data, results_path
+    ):
+        builder = PowerReportBuilder(
+            report_name="test",
+            criteria_config=[mock_criterion_config],
+            sample_sizes=[10, 20],
+            alternatives=[mock_alternative],
+            significance_levels=[0.05],
+            power_result=power_data,
+            results_path=results_path,
+            with_chart=ReportMode.WITH_CHART,
+            report_format=ReportFormat.HTML,
+            chart_format=ChartFormat.SVG,
+        )
+
+        builder.build()
+
+        mock_convert.assert_not_called()
+        html = (results_path / "test.html").read_text(encoding="utf-8")
+        assert 'src="test_assets/Normal_0.05.svg"' in html
+        assert (results_path / "test_assets" / "Normal_0.05.svg").exists()
+        assert not (results_path / "test.pdf").exists()
+
+    @patch("pysatl_experiment.report.power.convert_html_to_pdf")
+    def test_build_html_pdf_draws_pdf_without_html_conversion(
+        self, mock_convert, mock_criterion_config, mock_alternative, power_data, results_path
+    ):
+        builder = PowerReportBuilder(
+            report_name="test",
+            criteria_config=[mock_criterion_config],
+            sample_sizes=[10, 20],
+            alternatives=[mock_alternative],
+            significance_levels=[0.05],
+            power_result=power_data,
+            results_path=results_path,
+            with_chart=ReportMode.WITH_CHART,
+            report_format=ReportFormat.HTML_PDF,
+            chart_format=ChartFormat.PNG,
+        )
+
+        builder.build()
+
+        mock_convert.assert_not_called()
+        assert (results_path / "test.html").exists()
+        assert (results_path / "test_assets" / "Normal_0.05.png").exists()
+        assert (results_path / "test.pdf").read_bytes().startswith(b"%PDF")
@@ -5,7 +5,10 @@ from unittest.mock import MagicMock, patch
 
 import pytest
 
+from pysatl_experiment.configuration.models.chart_format import ChartFormat
+from pysatl_experiment.configuration.models.report_format import ReportFormat
 from pysatl_experiment.configuration.models.report_mode import ReportMode
+from pysatl_experiment.experiment_execution.complexity import fit_complexity
 from pysatl_experiment.report.time_complexity import TimeComplexityReportBuilder
 
 
@@ -160,3 +163,47 @@ class TestTimeComplexityReportBuilder:
             mock_gen_html.assert_called_once()
             mock_convert.assert_called_once_with("<html>Content</html>", results_path / "test.pdf")
             assert (results_path / "time_complexity_report.pdf").parent.exists()
+
+    @patch("pysatl_experiment.report.time_complexity.convert_html_to_pdf")
+    def test_build_html_references_external_chart(self, mock_convert, mock_criterion_config, time_data, results_path):
+        builder = TimeComplexityReportBuilder(
+            report_name="test",
+            criteria_config=[mock_criterion_config],
+            sample_sizes=[10, 20],
+            times=time_data,
+            results_path=results_path,
+            with_chart=ReportMode.WITH_CHART,
+            report_format=ReportFormat.HTML,
+            chart_format=ChartFormat.SVG,
+        )
+
+        builder.build()
+
+        mock_convert.assert_not_called()
+        html = (results_path / "test.html").read_text(encoding="utf-8")
+        assert "data:image/png;base64" not in html
+        assert 'src="test_assets/time_complexity.svg"' in html
+        assert (results_path / "test_assets" / "time_complexity.svg").exists()
+
+    @patch("pysatl_experiment.report.time_complexity.convert_html_to_pdf")
+    def test_build_html_includes_complexity_fits(self, mock_convert, mock_criterion_config, time_data, results_path):
+        fit = fit_complexity([10, 20, 40], [[1e-4], [2e-4], [4e-4]])
+        assert fit is not None
+        builder = TimeComplexityReportBuilder(
+            report_name="test",
+            criteria_config=[mock_criterion_config],
+            sample_sizes=[10, 20],
+            times=time_data,
+            results_path=results_path,
+            with_chart=ReportMode.WITH_CHART,
+            report_format=ReportFormat.HTML,
+            fits={"KS_": fit},
+            extrapolation_sizes=[400],
+        )
+
+        builder.build()
+
+        html = (results_path / "test.html").read_text(encoding="utf-8")
+        assert "O(n)" in html
+        assert "n = 400" in html
+        assert "4.00 ms" in html
@@ -0,0 +1,75 @@
+"""Tests for benchmarking mode of time complexity measurements."""
+
+import os
+
+import pytest
+from numpy import float64
+from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
+
+from pysatl_experiment.experiment_execution.worker.benchmark import (
+    BenchmarkSettings,
+    autorange,
+    calibrate_timer_overhead,
+    pinned_to_cpus,
+)
+from pysatl_experiment.experiment_execution.worker.time_complexity import TimeComplexityWorker
+
+
+class CountingStatistics(AbstractGoodnessOfFitStatistic):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    @staticmethod
+    def short_code() -> str:
+        return "COUNTING"
+
+    @staticmethod
+    def code() -> str:
+        return "COUNTING"
+
+    def execute_statistic(self, rvs, **kwargs) -> float | float64:
+        self.calls += 1
+        return sum(rvs)
+
+
+def test_autorange_repeats_calls_until_minimum_duration() -> None:
+    calls = []
+
+    number, elapsed = autorange(lambda: calls.append(1), 0.001)
+
+    assert str(number).rstrip("0") in {"1", "2", "5"}
+    assert elapsed >= 0.001
+    assert len(calls) >= number
+
+
+def test_timer_overhead_is_small_and_positive() -> None:
+    overhead = calibrate_timer_overhead(number=1000, repeat=3)
+
+    assert 0.0 < overhead < 1e-3
+
+
+def test_benchmark_warms_up_and_repeats_calls() -> None:
+    statistics = CountingStatistics()
+    samples = [[1.0, 2.0], [3.0, 4.0]]
+    worker = TimeComplexityWorker(
+        statistics=statistics,
+        sample_data=iter(samples),
+        benchmark=BenchmarkSettings(warmup_iterations=4, min_timing_seconds=0.001),
+    )
+
+    result = worker.execute()
+
+    assert len(result.results_times) == len(samples)
+    assert all(time >= 0.0 for time in result.results_times)
+    assert statistics.calls > 4 + len(samples)
+
+
+@pytest.mark.skipif(not hasattr(os, "sched_setaffinity"), reason="CPU pinning is not supported")
+def test_pinning_is_restored() -> None:
+    previous = os.sched_getaffinity(0)
+    cpu = min(previous)
+
+    with pinned_to_cpus([cpu]):
+        assert os.sched_getaffinity(0) == {cpu}
+
+    assert os.sched_getaffinity(0) == previous
@@ -0,0 +1,44 @@
+"""Tests for memory usage measurements of statistics."""
+
+import tracemalloc
+
+import numpy as np
+from numpy import float64
+from pysatl_criterion.statistics.goodness_of_fit import AbstractGoodnessOfFitStatistic
+
+from pysatl_experiment.experiment_execution.worker.memory_complexity import MemoryComplexityWorker
+
+
+class AllocatingStatistics(AbstractGoodnessOfFitStatistic):
+    @staticmethod
+    def short_code() -> str:
+        return "ALLOCATING"
+
+    @staticmethod
+    def code() -> str:
+        return "ALLOCATING"
+
+    def execute_statistic(self, rvs, **kwargs) -> float | float64:
+        return float(np.zeros(len(rvs) * 1000).sum())
+
+
+def test_worker_records_peak_allocation_of_each_call() -> None:
+    samples = [[0.0] * 10, [0.0] * 100]
+
+    result = MemoryComplexityWorker(AllocatingStatistics(), samples).execute()
+
+    assert len(result.results_peak_bytes) == 2
+    assert len(result.results_rss_bytes) == 2
+    assert result.results_peak_bytes[0] >= 8 * 10 * 1000
+    assert result.results_peak_bytes[1] >= 8 * 100 * 1000
+    assert result.results_peak_bytes[1] > result.results_peak_bytes[0]
+    assert not tracemalloc.is_tracing()
+
+
+def test_worker_keeps_tracing_started_by_caller() -> None:
+    tracemalloc.start()
+    try:
+        MemoryComplexityWorker(AllocatingStatistics(), [[0.0]]).execute()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()